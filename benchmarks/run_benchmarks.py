@@ -0,0 +1,705 @@
+"""
+Benchmarks de costo_personal.
+
+Mide el tiempo y el pico de memoria de los métodos públicos de
+CalculadoraCostos y GeneradorReportes, y de la exportación, sobre datos
+sintéticos de distintos tamaños, y el tiempo de importación del paquete en
+un intérprete nuevo. Los resultados se guardan en JSON y pueden compararse
+con los de otro commit para detectar regresiones.
+
+Uso:
+    python benchmarks/run_benchmarks.py --tamanos 10k,1M --salida actual.json
+    python benchmarks/run_benchmarks.py --tamanos 10k --comparar base.json
+"""
+
+import argparse
+import csv
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+import numpy as np
+import pandas as pd
+from costo_personal import (
+    CalculadoraCostos,
+    EmpleadoRegistry,
+    GeneradorReportes,
+    Moneda,
+    SimuladorEscenarios,
+)
+from costo_personal.historial import CambioEmpleado, HistorialEmpleados
+from costo_personal.flujo import leer_empleados_csv, procesar_flujo
+from costo_personal.ingesta import cargar_costos_csv, cargar_empleados_csv
+from costo_personal.instrumentacion import Instrumentacion
+from costo_personal.cargas import Condicion, ReglaCargas, ReglasCargas, Tramo
+from costo_personal.models import (
+    CostoPersonal,
+    CostoPersonalCompacto,
+    Empleado,
+    EmpleadoCompacto,
+)
+from costo_personal.prorrateo import Prorrateo
+from costo_personal.proyeccion import AjustesProyeccion, AumentoProgramado, PoliticaBonos
+from costo_personal.sintetico import generar_historial
+
+
+TAMANOS = {"10k": 10_000, "1M": 1_000_000, "10M": 10_000_000}
+
+# Las variantes con listas de CostoPersonal se omiten por encima de este
+# tamaño (10M de objetos no caben en memoria en equipos comunes)
+MAX_FILAS_LISTA = 1_000_000
+
+# La exportación a Excel celda por celda se limita a este tamaño
+MAX_FILAS_EXCEL = 200_000
+
+# Módulos cuyo tiempo de importación se mide (en un intérprete nuevo cada vez)
+IMPORTACIONES = ("costo_personal", "costo_personal.reportes")
+
+SCRIPT_IMPORTACION = """
+import importlib, json, sys, time, tracemalloc
+if sys.argv[2] == "1":
+    tracemalloc.start()
+inicio = time.perf_counter()
+importlib.import_module(sys.argv[1])
+segundos = time.perf_counter() - inicio
+pico = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0
+print(json.dumps({"segundos": segundos, "pico_bytes": pico}))
+"""
+
+AJUSTES = AjustesProyeccion(
+    aumentos=[
+        AumentoProgramado("2025-07", 0.05),
+        AumentoProgramado("2026-03", 0.03, departamento="Ventas"),
+    ],
+    inflacion_anual=0.04,
+    politicas_bonos=[
+        PoliticaBonos("Ventas", porcentaje_salario=0.1),
+        PoliticaBonos("Operaciones", monto_fijo=200.0, meses=[12]),
+    ],
+    beneficios=150.0,
+)
+
+PRORRATEO = Prorrateo("habiles", feriados=(date(2024, 1, 1), date(2024, 5, 1), date(2024, 12, 25)))
+
+MONEDA = Moneda(decimales=2, redondeo="mitad_arriba")
+
+REGLAS_CARGAS = ReglasCargas((
+    ReglaCargas(Condicion(departamentos=("Ventas",)), tasa=0.22, tope_base=6000.0),
+    ReglaCargas(tramos=(Tramo(0.0, 0.2), Tramo(4000.0, 0.27)), minimo=300.0),
+))
+
+
+@dataclass
+class Datos:
+    """Datos de entrada compartidos por todos los casos de un tamaño."""
+    
+    filas: int
+    empleados: list
+    registro: EmpleadoRegistry
+    lote: Any
+    lista: Optional[list]
+    periodos: List[str]
+    periodo: str
+    departamento: str
+    directorio: str
+
+
+@dataclass
+class Caso:
+    """Un benchmark: prepara la función a medir a partir de los datos."""
+    
+    nombre: str
+    preparar: Callable[[Datos], Callable[[], Any]]
+    max_filas: Optional[int] = None
+    requiere_lista: bool = False
+    # Si se indica, se informa el pico de memoria por objeto creado
+    objetos: Optional[Callable[[Datos], int]] = None
+
+
+def _casos_calculadora() -> List[Caso]:
+    """Casos de CalculadoraCostos."""
+    calc = CalculadoraCostos()
+    calc_reglas = CalculadoraCostos(reglas_cargas=REGLAS_CARGAS)
+    calc_centavos = CalculadoraCostos(moneda=MONEDA)
+    calc_prorrateo = CalculadoraCostos(prorrateo=PRORRATEO)
+    
+    def costo_mensual(d: Datos) -> Callable[[], Any]:
+        return lambda: [calc.calcular_costo_mensual(e, d.periodo, bonos=100.0) for e in d.empleados]
+    
+    def lote_instrumentado(d: Datos) -> Callable[[], Any]:
+        def ejecutar() -> Any:
+            with Instrumentacion():
+                return calc.calcular_costos_lote(d.registro, d.periodo, bonos=100.0)
+        return ejecutar
+    
+    return [
+        Caso("calculadora.calcular_costo_mensual", costo_mensual),
+        Caso(
+            "calculadora.calcular_costos_lote",
+            lambda d: lambda: calc.calcular_costos_lote(d.registro, d.periodo, bonos=100.0),
+        ),
+        Caso(
+            "calculadora.calcular_costos_lote[reglas]",
+            lambda d: lambda: calc_reglas.calcular_costos_lote(d.registro, d.periodo, bonos=100.0),
+        ),
+        Caso("calculadora.calcular_costos_lote[instrumentado]", lote_instrumentado),
+        Caso(
+            "calculadora.calcular_costos_lote[centavos]",
+            lambda d: lambda: calc_centavos.calcular_costos_lote(d.registro, d.periodo, bonos=100.0),
+        ),
+        Caso(
+            "calculadora.calcular_costos_periodos[serie]",
+            lambda d: lambda: calc.calcular_costos_periodos(d.registro, d.periodos, bonos=100.0),
+        ),
+        Caso(
+            "calculadora.calcular_costos_periodos[prorrateo_habiles]",
+            lambda d: lambda: calc_prorrateo.calcular_costos_periodos(
+                d.registro, d.periodos, bonos=100.0
+            ),
+        ),
+        Caso(
+            "calculadora.calcular_costos_periodos[paralelo]",
+            lambda d: lambda: calc.calcular_costos_periodos(
+                d.registro, d.periodos, bonos=100.0, procesos=None
+            ),
+        ),
+        Caso(
+            "calculadora.proyectar[36]",
+            lambda d: lambda: calc.proyectar(d.registro, "2025-01", "2027-12", AJUSTES),
+        ),
+        Caso(
+            "calculadora.calcular_costos_departamento",
+            lambda d: lambda: calc.calcular_costos_departamento(d.registro, d.departamento, d.periodo),
+        ),
+        Caso(
+            "calculadora.calcular_costo_promedio_por_empleado[lista]",
+            lambda d: lambda: calc.calcular_costo_promedio_por_empleado(d.lista),
+            requiere_lista=True,
+        ),
+        Caso(
+            "calculadora.calcular_costo_promedio_por_empleado[lote]",
+            lambda d: lambda: calc.calcular_costo_promedio_por_empleado(d.lote),
+        ),
+    ]
+
+
+def _casos_reportes() -> List[Caso]:
+    """Casos de GeneradorReportes, por backend y tipo de entrada."""
+    casos = []
+    # Método -> si recibe los empleados además de los costos
+    metodos = {
+        "generar_reporte_por_departamento": True,
+        "generar_metricas_clave": True,
+        "generar_reporte_tendencia": False,
+        "generar_paquete_reportes": True,
+    }
+    for backend in ("python", "pandas"):
+        generador = GeneradorReportes(backend=backend)
+        for metodo, con_empleados in metodos.items():
+            funcion = getattr(generador, metodo)
+            if con_empleados:
+                casos.append(Caso(
+                    f"reportes.{metodo}[{backend},lista]",
+                    lambda d, f=funcion: lambda: f(d.empleados, d.lista),
+                    requiere_lista=True,
+                ))
+                casos.append(Caso(
+                    f"reportes.{metodo}[{backend},lote]",
+                    lambda d, f=funcion: lambda: f(d.empleados, d.lote),
+                ))
+                if backend == "python":
+                    casos.append(Caso(
+                        f"reportes.{metodo}[centavos]",
+                        lambda d, f=funcion: _con_lote_centavos(d, lambda l: f(d.empleados, l)),
+                    ))
+            else:
+                casos.append(Caso(
+                    f"reportes.{metodo}[{backend},lista]",
+                    lambda d, f=funcion: lambda: f(d.lista),
+                    requiere_lista=True,
+                ))
+                casos.append(Caso(
+                    f"reportes.{metodo}[{backend},lote]",
+                    lambda d, f=funcion: lambda: f(d.lote),
+                ))
+                if backend == "python":
+                    casos.append(Caso(
+                        f"reportes.{metodo}[centavos]",
+                        lambda d, f=funcion: _con_lote_centavos(d, f),
+                    ))
+    return casos
+
+
+def _con_lote_centavos(d: Datos, funcion: Callable[[Any], Any]) -> Callable[[], Any]:
+    """Prepara el lote en centavos fuera de la medición."""
+    lote = d.lote.en_unidades(MONEDA)
+    return lambda: funcion(lote)
+
+
+def _casos_escenarios() -> List[Caso]:
+    """Casos de SimuladorEscenarios."""
+    escenarios = [
+        {"tasa_cargas_sociales": 0.20 + 0.002 * i, "tope_bonos": 500.0 + 10.0 * i}
+        for i in range(50)
+    ]
+    
+    def evaluar(d: Datos) -> Callable[[], Any]:
+        simulador = SimuladorEscenarios(d.registro, d.lote)
+        return lambda: simulador.evaluar(escenarios)
+    
+    return [Caso("escenarios.evaluar[50]", evaluar)]
+
+
+def _casos_flujo() -> List[Caso]:
+    """Casos del procesamiento en flujo."""
+    return [
+        Caso(
+            "flujo.procesar_flujo",
+            lambda d: lambda: procesar_flujo(
+                iter(d.empleados), d.periodos, bonos=100.0, tamano_fragmento=10_000
+            ),
+        ),
+        Caso(
+            "flujo.procesar_flujo[conceptos]",
+            lambda d: lambda: procesar_flujo(
+                iter(d.empleados), d.periodos, tamano_fragmento=10_000,
+                conceptos=((emp.id, {"bonos": 100.0}) for emp in d.empleados),
+            ),
+        ),
+    ]
+
+
+def _casos_periodos() -> List[Caso]:
+    """
+    Consultas por rango de periodos sobre el lote: una por cada ventana de
+    tres meses, con máscaras de texto o con un IndicePeriodos.
+    """
+    def ventanas(d: Datos) -> List[Any]:
+        return [(d.periodos[i], d.periodos[i + 2]) for i in range(len(d.periodos) - 2)]
+    
+    def con_mascara(d: Datos) -> Callable[[], Any]:
+        rangos = ventanas(d)
+        return lambda: [
+            d.lote[(d.lote.periodo >= desde) & (d.lote.periodo <= hasta)] for desde, hasta in rangos
+        ]
+    
+    def con_indice(d: Datos) -> Callable[[], Any]:
+        rangos = ventanas(d)
+        
+        def consultar() -> Any:
+            indice = d.lote.indice_periodos()
+            return [d.lote.entre_periodos(desde, hasta, indice) for desde, hasta in rangos]
+        return consultar
+    
+    return [
+        Caso("lote.rangos_periodo[mascara]", con_mascara),
+        Caso("lote.entre_periodos", con_indice),
+    ]
+
+
+def _casos_historial() -> List[Caso]:
+    """
+    Recálculo de los periodos del historial con datos vigentes: un cambio
+    de salario cada seis meses por empleado, en promedio.
+    """
+    def historial(d: Datos) -> HistorialEmpleados:
+        rng = np.random.default_rng(0)
+        cantidad = len(d.empleados) * len(d.periodos) // 6
+        empleados = rng.integers(0, len(d.empleados), cantidad)
+        periodos = rng.integers(0, len(d.periodos), cantidad)
+        salarios = rng.uniform(1000.0, 8000.0, cantidad)
+        return HistorialEmpleados(
+            d.empleados,
+            [
+                CambioEmpleado(d.empleados[e].id, d.periodos[p], salario_base=s)
+                for e, p, s in zip(empleados.tolist(), periodos.tolist(), salarios.tolist())
+            ],
+            desde=d.periodos[0],
+        )
+    
+    def vectorizado(d: Datos) -> Callable[[], Any]:
+        h = historial(d)
+        return lambda: CalculadoraCostos().calcular_costos_historicos(h, d.periodos)
+    
+    def por_periodo(d: Datos) -> Callable[[], Any]:
+        h = historial(d)
+        calculadora = CalculadoraCostos()
+        return lambda: [
+            calculadora.calcular_costos_lote(h.al(periodo, solo_activos=True), periodo)
+            for periodo in d.periodos
+        ]
+    
+    return [
+        Caso("calculadora.calcular_costos_historicos", vectorizado),
+        Caso(
+            "calculadora.calcular_costos_historicos[foto_por_periodo]",
+            por_periodo,
+            max_filas=MAX_FILAS_LISTA,
+        ),
+    ]
+
+
+def _casos_dotacion() -> List[Caso]:
+    """Serie de dotación con un egreso para cada empleado inactivo."""
+    def dotacion(d: Datos) -> Callable[[], Any]:
+        egresos = {
+            emp.id: emp.fecha_ingreso + timedelta(days=365)
+            for emp in d.empleados if not emp.activo
+        }
+        generador = GeneradorReportes()
+        return lambda: generador.generar_reporte_dotacion(
+            d.empleados, "2015-01", d.periodo, egresos, por=("departamento", "cargo")
+        )
+    
+    return [Caso("reportes.generar_reporte_dotacion", dotacion)]
+
+
+def _casos_exportacion() -> List[Caso]:
+    """Casos de exportación."""
+    generador = GeneradorReportes()
+    
+    def reporte(d: Datos) -> pd.DataFrame:
+        return generador.generar_reporte_tendencia(d.lote)
+    
+    def ruta(d: Datos, nombre: str) -> str:
+        return os.path.join(d.directorio, nombre)
+    
+    def exportar_csv(d: Datos) -> Callable[[], Any]:
+        df = reporte(d)
+        return lambda: generador.exportar_reporte_csv(df, ruta(d, "reporte.csv"))
+    
+    def exportar_excel(d: Datos) -> Callable[[], Any]:
+        df = reporte(d)
+        return lambda: generador.exportar_reporte_excel(df, ruta(d, "reporte.xlsx"))
+    
+    return [
+        Caso("reportes.exportar_reporte_csv", exportar_csv),
+        Caso("reportes.exportar_reporte_excel", exportar_excel),
+        Caso(
+            "reportes.exportar_csv_por_lotes",
+            lambda d: lambda: generador.exportar_csv_por_lotes(d.lote, ruta(d, "detalle.csv")),
+        ),
+        Caso(
+            "reportes.exportar_excel_por_lotes",
+            lambda d: lambda: generador.exportar_excel_por_lotes(d.lote, ruta(d, "detalle.xlsx")),
+            max_filas=MAX_FILAS_EXCEL,
+        ),
+    ]
+
+
+def _casos_ingesta() -> List[Caso]:
+    """Casos de carga masiva (el archivo se escribe al preparar el caso)."""
+    def archivo_empleados(d: Datos) -> str:
+        ruta = os.path.join(d.directorio, "empleados.csv")
+        pd.DataFrame([emp.to_dict() for emp in d.empleados]).to_csv(ruta, index=False)
+        return ruta
+    
+    def archivo_costos(d: Datos) -> str:
+        ruta = os.path.join(d.directorio, "costos.csv")
+        d.lote.to_dataframe().to_csv(ruta, index=False)
+        return ruta
+    
+    def empleados_fila_a_fila(d: Datos) -> Callable[[], Any]:
+        ruta = archivo_empleados(d)
+        return lambda: list(leer_empleados_csv(ruta))
+    
+    def empleados_masivo(d: Datos) -> Callable[[], Any]:
+        ruta = archivo_empleados(d)
+        return lambda: cargar_empleados_csv(ruta)
+    
+    def costos_masivo(d: Datos) -> Callable[[], Any]:
+        ruta = archivo_costos(d)
+        return lambda: cargar_costos_csv(ruta)
+    
+    return [
+        Caso("ingesta.empleados_csv[fila_a_fila]", empleados_fila_a_fila),
+        Caso("ingesta.cargar_empleados_csv", empleados_masivo),
+        Caso("ingesta.cargar_costos_csv", costos_masivo),
+    ]
+
+
+def _casos_modelos() -> List[Caso]:
+    """
+    Casos de creación de modelos, para comparar los bytes por objeto.
+    
+    Las filas se leen con csv de un texto preparado antes, de modo que cada
+    objeto recibe cadenas nuevas como al leer un archivo, y la lista creada
+    queda incluida en el pico de memoria.
+    """
+    def costos(clase: Callable[..., Any]) -> Callable[[Datos], Callable[[], Any]]:
+        def preparar(d: Datos) -> Callable[[], Any]:
+            lineas = d.lote.to_dataframe(incluir_total=False).to_csv(
+                index=False, header=False
+            ).splitlines()
+            return lambda: [
+                clase(f[0], f[1], *map(float, f[2:])) for f in csv.reader(lineas)
+            ]
+        return preparar
+    
+    def empleados(clase: Callable[..., Any]) -> Callable[[Datos], Callable[[], Any]]:
+        def preparar(d: Datos) -> Callable[[], Any]:
+            lineas = pd.DataFrame([emp.to_dict() for emp in d.empleados]).to_csv(
+                index=False, header=False
+            ).splitlines()
+            return lambda: [
+                clase(f[0], f[1], f[2], f[3], float(f[4]), date.fromisoformat(f[5]), f[6] == "True")
+                for f in csv.reader(lineas)
+            ]
+        return preparar
+    
+    return [
+        Caso(f"modelos.{clase.__name__}", preparar(clase), max_filas=MAX_FILAS_LISTA, objetos=objetos)
+        for preparar, objetos, clases in (
+            (costos, lambda d: len(d.lote), (CostoPersonal, CostoPersonalCompacto)),
+            (empleados, lambda d: len(d.empleados), (Empleado, EmpleadoCompacto)),
+        )
+        for clase in clases
+    ]
+
+
+def casos() -> List[Caso]:
+    """Todos los casos de benchmark."""
+    return (
+        _casos_calculadora() + _casos_reportes() + _casos_escenarios()
+        + _casos_flujo() + _casos_ingesta() + _casos_exportacion()
+        + _casos_modelos() + _casos_periodos() + _casos_historial()
+        + _casos_dotacion()
+    )
+
+
+def preparar_datos(filas: int, semilla: int, directorio: str) -> Datos:
+    """Genera los datos sintéticos de un tamaño."""
+    empleados, lote = generar_historial(filas, semilla=semilla)
+    conteo = pd.Series([e.departamento for e in empleados]).value_counts()
+    return Datos(
+        filas=filas,
+        empleados=empleados,
+        registro=EmpleadoRegistry(empleados),
+        lote=lote,
+        lista=lote.to_costos() if filas <= MAX_FILAS_LISTA else None,
+        periodos=list(dict.fromkeys(lote.periodo.tolist())),
+        periodo=str(lote.periodo[-1]),
+        departamento=str(conteo.index[0]),
+        directorio=directorio,
+    )
+
+
+def medir(funcion: Callable[[], Any], repeticiones: int) -> Dict[str, float]:
+    """
+    Mide una función.
+    
+    El tiempo es el mejor de ``repeticiones`` ejecuciones sin tracemalloc;
+    el pico de memoria se mide en una ejecución adicional con tracemalloc.
+    """
+    tiempos = []
+    for _ in range(repeticiones):
+        gc.collect()
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    
+    gc.collect()
+    tracemalloc.start()
+    try:
+        funcion()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    return {"segundos": min(tiempos), "pico_bytes": pico}
+
+
+def medir_importacion(modulo: str, repeticiones: int) -> Dict[str, float]:
+    """
+    Mide la importación de un módulo en intérpretes nuevos.
+    
+    Igual que ``medir``: el mejor tiempo de ``repeticiones`` importaciones y
+    el pico de memoria en una importación adicional con tracemalloc.
+    """
+    def importar(con_tracemalloc: bool) -> Dict[str, float]:
+        salida = subprocess.run(
+            [sys.executable, "-c", SCRIPT_IMPORTACION, modulo, "1" if con_tracemalloc else "0"],
+            capture_output=True, text=True, check=True,
+        ).stdout
+        return json.loads(salida)
+    
+    segundos = min(importar(False)["segundos"] for _ in range(repeticiones))
+    return {"segundos": segundos, "pico_bytes": importar(True)["pico_bytes"]}
+
+
+def _informar(nombre: str, filas: int, medicion: Dict[str, float]) -> None:
+    """Imprime una medición."""
+    por_objeto = medicion.get("bytes_por_objeto")
+    print(
+        f"{nombre:<70} {filas:>10} "
+        f"{medicion['segundos']:>10.4f} s {medicion['pico_bytes'] / 2**20:>10.1f} MiB"
+        + (f" {por_objeto:>8.0f} B/objeto" if por_objeto is not None else ""),
+        flush=True,
+    )
+
+
+def ejecutar(
+    tamanos: List[str],
+    repeticiones: int = 3,
+    semilla: int = 0,
+    filtro: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Ejecuta los benchmarks.
+    
+    Args:
+        tamanos: Nombres de tamaños ("10k", "1M", "10M") o cantidades de filas
+        repeticiones: Ejecuciones por caso (se guarda la más rápida)
+        semilla: Semilla de los datos sintéticos
+        filtro: Si se indica, solo los casos cuyo nombre lo contiene
+        
+    Returns:
+        Diccionario con metadatos y resultados
+    """
+    resultados = []
+    for modulo in IMPORTACIONES:
+        nombre = f"importacion.{modulo}"
+        if filtro and filtro not in nombre:
+            continue
+        medicion = medir_importacion(modulo, repeticiones)
+        resultados.append({"caso": nombre, "filas": 0, **medicion})
+        _informar(nombre, 0, medicion)
+    
+    seleccionados = [c for c in casos() if not filtro or filtro in c.nombre]
+    for tamano in tamanos:
+        if not seleccionados:
+            break
+        filas = TAMANOS.get(tamano) or int(tamano)
+        with tempfile.TemporaryDirectory() as directorio:
+            datos = preparar_datos(filas, semilla, directorio)
+            for caso in seleccionados:
+                if caso.max_filas is not None and filas > caso.max_filas:
+                    continue
+                if caso.requiere_lista and datos.lista is None:
+                    continue
+                medicion = medir(caso.preparar(datos), repeticiones)
+                if caso.objetos is not None:
+                    medicion["bytes_por_objeto"] = medicion["pico_bytes"] / caso.objetos(datos)
+                resultados.append({"caso": caso.nombre, "filas": filas, **medicion})
+                _informar(caso.nombre, filas, medicion)
+            del datos
+            gc.collect()
+    
+    return {"metadatos": _metadatos(semilla, repeticiones), "resultados": resultados}
+
+
+def comparar(
+    actual: Dict[str, Any],
+    anterior: Dict[str, Any],
+    umbral: float = 1.25,
+    min_segundos: float = 0.005,
+    min_bytes: int = 1024 * 1024,
+) -> List[Dict[str, Any]]:
+    """
+    Compara dos ejecuciones y devuelve las regresiones.
+    
+    Args:
+        actual: Resultados de la ejecución actual
+        anterior: Resultados de referencia
+        umbral: Razón actual/anterior a partir de la cual hay regresión
+        min_segundos: Los tiempos menores que este valor en ambas
+            ejecuciones se ignoran (dominados por el ruido)
+        min_bytes: Ídem para el pico de memoria
+        
+    Returns:
+        Lista de regresiones de tiempo o de memoria
+    """
+    minimos = {"segundos": min_segundos, "pico_bytes": min_bytes}
+    referencia = {(r["caso"], r["filas"]): r for r in anterior["resultados"]}
+    regresiones = []
+    for r in actual["resultados"]:
+        base = referencia.get((r["caso"], r["filas"]))
+        if base is None:
+            continue
+        for metrica in ("segundos", "pico_bytes"):
+            if max(base[metrica], r[metrica]) < minimos[metrica]:
+                continue
+            if base[metrica] > 0 and r[metrica] / base[metrica] > umbral:
+                regresiones.append({
+                    "caso": r["caso"],
+                    "filas": r["filas"],
+                    "metrica": metrica,
+                    "anterior": base[metrica],
+                    "actual": r[metrica],
+                    "razon": r[metrica] / base[metrica],
+                })
+    return regresiones
+
+
+def _metadatos(semilla: int, repeticiones: int) -> Dict[str, Any]:
+    """Entorno de la ejecución."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "plataforma": platform.platform(),
+        "semilla": semilla,
+        "repeticiones": repeticiones,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tamanos", default="10k",
+                        help="Tamaños separados por coma: 10k, 1M, 10M o cantidades de filas")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--filtro", help="Solo los casos cuyo nombre contiene este texto")
+    parser.add_argument("--salida", help="Archivo JSON de resultados")
+    parser.add_argument("--comparar", help="Archivo JSON de referencia")
+    parser.add_argument("--umbral", type=float, default=1.25,
+                        help="Razón a partir de la cual se informa una regresión")
+    args = parser.parse_args(argv)
+    
+    actual = ejecutar(
+        [t.strip() for t in args.tamanos.split(",") if t.strip()],
+        repeticiones=args.repeticiones,
+        semilla=args.semilla,
+        filtro=args.filtro,
+    )
+    
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(actual, f, indent=2)
+    
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            anterior = json.load(f)
+        regresiones = comparar(actual, anterior, args.umbral)
+        for r in regresiones:
+            print(
+                f"REGRESIÓN {r['caso']} ({r['filas']} filas) {r['metrica']}: "
+                f"{r['anterior']:.4g} -> {r['actual']:.4g} (x{r['razon']:.2f})"
+            )
+        if regresiones:
+            return 1
+        print(f"Sin regresiones respecto de {anterior['metadatos'].get('commit')}")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,7 @@ del sistema de reportería y métricas de costo de personal.
 
 from datetime import date
 from costo_personal import Empleado, CalculadoraCostos, GeneradorReportes
+from costo_personal.proyeccion import AjustesProyeccion, AumentoProgramado, PoliticaBonos
 
 
 def ejemplo_basico():
@@ -130,6 +131,22 @@ def ejemplo_basico():
     print(df_tendencia.to_string(index=False))
     print()
     
+    # 5. Proyección de presupuesto
+    print("5. Proyectando costos 2025...")
+    ajustes = AjustesProyeccion(
+        aumentos=[AumentoProgramado("2025-07", 0.05)],
+        inflacion_anual=0.04,
+        politicas_bonos=[PoliticaBonos("Ventas", porcentaje_salario=0.5, meses=[12])],
+        beneficios=150.0,
+    )
+    proyeccion = calculadora.proyectar(empleados, "2025-01", "2025-12", ajustes)
+    
+    print("\n   PROYECCIÓN DE COSTOS:")
+    print("   " + "-" * 56)
+    df_proyeccion = generador.generar_reporte_tendencia(proyeccion)
+    print(df_proyeccion.to_string(index=False))
+    print()
+    
     print("=" * 60)
     print("Ejemplo completado exitosamente!")
     print("=" * 60)
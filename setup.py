@@ -15,6 +15,9 @@ setup(
         "openpyxl>=3.0.0",
     ],
     extras_require={
+        "parquet": [
+            "pyarrow>=12.0.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
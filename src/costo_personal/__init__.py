@@ -3,17 +3,61 @@ Sistema de reportería y métricas de costo de personal.
 
 Este paquete proporciona herramientas para gestionar, calcular y reportar
 los costos de personal de una organización.
+
+Los modelos y la calculadora se importan al cargar el paquete; los reportes,
+agregados, caché, almacenamiento y escenarios dependen de pandas y se
+importan recién al usarlos por primera vez.
 """
 
+import importlib
+from typing import Any, List
+
 __version__ = "0.1.0"
 
 from .models import Empleado, CostoPersonal
+from .dinero import Moneda
+from .periodos import Periodo
+from .lote import CostoPersonalBatch
+from .registro import EmpleadoRegistry
 from .calculadora import CalculadoraCostos
-from .reportes import GeneradorReportes
+
+# Nombre exportado -> módulo que lo define (importado al primer acceso)
+_PEREZOSOS = {
+    "GeneradorReportes": ".reportes",
+    "AgregadoIncremental": ".agregados",
+    "AgregadoParcial": ".agregados",
+    "AgregadoFlujo": ".agregados",
+    "CacheReportes": ".cache",
+    "AlmacenCostos": ".almacenamiento",
+    "SimuladorEscenarios": ".escenarios",
+}
 
 __all__ = [
     "Empleado",
     "CostoPersonal",
+    "Moneda",
+    "Periodo",
+    "CostoPersonalBatch",
+    "EmpleadoRegistry",
     "CalculadoraCostos",
     "GeneradorReportes",
+    "AgregadoIncremental",
+    "AgregadoParcial",
+    "AgregadoFlujo",
+    "CacheReportes",
+    "AlmacenCostos",
+    "SimuladorEscenarios",
 ]
+
+
+def __getattr__(nombre: str) -> Any:
+    modulo = _PEREZOSOS.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(modulo, __name__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_PEREZOSOS))
@@ -0,0 +1,525 @@
+"""
+Agregados incrementales de costos de personal.
+
+Mantienen sumas por periodo y por departamento que se actualizan con cada
+lote de costos nuevos (o retirados), de modo que los reportes se obtienen
+sin volver a recorrer todo el historial. Los agregados parciales permiten
+además calcular cada archivo o fragmento por separado (en otro proceso o en
+otra máquina) y combinarlos después, y el agregado de flujo acumula una
+nómina leída por fragmentos sin guardar datos por empleado.
+"""
+
+from dataclasses import dataclass, field
+from functools import reduce
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+import numpy as np
+import pandas as pd
+from .models import Empleado
+from .lote import CostoPersonalBatch, agrupar, como_lote
+from .reportes import (
+    Costos,
+    Empleados,
+    _agregar_departamentos_lote,
+    _agregar_periodos_lote,
+    _construir_metricas_clave,
+    _construir_reporte_departamento,
+    _construir_reporte_tendencia,
+    _contar_activos,
+    _indice_empleados,
+    _totales_lote,
+)
+
+
+CAMPOS_PERIODO = (
+    ("costo_total", "costo_total"),
+    ("salario_base_total", "salario_base"),
+    ("bonos_total", "bonos"),
+    ("horas_extra_total", "horas_extra"),
+)
+
+CAMPOS_DEPARTAMENTO = CAMPOS_PERIODO + (
+    ("beneficios_total", "beneficios"),
+    ("cargas_sociales_total", "cargas_sociales"),
+)
+
+CAMPOS_TOTALES = ("costo_total", "salario_base", "bonos", "horas_extra", "cargas_sociales")
+
+
+class AgregadoIncremental:
+    """
+    Reporte por departamento, tendencia y métricas clave mantenidos de forma
+    incremental.
+    
+    Cada llamada a ``agregar`` o ``retirar`` cuesta en proporción al lote
+    recibido, y los reportes se construyen a partir de las sumas guardadas
+    (en proporción a la cantidad de periodos y departamentos). Los
+    resultados coinciden con los de GeneradorReportes salvo diferencias de
+    redondeo por el orden de las sumas.
+    """
+    
+    def __init__(self, empleados: Empleados, costos: Optional[Costos] = None):
+        """
+        Inicializa el agregado.
+        
+        Args:
+            empleados: Lista de empleados o EmpleadoRegistry usado para
+                asignar el departamento de cada costo
+            costos: Costos iniciales (opcional)
+        """
+        self._empleados = empleados
+        self._emp_dict = _indice_empleados(empleados)
+        
+        self._periodos: Dict[str, Dict[str, Any]] = {}
+        self._departamentos: Dict[str, Dict[str, Any]] = {}
+        # Registros por empleado dentro de cada departamento, para contar
+        # empleados únicos aun cuando se retiran costos
+        self._registros_por_dept: Dict[str, Dict[str, int]] = {}
+        # Departamento con el que se agregaron los costos de cada empleado
+        self._dept_asignado: Dict[str, str] = {}
+        self._totales = {campo: 0.0 for campo in CAMPOS_TOTALES}
+        self._num_registros = 0
+        
+        if costos is not None:
+            self.agregar(costos)
+    
+    @property
+    def cantidad_registros(self) -> int:
+        """Cantidad de registros de costo acumulados."""
+        return self._num_registros
+    
+    def agregar(self, costos: Costos) -> None:
+        """
+        Incorpora costos nuevos a los agregados.
+        
+        Args:
+            costos: Lista de costos de personal o CostoPersonalBatch
+        """
+        self._aplicar(como_lote(costos), 1)
+    
+    def retirar(self, costos: Costos) -> None:
+        """
+        Quita costos previamente agregados (por ejemplo, para corregirlos).
+        
+        Args:
+            costos: Lista de costos de personal o CostoPersonalBatch
+            
+        Raises:
+            ValueError: Si se retiran más registros de los agregados para un
+                periodo o empleado. En ese caso los agregados no se modifican.
+        """
+        self._aplicar(como_lote(costos), -1)
+    
+    def reporte_por_departamento(self) -> pd.DataFrame:
+        """Equivalente a GeneradorReportes.generar_reporte_por_departamento."""
+        dept_data = {}
+        for dept, sumas in self._departamentos.items():
+            metrics = dict(sumas)
+            metrics["cantidad_empleados"] = len(self._registros_por_dept[dept])
+            dept_data[dept] = metrics
+        return _construir_reporte_departamento(dept_data)
+    
+    def reporte_tendencia(self) -> pd.DataFrame:
+        """Equivalente a GeneradorReportes.generar_reporte_tendencia."""
+        return _construir_reporte_tendencia(
+            {periodo: dict(sumas) for periodo, sumas in self._periodos.items()}
+        )
+    
+    def metricas_clave(self) -> Dict[str, Any]:
+        """Equivalente a GeneradorReportes.generar_metricas_clave."""
+        return _construir_metricas_clave(
+            _contar_activos(self._empleados), dict(self._totales), self._num_registros
+        )
+    
+    def _departamento_de(self, empleado_id: str) -> Optional[str]:
+        """Departamento al que se asignan los costos de un empleado."""
+        dept = self._dept_asignado.get(empleado_id)
+        if dept is None:
+            empleado = self._emp_dict.get(empleado_id)
+            if empleado:
+                dept = empleado.departamento
+        return dept
+    
+    def _aplicar(self, lote: CostoPersonalBatch, signo: int) -> None:
+        """Suma (signo=1) o resta (signo=-1) un lote a los agregados."""
+        if len(lote) == 0:
+            return
+        
+        costo_total = lote.costo_total
+        columnas = {
+            "costo_total": costo_total,
+            "salario_base": lote.salario_base,
+            "bonos": lote.bonos,
+            "horas_extra": lote.horas_extra,
+            "beneficios": lote.beneficios,
+            "cargas_sociales": lote.cargas_sociales,
+        }
+        
+        # Sumas por periodo
+        periodos, codigo_periodo = agrupar(lote.periodo)
+        registros_periodo = np.bincount(codigo_periodo, minlength=len(periodos))
+        
+        # Registros por empleado y su departamento
+        ids, codigo_id = agrupar(lote.empleado_id)
+        registros_id = np.bincount(codigo_id, minlength=len(ids))
+        depts_id = [self._departamento_de(emp_id) for emp_id in ids]
+        
+        if signo < 0:
+            self._validar_retiro(periodos, registros_periodo, ids, registros_id, depts_id)
+        
+        self._num_registros += signo * len(lote)
+        for campo in CAMPOS_TOTALES:
+            self._totales[campo] += signo * float(columnas[campo].sum())
+        
+        sumas_periodo = {
+            campo: np.bincount(codigo_periodo, weights=columnas[origen], minlength=len(periodos))
+            for campo, origen in CAMPOS_PERIODO
+        }
+        for k, periodo in enumerate(periodos):
+            actual = self._periodos.get(periodo)
+            if actual is None:
+                actual = self._periodos[periodo] = {"cantidad_registros": 0}
+                actual.update({campo: 0.0 for campo, _ in CAMPOS_PERIODO})
+            actual["cantidad_registros"] += signo * int(registros_periodo[k])
+            if actual["cantidad_registros"] == 0:
+                del self._periodos[periodo]
+                continue
+            for campo, _ in CAMPOS_PERIODO:
+                actual[campo] += signo * float(sumas_periodo[campo][k])
+        
+        # Sumas por departamento
+        codigos_dept: Dict[str, int] = {}
+        dept_por_id = np.empty(len(ids), dtype=np.intp)
+        for k, dept in enumerate(depts_id):
+            dept_por_id[k] = -1 if dept is None else codigos_dept.setdefault(dept, len(codigos_dept))
+        
+        dept_fila = dept_por_id[codigo_id]
+        validas = dept_fila >= 0
+        sumas_dept = {
+            campo: np.bincount(
+                dept_fila[validas],
+                weights=columnas[origen][validas],
+                minlength=len(codigos_dept),
+            )
+            for campo, origen in CAMPOS_DEPARTAMENTO
+        }
+        
+        for k, (emp_id, dept) in enumerate(zip(ids, depts_id)):
+            if dept is None:
+                continue
+            registros = self._registros_por_dept.setdefault(dept, {})
+            n = registros.get(emp_id, 0) + signo * int(registros_id[k])
+            if n > 0:
+                registros[emp_id] = n
+                self._dept_asignado[emp_id] = dept
+            else:
+                registros.pop(emp_id, None)
+                self._dept_asignado.pop(emp_id, None)
+        
+        for dept, k in codigos_dept.items():
+            if not self._registros_por_dept.get(dept):
+                self._registros_por_dept.pop(dept, None)
+                self._departamentos.pop(dept, None)
+                continue
+            actual = self._departamentos.get(dept)
+            if actual is None:
+                actual = self._departamentos[dept] = {
+                    campo: 0.0 for campo, _ in CAMPOS_DEPARTAMENTO
+                }
+            for campo, _ in CAMPOS_DEPARTAMENTO:
+                actual[campo] += signo * float(sumas_dept[campo][k])
+    
+    def _validar_retiro(
+        self,
+        periodos: np.ndarray,
+        registros_periodo: np.ndarray,
+        ids: np.ndarray,
+        registros_id: np.ndarray,
+        depts_id: List[Optional[str]],
+    ) -> None:
+        """Verifica que los registros a retirar hayan sido agregados."""
+        for periodo, n in zip(periodos, registros_periodo):
+            actual = self._periodos.get(periodo, {}).get("cantidad_registros", 0)
+            if n > actual:
+                raise ValueError(
+                    f"No se pueden retirar {n} registros del periodo '{periodo}' "
+                    f"(hay {actual})"
+                )
+        for emp_id, n, dept in zip(ids, registros_id, depts_id):
+            if dept is None:
+                continue
+            actual = self._registros_por_dept.get(dept, {}).get(emp_id, 0)
+            if n > actual:
+                raise ValueError(
+                    f"No se pueden retirar {n} registros del empleado '{emp_id}' "
+                    f"(hay {actual})"
+                )
+
+
+@dataclass
+class AgregadoParcial:
+    """
+    Sumas parciales de un fragmento de costos (un archivo, un país, un mes).
+    
+    Los parciales se calculan por separado con ``desde_costos``, se combinan
+    con ``combinar`` (la operación es asociativa y el parcial vacío es su
+    neutro) y se finalizan en los mismos reportes que GeneradorReportes
+    sobre todos los costos, salvo diferencias de redondeo por el orden de
+    las sumas. Los departamentos y periodos conservan el orden de primera
+    aparición de los fragmentos combinados.
+    
+    Las cantidades de empleados por departamento se cuentan con los
+    conjuntos exactos de IDs, por lo que un empleado presente en varios
+    fragmentos se cuenta una sola vez. Los parciales se pueden enviar entre
+    procesos con pickle o guardar como JSON con ``to_dict``/``from_dict``.
+    """
+    
+    periodos: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    departamentos: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    empleados_por_departamento: Dict[str, Set[str]] = field(default_factory=dict)
+    totales: Dict[str, float] = field(
+        default_factory=lambda: {campo: 0.0 for campo in CAMPOS_TOTALES}
+    )
+    cantidad_registros: int = 0
+    
+    @classmethod
+    def desde_costos(cls, empleados: Empleados, costos: Costos) -> "AgregadoParcial":
+        """
+        Calcula el agregado parcial de un fragmento de costos.
+        
+        Args:
+            empleados: Lista de empleados o EmpleadoRegistry usado para
+                asignar el departamento de cada costo
+            costos: Lista de costos de personal o CostoPersonalBatch
+            
+        Returns:
+            Agregado parcial del fragmento
+        """
+        lote = como_lote(costos)
+        if len(lote) == 0:
+            return cls()
+        
+        emp_dict = _indice_empleados(empleados)
+        costo_total = lote.costo_total
+        
+        departamentos = _agregar_departamentos_lote(emp_dict, lote, costo_total)
+        for sumas in departamentos.values():
+            del sumas["cantidad_empleados"]
+        
+        empleados_por_departamento: Dict[str, Set[str]] = {}
+        ids, _ = agrupar(lote.empleado_id)
+        for emp_id in ids:
+            empleado = emp_dict.get(emp_id)
+            if empleado:
+                empleados_por_departamento.setdefault(empleado.departamento, set()).add(emp_id)
+        
+        return cls(
+            periodos=_agregar_periodos_lote(lote, costo_total),
+            departamentos=departamentos,
+            empleados_por_departamento=empleados_por_departamento,
+            totales=_totales_lote(lote, costo_total),
+            cantidad_registros=len(lote),
+        )
+    
+    def combinar(self, otro: "AgregadoParcial") -> "AgregadoParcial":
+        """
+        Combina dos agregados parciales sin modificarlos.
+        
+        Args:
+            otro: Agregado parcial de otro fragmento
+            
+        Returns:
+            Agregado parcial de ambos fragmentos
+        """
+        return AgregadoParcial(
+            periodos=_sumar_por_clave(self.periodos, otro.periodos),
+            departamentos=_sumar_por_clave(self.departamentos, otro.departamentos),
+            empleados_por_departamento={
+                dept: self.empleados_por_departamento.get(dept, set())
+                | otro.empleados_por_departamento.get(dept, set())
+                for dept in {**self.empleados_por_departamento, **otro.empleados_por_departamento}
+            },
+            totales={
+                campo: self.totales[campo] + otro.totales[campo]
+                for campo in CAMPOS_TOTALES
+            },
+            cantidad_registros=self.cantidad_registros + otro.cantidad_registros,
+        )
+    
+    def reporte_por_departamento(self) -> pd.DataFrame:
+        """Equivalente a GeneradorReportes.generar_reporte_por_departamento."""
+        return _construir_reporte_departamento({
+            dept: {
+                "cantidad_empleados": len(self.empleados_por_departamento[dept]),
+                **sumas,
+            }
+            for dept, sumas in self.departamentos.items()
+        })
+    
+    def reporte_tendencia(self) -> pd.DataFrame:
+        """Equivalente a GeneradorReportes.generar_reporte_tendencia."""
+        return _construir_reporte_tendencia(
+            {periodo: dict(sumas) for periodo, sumas in self.periodos.items()}
+        )
+    
+    def metricas_clave(self, empleados: Empleados) -> Dict[str, Any]:
+        """
+        Equivalente a GeneradorReportes.generar_metricas_clave.
+        
+        Args:
+            empleados: Nómina completa (para contar los empleados activos)
+        """
+        return _construir_metricas_clave(
+            _contar_activos(empleados), dict(self.totales), self.cantidad_registros
+        )
+    
+    def paquete_reportes(self, empleados: Empleados) -> Dict[str, Any]:
+        """Equivalente a GeneradorReportes.generar_paquete_reportes."""
+        return {
+            "por_departamento": self.reporte_por_departamento(),
+            "metricas_clave": self.metricas_clave(empleados),
+            "tendencia": self.reporte_tendencia(),
+        }
+    
+    def costo_promedio_por_empleado(self) -> float:
+        """Equivalente a CalculadoraCostos.calcular_costo_promedio_por_empleado."""
+        if self.cantidad_registros == 0:
+            return 0.0
+        return self.totales["costo_total"] / self.cantidad_registros
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convierte el agregado a un diccionario serializable como JSON."""
+        return {
+            "periodos": {k: dict(v) for k, v in self.periodos.items()},
+            "departamentos": {k: dict(v) for k, v in self.departamentos.items()},
+            "empleados_por_departamento": {
+                k: sorted(v) for k, v in self.empleados_por_departamento.items()
+            },
+            "totales": dict(self.totales),
+            "cantidad_registros": self.cantidad_registros,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AgregadoParcial":
+        """Reconstruye un agregado a partir de ``to_dict``."""
+        return cls(
+            periodos={k: dict(v) for k, v in data["periodos"].items()},
+            departamentos={k: dict(v) for k, v in data["departamentos"].items()},
+            empleados_por_departamento={
+                k: set(v) for k, v in data["empleados_por_departamento"].items()
+            },
+            totales=dict(data["totales"]),
+            cantidad_registros=int(data["cantidad_registros"]),
+        )
+
+
+class AgregadoFlujo:
+    """
+    Reportes acumulados a partir de una nómina que llega por fragmentos.
+    
+    Cada fragmento aporta sus empleados y los costos calculados para ellos;
+    solo se guardan sumas por periodo y por departamento, de modo que la
+    memoria no depende de la cantidad total de empleados. A diferencia de
+    AgregadoParcial, las cantidades de empleados por departamento se suman
+    entre fragmentos, por lo que cada empleado debe aparecer en un solo
+    fragmento. Los resultados coinciden con los de GeneradorReportes sobre
+    la nómina y los costos completos salvo diferencias de redondeo por el
+    orden de las sumas.
+    """
+    
+    def __init__(self):
+        """Inicializa un agregado vacío."""
+        self._periodos: Dict[str, Dict[str, Any]] = {}
+        self._departamentos: Dict[str, Dict[str, Any]] = {}
+        self._totales = {campo: 0.0 for campo in CAMPOS_TOTALES}
+        self._num_registros = 0
+        self.cantidad_empleados = 0
+        self.cantidad_activos = 0
+    
+    @property
+    def cantidad_registros(self) -> int:
+        """Cantidad de registros de costo acumulados."""
+        return self._num_registros
+    
+    def agregar(self, empleados: Sequence[Empleado], costos: Costos) -> None:
+        """
+        Incorpora un fragmento de la nómina.
+        
+        Args:
+            empleados: Empleados del fragmento (todos cuentan para
+                ``total_empleados`` si están activos, tengan o no costos)
+            costos: Costos de los empleados del fragmento
+        """
+        self.cantidad_empleados += len(empleados)
+        self.cantidad_activos += sum(1 for emp in empleados if emp.activo)
+        
+        lote = como_lote(costos)
+        if len(lote) == 0:
+            return
+        
+        costo_total = lote.costo_total
+        emp_dict = {emp.id: emp for emp in empleados}
+        self._departamentos = _sumar_por_clave(
+            self._departamentos, _agregar_departamentos_lote(emp_dict, lote, costo_total)
+        )
+        self._periodos = _sumar_por_clave(
+            self._periodos, _agregar_periodos_lote(lote, costo_total)
+        )
+        for campo, valor in _totales_lote(lote, costo_total).items():
+            self._totales[campo] += valor
+        self._num_registros += len(lote)
+    
+    def reporte_por_departamento(self) -> pd.DataFrame:
+        """Equivalente a GeneradorReportes.generar_reporte_por_departamento."""
+        return _construir_reporte_departamento(
+            {dept: dict(sumas) for dept, sumas in self._departamentos.items()}
+        )
+    
+    def reporte_tendencia(self) -> pd.DataFrame:
+        """Equivalente a GeneradorReportes.generar_reporte_tendencia."""
+        return _construir_reporte_tendencia(
+            {periodo: dict(sumas) for periodo, sumas in self._periodos.items()}
+        )
+    
+    def metricas_clave(self) -> Dict[str, Any]:
+        """Equivalente a GeneradorReportes.generar_metricas_clave."""
+        return _construir_metricas_clave(
+            self.cantidad_activos, dict(self._totales), self._num_registros
+        )
+    
+    def paquete_reportes(self) -> Dict[str, Any]:
+        """Equivalente a GeneradorReportes.generar_paquete_reportes."""
+        return {
+            "por_departamento": self.reporte_por_departamento(),
+            "metricas_clave": self.metricas_clave(),
+            "tendencia": self.reporte_tendencia(),
+        }
+
+
+def combinar_parciales(parciales: Iterable[AgregadoParcial]) -> AgregadoParcial:
+    """
+    Combina una secuencia de agregados parciales en orden.
+    
+    Args:
+        parciales: Agregados parciales (por ejemplo, los resultados de un
+            ProcessPoolExecutor.map sobre archivos)
+            
+    Returns:
+        Agregado parcial combinado (vacío si no hay parciales)
+    """
+    return reduce(AgregadoParcial.combinar, parciales, AgregadoParcial())
+
+
+def _sumar_por_clave(
+    a: Dict[str, Dict[str, Any]],
+    b: Dict[str, Dict[str, Any]],
+) -> Dict[str, Dict[str, Any]]:
+    """Suma campo a campo dos diccionarios de sumas, en orden de aparición."""
+    resultado = {clave: dict(sumas) for clave, sumas in a.items()}
+    for clave, sumas in b.items():
+        actual = resultado.get(clave)
+        if actual is None:
+            resultado[clave] = dict(sumas)
+        else:
+            for campo, valor in sumas.items():
+                actual[campo] += valor
+    return resultado
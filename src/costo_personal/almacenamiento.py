@@ -0,0 +1,285 @@
+"""
+Persistencia columnar del historial de costos y de la nómina.
+
+Los costos se guardan en Parquet particionados por periodo
+(``costos/periodo=YYYY-MM/parte-00000.parquet``), de modo que las lecturas
+por rango de periodos solo abren las particiones necesarias. Requiere
+``pyarrow`` (``pip install costo_personal[parquet]``).
+"""
+
+import os
+import shutil
+from typing import Iterable, List, Optional, Sequence
+import numpy as np
+import pandas as pd
+from .models import Empleado
+from .lote import CAMPOS, CAMPOS_MONTO, CostoPersonalBatch, agrupar, como_lote
+from .reportes import Costos
+from .periodos import Periodo
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - depende del entorno
+    pa = None
+    pq = None
+
+
+MODOS = ("reemplazar", "agregar")
+
+PREFIJO_PARTICION = "periodo="
+
+
+def _requerir_pyarrow() -> None:
+    """Verifica que pyarrow esté instalado."""
+    if pa is None:
+        raise ImportError(
+            "El almacenamiento Parquet requiere pyarrow: "
+            "pip install costo_personal[parquet]"
+        )
+
+
+def _escribir_tabla(tabla: "pa.Table", ruta: str) -> None:
+    """Escribe una tabla Parquet de forma atómica."""
+    temporal = ruta + ".tmp"
+    pq.write_table(tabla, temporal)
+    os.replace(temporal, ruta)
+
+
+def _reemplazar_particion(tabla: "pa.Table", directorio: str) -> None:
+    """
+    Reemplaza una partición por una nueva con una sola tabla.
+    
+    La tabla se escribe primero en un directorio hermano oculto (que
+    ``periodos`` no lista) y luego se intercambia con la partición anterior
+    mediante renombres, así que si la escritura falla la partición anterior
+    queda intacta.
+    """
+    padre, nombre = os.path.split(directorio)
+    nuevo = os.path.join(padre, f".nuevo-{nombre}")
+    anterior = os.path.join(padre, f".anterior-{nombre}")
+    for residuo in (nuevo, anterior):
+        if os.path.isdir(residuo):
+            shutil.rmtree(residuo)
+    
+    os.makedirs(nuevo)
+    try:
+        _escribir_tabla(tabla, os.path.join(nuevo, "parte-00000.parquet"))
+    except BaseException:
+        shutil.rmtree(nuevo, ignore_errors=True)
+        raise
+    
+    if os.path.isdir(directorio):
+        os.rename(directorio, anterior)
+    os.rename(nuevo, directorio)
+    shutil.rmtree(anterior, ignore_errors=True)
+
+
+class AlmacenCostos:
+    """Almacén en disco de costos (particionados por periodo) y empleados."""
+    
+    def __init__(self, ruta: str):
+        """
+        Inicializa el almacén.
+        
+        Args:
+            ruta: Directorio raíz del almacén (se crea si no existe)
+        """
+        _requerir_pyarrow()
+        self.ruta = ruta
+        self._ruta_costos = os.path.join(ruta, "costos")
+        self._ruta_empleados = os.path.join(ruta, "empleados.parquet")
+        os.makedirs(self._ruta_costos, exist_ok=True)
+    
+    def periodos(self) -> List[str]:
+        """Devuelve los periodos guardados, en orden ascendente."""
+        return sorted(
+            nombre[len(PREFIJO_PARTICION):]
+            for nombre in os.listdir(self._ruta_costos)
+            if nombre.startswith(PREFIJO_PARTICION)
+        )
+    
+    def guardar_costos(self, costos: Costos, modo: str = "reemplazar") -> List[str]:
+        """
+        Guarda costos en la partición de su periodo.
+        
+        Args:
+            costos: Lista de costos de personal o CostoPersonalBatch
+            modo: "reemplazar" sustituye las particiones de los periodos
+                recibidos; "agregar" añade un archivo nuevo a cada partición
+                
+        Returns:
+            Periodos escritos
+            
+        Raises:
+            ValueError: Si el modo no es válido
+        """
+        if modo not in MODOS:
+            raise ValueError(f"Modo inválido: '{modo}'. Opciones: {', '.join(MODOS)}")
+        
+        lote = como_lote(costos)
+        periodos, codigo = agrupar(lote.periodo, ordenar=True)
+        orden = np.argsort(codigo, kind="stable")
+        limites = np.searchsorted(codigo[orden], np.arange(len(periodos) + 1))
+        
+        directorios = [self._ruta_particion(periodo) for periodo in periodos]
+        for k, directorio in enumerate(directorios):
+            tabla = _lote_a_tabla(lote[orden[limites[k]:limites[k + 1]]])
+            if modo == "reemplazar":
+                _reemplazar_particion(tabla, directorio)
+                continue
+            os.makedirs(directorio, exist_ok=True)
+            parte = len([n for n in os.listdir(directorio) if n.endswith(".parquet")])
+            _escribir_tabla(tabla, os.path.join(directorio, f"parte-{parte:05d}.parquet"))
+        
+        return list(periodos)
+    
+    def eliminar_periodo(self, periodo: str) -> None:
+        """Elimina la partición de un periodo, si existe."""
+        directorio = self._ruta_particion(periodo)
+        if os.path.isdir(directorio):
+            shutil.rmtree(directorio)
+    
+    def leer_dataframe(
+        self,
+        desde: Optional[str] = None,
+        hasta: Optional[str] = None,
+        columnas: Optional[Sequence[str]] = None,
+        ultimos: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Lee costos como DataFrame leyendo solo las particiones y columnas
+        pedidas.
+        
+        Args:
+            desde: Primer periodo a incluir ("YYYY-MM"), inclusive
+            hasta: Último periodo a incluir ("YYYY-MM"), inclusive
+            columnas: Columnas a leer (por defecto todas)
+            ultimos: Si se indica, solo los últimos N periodos del rango
+            
+        Returns:
+            DataFrame con los costos, ordenado por periodo
+        """
+        columnas = list(columnas) if columnas is not None else list(CAMPOS)
+        tablas = [
+            pq.read_table(archivo, columns=columnas)
+            for archivo in self._archivos(desde, hasta, ultimos)
+        ]
+        if not tablas:
+            return pd.DataFrame({col: pd.Series(dtype=_tipo_vacio(col)) for col in columnas})
+        return pa.concat_tables(tablas).to_pandas()
+    
+    def leer_costos(
+        self,
+        desde: Optional[str] = None,
+        hasta: Optional[str] = None,
+        ultimos: Optional[int] = None,
+    ) -> CostoPersonalBatch:
+        """
+        Lee costos directamente en un CostoPersonalBatch.
+        
+        Args:
+            desde: Primer periodo a incluir ("YYYY-MM"), inclusive
+            hasta: Último periodo a incluir ("YYYY-MM"), inclusive
+            ultimos: Si se indica, solo los últimos N periodos del rango
+            
+        Returns:
+            CostoPersonalBatch con los costos, ordenado por periodo
+        """
+        tablas = [
+            pq.read_table(archivo, columns=list(CAMPOS))
+            for archivo in self._archivos(desde, hasta, ultimos)
+        ]
+        if not tablas:
+            return CostoPersonalBatch.vacio()
+        
+        tabla = pa.concat_tables(tablas).combine_chunks()
+        columnas = {
+            campo: tabla.column(campo).to_numpy(zero_copy_only=False)
+            for campo in CAMPOS_MONTO
+        }
+        for campo in ("empleado_id", "periodo"):
+            columnas[campo] = np.asarray(
+                tabla.column(campo).to_pylist(), dtype=object
+            )
+        return CostoPersonalBatch(**columnas)
+    
+    def guardar_empleados(self, empleados: Iterable[Empleado]) -> None:
+        """
+        Guarda la nómina completa, reemplazando la anterior.
+        
+        Args:
+            empleados: Lista de empleados o EmpleadoRegistry
+        """
+        empleados = list(empleados)
+        tabla = pa.table({
+            "id": pa.array([e.id for e in empleados], type=pa.string()),
+            "nombre": pa.array([e.nombre for e in empleados], type=pa.string()),
+            "departamento": pa.array([e.departamento for e in empleados], type=pa.string()),
+            "cargo": pa.array([e.cargo for e in empleados], type=pa.string()),
+            "salario_base": pa.array([e.salario_base for e in empleados], type=pa.float64()),
+            "fecha_ingreso": pa.array([e.fecha_ingreso for e in empleados], type=pa.date32()),
+            "activo": pa.array([e.activo for e in empleados], type=pa.bool_()),
+        })
+        _escribir_tabla(tabla, self._ruta_empleados)
+    
+    def leer_empleados(self) -> List[Empleado]:
+        """
+        Lee la nómina guardada.
+        
+        Returns:
+            Lista de empleados (vacía si no se guardó ninguna)
+        """
+        if not os.path.exists(self._ruta_empleados):
+            return []
+        tabla = pq.read_table(self._ruta_empleados)
+        return [Empleado(**fila) for fila in tabla.to_pylist()]
+    
+    def _ruta_particion(self, periodo: str) -> str:
+        """
+        Directorio de la partición de un periodo.
+        
+        Raises:
+            ValueError: Si ``periodo`` no es un periodo válido ("YYYY-MM")
+        """
+        return os.path.join(self._ruta_costos, f"{PREFIJO_PARTICION}{Periodo(periodo)}")
+    
+    def _archivos(
+        self,
+        desde: Optional[str],
+        hasta: Optional[str],
+        ultimos: Optional[int],
+    ) -> List[str]:
+        """Archivos de las particiones dentro del rango, en orden de periodo."""
+        periodos = [
+            p for p in self.periodos()
+            if (desde is None or p >= desde) and (hasta is None or p <= hasta)
+        ]
+        if ultimos is not None:
+            periodos = periodos[-ultimos:] if ultimos > 0 else []
+        
+        archivos = []
+        for periodo in periodos:
+            directorio = self._ruta_particion(periodo)
+            archivos.extend(
+                os.path.join(directorio, nombre)
+                for nombre in sorted(os.listdir(directorio))
+                if nombre.endswith(".parquet")
+            )
+        return archivos
+
+
+def _lote_a_tabla(lote: CostoPersonalBatch) -> "pa.Table":
+    """Convierte un lote de costos a una tabla Arrow."""
+    data = {
+        "empleado_id": pa.array(lote.empleado_id.tolist(), type=pa.string()),
+        "periodo": pa.array(lote.periodo.tolist(), type=pa.string()),
+    }
+    for campo in CAMPOS_MONTO:
+        data[campo] = pa.array(getattr(lote, campo), type=pa.float64())
+    return pa.table(data)
+
+
+def _tipo_vacio(columna: str) -> str:
+    """Tipo de una columna para un DataFrame vacío."""
+    return "float64" if columna in CAMPOS_MONTO else "object"
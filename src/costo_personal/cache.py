@@ -0,0 +1,239 @@
+"""
+Caché de resultados de reportes direccionada por contenido.
+
+Las entradas se identifican con una huella (hash) de los datos de entrada,
+de modo que cualquier cambio en los empleados o en los costos (por ejemplo,
+otra tasa de cargas sociales o una fila editada) produce una clave distinta.
+La huella debe costar mucho menos que el reporte: los lotes y arreglos se
+resumen a partir de los bytes de sus columnas y un EmpleadoRegistry por su
+versión, mientras que las listas de objetos (que habría que recorrer en
+Python en cada consulta) no se guardan en la caché.
+"""
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import numpy as np
+import pandas as pd
+from .models import CostoPersonal, CostoPersonalCompacto, Empleado, EmpleadoCompacto
+from .lote import CAMPOS, CostoPersonalBatch
+from .instrumentacion import contar
+from .registro import EmpleadoRegistry
+
+
+def huella(*objetos: Any) -> str:
+    """
+    Calcula una huella del contenido de los objetos.
+    
+    Soporta CostoPersonalBatch, arreglos NumPy, listas de CostoPersonal o
+    Empleado, DataFrames y valores simples. Un EmpleadoRegistry se resume
+    por su versión (ver EmpleadoRegistry.version), no por su contenido.
+    
+    Args:
+        *objetos: Objetos a incluir en la huella
+        
+    Returns:
+        Digest hexadecimal
+    """
+    h = hashlib.blake2b(digest_size=20)
+    for obj in objetos:
+        _actualizar_huella(h, obj)
+    return h.hexdigest()
+
+
+def _actualizar_huella(h: "hashlib._Hash", obj: Any) -> None:
+    """Agrega el contenido de un objeto a la huella ``h``."""
+    if isinstance(obj, CostoPersonalBatch):
+        h.update(b"lote")
+        h.update(len(obj).to_bytes(8, "little"))
+        h.update(repr(obj.moneda).encode("utf-8"))
+        for campo in CAMPOS:
+            columna = getattr(obj, campo)
+            if columna.dtype == object:
+                h.update("\x00".join(map(str, columna)).encode("utf-8"))
+            else:
+                h.update(np.ascontiguousarray(columna).tobytes())
+            h.update(b"\x1f")
+    elif isinstance(obj, np.ndarray):
+        h.update(b"arr")
+        h.update(f"{obj.dtype.str}{obj.shape}".encode("utf-8"))
+        if obj.dtype == object:
+            h.update("\x00".join(map(str, obj.ravel())).encode("utf-8"))
+        else:
+            h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, pd.DataFrame):
+        h.update(b"df")
+        h.update(repr(list(obj.columns)).encode("utf-8"))
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, EmpleadoRegistry):
+        h.update(b"registro")
+        h.update(obj.version.to_bytes(8, "little"))
+    elif isinstance(obj, (list, tuple)):
+        if obj and isinstance(obj[0], (CostoPersonal, CostoPersonalCompacto)):
+            _actualizar_huella(h, CostoPersonalBatch.from_costos(obj))
+        elif obj and isinstance(obj[0], (Empleado, EmpleadoCompacto)):
+            h.update(b"empleados")
+            _actualizar_huella_empleados(h, obj)
+        else:
+            h.update(b"seq")
+            h.update(len(obj).to_bytes(8, "little"))
+            for item in obj:
+                _actualizar_huella(h, item)
+    else:
+        h.update(b"val")
+        h.update(repr(obj).encode("utf-8"))
+    h.update(b"\x1e")
+
+
+def _huella_costosa(obj: Any) -> bool:
+    """Indica si la huella de ``obj`` exige recorrer objetos en Python."""
+    return isinstance(obj, (list, tuple)) and bool(obj) and isinstance(
+        obj[0], (CostoPersonal, CostoPersonalCompacto, Empleado, EmpleadoCompacto)
+    )
+
+
+def _actualizar_huella_empleados(h: "hashlib._Hash", empleados: Any) -> None:
+    """Agrega todos los campos de cada empleado a la huella ``h``."""
+    for e in empleados:
+        fecha = e.fecha_ingreso.isoformat() if isinstance(e.fecha_ingreso, date) else e.fecha_ingreso
+        h.update(
+            f"{e.id}\x00{e.nombre}\x00{e.departamento}\x00{e.cargo}\x00"
+            f"{e.salario_base!r}\x00{fecha}\x00{e.activo}\x1f".encode("utf-8")
+        )
+
+
+def _tamano(valor: Any) -> int:
+    """Estima los bytes que ocupa un resultado de reporte."""
+    if isinstance(valor, pd.DataFrame):
+        return int(valor.memory_usage(deep=True, index=True).sum())
+    if isinstance(valor, dict):
+        return sys.getsizeof(valor) + sum(_tamano(v) for v in valor.values())
+    return sys.getsizeof(valor)
+
+
+def _copiar(valor: Any) -> Any:
+    """Copia un resultado para que el llamador no modifique la entrada guardada."""
+    if isinstance(valor, pd.DataFrame):
+        return valor.copy()
+    if isinstance(valor, dict):
+        return {k: _copiar(v) for k, v in valor.items()}
+    return valor
+
+
+class CacheReportes:
+    """Caché LRU de resultados de reportes con límite de entradas y de memoria."""
+    
+    def __init__(self, max_entradas: int = 128, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Inicializa la caché.
+        
+        Args:
+            max_entradas: Cantidad máxima de resultados guardados
+            max_bytes: Memoria máxima estimada de los resultados guardados
+        """
+        if max_entradas < 1 or max_bytes < 1:
+            raise ValueError("Los límites de la caché deben ser positivos")
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        
+        self._entradas: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._aciertos = 0
+        self._fallos = 0
+        self._desalojos = 0
+        self._lock = threading.Lock()
+    
+    def clave(self, metodo: str, *argumentos: Any) -> Optional[Tuple[str, str]]:
+        """
+        Construye la clave de un resultado a partir de sus entradas.
+        
+        Args:
+            metodo: Nombre del reporte
+            *argumentos: Entradas y opciones que afectan al resultado
+            
+        Returns:
+            Clave (metodo, huella), o None si algún argumento es una lista de
+            empleados o de costos: su huella cuesta tanto como el reporte,
+            así que esas consultas se calculan sin caché
+        """
+        if any(_huella_costosa(argumento) for argumento in argumentos):
+            return None
+        return (metodo, huella(*argumentos))
+    
+    def obtener_o_calcular(self, clave: Hashable, calcular: Callable[[], Any]) -> Any:
+        """
+        Devuelve el resultado guardado para ``clave`` o lo calcula y guarda.
+        
+        Args:
+            clave: Clave del resultado
+            calcular: Función que calcula el resultado si no está guardado
+            
+        Returns:
+            Copia del resultado
+        """
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is not None:
+                self._entradas.move_to_end(clave)
+                self._aciertos += 1
+                contar("cache_reportes.aciertos")
+                return _copiar(entrada[0])
+            self._fallos += 1
+            contar("cache_reportes.fallos")
+        
+        valor = calcular()
+        self.guardar(clave, valor)
+        return _copiar(valor)
+    
+    def guardar(self, clave: Hashable, valor: Any) -> None:
+        """
+        Guarda un resultado, desalojando los menos usados si hace falta.
+        
+        Los resultados más grandes que ``max_bytes`` no se guardan.
+        """
+        tamano = _tamano(valor)
+        if tamano > self.max_bytes:
+            return
+        
+        with self._lock:
+            anterior = self._entradas.pop(clave, None)
+            if anterior is not None:
+                self._bytes -= anterior[1]
+            self._entradas[clave] = (valor, tamano)
+            self._bytes += tamano
+            
+            while len(self._entradas) > self.max_entradas or self._bytes > self.max_bytes:
+                _, (_, tamano_desalojado) = self._entradas.popitem(last=False)
+                self._bytes -= tamano_desalojado
+                self._desalojos += 1
+    
+    def limpiar(self) -> None:
+        """Elimina todas las entradas (las estadísticas se conservan)."""
+        with self._lock:
+            self._entradas.clear()
+            self._bytes = 0
+    
+    def estadisticas(self) -> Dict[str, Any]:
+        """
+        Devuelve las estadísticas de uso de la caché.
+        
+        Returns:
+            Diccionario con aciertos, fallos, desalojos, entradas, bytes y
+            tasa de aciertos
+        """
+        with self._lock:
+            consultas = self._aciertos + self._fallos
+            return {
+                "aciertos": self._aciertos,
+                "fallos": self._fallos,
+                "desalojos": self._desalojos,
+                "entradas": len(self._entradas),
+                "bytes": self._bytes,
+                "tasa_aciertos": self._aciertos / consultas if consultas > 0 else 0.0,
+            }
+    
+    def __len__(self) -> int:
+        return len(self._entradas)
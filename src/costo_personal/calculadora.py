@@ -2,21 +2,54 @@
 Calculadora de costos de personal.
 """
 
-from typing import List, Dict
+from datetime import date
+from decimal import Decimal
+from typing import Any, List, Dict, Mapping, Optional, Sequence, Union
+import numpy as np
 from .models import Empleado, CostoPersonal
+from .lote import CostoPersonalBatch
+from .registro import EmpleadoRegistry
+from .cargas import AtributosCargas, ReglasCargas, compilar
+from .dinero import Moneda
+from .prorrateo import Prorrateo, ordinales
+from .paralelo import CONCEPTOS, TAMANO_FRAGMENTO, calcular_costos_paralelo
+from .proyeccion import AjustesProyeccion, proyectar_costos
+from .historial import HistorialEmpleados, calcular_costos_historial
+from .instrumentacion import medido
+
+
+ValoresPorEmpleado = Optional[Union[float, Sequence[float], np.ndarray, Mapping[str, float]]]
 
 
 class CalculadoraCostos:
     """Calcula los costos de personal según diferentes parámetros."""
     
-    def __init__(self, tasa_cargas_sociales: float = 0.25):
+    def __init__(
+        self,
+        tasa_cargas_sociales: float = 0.25,
+        reglas_cargas: Optional[ReglasCargas] = None,
+        moneda: Optional[Moneda] = None,
+        prorrateo: Optional[Prorrateo] = None,
+    ):
         """
         Inicializa la calculadora.
         
         Args:
             tasa_cargas_sociales: Porcentaje de cargas sociales sobre el salario base
+            reglas_cargas: Reglas de cargas sociales (tramos, topes,
+                excepciones por departamento o cargo). Si se indican,
+                reemplazan a ``tasa_cargas_sociales``
+            moneda: Si se indica, los montos se redondean a la unidad menor
+                (las cargas sociales se calculan sobre el salario ya
+                redondeado) y los lotes se devuelven en unidades menores int64
+            prorrateo: Si se indica, el salario base de los meses de ingreso
+                y de egreso se prorratea por días corridos o hábiles (las
+                cargas sociales se calculan sobre el salario prorrateado)
         """
         self.tasa_cargas_sociales = tasa_cargas_sociales
+        self.reglas_cargas = reglas_cargas
+        self.moneda = moneda
+        self.prorrateo = prorrateo
     
     def calcular_costo_mensual(
         self,
@@ -26,6 +59,7 @@ class CalculadoraCostos:
         horas_extra: float = 0.0,
         beneficios: float = 0.0,
         otros_costos: float = 0.0,
+        egreso: Optional[date] = None,
     ) -> CostoPersonal:
         """
         Calcula el costo mensual de un empleado.
@@ -37,26 +71,284 @@ class CalculadoraCostos:
             horas_extra: Costo de horas extra
             beneficios: Beneficios adicionales
             otros_costos: Otros costos asociados
-            
+            egreso: Fecha de egreso (último día trabajado), usada con
+                ``prorrateo``
+                
         Returns:
-            CostoPersonal con el desglose completo
+            CostoPersonal con el desglose completo (con ``moneda``, montos
+            redondeados a la unidad menor)
         """
-        cargas_sociales = empleado.salario_base * self.tasa_cargas_sociales
+        salario_base = empleado.salario_base
+        fracciones = self.fracciones_trabajadas([empleado], [periodo], {empleado.id: egreso})
+        if fracciones is not None:
+            salario_base *= float(fracciones[0, 0])
+        
+        if self.reglas_cargas is None and self.moneda is None:
+            cargas_sociales = salario_base * self.tasa_cargas_sociales
+        else:
+            cargas_sociales = float(self.calcular_cargas_sociales(
+                np.array([salario_base]),
+                self.atributos_cargas([empleado]),
+                None if fracciones is None else fracciones[0],
+            )[0])
+        
+        montos = {
+            "salario_base": salario_base,
+            "bonos": bonos,
+            "horas_extra": horas_extra,
+            "beneficios": beneficios,
+            "otros_costos": otros_costos,
+        }
+        if self.moneda is not None:
+            montos = {campo: self.moneda.redondear(monto) for campo, monto in montos.items()}
         
         return CostoPersonal(
             empleado_id=empleado.id,
             periodo=periodo,
-            salario_base=empleado.salario_base,
-            bonos=bonos,
-            horas_extra=horas_extra,
-            beneficios=beneficios,
             cargas_sociales=cargas_sociales,
-            otros_costos=otros_costos,
+            **montos,
         )
     
+    @medido("calculadora.calcular_costos_lote", filas="resultado")
+    def calcular_costos_lote(
+        self,
+        empleados: Union[Sequence[Empleado], EmpleadoRegistry],
+        periodo: str,
+        bonos: ValoresPorEmpleado = None,
+        horas_extra: ValoresPorEmpleado = None,
+        beneficios: ValoresPorEmpleado = None,
+        otros_costos: ValoresPorEmpleado = None,
+        egresos: Optional[Mapping[str, date]] = None,
+    ) -> CostoPersonalBatch:
+        """
+        Calcula el costo mensual de muchos empleados en una sola pasada.
+        
+        Equivale a llamar a calcular_costo_mensual por cada empleado, pero
+        las cargas sociales y los totales se calculan con NumPy sobre toda
+        la nómina sin construir un CostoPersonal por empleado.
+        
+        Cada concepto variable puede ser un valor único para todos, un
+        arreglo alineado con ``empleados`` o un diccionario por ID de
+        empleado (los IDs ausentes reciben 0.0).
+        
+        Args:
+            empleados: Empleados a calcular (lista o EmpleadoRegistry)
+            periodo: Periodo en formato "YYYY-MM"
+            bonos: Bonos del periodo
+            horas_extra: Costo de horas extra
+            beneficios: Beneficios adicionales
+            otros_costos: Otros costos asociados
+            egresos: Fecha de egreso (último día trabajado) por ID de
+                empleado, usada con ``prorrateo``
+                
+        Returns:
+            CostoPersonalBatch con un registro por empleado, en el mismo
+            orden (en unidades menores si la calculadora tiene ``moneda``)
+        """
+        empleados = list(empleados)
+        ids = [emp.id for emp in empleados]
+        salario_base = np.fromiter(
+            (emp.salario_base for emp in empleados),
+            dtype=np.float64,
+            count=len(ids),
+        )
+        fracciones = self.fracciones_trabajadas(empleados, [periodo], egresos)
+        if fracciones is not None:
+            fracciones = fracciones[0]
+            salario_base = salario_base * fracciones
+        
+        return self._en_moneda(CostoPersonalBatch(
+            empleado_id=ids,
+            periodo=periodo,
+            salario_base=salario_base,
+            bonos=_valores_por_empleado(bonos, ids),
+            horas_extra=_valores_por_empleado(horas_extra, ids),
+            beneficios=_valores_por_empleado(beneficios, ids),
+            cargas_sociales=self.calcular_cargas_sociales(
+                salario_base, self.atributos_cargas(empleados), fracciones
+            ),
+            otros_costos=_valores_por_empleado(otros_costos, ids),
+        ))
+    
+    @medido("calculadora.calcular_costos_periodos", filas="resultado")
+    def calcular_costos_periodos(
+        self,
+        empleados: Union[Sequence[Empleado], EmpleadoRegistry],
+        periodos: Sequence[str],
+        bonos: ValoresPorEmpleado = None,
+        horas_extra: ValoresPorEmpleado = None,
+        beneficios: ValoresPorEmpleado = None,
+        otros_costos: ValoresPorEmpleado = None,
+        procesos: Optional[int] = 1,
+        tamano_fragmento: int = TAMANO_FRAGMENTO,
+        egresos: Optional[Mapping[str, date]] = None,
+    ) -> CostoPersonalBatch:
+        """
+        Calcula el costo de muchos empleados para varios periodos.
+        
+        Con ``procesos`` distinto de 1 la nómina se divide en fragmentos de
+        ``tamano_fragmento`` empleados que se calculan en un
+        ProcessPoolExecutor; el resultado es idéntico al cálculo en serie.
+        En plataformas que inician procesos con "spawn" (Windows, macOS) la
+        llamada debe hacerse bajo ``if __name__ == "__main__":``.
+        
+        Cada concepto variable acepta lo mismo que en calcular_costos_lote,
+        y se repite en todos los periodos, o una matriz (periodos,
+        empleados) con un valor por periodo.
+        
+        Args:
+            empleados: Empleados a calcular (lista o EmpleadoRegistry)
+            periodos: Periodos en formato "YYYY-MM"
+            bonos: Bonos de cada periodo
+            horas_extra: Costo de horas extra de cada periodo
+            beneficios: Beneficios adicionales de cada periodo
+            otros_costos: Otros costos asociados de cada periodo
+            procesos: Cantidad de procesos; None usa uno por CPU
+            tamano_fragmento: Empleados por fragmento
+            egresos: Fecha de egreso por ID de empleado, usada con
+                ``prorrateo``
+                
+        Returns:
+            CostoPersonalBatch ordenado por periodo y, dentro de cada
+            periodo, en el orden de ``empleados``
+            
+        Raises:
+            ValueError: Si un concepto no está alineado con los empleados
+                (o con los periodos y los empleados), o si ``procesos`` o
+                ``tamano_fragmento`` no son positivos
+        """
+        empleados = list(empleados)
+        periodos = list(periodos)
+        ids = [emp.id for emp in empleados]
+        salario_base = np.fromiter(
+            (emp.salario_base for emp in empleados),
+            dtype=np.float64,
+            count=len(ids),
+        )
+        valores = dict(zip(CONCEPTOS, (bonos, horas_extra, beneficios, otros_costos)))
+        conceptos = {
+            campo: _conceptos_por_periodo(valores[campo], ids, len(periodos))
+            for campo in CONCEPTOS
+        }
+        
+        return self._en_moneda(calcular_costos_paralelo(
+            self,
+            ids,
+            salario_base,
+            conceptos,
+            periodos,
+            atributos=self.atributos_cargas(empleados),
+            procesos=procesos,
+            tamano_fragmento=tamano_fragmento,
+            fracciones=self.fracciones_trabajadas(empleados, periodos, egresos),
+        ))
+    
+    @medido("calculadora.calcular_costos_historicos", filas="resultado")
+    def calcular_costos_historicos(
+        self,
+        historial: HistorialEmpleados,
+        periodos: Sequence[str],
+        bonos: ValoresPorEmpleado = None,
+        horas_extra: ValoresPorEmpleado = None,
+        beneficios: ValoresPorEmpleado = None,
+        otros_costos: ValoresPorEmpleado = None,
+        solo_activos: bool = True,
+        egresos: Optional[Mapping[str, date]] = None,
+    ) -> CostoPersonalBatch:
+        """
+        Recalcula varios periodos con los datos vigentes en cada uno.
+        
+        El salario, departamento, cargo y estado de cada empleado se toman
+        del segmento del historial vigente en cada periodo, buscado para
+        toda la nómina y todos los periodos de una vez. Con ``prorrateo``,
+        el salario vigente se prorratea en los meses de ingreso y de egreso
+        como en calcular_costos_periodos.
+        
+        Args:
+            historial: Historial de la nómina
+            periodos: Periodos en formato "YYYY-MM"
+            bonos: Bonos de cada periodo (valor único, arreglo alineado con
+                ``historial.ids`` o diccionario por ID)
+            horas_extra: Costo de horas extra de cada periodo
+            beneficios: Beneficios adicionales de cada periodo
+            otros_costos: Otros costos asociados de cada periodo
+            solo_activos: Si solo se incluyen los empleados activos en cada
+                periodo
+            egresos: Fecha de egreso por ID de empleado, usada con
+                ``prorrateo``
+                
+        Returns:
+            CostoPersonalBatch ordenado por periodo y, dentro de cada
+            periodo, en el orden del historial; los empleados sin estado
+            inicial en un periodo no tienen registro en él
+        """
+        ids = historial.ids.tolist()
+        fracciones = None
+        if self.prorrateo is not None:
+            egreso = None
+            if egresos:
+                egreso = ordinales((egresos.get(emp_id) for emp_id in ids), len(ids))
+            fracciones = self.prorrateo.matriz(periodos, historial.fecha_ingreso, egreso)
+        valores = dict(zip(CONCEPTOS, (bonos, horas_extra, beneficios, otros_costos)))
+        conceptos = {
+            campo: np.broadcast_to(
+                np.asarray(
+                    0.0 if valores[campo] is None else _valores_por_empleado(valores[campo], ids),
+                    dtype=np.float64,
+                ),
+                (len(ids),),
+            )
+            for campo in CONCEPTOS
+        }
+        return self._en_moneda(calcular_costos_historial(
+            self, historial, periodos, conceptos, solo_activos, fracciones
+        ))
+    
+    @medido("calculadora.proyectar", filas="resultado")
+    def proyectar(
+        self,
+        empleados: Union[Sequence[Empleado], EmpleadoRegistry],
+        desde: str,
+        hasta: str,
+        ajustes: Optional[AjustesProyeccion] = None,
+        egresos: Optional[Mapping[str, date]] = None,
+    ) -> CostoPersonalBatch:
+        """
+        Proyecta los costos de la nómina entre dos periodos.
+        
+        Los aumentos programados, la indexación por inflación y los bonos
+        por departamento se aplican sobre una matriz periodos x empleados,
+        sin recorrer los periodos en Python. Con ``prorrateo``, el salario
+        proyectado se prorratea en los meses de ingreso y de egreso (los
+        bonos por porcentaje se calculan sobre el salario prorrateado; los
+        montos fijos de ``ajustes`` no se prorratean) y los meses sin días
+        trabajados, como los posteriores al egreso, no se proyectan.
+        
+        Args:
+            empleados: Empleados a proyectar (lista o EmpleadoRegistry)
+            desde: Primer periodo ("YYYY-MM")
+            hasta: Último periodo ("YYYY-MM"), inclusive
+            ajustes: Supuestos de la proyección (por defecto, salarios
+                constantes sin bonos)
+            egresos: Fecha de egreso por ID de empleado, usada con
+                ``prorrateo``
+                
+        Returns:
+            CostoPersonalBatch ordenado por periodo y, dentro de cada
+            periodo, en el orden de ``empleados``, con filas solo desde el
+            mes de ingreso de cada empleado (y, con ``prorrateo``, solo de
+            los meses con días trabajados)
+            
+        Raises:
+            ValueError: Si los periodos no son válidos o ``desde`` es
+                posterior a ``hasta``
+        """
+        return self._en_moneda(proyectar_costos(self, empleados, desde, hasta, ajustes, egresos))
+    
+    @medido("calculadora.calcular_costos_departamento", filas="resultado")
     def calcular_costos_departamento(
         self,
-        empleados: List[Empleado],
+        empleados: Union[List[Empleado], EmpleadoRegistry],
         departamento: str,
         periodo: str,
     ) -> List[CostoPersonal]:
@@ -64,38 +356,183 @@ class CalculadoraCostos:
         Calcula los costos de todos los empleados de un departamento.
         
         Args:
-            empleados: Lista de empleados
+            empleados: Lista de empleados o EmpleadoRegistry
             departamento: Nombre del departamento
             periodo: Periodo en formato "YYYY-MM"
             
         Returns:
             Lista de CostoPersonal para cada empleado del departamento
         """
-        empleados_dept = [
-            emp for emp in empleados
-            if emp.departamento == departamento and emp.activo
-        ]
+        if isinstance(empleados, EmpleadoRegistry):
+            empleados_dept = empleados.por_departamento(departamento, solo_activos=True)
+        else:
+            empleados_dept = [
+                emp for emp in empleados
+                if emp.departamento == departamento and emp.activo
+            ]
         
         return [
             self.calcular_costo_mensual(emp, periodo)
             for emp in empleados_dept
         ]
     
+    @medido("calculadora.calcular_costo_promedio_por_empleado", filas="costos")
     def calcular_costo_promedio_por_empleado(
         self,
-        costos: List[CostoPersonal]
-    ) -> float:
+        costos: Union[List[CostoPersonal], CostoPersonalBatch]
+    ) -> Union[float, Decimal]:
         """
         Calcula el costo promedio por empleado.
         
         Args:
-            costos: Lista de costos de personal
+            costos: Lista de costos de personal o CostoPersonalBatch
             
         Returns:
-            Costo promedio por empleado
+            Costo promedio por empleado (para un lote en unidades menores,
+            en el tipo de salida de su moneda, como los totales de los
+            reportes)
         """
         if not costos:
             return 0.0
         
+        if isinstance(costos, CostoPersonalBatch):
+            if costos.moneda is not None:
+                return costos.moneda.convertir(costos.costo_total.sum()) / len(costos)
+            return float(costos.costo_total.sum()) / len(costos)
+        
         total = sum(costo.costo_total for costo in costos)
         return total / len(costos)
+    
+    def calcular_cargas_sociales(
+        self,
+        salario_base: np.ndarray,
+        atributos: Optional[AtributosCargas] = None,
+        fracciones: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Cargas sociales de un arreglo de salarios base.
+        
+        Es el cálculo que comparten todas las formas de cálculo de la
+        calculadora, para los módulos que arman sus propias matrices de
+        salarios (proyección, historial, cálculo en paralelo).
+        
+        Args:
+            salario_base: Salarios base (la última dimensión son los empleados)
+            atributos: Atributos de los empleados, requeridos por las reglas
+                con condiciones
+            fracciones: Fracción trabajada de cada salario (misma forma que
+                ``salario_base``), si se prorratea. Las cargas de los meses
+                sin días trabajados son 0 aunque las reglas tengan un mínimo
+                
+        Returns:
+            Cargas sociales con la misma forma que ``salario_base`` (con
+            ``moneda``, calculadas sobre el salario redondeado y redondeadas
+            según su política)
+        """
+        if self.moneda is not None:
+            salario_base = self.moneda.redondear(salario_base)
+        if self.reglas_cargas is None:
+            cargas = salario_base * self.tasa_cargas_sociales
+        else:
+            cargas = compilar(self.reglas_cargas).aplicar(salario_base, atributos)
+        if fracciones is not None:
+            cargas = np.where(fracciones > 0, cargas, 0.0)
+        return cargas if self.moneda is None else self.moneda.redondear(cargas)
+    
+    def atributos_cargas(self, empleados: Sequence[Empleado]) -> Optional[AtributosCargas]:
+        """
+        Atributos de los empleados para ``calcular_cargas_sociales``.
+        
+        Args:
+            empleados: Empleados, en el orden de las columnas de salarios
+            
+        Returns:
+            AtributosCargas alineados con ``empleados``, o None si la
+            calculadora no usa reglas de cargas sociales
+        """
+        if self.reglas_cargas is None:
+            return None
+        return AtributosCargas.desde_empleados(empleados)
+    
+    def _en_moneda(self, lote: CostoPersonalBatch) -> CostoPersonalBatch:
+        """Pasa un lote calculado a unidades menores, si hay ``moneda``."""
+        return lote if self.moneda is None else lote.en_unidades(self.moneda)
+    
+    def fracciones_trabajadas(
+        self,
+        empleados: Sequence[Empleado],
+        periodos: Sequence[str],
+        egresos: Optional[Mapping[str, Optional[date]]] = None,
+    ) -> Optional[np.ndarray]:
+        """
+        Fracción trabajada de cada periodo (filas) por empleado (columnas).
+        
+        Args:
+            empleados: Empleados
+            periodos: Periodos en formato "YYYY-MM"
+            egresos: Fecha de egreso por ID de empleado
+            
+        Returns:
+            Matriz (periodos, empleados) según ``prorrateo``, o None si la
+            calculadora no prorratea
+        """
+        if self.prorrateo is None:
+            return None
+        n = len(empleados)
+        ingreso = ordinales((emp.fecha_ingreso for emp in empleados), n)
+        egreso = None
+        if egresos:
+            egreso = ordinales((egresos.get(emp.id) for emp in empleados), n)
+        return self.prorrateo.matriz(periodos, ingreso, egreso)
+
+
+def _conceptos_por_periodo(
+    valores: ValoresPorEmpleado,
+    ids: List[str],
+    cantidad_periodos: int,
+) -> np.ndarray:
+    """
+    Alinea un concepto variable con los empleados de varios periodos.
+    
+    Args:
+        valores: Valor único, arreglo o diccionario por empleado, o matriz
+            (periodos, empleados)
+        ids: IDs de empleado en orden
+        cantidad_periodos: Cantidad de periodos
+        
+    Returns:
+        Arreglo float64 de forma (empleados,) o (periodos, empleados)
+        
+    Raises:
+        ValueError: Si el arreglo no tiene una de esas formas
+    """
+    arreglo = np.asarray(
+        0.0 if valores is None else _valores_por_empleado(valores, ids), dtype=np.float64
+    )
+    if arreglo.ndim == 2:
+        if arreglo.shape != (cantidad_periodos, len(ids)):
+            raise ValueError(
+                f"La matriz del concepto debe tener forma ({cantidad_periodos}, {len(ids)})"
+            )
+        return arreglo
+    return np.broadcast_to(arreglo, (len(ids),))
+
+
+def _valores_por_empleado(valores: ValoresPorEmpleado, ids: List[str]) -> Any:
+    """
+    Alinea un concepto variable con la lista de IDs de empleado.
+    
+    Args:
+        valores: Valor único, arreglo alineado o diccionario por ID
+        ids: IDs de empleado en orden
+        
+    Returns:
+        Valor aceptado por CostoPersonalBatch para la columna
+    """
+    if isinstance(valores, Mapping):
+        return np.fromiter(
+            (valores.get(emp_id, 0.0) for emp_id in ids),
+            dtype=np.float64,
+            count=len(ids),
+        )
+    return valores
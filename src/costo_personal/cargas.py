@@ -0,0 +1,259 @@
+"""
+Reglas declarativas de cargas sociales.
+
+Un ``ReglasCargas`` describe las cargas sociales como una lista de reglas
+(con condiciones sobre departamento, cargo y fecha de ingreso, tramos,
+topes de base imponible y mínimos/máximos). Las reglas se compilan una sola
+vez en operaciones NumPy (``clip``, ``minimum``/``maximum`` y ``select``)
+que se aplican a toda la nómina de una vez. La compilación se guarda en
+caché por conjunto de reglas, identificado por su contenido y su versión.
+"""
+
+import functools
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Iterable, List, Optional, Tuple
+import numpy as np
+from .models import Empleado
+from .instrumentacion import contar, instrumentacion_activa
+
+
+@dataclass(frozen=True)
+class Tramo:
+    """Tramo de una escala progresiva: ``tasa`` sobre la parte del salario desde ``desde``."""
+    
+    desde: float
+    tasa: float
+
+
+@dataclass(frozen=True)
+class Condicion:
+    """
+    Empleados a los que aplica una regla. Los criterios vacíos no filtran.
+    
+    Attributes:
+        departamentos: Departamentos incluidos
+        cargos: Cargos incluidos
+        ingreso_desde: Fecha de ingreso mínima (inclusive)
+        ingreso_hasta: Fecha de ingreso máxima (inclusive)
+    """
+    
+    departamentos: Tuple[str, ...] = ()
+    cargos: Tuple[str, ...] = ()
+    ingreso_desde: Optional[date] = None
+    ingreso_hasta: Optional[date] = None
+    
+    def __post_init__(self):
+        object.__setattr__(self, "departamentos", tuple(self.departamentos))
+        object.__setattr__(self, "cargos", tuple(self.cargos))
+
+
+@dataclass(frozen=True)
+class ReglaCargas:
+    """
+    Cálculo de cargas sociales para los empleados que cumplen una condición.
+    
+    La base imponible es el salario base, limitado a ``tope_base`` si se
+    indica. Sobre ella se aplica una tasa única (``tasa``) o una escala
+    progresiva (``tramos``), y el resultado se acota a [``minimo``,
+    ``maximo``].
+    """
+    
+    condicion: Condicion = Condicion()
+    tasa: Optional[float] = None
+    tramos: Tuple[Tramo, ...] = ()
+    tope_base: Optional[float] = None
+    minimo: Optional[float] = None
+    maximo: Optional[float] = None
+    
+    def __post_init__(self):
+        object.__setattr__(self, "tramos", tuple(self.tramos))
+        if (self.tasa is None) == (not self.tramos):
+            raise ValueError("Cada regla debe indicar una tasa o una escala de tramos (no ambas)")
+        desdes = [t.desde for t in self.tramos]
+        if desdes != sorted(desdes) or len(set(desdes)) != len(desdes):
+            raise ValueError("Los tramos deben estar en orden ascendente y sin repetir")
+        if self.minimo is not None and self.maximo is not None and self.minimo > self.maximo:
+            raise ValueError("El mínimo de cargas no puede superar al máximo")
+
+
+@dataclass(frozen=True)
+class ReglasCargas:
+    """
+    Conjunto versionado de reglas de cargas sociales.
+    
+    Las reglas se evalúan en orden y a cada empleado se le aplica la primera
+    cuya condición cumple; si no cumple ninguna se usa ``tasa_defecto`` sobre
+    el salario base.
+    """
+    
+    reglas: Tuple[ReglaCargas, ...] = ()
+    tasa_defecto: float = 0.25
+    version: str = "1"
+    
+    def __post_init__(self):
+        object.__setattr__(self, "reglas", tuple(self.reglas))
+
+
+@dataclass
+class AtributosCargas:
+    """Atributos de los empleados usados por las condiciones, como arreglos."""
+    
+    departamento: np.ndarray
+    cargo: np.ndarray
+    fecha_ingreso: np.ndarray
+    
+    @classmethod
+    def desde_empleados(cls, empleados: Iterable[Empleado]) -> "AtributosCargas":
+        """Extrae los atributos de una lista de empleados."""
+        empleados = list(empleados)
+        departamento = np.empty(len(empleados), dtype=object)
+        departamento[:] = [emp.departamento for emp in empleados]
+        cargo = np.empty(len(empleados), dtype=object)
+        cargo[:] = [emp.cargo for emp in empleados]
+        fecha_ingreso = np.fromiter(
+            (emp.fecha_ingreso.toordinal() for emp in empleados),
+            dtype=np.int64,
+            count=len(empleados),
+        )
+        return cls(departamento, cargo, fecha_ingreso)
+    
+    def __getitem__(self, indice: Any) -> "AtributosCargas":
+        return AtributosCargas(
+            self.departamento[indice], self.cargo[indice], self.fecha_ingreso[indice]
+        )
+    
+    def __len__(self) -> int:
+        return len(self.fecha_ingreso)
+
+
+class ReglasCompiladas:
+    """Reglas de cargas sociales compiladas a operaciones vectorizadas."""
+    
+    def __init__(self, reglas: ReglasCargas):
+        """
+        Compila un conjunto de reglas.
+        
+        Args:
+            reglas: Reglas a compilar
+        """
+        self.version = reglas.version
+        self.tasa_defecto = reglas.tasa_defecto
+        self._reglas = reglas.reglas
+        # Escalas precalculadas (límite inferior, ancho y tasa de cada tramo)
+        self._escalas: List[Optional[Tuple[List[float], List[float], List[float]]]] = []
+        for regla in reglas.reglas:
+            if regla.tramos:
+                desde = [t.desde for t in regla.tramos]
+                ancho = [b - a for a, b in zip(desde, desde[1:])] + [np.inf]
+                tasa = [t.tasa for t in regla.tramos]
+                self._escalas.append((desde, ancho, tasa))
+            else:
+                self._escalas.append(None)
+    
+    def aplicar(
+        self,
+        salario_base: np.ndarray,
+        atributos: Optional[AtributosCargas] = None,
+    ) -> np.ndarray:
+        """
+        Calcula las cargas sociales de toda la nómina.
+        
+        Args:
+            salario_base: Salarios base; la última dimensión corresponde a
+                los empleados (por ejemplo, una matriz periodos x empleados)
+            atributos: Atributos de los empleados, alineados con la última
+                dimensión de ``salario_base``. Solo hacen falta si alguna
+                regla tiene condiciones
+                
+        Returns:
+            Cargas sociales con la misma forma que ``salario_base``
+            
+        Raises:
+            ValueError: Si alguna regla tiene condiciones y no se reciben
+                los atributos de los empleados
+        """
+        salario_base = np.asarray(salario_base, dtype=np.float64)
+        if not self._reglas:
+            return salario_base * self.tasa_defecto
+        
+        condiciones = [self._condicion(regla.condicion, atributos) for regla in self._reglas]
+        cargas = [
+            self._calcular(regla, escala, salario_base)
+            for regla, escala in zip(self._reglas, self._escalas)
+        ]
+        return np.select(
+            [np.broadcast_to(c, salario_base.shape) for c in condiciones],
+            cargas,
+            default=salario_base * self.tasa_defecto,
+        )
+    
+    @staticmethod
+    def _condicion(condicion: Condicion, atributos: Optional[AtributosCargas]) -> Any:
+        """Máscara de los empleados que cumplen la condición."""
+        if not (condicion.departamentos or condicion.cargos
+                or condicion.ingreso_desde or condicion.ingreso_hasta):
+            return True
+        if atributos is None:
+            raise ValueError("Las reglas con condiciones requieren los atributos de los empleados")
+        
+        mascara = np.ones(len(atributos), dtype=bool)
+        if condicion.departamentos:
+            mascara &= np.isin(atributos.departamento, condicion.departamentos)
+        if condicion.cargos:
+            mascara &= np.isin(atributos.cargo, condicion.cargos)
+        if condicion.ingreso_desde is not None:
+            mascara &= atributos.fecha_ingreso >= condicion.ingreso_desde.toordinal()
+        if condicion.ingreso_hasta is not None:
+            mascara &= atributos.fecha_ingreso <= condicion.ingreso_hasta.toordinal()
+        return mascara
+    
+    @staticmethod
+    def _calcular(
+        regla: ReglaCargas,
+        escala: Optional[Tuple[List[float], List[float], List[float]]],
+        salario_base: np.ndarray,
+    ) -> np.ndarray:
+        """Cargas según una regla, para todos los empleados."""
+        base = salario_base
+        if regla.tope_base is not None:
+            base = np.minimum(base, regla.tope_base)
+        
+        if escala is None:
+            cargas = base * regla.tasa
+        else:
+            # Se acumula tramo por tramo (y no con un producto matricial)
+            # para que el resultado no dependa de la forma del arreglo
+            cargas = np.zeros_like(base)
+            for desde, ancho, tasa in zip(*escala):
+                cargas += np.clip(base - desde, 0.0, ancho) * tasa
+        
+        if regla.minimo is not None or regla.maximo is not None:
+            cargas = np.clip(cargas, regla.minimo, regla.maximo)
+        return cargas
+
+
+def compilar(reglas: ReglasCargas) -> ReglasCompiladas:
+    """
+    Compila un conjunto de reglas, reutilizando la compilación previa del
+    mismo conjunto (mismo contenido y versión).
+    
+    Args:
+        reglas: Reglas a compilar
+        
+    Returns:
+        Reglas compiladas
+    """
+    if instrumentacion_activa() is None:
+        return _compilar(reglas)
+    aciertos = _compilar.cache_info().hits
+    compiladas = _compilar(reglas)
+    acierto = _compilar.cache_info().hits > aciertos
+    contar("reglas_cargas.aciertos" if acierto else "reglas_cargas.fallos")
+    return compiladas
+
+
+@functools.lru_cache(maxsize=32)
+def _compilar(reglas: ReglasCargas) -> ReglasCompiladas:
+    """Compilación guardada en caché por conjunto de reglas."""
+    return ReglasCompiladas(reglas)
@@ -0,0 +1,147 @@
+"""
+Montos en punto fijo: enteros int64 en unidades menores (centavos).
+
+Con una ``Moneda`` la calculadora redondea los montos según una política
+definida y devuelve los lotes en unidades menores; los reportes suman esas
+columnas enteras de forma exacta y convierten a float o Decimal recién al
+construir el resultado. Sin ``Moneda`` todo sigue en float64.
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Union
+import numpy as np
+
+
+REDONDEOS = ("mitad_arriba", "mitad_par", "truncar")
+
+SALIDAS = ("float", "decimal")
+
+# Decimales de unidad menor que se descartan antes de redondear: absorben el
+# error de representación de float (2.675 * 100 = 267.49999999999997)
+_DECIMALES_RUIDO = 6
+
+# Hasta esta suma de valores absolutos las sumas en float64 son exactas
+_MAX_SUMA_EXACTA = 2 ** 53
+
+
+@dataclass(frozen=True)
+class Moneda:
+    """
+    Representación de los montos en unidades menores enteras.
+    
+    Attributes:
+        decimales: Decimales de la unidad menor (2 = centavos)
+        redondeo: Política para llevar un monto a unidades menores:
+            "mitad_arriba" (0.5 se aleja de cero), "mitad_par" (redondeo
+            bancario) o "truncar" (hacia cero)
+        salida: Tipo de los montos en los reportes: "float" o "decimal"
+    """
+    
+    decimales: int = 2
+    redondeo: str = "mitad_arriba"
+    salida: str = "float"
+    
+    def __post_init__(self):
+        if not 0 <= self.decimales <= 6:
+            raise ValueError("Los decimales deben estar entre 0 y 6")
+        if self.redondeo not in REDONDEOS:
+            raise ValueError(
+                f"Redondeo inválido: '{self.redondeo}'. Opciones: {', '.join(REDONDEOS)}"
+            )
+        if self.salida not in SALIDAS:
+            raise ValueError(
+                f"Salida inválida: '{self.salida}'. Opciones: {', '.join(SALIDAS)}"
+            )
+    
+    @property
+    def escala(self) -> int:
+        """Unidades menores por unidad de moneda."""
+        return 10 ** self.decimales
+    
+    def a_unidades(self, montos: Any) -> np.ndarray:
+        """
+        Convierte montos a unidades menores aplicando la política de redondeo.
+        
+        Args:
+            montos: Monto o arreglo de montos
+            
+        Returns:
+            Arreglo int64 con la forma de ``montos``
+        """
+        escalado = np.round(np.asarray(montos, dtype=np.float64) * self.escala, _DECIMALES_RUIDO)
+        if self.redondeo == "mitad_par":
+            redondeado = np.rint(escalado)
+        elif self.redondeo == "mitad_arriba":
+            redondeado = np.copysign(np.floor(np.abs(escalado) + 0.5), escalado)
+        else:
+            redondeado = np.trunc(escalado)
+        return redondeado.astype(np.int64)
+    
+    def a_float(self, unidades: Any) -> Union[float, np.ndarray]:
+        """
+        Convierte unidades menores a montos float.
+        
+        Args:
+            unidades: Entero o arreglo de enteros en unidades menores
+            
+        Returns:
+            Monto (o arreglo float64) más cercano al valor exacto
+        """
+        if isinstance(unidades, np.ndarray):
+            return unidades / self.escala
+        # int / int de Python redondea correctamente aunque supere 2**53
+        return int(unidades) / self.escala
+    
+    def a_decimal(self, unidades: Any) -> Decimal:
+        """Convierte un entero en unidades menores a un Decimal exacto."""
+        return Decimal(int(unidades)).scaleb(-self.decimales)
+    
+    def convertir(self, unidades: Any) -> Union[float, Decimal]:
+        """Convierte una suma en unidades menores al tipo de ``salida``."""
+        if self.salida == "decimal":
+            return self.a_decimal(unidades)
+        return self.a_float(unidades)
+    
+    def redondear(self, montos: Any) -> Any:
+        """
+        Redondea montos a la unidad menor sin dejar de usar float.
+        
+        Args:
+            montos: Monto o arreglo de montos
+            
+        Returns:
+            Monto float o arreglo float64 redondeado
+        """
+        unidades = self.a_unidades(montos)
+        if unidades.ndim == 0:
+            return self.a_float(int(unidades))
+        return self.a_float(unidades)
+
+
+def sumar_por_grupo(codigos: np.ndarray, unidades: np.ndarray, cantidad: int) -> np.ndarray:
+    """
+    Suma enteros por grupo de forma exacta.
+    
+    Mientras la suma de valores absolutos no supere 2**53 se usa
+    np.bincount (todas las sumas parciales son exactas en float64); por
+    encima se acumula en int64 con np.add.at, bastante más lento. La cota
+    se prueba primero con el máximo absoluto por la cantidad de valores,
+    que no requiere un arreglo temporal.
+    
+    Args:
+        codigos: Código de grupo de cada valor
+        unidades: Valores enteros en unidades menores
+        cantidad: Cantidad de grupos
+        
+    Returns:
+        Arreglo int64 con la suma de cada grupo
+    """
+    if len(unidades) == 0:
+        return np.zeros(cantidad, dtype=np.int64)
+    maximo = max(int(unidades.max()), -int(unidades.min()))
+    if maximo * len(unidades) < _MAX_SUMA_EXACTA or int(np.abs(unidades).sum()) < _MAX_SUMA_EXACTA:
+        return np.bincount(codigos, weights=unidades, minlength=cantidad).astype(np.int64)
+    sumas = np.zeros(cantidad, dtype=np.int64)
+    np.add.at(sumas, codigos, unidades)
+    return sumas
@@ -0,0 +1,306 @@
+"""
+Evaluación de escenarios sobre una misma nómina.
+
+Cada escenario puede cambiar la tasa de cargas sociales, aplicar un aumento
+salarial, poner un tope a los bonos o recortar la dotación de algunos
+departamentos. Todos los escenarios se evalúan juntos como una matriz
+escenarios x registros de costo, sin reconstruir objetos CostoPersonal.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Union
+import numpy as np
+import pandas as pd
+from .lote import CAMPOS_MONTO, agrupar, como_lote
+from .instrumentacion import medido
+from .reportes import (
+    COLUMNAS_DEPARTAMENTO,
+    Costos,
+    Empleados,
+    _construir_metricas_clave,
+    _construir_reporte_departamento,
+    _contar_activos,
+    _indice_empleados,
+)
+
+
+PARAMETROS = ("nombre", "tasa_cargas_sociales", "aumento_salarial", "tope_bonos", "recortes")
+
+CAMPOS_TOTALES = ("costo_total", "salario_base", "bonos", "horas_extra", "cargas_sociales")
+
+# Celdas (escenarios x registros) calculadas a la vez
+LIMITE_CELDAS = 2_000_000
+
+Escenarios = Union[pd.DataFrame, Iterable[Mapping[str, Any]]]
+
+
+@dataclass
+class ResultadoEscenarios:
+    """
+    Resultados de todos los escenarios.
+    
+    Attributes:
+        metricas: Métricas clave, una fila por escenario (índice "escenario")
+        por_departamento: Reporte por departamento de todos los escenarios,
+            con una columna "escenario" adicional
+    """
+    
+    metricas: pd.DataFrame
+    por_departamento: pd.DataFrame
+    
+    def metricas_clave(self, escenario: str) -> Dict[str, Any]:
+        """Métricas clave de un escenario, como generar_metricas_clave."""
+        metricas = self.metricas.loc[escenario].to_dict()
+        metricas["total_empleados"] = int(metricas["total_empleados"])
+        return metricas
+    
+    def reporte_por_departamento(self, escenario: str) -> pd.DataFrame:
+        """Reporte por departamento de un escenario, como generar_reporte_por_departamento."""
+        df = self.por_departamento[self.por_departamento["escenario"] == escenario]
+        return df[COLUMNAS_DEPARTAMENTO].reset_index(drop=True)
+
+
+class SimuladorEscenarios:
+    """
+    Evalúa escenarios sobre un conjunto base de costos.
+    
+    Parámetros de cada escenario (todos opcionales):
+    
+    - ``nombre``: identificador del escenario (por defecto, su posición)
+    - ``tasa_cargas_sociales``: nueva tasa sobre el salario base; si no se
+      indica se conservan las cargas sociales de los costos base
+    - ``aumento_salarial``: aumento sobre el salario base (0.05 = 5%)
+    - ``tope_bonos``: bono máximo por registro
+    - ``recortes``: diccionario departamento -> proporción de la dotación
+      que se elimina; se retiran primero los empleados de ingreso más
+      reciente
+      
+    Con un escenario sin parámetros los resultados coinciden con los de
+    GeneradorReportes sobre los costos base, salvo diferencias de redondeo
+    por el orden de las sumas.
+    """
+    
+    def __init__(self, empleados: Empleados, costos: Costos):
+        """
+        Inicializa el simulador.
+        
+        Args:
+            empleados: Lista de empleados o EmpleadoRegistry
+            costos: Costos base (lista de costos o CostoPersonalBatch)
+        """
+        lote = como_lote(costos)
+        self._cantidad_registros = len(lote)
+        emp_dict = _indice_empleados(empleados)
+        self._total_activos = _contar_activos(empleados)
+        
+        # Atributos por empleado presente en los costos
+        ids, self._codigo_id = agrupar(lote.empleado_id)
+        codigos_dept: Dict[str, int] = {}
+        dept_id = np.full(len(ids), -1, dtype=np.intp)
+        activo_id = np.zeros(len(ids), dtype=bool)
+        ingreso_id = np.zeros(len(ids), dtype=np.int64)
+        for k, emp_id in enumerate(ids):
+            empleado = emp_dict.get(emp_id)
+            if empleado:
+                dept_id[k] = codigos_dept.setdefault(empleado.departamento, len(codigos_dept))
+                activo_id[k] = empleado.activo
+                ingreso_id[k] = empleado.fecha_ingreso.toordinal()
+        self._departamentos: List[str] = list(codigos_dept)
+        self._dept_id = dept_id
+        self._activo_id = activo_id
+        
+        # Posición de cada empleado dentro de su departamento, del ingreso
+        # más reciente al más antiguo
+        orden = np.lexsort((np.arange(len(ids)), -ingreso_id, dept_id))
+        self._cantidad_dept = np.bincount(dept_id[dept_id >= 0], minlength=len(codigos_dept))
+        inicio_dept = np.concatenate(([0], np.cumsum(self._cantidad_dept)))
+        desplazamiento = int((dept_id < 0).sum())
+        posicion = np.empty(len(ids), dtype=np.int64)
+        posicion[orden] = np.arange(len(ids)) - desplazamiento
+        self._rango = np.where(
+            dept_id >= 0, posicion - inicio_dept[np.maximum(dept_id, 0)], 0
+        )
+        
+        # Registros ordenados por departamento (de forma estable) para sumar
+        # cada departamento como un tramo contiguo; los registros sin
+        # departamento quedan al final
+        dept_fila = dept_id[self._codigo_id]
+        orden = np.argsort(
+            np.where(dept_fila >= 0, dept_fila, len(codigos_dept)), kind="stable"
+        )
+        self._columnas = {campo: getattr(lote, campo)[orden] for campo in CAMPOS_MONTO}
+        self._codigo_ordenado = self._codigo_id[orden]
+        self._inicios_dept = np.searchsorted(dept_fila[orden], np.arange(len(codigos_dept)))
+        self._filas_con_dept = int((dept_fila >= 0).sum())
+    
+    @medido("escenarios.evaluar", filas="escenarios")
+    def evaluar(self, escenarios: Escenarios) -> ResultadoEscenarios:
+        """
+        Evalúa todos los escenarios.
+        
+        Args:
+            escenarios: DataFrame o lista de diccionarios con los parámetros
+                de cada escenario
+                
+        Returns:
+            ResultadoEscenarios con las métricas clave y el reporte por
+            departamento de cada escenario
+            
+        Raises:
+            ValueError: Si hay parámetros desconocidos, nombres repetidos o
+                proporciones de recorte fuera de [0, 1]
+        """
+        nombres, tasa, aumento, tope, recortes = self._parametros(escenarios)
+        
+        filas_metricas = []
+        tablas_dept = []
+        bloque = max(1, LIMITE_CELDAS // max(self._cantidad_registros, 1))
+        for inicio in range(0, len(nombres), bloque):
+            tramo = slice(inicio, inicio + bloque)
+            metricas, departamentos = self._evaluar_bloque(
+                tasa[tramo], aumento[tramo], tope[tramo], recortes[tramo]
+            )
+            filas_metricas.extend(metricas)
+            for nombre, dept_data in zip(nombres[tramo], departamentos):
+                df = _construir_reporte_departamento(dept_data)
+                df.insert(0, "escenario", nombre)
+                tablas_dept.append(df)
+        
+        metricas_df = pd.DataFrame(filas_metricas, index=pd.Index(nombres, name="escenario"))
+        if tablas_dept:
+            por_departamento = pd.concat(tablas_dept, ignore_index=True)
+        else:
+            por_departamento = pd.DataFrame(columns=["escenario"] + COLUMNAS_DEPARTAMENTO)
+        return ResultadoEscenarios(metricas=metricas_df, por_departamento=por_departamento)
+    
+    def _parametros(self, escenarios: Escenarios):
+        """Convierte la tabla de escenarios a arreglos por parámetro."""
+        if isinstance(escenarios, pd.DataFrame):
+            tabla = escenarios
+        else:
+            tabla = pd.DataFrame(list(escenarios))
+        desconocidos = sorted(str(col) for col in set(tabla.columns) - set(PARAMETROS))
+        if desconocidos:
+            raise ValueError(f"Parámetros de escenario desconocidos: {', '.join(desconocidos)}")
+        
+        s = len(tabla)
+        if "nombre" in tabla:
+            nombres = [str(nombre) for nombre in tabla["nombre"]]
+        else:
+            nombres = [str(nombre) for nombre in tabla.index]
+        if len(set(nombres)) != s:
+            raise ValueError("Los nombres de los escenarios deben ser únicos")
+        
+        def columna(nombre: str, defecto: float) -> np.ndarray:
+            if nombre not in tabla:
+                return np.full(s, defecto)
+            valores = pd.to_numeric(tabla[nombre]).to_numpy(dtype=np.float64)
+            return np.where(np.isnan(valores), defecto, valores)
+        
+        recortes = np.zeros((s, len(self._departamentos)))
+        if "recortes" in tabla:
+            posicion = {dept: k for k, dept in enumerate(self._departamentos)}
+            for i, recorte in enumerate(tabla["recortes"]):
+                if not isinstance(recorte, Mapping):
+                    continue
+                for dept, proporcion in recorte.items():
+                    if not 0.0 <= proporcion <= 1.0:
+                        raise ValueError(
+                            f"Proporción de recorte inválida para '{dept}': {proporcion}"
+                        )
+                    if dept in posicion:
+                        recortes[i, posicion[dept]] = proporcion
+        
+        return (
+            nombres,
+            columna("tasa_cargas_sociales", np.nan),
+            columna("aumento_salarial", 0.0),
+            columna("tope_bonos", np.inf),
+            recortes,
+        )
+    
+    def _evaluar_bloque(
+        self,
+        tasa: np.ndarray,
+        aumento: np.ndarray,
+        tope: np.ndarray,
+        recortes: np.ndarray,
+    ):
+        """Evalúa un bloque de escenarios sobre la matriz escenarios x registros."""
+        columnas = self._columnas
+        
+        # Empleados que permanecen en cada escenario
+        con_dept = self._dept_id >= 0
+        dept_id = np.maximum(self._dept_id, 0)
+        umbral = np.where(
+            con_dept,
+            np.round(recortes[:, dept_id] * self._cantidad_dept[dept_id]),
+            0.0,
+        )
+        queda_id = self._rango >= umbral
+        queda = queda_id[:, self._codigo_ordenado].astype(np.float64)
+        
+        factor = (1.0 + aumento)[:, np.newaxis]
+        salario_base = columnas["salario_base"] * factor * queda
+        cargas_sociales = salario_base * tasa[:, np.newaxis]
+        sin_tasa = np.isnan(tasa)
+        cargas_sociales[sin_tasa] = (
+            columnas["cargas_sociales"] * factor[sin_tasa] * queda[sin_tasa]
+        )
+        montos = {
+            "salario_base": salario_base,
+            "bonos": np.minimum(columnas["bonos"], tope[:, np.newaxis]) * queda,
+            "horas_extra": columnas["horas_extra"] * queda,
+            "beneficios": columnas["beneficios"] * queda,
+            "cargas_sociales": cargas_sociales,
+            "otros_costos": columnas["otros_costos"] * queda,
+        }
+        # Mismo orden de suma que CostoPersonal.costo_total
+        montos["costo_total"] = (
+            montos["salario_base"] + montos["bonos"] + montos["horas_extra"]
+            + montos["beneficios"] + montos["cargas_sociales"] + montos["otros_costos"]
+        )
+        
+        num_registros = queda.sum(axis=1)
+        retirados_activos = (~queda_id & self._activo_id).sum(axis=1)
+        totales = {campo: montos[campo].sum(axis=1) for campo in CAMPOS_TOTALES}
+        metricas = [
+            _construir_metricas_clave(
+                self._total_activos - int(retirados_activos[i]),
+                {campo: float(valores[i]) for campo, valores in totales.items()},
+                int(num_registros[i]),
+            )
+            for i in range(len(tasa))
+        ]
+        
+        # Sumas por escenario y departamento, en el orden de los registros
+        def sumar(matriz: np.ndarray) -> np.ndarray:
+            if len(self._inicios_dept) == 0:
+                return np.zeros((len(tasa), 0))
+            return np.add.reduceat(
+                matriz[:, :self._filas_con_dept], self._inicios_dept, axis=1
+            )
+        
+        sumas = {
+            "costo_total": sumar(montos["costo_total"]),
+            "salario_base_total": sumar(montos["salario_base"]),
+            "bonos_total": sumar(montos["bonos"]),
+            "horas_extra_total": sumar(montos["horas_extra"]),
+            "beneficios_total": sumar(montos["beneficios"]),
+            "cargas_sociales_total": sumar(montos["cargas_sociales"]),
+        }
+        retirados_dept = np.round(recortes * self._cantidad_dept).astype(np.int64)
+        empleados_dept = self._cantidad_dept - retirados_dept
+        
+        departamentos = [
+            {
+                dept: {
+                    "cantidad_empleados": int(empleados_dept[i, k]),
+                    **{campo: float(valores[i, k]) for campo, valores in sumas.items()},
+                }
+                for k, dept in enumerate(self._departamentos)
+                if empleados_dept[i, k] > 0
+            }
+            for i in range(len(tasa))
+        ]
+        return metricas, departamentos
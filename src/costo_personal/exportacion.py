@@ -0,0 +1,212 @@
+"""
+Exportación por lotes de reportes y detalle de costos.
+
+Los datos se escriben de a un lote por vez, de modo que la memoria usada no
+depende de la cantidad total de filas.
+"""
+
+from itertools import chain, islice
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Union
+import pandas as pd
+from openpyxl import Workbook
+from .models import CAMPOS_COSTO, CostoPersonal, CostoPersonalCompacto
+from .lote import CostoPersonalBatch
+
+
+MAX_FILAS_EXCEL = 1_048_576
+
+TAMANO_LOTE = 50_000
+
+Filas = Union[
+    pd.DataFrame,
+    CostoPersonalBatch,
+    Iterable[CostoPersonal],
+    Iterable[Mapping[str, Any]],
+    Iterable[pd.DataFrame],
+    Iterable[CostoPersonalBatch],
+    Iterable[List[Dict[str, Any]]],
+]
+
+
+def iterar_lotes(filas: Filas, tamano_lote: int = TAMANO_LOTE) -> Iterator[pd.DataFrame]:
+    """
+    Normaliza distintas fuentes de filas a un iterador de DataFrames.
+    
+    Args:
+        filas: DataFrame, CostoPersonalBatch, iterable de CostoPersonal,
+            iterable de filas como diccionarios (por ejemplo,
+            ``CostoPersonal.to_dict()``) o iterable de lotes (DataFrames,
+            CostoPersonalBatch o listas de diccionarios)
+        tamano_lote: Filas por lote al dividir DataFrames, lotes, costos o
+            diccionarios
+            
+    Returns:
+        Iterador de DataFrames con a lo sumo ``tamano_lote`` filas cuando la
+        fuente se divide aquí; los lotes recibidos se respetan tal cual
+        
+    Raises:
+        ValueError: Si el tamaño de lote no es positivo
+        TypeError: Si algún elemento de ``filas`` no es de un tipo admitido
+    """
+    if tamano_lote < 1:
+        raise ValueError("El tamaño de lote debe ser positivo")
+    
+    if isinstance(filas, pd.DataFrame):
+        for inicio in range(0, len(filas), tamano_lote):
+            yield filas.iloc[inicio:inicio + tamano_lote]
+        return
+    
+    if isinstance(filas, CostoPersonalBatch):
+        for inicio in range(0, len(filas), tamano_lote):
+            yield filas[inicio:inicio + tamano_lote].to_dataframe()
+        return
+    
+    iterador = iter(filas)
+    primero = next(iterador, None)
+    if primero is None:
+        return
+    iterador = chain([primero], iterador)
+    
+    if isinstance(primero, (CostoPersonal, CostoPersonalCompacto)):
+        while True:
+            bloque = list(islice(iterador, tamano_lote))
+            if not bloque:
+                return
+            yield pd.DataFrame.from_records(
+                CostoPersonalCompacto.to_records(bloque), columns=list(CAMPOS_COSTO)
+            )
+    
+    if isinstance(primero, Mapping):
+        while True:
+            bloque = list(islice(iterador, tamano_lote))
+            if not bloque:
+                return
+            yield _desde_diccionarios(bloque)
+    
+    for lote in iterador:
+        if isinstance(lote, pd.DataFrame):
+            yield lote
+        elif isinstance(lote, CostoPersonalBatch):
+            yield lote.to_dataframe()
+        elif isinstance(lote, (list, tuple)):
+            yield _desde_diccionarios(lote)
+        else:
+            raise TypeError(f"Tipo de lote no admitido: {type(lote).__name__}")
+
+
+def _columnas_sin_filas(filas: Filas) -> List[Any]:
+    """Encabezado a escribir cuando ``filas`` no tiene ninguna fila."""
+    if isinstance(filas, pd.DataFrame):
+        return list(filas.columns)
+    return list(CAMPOS_COSTO)
+
+
+def _desde_diccionarios(filas: List[Any]) -> pd.DataFrame:
+    """DataFrame de una lista de filas como diccionarios."""
+    invalidas = [fila for fila in filas if not isinstance(fila, Mapping)]
+    if invalidas:
+        raise TypeError(f"Tipo de fila no admitido: {type(invalidas[0]).__name__}")
+    return pd.DataFrame.from_records(filas)
+
+
+def exportar_csv_por_lotes(
+    filas: Filas,
+    filename: str,
+    tamano_lote: int = TAMANO_LOTE,
+    buffer_bytes: int = 1024 * 1024,
+) -> int:
+    """
+    Exporta filas a un archivo CSV escribiendo un lote por vez.
+    
+    El encabezado es el del primer lote; en los siguientes, las columnas que
+    falten se escriben vacías. Sin filas se escribe solo el encabezado (las
+    columnas del DataFrame recibido o, si no, las de CostoPersonal).
+    
+    Args:
+        filas: Fuente de filas (ver iterar_lotes)
+        filename: Nombre del archivo de salida
+        tamano_lote: Filas por lote
+        buffer_bytes: Tamaño del buffer de escritura
+        
+    Returns:
+        Cantidad de filas escritas
+    """
+    total = 0
+    with open(filename, "w", encoding="utf-8-sig", newline="", buffering=buffer_bytes) as f:
+        columnas = None
+        for df in iterar_lotes(filas, tamano_lote):
+            if columnas is None:
+                columnas = list(df.columns)
+                df.to_csv(f, index=False, header=True)
+            else:
+                # Las columnas que falten en un lote se escriben vacías
+                df.reindex(columns=columnas).to_csv(f, index=False, header=False)
+            total += len(df)
+        if columnas is None:
+            pd.DataFrame(columns=_columnas_sin_filas(filas)).to_csv(f, index=False)
+    return total
+
+
+def exportar_excel_por_lotes(
+    filas: Filas,
+    filename: str,
+    tamano_lote: int = TAMANO_LOTE,
+    max_filas_hoja: int = MAX_FILAS_EXCEL,
+    nombre_hoja: str = "Hoja",
+) -> int:
+    """
+    Exporta filas a un archivo Excel en modo de solo escritura de openpyxl.
+    
+    Cuando una hoja alcanza ``max_filas_hoja`` (encabezado incluido) se
+    continúa en una hoja nueva ("Hoja1", "Hoja2", ...) con el mismo
+    encabezado. El encabezado y las columnas vacías se manejan como en
+    exportar_csv_por_lotes.
+    
+    Args:
+        filas: Fuente de filas (ver iterar_lotes)
+        filename: Nombre del archivo de salida
+        tamano_lote: Filas por lote
+        max_filas_hoja: Filas máximas por hoja, incluido el encabezado
+        nombre_hoja: Prefijo del nombre de las hojas
+        
+    Returns:
+        Cantidad de filas de datos escritas
+    """
+    if max_filas_hoja < 2:
+        raise ValueError("Cada hoja debe admitir al menos el encabezado y una fila")
+    
+    wb = Workbook(write_only=True)
+    hoja = None
+    columnas: List[Any] = []
+    encabezado: List[str] = []
+    filas_hoja = 0
+    hojas = 0
+    total = 0
+    
+    for df in iterar_lotes(filas, tamano_lote):
+        if not columnas:
+            columnas = list(df.columns)
+            encabezado = [str(col) for col in columnas]
+        else:
+            # Los lotes siguientes se escriben en el orden del encabezado y
+            # las columnas que les falten quedan vacías
+            faltan_columnas = not set(columnas).issubset(df.columns)
+            df = df.reindex(columns=columnas)
+            if faltan_columnas:
+                df = df.astype(object).where(df.notna(), None)
+        for fila in df.itertuples(index=False, name=None):
+            if hoja is None or filas_hoja >= max_filas_hoja:
+                hojas += 1
+                hoja = wb.create_sheet(f"{nombre_hoja}{hojas}")
+                hoja.append(encabezado)
+                filas_hoja = 1
+            hoja.append(list(fila))
+            filas_hoja += 1
+            total += 1
+    
+    if hoja is None:
+        hoja = wb.create_sheet(f"{nombre_hoja}1")
+        hoja.append(encabezado or [str(col) for col in _columnas_sin_filas(filas)])
+    
+    wb.save(filename)
+    return total
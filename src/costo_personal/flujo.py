@@ -0,0 +1,353 @@
+"""
+Procesamiento en flujo de nóminas grandes.
+
+La nómina se recibe como un iterador de empleados (por ejemplo, leído de un
+CSV con ``leer_empleados_csv``) que se consume de a un fragmento por vez:
+cada fragmento se calcula con CalculadoraCostos, se acumula en un
+AgregadoFlujo y se descarta. La memoria usada depende del tamaño de
+fragmento y no de la cantidad total de empleados.
+
+Los conceptos variables también pueden leerse en flujo (``iterar_conceptos_csv``):
+si los empleados y los conceptos vienen ordenados por ``empleado_id``, cada
+fragmento de empleados toma solo los conceptos de sus IDs.
+"""
+
+import csv
+from dataclasses import dataclass
+from datetime import date
+from itertools import islice
+from numbers import Real
+from typing import (
+    Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, TypeVar, Union
+)
+import pandas as pd
+from .models import Empleado
+from .calculadora import CalculadoraCostos
+from .agregados import AgregadoFlujo
+from .ingesta import VALORES_FALSOS, VALORES_VERDADEROS
+from .paralelo import CONCEPTOS, TAMANO_FRAGMENTO
+from .instrumentacion import medido, pico_rss
+
+
+T = TypeVar("T")
+
+# Conceptos variables de un registro: (ID de empleado, {concepto: monto})
+RegistroConceptos = Tuple[str, Mapping[str, float]]
+
+# Un concepto variable en flujo: monto único o diccionario por ID. Las
+# secuencias y arreglos posicionales no se admiten, porque no se pueden
+# alinear con una nómina que se lee por fragmentos
+ConceptoFlujo = Optional[Union[float, Mapping[str, float]]]
+
+
+@dataclass
+class ResultadoFlujo:
+    """
+    Reportes de una nómina procesada en flujo.
+    
+    Attributes:
+        por_departamento: Igual a GeneradorReportes.generar_reporte_por_departamento
+        metricas_clave: Igual a GeneradorReportes.generar_metricas_clave
+        tendencia: Igual a GeneradorReportes.generar_reporte_tendencia
+        cantidad_empleados: Empleados leídos
+        cantidad_registros: Registros de costo calculados
+        cantidad_fragmentos: Fragmentos procesados
+        pico_rss_bytes: Pico de memoria residente del proceso al terminar
+            (None si la plataforma no lo informa)
+    """
+    
+    por_departamento: pd.DataFrame
+    metricas_clave: Dict[str, Any]
+    tendencia: pd.DataFrame
+    cantidad_empleados: int
+    cantidad_registros: int
+    cantidad_fragmentos: int
+    pico_rss_bytes: Optional[int]
+
+
+def fragmentar(elementos: Iterable[T], tamano: int) -> Iterator[List[T]]:
+    """
+    Divide un iterable en listas de a lo sumo ``tamano`` elementos.
+    
+    Args:
+        elementos: Elementos a dividir (se consumen de forma perezosa)
+        tamano: Elementos por fragmento
+        
+    Returns:
+        Iterador de fragmentos
+        
+    Raises:
+        ValueError: Si el tamaño no es positivo
+    """
+    if tamano < 1:
+        raise ValueError("El tamaño de fragmento debe ser positivo")
+    iterador = iter(elementos)
+    while True:
+        fragmento = list(islice(iterador, tamano))
+        if not fragmento:
+            return
+        yield fragmento
+
+
+def leer_empleados_csv(ruta: str, encoding: str = "utf-8") -> Iterator[Empleado]:
+    """
+    Lee empleados de un CSV fila por fila.
+    
+    El archivo debe tener las columnas de Empleado.to_dict (``activo`` es
+    opcional y vale True si falta; acepta los mismos valores que
+    ``ingesta.validar_empleados``).
+    
+    Args:
+        ruta: Ruta del archivo CSV
+        encoding: Codificación del archivo
+        
+    Returns:
+        Iterador de empleados en el orden del archivo
+        
+    Raises:
+        ValueError: Si una fila no se puede convertir en Empleado
+    """
+    with open(ruta, newline="", encoding=encoding) as archivo:
+        for numero, fila in enumerate(csv.DictReader(archivo), start=2):
+            try:
+                yield Empleado(
+                    id=fila["id"],
+                    nombre=fila["nombre"],
+                    departamento=fila["departamento"],
+                    cargo=fila["cargo"],
+                    salario_base=float(fila["salario_base"]),
+                    fecha_ingreso=date.fromisoformat(fila["fecha_ingreso"]),
+                    activo=_activo(fila.get("activo")),
+                )
+            except (KeyError, TypeError, ValueError) as error:
+                raise ValueError(f"{ruta}, línea {numero}: {error}") from None
+
+
+def _activo(valor: Optional[str]) -> bool:
+    """Convierte el texto de la columna ``activo`` (None si no está)."""
+    if valor is None:
+        return True
+    texto = valor.strip().lower()
+    if texto in VALORES_VERDADEROS:
+        return True
+    if texto in VALORES_FALSOS:
+        return False
+    raise ValueError(f"valor booleano inválido en 'activo': '{valor}'")
+
+
+def iterar_conceptos_csv(ruta: str, encoding: str = "utf-8") -> Iterator[RegistroConceptos]:
+    """
+    Lee los conceptos variables (bonos, horas extra...) de un CSV fila por fila.
+    
+    El archivo tiene una columna ``empleado_id`` y una columna por concepto
+    (cualquiera de bonos, horas_extra, beneficios y otros_costos); las
+    celdas vacías se omiten.
+    
+    Args:
+        ruta: Ruta del archivo CSV
+        encoding: Codificación del archivo
+        
+    Returns:
+        Iterador de (ID de empleado, {concepto: monto}) en el orden del
+        archivo, apto para el parámetro ``conceptos`` de procesar_flujo
+        
+    Raises:
+        ValueError: Si falta la columna ``empleado_id`` o un monto no es numérico
+    """
+    with open(ruta, newline="", encoding=encoding) as archivo:
+        lector = csv.DictReader(archivo)
+        if "empleado_id" not in (lector.fieldnames or []):
+            raise ValueError(f"{ruta}: falta la columna 'empleado_id'")
+        columnas = [c for c in CONCEPTOS if c in lector.fieldnames]
+        
+        for numero, fila in enumerate(lector, start=2):
+            montos: Dict[str, float] = {}
+            for columna in columnas:
+                valor = fila[columna]
+                if not valor:
+                    continue
+                try:
+                    montos[columna] = float(valor)
+                except ValueError:
+                    raise ValueError(
+                        f"{ruta}, línea {numero}: monto inválido en '{columna}': '{valor}'"
+                    ) from None
+            yield fila["empleado_id"], montos
+
+
+def leer_conceptos_csv(ruta: str, encoding: str = "utf-8") -> Dict[str, Dict[str, float]]:
+    """
+    Lee todos los conceptos variables de un CSV en diccionarios.
+    
+    Los registros repetidos de un mismo empleado se suman y solo se guardan
+    los empleados con conceptos variables. El resultado ocupa memoria
+    proporcional al archivo: para extractos grandes, ordenar ambos archivos
+    por ``empleado_id`` y pasar ``iterar_conceptos_csv`` a procesar_flujo.
+    
+    Args:
+        ruta: Ruta del archivo CSV (ver iterar_conceptos_csv)
+        encoding: Codificación del archivo
+        
+    Returns:
+        Diccionario concepto -> {ID de empleado: monto}, apto para los
+        parámetros de CalculadoraCostos y procesar_flujo, con una entrada
+        por cada columna de concepto del archivo
+        
+    Raises:
+        ValueError: Si falta la columna ``empleado_id`` o un monto no es numérico
+    """
+    with open(ruta, newline="", encoding=encoding) as archivo:
+        columnas = next(csv.reader(archivo), [])
+    conceptos: Dict[str, Dict[str, float]] = {c: {} for c in CONCEPTOS if c in columnas}
+    for emp_id, montos in iterar_conceptos_csv(ruta, encoding):
+        for columna, monto in montos.items():
+            por_empleado = conceptos[columna]
+            por_empleado[emp_id] = por_empleado.get(emp_id, 0.0) + monto
+    return conceptos
+
+
+def combinar_conceptos(
+    fragmentos: Iterable[List[Empleado]],
+    conceptos: Iterable[RegistroConceptos],
+) -> Iterator[Tuple[List[Empleado], Dict[str, Dict[str, float]]]]:
+    """
+    Junta cada fragmento de empleados con sus conceptos variables.
+    
+    Ambas fuentes deben venir ordenadas por ID de empleado (orden de texto):
+    como en un merge join, cada fragmento consume los registros de
+    conceptos hasta su último ID, de modo que en memoria solo están los
+    conceptos del fragmento actual. Los registros repetidos de un empleado
+    se suman y los de IDs que no están en la nómina se descartan.
+    
+    Args:
+        fragmentos: Fragmentos de empleados ordenados por ID, sin repetidos
+        conceptos: Registros (ID de empleado, {concepto: monto}) ordenados
+            por ID
+            
+    Returns:
+        Iterador de (fragmento, concepto -> {ID de empleado: monto})
+        
+    Raises:
+        ValueError: Si alguna de las fuentes no está ordenada por ID
+    """
+    registros = iter(conceptos)
+    siguiente = next(registros, None)
+    ultimo_empleado: Optional[str] = None
+    for fragmento in fragmentos:
+        for emp in fragmento:
+            if ultimo_empleado is not None and emp.id <= ultimo_empleado:
+                raise ValueError(
+                    f"Los empleados deben estar ordenados por ID y sin repetir: "
+                    f"'{emp.id}' después de '{ultimo_empleado}'"
+                )
+            ultimo_empleado = emp.id
+        
+        montos: Dict[str, Dict[str, float]] = {campo: {} for campo in CONCEPTOS}
+        while (
+            siguiente is not None and ultimo_empleado is not None
+            and siguiente[0] <= ultimo_empleado
+        ):
+            emp_id, valores = siguiente
+            for campo, monto in valores.items():
+                por_empleado = montos[campo]
+                por_empleado[emp_id] = por_empleado.get(emp_id, 0.0) + monto
+            siguiente = next(registros, None)
+            if siguiente is not None and siguiente[0] < emp_id:
+                raise ValueError(
+                    f"Los conceptos deben estar ordenados por ID de empleado: "
+                    f"'{siguiente[0]}' después de '{emp_id}'"
+                )
+        yield fragmento, montos
+
+
+@medido("flujo.procesar_flujo")
+def procesar_flujo(
+    empleados: Iterable[Empleado],
+    periodos: Union[str, Sequence[str]],
+    calculadora: Optional[CalculadoraCostos] = None,
+    bonos: ConceptoFlujo = None,
+    horas_extra: ConceptoFlujo = None,
+    beneficios: ConceptoFlujo = None,
+    otros_costos: ConceptoFlujo = None,
+    solo_activos: bool = True,
+    tamano_fragmento: int = TAMANO_FRAGMENTO,
+    conceptos: Optional[Iterable[RegistroConceptos]] = None,
+) -> ResultadoFlujo:
+    """
+    Calcula los costos y reportes de una nómina leída por fragmentos.
+    
+    El resultado equivale a calcular los costos de toda la nómina con
+    CalculadoraCostos.calcular_costos_periodos y pasarlos a los reportes de
+    GeneradorReportes, salvo diferencias de redondeo por el orden de las
+    sumas. Cada empleado debe aparecer una sola vez en ``empleados``.
+    
+    Args:
+        empleados: Iterable de empleados (se consume de forma perezosa)
+        periodos: Periodo o periodos a calcular ("YYYY-MM")
+        calculadora: Calculadora a usar (por defecto, CalculadoraCostos())
+        bonos: Bonos como valor único o diccionario por ID de empleado
+        horas_extra: Horas extra como valor único o diccionario por ID
+        beneficios: Beneficios como valor único o diccionario por ID
+        otros_costos: Otros costos como valor único o diccionario por ID
+        solo_activos: Si solo se calculan costos de los empleados activos
+            (los inactivos igual se cuentan como empleados leídos)
+        tamano_fragmento: Empleados por fragmento
+        conceptos: Registros de conceptos variables leídos en flujo (por
+            ejemplo, ``iterar_conceptos_csv``), en lugar de ``bonos``,
+            ``horas_extra``, ``beneficios`` y ``otros_costos``. Requiere
+            que los empleados y los conceptos estén ordenados por ID (ver
+            combinar_conceptos)
+            
+    Returns:
+        ResultadoFlujo con los reportes y el pico de memoria
+        
+    Raises:
+        ValueError: Si el tamaño de fragmento no es positivo, algún
+            concepto no es un número ni un diccionario, se indican
+            ``conceptos`` junto con algún concepto por parámetro, o las
+            fuentes de ``conceptos`` no están ordenadas
+    """
+    calculadora = calculadora or CalculadoraCostos()
+    periodos = [periodos] if isinstance(periodos, str) else list(periodos)
+    valores = dict(zip(CONCEPTOS, (bonos, horas_extra, beneficios, otros_costos)))
+    for campo, valor in valores.items():
+        if not (valor is None or isinstance(valor, (Real, Mapping))):
+            raise ValueError(
+                f"'{campo}' debe ser un número o un diccionario por ID de empleado "
+                f"(se recibió {type(valor).__name__})"
+            )
+    
+    fragmentos = fragmentar(empleados, tamano_fragmento)
+    if conceptos is None:
+        con_conceptos: Iterable[Tuple[List[Empleado], Dict[str, Any]]] = (
+            (fragmento, valores) for fragmento in fragmentos
+        )
+    else:
+        if any(valor is not None for valor in valores.values()):
+            raise ValueError(
+                "Los conceptos variables se indican por parámetro o con 'conceptos', no ambos"
+            )
+        con_conceptos = combinar_conceptos(fragmentos, conceptos)
+    
+    agregado = AgregadoFlujo()
+    cantidad_fragmentos = 0
+    for fragmento, montos in con_conceptos:
+        a_calcular = [emp for emp in fragmento if emp.activo] if solo_activos else fragmento
+        costos = calculadora.calcular_costos_periodos(
+            a_calcular,
+            periodos,
+            tamano_fragmento=tamano_fragmento,
+            **montos,
+        )
+        agregado.agregar(fragmento, costos)
+        cantidad_fragmentos += 1
+    
+    return ResultadoFlujo(
+        por_departamento=agregado.reporte_por_departamento(),
+        metricas_clave=agregado.metricas_clave(),
+        tendencia=agregado.reporte_tendencia(),
+        cantidad_empleados=agregado.cantidad_empleados,
+        cantidad_registros=agregado.cantidad_registros,
+        cantidad_fragmentos=cantidad_fragmentos,
+        pico_rss_bytes=pico_rss(),
+    )
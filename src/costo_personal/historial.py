@@ -0,0 +1,313 @@
+"""
+Historial de empleados con vigencias por periodo.
+
+Cada empleado tiene una serie de segmentos con el salario, departamento,
+cargo y estado activo vigentes desde un periodo. Los segmentos de todos los
+empleados se guardan en arreglos NumPy ordenados por (empleado, periodo),
+con departamento y cargo codificados como enteros, de modo que la foto de la
+nómina en un periodo es una búsqueda binaria por empleado, vectorizada para
+toda la nómina y para varios periodos a la vez.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Union
+import numpy as np
+from .models import Empleado
+from .lote import CostoPersonalBatch, agrupar
+from .cargas import AtributosCargas
+from .periodos import Periodo, codificar, formatear
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .calculadora import CalculadoraCostos
+
+
+# Separación entre empleados en las claves (empleado, periodo): mayor que
+# cualquier código de periodo (año 9999)
+_ESPACIO = 10000 * 12
+
+
+@dataclass(frozen=True)
+class CambioEmpleado:
+    """
+    Cambio de los datos de un empleado que rige desde un periodo.
+    
+    Los campos en None conservan el valor vigente hasta ese periodo.
+    """
+    
+    empleado_id: str
+    periodo: str
+    salario_base: Optional[float] = None
+    departamento: Optional[str] = None
+    cargo: Optional[str] = None
+    activo: Optional[bool] = None
+    
+    def __post_init__(self):
+        if self.salario_base is not None and self.salario_base < 0:
+            raise ValueError("El salario base no puede ser negativo")
+
+
+def _arrastrar(valores: np.ndarray, presentes: np.ndarray) -> np.ndarray:
+    """Completa cada valor ausente con el último presente anterior."""
+    ultimo = np.where(presentes, np.arange(len(valores)), 0)
+    np.maximum.accumulate(ultimo, out=ultimo)
+    return valores[ultimo]
+
+
+class HistorialEmpleados:
+    """
+    Segmentos de vigencia de los datos de una nómina.
+    
+    El historial es inmutable: se construye de una vez con el estado inicial
+    de cada empleado y la lista de cambios.
+    """
+    
+    def __init__(
+        self,
+        empleados: Iterable[Empleado],
+        cambios: Iterable[CambioEmpleado] = (),
+        desde: Optional[str] = None,
+    ):
+        """
+        Inicializa el historial.
+        
+        Args:
+            empleados: Estado inicial de cada empleado
+            cambios: Cambios posteriores, en cualquier orden; si dos cambios
+                de un empleado rigen desde el mismo periodo se aplican en el
+                orden recibido
+            desde: Periodo desde el que rige el estado inicial de todos los
+                empleados (por defecto, el mes de ingreso de cada uno)
+                
+        Raises:
+            ValueError: Si hay IDs repetidos, un cambio es de un empleado
+                desconocido o rige antes de su estado inicial, o algún
+                periodo no es válido
+        """
+        empleados = list(empleados)
+        n = len(empleados)
+        self._posicion: Dict[str, int] = {}
+        for i, emp in enumerate(empleados):
+            if self._posicion.setdefault(emp.id, i) != i:
+                raise ValueError(f"El empleado '{emp.id}' está repetido")
+        
+        self.ids = np.empty(n, dtype=object)
+        self.ids[:] = [emp.id for emp in empleados]
+        self._nombre = np.empty(n, dtype=object)
+        self._nombre[:] = [emp.nombre for emp in empleados]
+        self.fecha_ingreso = np.fromiter(
+            (emp.fecha_ingreso.toordinal() for emp in empleados), dtype=np.int64, count=n
+        )
+        if desde is None:
+            inicio = np.fromiter(
+                (emp.fecha_ingreso.year * 12 + emp.fecha_ingreso.month - 1 for emp in empleados),
+                dtype=np.int64,
+                count=n,
+            )
+        else:
+            inicio = np.full(n, int(Periodo(desde)), dtype=np.int64)
+        
+        cambios = list(cambios)
+        try:
+            pos_cambios = [self._posicion[c.empleado_id] for c in cambios]
+        except KeyError as error:
+            raise ValueError(f"El empleado {error} no está en el historial") from None
+        pos = np.concatenate([np.arange(n), np.array(pos_cambios, dtype=np.int64)])
+        codigo = np.concatenate([inicio, codificar([c.periodo for c in cambios])])
+        previos = codigo[n:] < inicio[pos[n:]]
+        if previos.any():
+            cambio = cambios[int(np.argmax(previos))]
+            raise ValueError(
+                f"El cambio de '{cambio.empleado_id}' en {cambio.periodo} es anterior "
+                "a su estado inicial"
+            )
+        
+        filas = empleados + cambios
+        columnas = {}
+        for campo in ("salario_base", "departamento", "cargo", "activo"):
+            valores = np.empty(len(filas), dtype=object)
+            valores[:] = [getattr(fila, campo) for fila in filas]
+            columnas[campo] = valores
+        
+        # Orden (empleado, periodo, orden de llegada); el estado inicial de
+        # cada empleado es su primera fila y está completo, así que arrastrar
+        # los valores presentes completa los campos en None de cada cambio
+        orden = np.lexsort((np.arange(len(filas)), codigo, pos))
+        pos, codigo = pos[orden], codigo[orden]
+        for campo, valores in columnas.items():
+            valores = valores[orden]
+            columnas[campo] = _arrastrar(valores, valores != None)  # noqa: E711
+        
+        # Un segmento por (empleado, periodo) con el último estado, y sin
+        # los que repiten los datos del segmento anterior
+        claves = pos * _ESPACIO + codigo
+        ultimo = np.append(claves[1:] != claves[:-1], True)
+        pos, codigo, claves = pos[ultimo], codigo[ultimo], claves[ultimo]
+        salario = columnas["salario_base"][ultimo].astype(np.float64)
+        self.departamentos, departamento = agrupar(columnas["departamento"][ultimo])
+        self.cargos, cargo = agrupar(columnas["cargo"][ultimo])
+        activo = columnas["activo"][ultimo].astype(bool)
+        
+        cambia = np.ones(len(claves), dtype=bool)
+        cambia[1:] = (
+            (pos[1:] != pos[:-1])
+            | (salario[1:] != salario[:-1])
+            | (departamento[1:] != departamento[:-1])
+            | (cargo[1:] != cargo[:-1])
+            | (activo[1:] != activo[:-1])
+        )
+        
+        self._claves = claves[cambia]
+        self.desde = codigo[cambia]
+        self.salario_base = salario[cambia]
+        self.departamento = departamento[cambia].astype(np.int32)
+        self.cargo = cargo[cambia].astype(np.int32)
+        self.activo = activo[cambia]
+        # Segmentos del empleado i: limites[i]:limites[i + 1]
+        self.limites = np.searchsorted(pos[cambia], np.arange(n + 1))
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def __contains__(self, empleado_id: object) -> bool:
+        return empleado_id in self._posicion
+    
+    def __repr__(self) -> str:
+        return f"HistorialEmpleados(empleados={len(self)}, segmentos={self.cantidad_segmentos})"
+    
+    @property
+    def cantidad_segmentos(self) -> int:
+        return len(self._claves)
+    
+    def segmentos(self, periodos: Union[str, int, Sequence[str], np.ndarray]) -> np.ndarray:
+        """
+        Segmento vigente de cada empleado en uno o varios periodos.
+        
+        Args:
+            periodos: Un periodo o una secuencia de periodos ("YYYY-MM" o
+                códigos)
+                
+        Returns:
+            Arreglo de posiciones de segmento, de forma (empleados,) para un
+            periodo o (periodos, empleados) para varios; -1 donde el
+            empleado todavía no tenía estado inicial
+        """
+        if isinstance(periodos, (str, int, np.integer)):
+            codigos = np.int64(Periodo(periodos))
+        else:
+            codigos = codificar(periodos)[:, np.newaxis]
+        claves = np.arange(len(self), dtype=np.int64) * _ESPACIO + codigos
+        segmento = np.searchsorted(self._claves, claves, side="right") - 1
+        return np.where(segmento >= self.limites[:-1], segmento, -1)
+    
+    def vigente(self, empleado_id: str, periodo: Union[str, int]) -> Optional[Empleado]:
+        """
+        Datos de un empleado vigentes en un periodo.
+        
+        Args:
+            empleado_id: ID del empleado
+            periodo: Periodo ("YYYY-MM" o código)
+            
+        Returns:
+            Empleado con los datos del periodo, o None si su estado inicial
+            es posterior
+            
+        Raises:
+            KeyError: Si el empleado no está en el historial
+        """
+        i = self._posicion[empleado_id]
+        a, b = int(self.limites[i]), int(self.limites[i + 1])
+        segmento = bisect_right(self.desde, int(Periodo(periodo)), a, b) - 1
+        return self._empleado(i, segmento) if segmento >= a else None
+    
+    def al(self, periodo: Union[str, int], solo_activos: bool = False) -> List[Empleado]:
+        """
+        Nómina vigente en un periodo, como objetos Empleado.
+        
+        Para recalcular costos conviene ``calcular_costos_historial``, que
+        no construye objetos.
+        
+        Args:
+            periodo: Periodo ("YYYY-MM" o código)
+            solo_activos: Si solo se incluyen los empleados activos
+            
+        Returns:
+            Empleados con estado en el periodo, en el orden del historial
+        """
+        segmento = self.segmentos(periodo)
+        incluir = segmento >= 0
+        if solo_activos:
+            incluir &= self.activo[segmento]
+        return [
+            self._empleado(i, s)
+            for i, s in zip(np.flatnonzero(incluir).tolist(), segmento[incluir].tolist())
+        ]
+    
+    def _empleado(self, i: int, segmento: int) -> Empleado:
+        """Construye el Empleado ``i`` con los datos de un segmento."""
+        return Empleado(
+            id=self.ids[i],
+            nombre=self._nombre[i],
+            departamento=self.departamentos[self.departamento[segmento]],
+            cargo=self.cargos[self.cargo[segmento]],
+            salario_base=float(self.salario_base[segmento]),
+            fecha_ingreso=date.fromordinal(int(self.fecha_ingreso[i])),
+            activo=bool(self.activo[segmento]),
+        )
+
+
+def calcular_costos_historial(
+    calculadora: "CalculadoraCostos",
+    historial: HistorialEmpleados,
+    periodos: Sequence[str],
+    conceptos: Dict[str, np.ndarray],
+    solo_activos: bool = True,
+    fracciones: Optional[np.ndarray] = None,
+) -> CostoPersonalBatch:
+    """
+    Calcula los costos de varios periodos con los datos vigentes en cada uno.
+    
+    Ver CalculadoraCostos.calcular_costos_historicos.
+    
+    Args:
+        calculadora: Calculadora con la configuración a aplicar
+        historial: Historial de la nómina
+        periodos: Periodos a calcular ("YYYY-MM")
+        conceptos: Conceptos variables alineados con ``historial.ids``
+        solo_activos: Si solo se incluyen los empleados activos en cada
+            periodo
+        fracciones: Fracción trabajada (periodos, empleados del historial)
+            para prorratear el salario vigente
+            
+    Returns:
+        CostoPersonalBatch ordenado por periodo y, dentro de cada periodo,
+        en el orden del historial
+    """
+    codigos = codificar(periodos)
+    segmento = historial.segmentos(codigos)
+    incluir = segmento >= 0
+    if solo_activos:
+        incluir &= historial.activo[segmento]
+    fila, empleado = np.nonzero(incluir)
+    segmento = segmento[fila, empleado]
+    
+    salario_base = historial.salario_base[segmento]
+    if fracciones is not None:
+        fracciones = fracciones[fila, empleado]
+        salario_base = salario_base * fracciones
+    atributos = None
+    if calculadora.reglas_cargas is not None:
+        atributos = AtributosCargas(
+            historial.departamentos[historial.departamento[segmento]],
+            historial.cargos[historial.cargo[segmento]],
+            historial.fecha_ingreso[empleado],
+        )
+    
+    return CostoPersonalBatch(
+        empleado_id=historial.ids[empleado],
+        periodo=formatear(codigos)[fila],
+        salario_base=salario_base,
+        cargas_sociales=calculadora.calcular_cargas_sociales(salario_base, atributos, fracciones),
+        **{campo: valores[empleado] for campo, valores in conceptos.items()},
+    )
@@ -0,0 +1,343 @@
+"""
+Carga masiva de empleados y costos desde CSV o Excel.
+
+Los archivos se leen con pandas y se validan por columna completa (montos
+no numéricos o negativos, IDs faltantes o repetidos, periodos que no son
+"YYYY-MM", fechas inválidas), sin construir un objeto por fila. Las filas
+con errores se excluyen de los datos cargados y se informan en un reporte
+con una fila por error.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Union
+import numpy as np
+import pandas as pd
+from .models import Empleado, EmpleadoCompacto
+from .lote import CAMPOS_MONTO, CostoPersonalBatch
+
+
+COLUMNAS_EMPLEADO = ("id", "nombre", "departamento", "cargo", "salario_base", "fecha_ingreso")
+
+COLUMNAS_TEXTO_EMPLEADO = ("id", "nombre", "departamento", "cargo")
+
+COLUMNAS_ERRORES = ["fila", "columna", "valor", "error"]
+
+VALORES_VERDADEROS = ("1", "1.0", "true", "verdadero", "si", "sí", "s", "yes")
+
+VALORES_FALSOS = ("0", "0.0", "false", "falso", "no", "n")
+
+PATRON_PERIODO = r"\d{4}-(?:0[1-9]|1[0-2])"
+
+# Número de fila del archivo que corresponde a la primera fila de datos
+# (la fila 1 es el encabezado, tanto en CSV como en Excel)
+PRIMERA_FILA = 2
+
+
+@dataclass
+class ResultadoCarga:
+    """
+    Datos cargados y reporte de errores.
+    
+    Attributes:
+        datos: Filas válidas; un DataFrame tipado para empleados o un
+            CostoPersonalBatch para costos
+        errores: Un error por fila, con las columnas ``fila`` (número de
+            fila en el archivo), ``columna``, ``valor`` y ``error``
+        filas_leidas: Cantidad de filas de datos del archivo
+    """
+    
+    datos: Any
+    errores: pd.DataFrame
+    filas_leidas: int
+    
+    @property
+    def valido(self) -> bool:
+        """Si el archivo no tiene errores."""
+        return self.errores.empty
+    
+    @property
+    def filas_invalidas(self) -> int:
+        """Cantidad de filas excluidas por tener al menos un error."""
+        return self.errores["fila"].nunique()
+
+
+class _Errores:
+    """Acumula los errores detectados por máscaras de columna."""
+    
+    def __init__(self, df: pd.DataFrame):
+        self._df = df
+        self._partes: List[pd.DataFrame] = []
+        self.invalidas = np.zeros(len(df), dtype=bool)
+    
+    def agregar(self, mascara: Any, columna: str, mensaje: str) -> None:
+        """Registra un error en las filas donde ``mascara`` es verdadera."""
+        mascara = np.asarray(mascara, dtype=bool)
+        if not mascara.any():
+            return
+        posiciones = np.flatnonzero(mascara)
+        self.invalidas |= mascara
+        self._partes.append(pd.DataFrame({
+            "fila": posiciones + PRIMERA_FILA,
+            "columna": columna,
+            "valor": self._df[columna].to_numpy(dtype=object)[posiciones],
+            "error": mensaje,
+        }))
+    
+    def reporte(self) -> pd.DataFrame:
+        """Reporte de errores ordenado por fila."""
+        if not self._partes:
+            return pd.DataFrame({
+                "fila": pd.Series(dtype=np.int64),
+                "columna": pd.Series(dtype=object),
+                "valor": pd.Series(dtype=object),
+                "error": pd.Series(dtype=object),
+            })
+        errores = pd.concat(self._partes, ignore_index=True)
+        return errores.sort_values("fila", kind="stable", ignore_index=True)[COLUMNAS_ERRORES]
+
+
+def _faltante(columna: pd.Series) -> np.ndarray:
+    """Máscara de valores vacíos o nulos."""
+    nulo = columna.isna().to_numpy(dtype=bool)
+    if pd.api.types.is_numeric_dtype(columna) or pd.api.types.is_datetime64_any_dtype(columna):
+        return nulo
+    if not isinstance(columna.dtype, pd.StringDtype):
+        columna = columna.astype("string")
+    return nulo | (columna.str.strip() == "").fillna(True).to_numpy(dtype=bool)
+
+
+def _numerico(columna: pd.Series) -> pd.Series:
+    """Convierte una columna a float64 (NaN donde no es numérica)."""
+    if columna.dtype == np.float64:
+        return columna
+    return pd.to_numeric(columna, errors="coerce").astype(np.float64)
+
+
+def _verificar_columnas(df: pd.DataFrame, requeridas: Sequence[str], origen: str) -> None:
+    """Verifica que el archivo tenga las columnas requeridas."""
+    faltantes = [c for c in requeridas if c not in df.columns]
+    if faltantes:
+        raise ValueError(f"{origen}: faltan las columnas {', '.join(faltantes)}")
+
+
+def validar_empleados(df: pd.DataFrame, origen: str = "empleados") -> ResultadoCarga:
+    """
+    Valida y tipa una tabla de empleados.
+    
+    Args:
+        df: Tabla con las columnas de Empleado.to_dict (``activo`` es
+            opcional y vale True si falta o está vacío)
+        origen: Nombre del origen para los mensajes de error
+        
+    Returns:
+        ResultadoCarga cuyo ``datos`` es un DataFrame con ``salario_base``
+        float64, ``fecha_ingreso`` datetime64 y ``activo`` bool
+        
+    Raises:
+        ValueError: Si faltan columnas requeridas
+    """
+    _verificar_columnas(df, COLUMNAS_EMPLEADO, origen)
+    df = df.reset_index(drop=True)
+    errores = _Errores(df)
+    
+    for columna in COLUMNAS_TEXTO_EMPLEADO:
+        errores.agregar(_faltante(df[columna]), columna, "Valor faltante")
+    
+    texto = {c: df[c].astype(str).str.strip() for c in COLUMNAS_TEXTO_EMPLEADO}
+    id_valido = ~_faltante(df["id"])
+    errores.agregar(
+        id_valido & texto["id"].duplicated(keep=False).to_numpy(), "id", "ID duplicado"
+    )
+    
+    salario = _numerico(df["salario_base"])
+    sin_numero = salario.isna().to_numpy()
+    errores.agregar(sin_numero, "salario_base", "Monto inválido")
+    errores.agregar(
+        ~sin_numero & (salario < 0).to_numpy(),
+        "salario_base",
+        "El salario base no puede ser negativo",
+    )
+    
+    fecha = pd.to_datetime(df["fecha_ingreso"], format="%Y-%m-%d", errors="coerce")
+    errores.agregar(fecha.isna().to_numpy(), "fecha_ingreso", "Fecha inválida (se espera YYYY-MM-DD)")
+    
+    if "activo" in df.columns:
+        # Una celda vacía vale True, igual que si falta la columna
+        valor = df["activo"].astype("string").str.strip().str.lower()
+        vacio = _faltante(df["activo"])
+        verdadero = valor.isin(VALORES_VERDADEROS).to_numpy(dtype=bool) | vacio
+        falso = valor.isin(VALORES_FALSOS).to_numpy(dtype=bool)
+        errores.agregar(~(verdadero | falso), "activo", "Valor booleano inválido")
+        activo = pd.Series(verdadero, index=df.index)
+    else:
+        activo = pd.Series(True, index=df.index)
+    
+    validas = ~errores.invalidas
+    datos = pd.DataFrame({
+        **texto,
+        "salario_base": salario,
+        "fecha_ingreso": fecha,
+        "activo": activo,
+    })[validas].reset_index(drop=True)
+    
+    return ResultadoCarga(datos=datos, errores=errores.reporte(), filas_leidas=len(df))
+
+
+def validar_costos(df: pd.DataFrame, origen: str = "costos") -> ResultadoCarga:
+    """
+    Valida una tabla de costos y la convierte a CostoPersonalBatch.
+    
+    Args:
+        df: Tabla con ``empleado_id``, ``periodo`` y ``salario_base``; los
+            demás montos son opcionales (0.0 si faltan o están vacíos), no
+            pueden ser negativos y ``costo_total`` se ignora
+        origen: Nombre del origen para los mensajes de error
+        
+    Returns:
+        ResultadoCarga cuyo ``datos`` es un CostoPersonalBatch
+        
+    Raises:
+        ValueError: Si faltan columnas requeridas
+    """
+    _verificar_columnas(df, ("empleado_id", "periodo", "salario_base"), origen)
+    df = df.reset_index(drop=True)
+    errores = _Errores(df)
+    
+    errores.agregar(_faltante(df["empleado_id"]), "empleado_id", "ID faltante")
+    
+    periodo = df["periodo"].astype("string").str.strip()
+    periodo_valido = periodo.str.fullmatch(PATRON_PERIODO).fillna(False).to_numpy(dtype=bool)
+    errores.agregar(~periodo_valido, "periodo", "Periodo inválido (se espera YYYY-MM)")
+    
+    empleado_id = df["empleado_id"].astype(str).str.strip()
+    clave_valida = periodo_valido & ~_faltante(df["empleado_id"])
+    duplicada = pd.DataFrame({"id": empleado_id, "periodo": periodo}).duplicated(keep=False)
+    errores.agregar(
+        clave_valida & duplicada.to_numpy(), "empleado_id", "Registro duplicado para el periodo"
+    )
+    
+    montos: Dict[str, np.ndarray] = {}
+    for campo in CAMPOS_MONTO:
+        if campo not in df.columns:
+            continue
+        valores = _numerico(df[campo])
+        sin_numero = valores.isna().to_numpy()
+        if campo == "salario_base":
+            errores.agregar(sin_numero, campo, "Monto inválido")
+            negativo = "El salario base no puede ser negativo"
+        else:
+            errores.agregar(sin_numero & ~_faltante(df[campo]), campo, "Monto inválido")
+            negativo = "El monto no puede ser negativo"
+        errores.agregar(~sin_numero & (valores < 0).to_numpy(), campo, negativo)
+        montos[campo] = valores.fillna(0.0).to_numpy(dtype=np.float64)
+    
+    validas = ~errores.invalidas
+    datos = CostoPersonalBatch(
+        empleado_id=empleado_id.to_numpy(dtype=object)[validas],
+        periodo=periodo.to_numpy(dtype=object)[validas],
+        **{campo: valores[validas] for campo, valores in montos.items()},
+    )
+    return ResultadoCarga(datos=datos, errores=errores.reporte(), filas_leidas=len(df))
+
+
+def cargar_empleados_csv(ruta: str, encoding: str = "utf-8", **kwargs: Any) -> ResultadoCarga:
+    """
+    Carga empleados desde un CSV.
+    
+    Args:
+        ruta: Ruta del archivo
+        encoding: Codificación del archivo
+        **kwargs: Argumentos adicionales para pandas.read_csv (``sep``...)
+        
+    Returns:
+        ResultadoCarga (ver validar_empleados)
+    """
+    df = pd.read_csv(
+        ruta,
+        encoding=encoding,
+        dtype={c: str for c in COLUMNAS_TEXTO_EMPLEADO + ("fecha_ingreso", "activo")},
+        **kwargs,
+    )
+    return validar_empleados(df, origen=str(ruta))
+
+
+def cargar_costos_csv(ruta: str, encoding: str = "utf-8", **kwargs: Any) -> ResultadoCarga:
+    """
+    Carga costos desde un CSV (por ejemplo, uno generado con exportar_csv_por_lotes).
+    
+    Args:
+        ruta: Ruta del archivo
+        encoding: Codificación del archivo
+        **kwargs: Argumentos adicionales para pandas.read_csv (``sep``...)
+        
+    Returns:
+        ResultadoCarga (ver validar_costos)
+    """
+    df = pd.read_csv(
+        ruta, encoding=encoding, dtype={"empleado_id": str, "periodo": str}, **kwargs
+    )
+    return validar_costos(df, origen=str(ruta))
+
+
+def cargar_empleados_excel(ruta: str, hoja: Union[str, int] = 0) -> ResultadoCarga:
+    """
+    Carga empleados desde una hoja de Excel.
+    
+    Args:
+        ruta: Ruta del archivo .xlsx
+        hoja: Nombre o índice de la hoja
+        
+    Returns:
+        ResultadoCarga (ver validar_empleados)
+    """
+    df = pd.read_excel(ruta, sheet_name=hoja, dtype={c: str for c in COLUMNAS_TEXTO_EMPLEADO})
+    return validar_empleados(df, origen=f"{ruta}[{hoja}]")
+
+
+def cargar_costos_excel(ruta: str, hoja: Union[str, int] = 0) -> ResultadoCarga:
+    """
+    Carga costos desde una hoja de Excel.
+    
+    Args:
+        ruta: Ruta del archivo .xlsx
+        hoja: Nombre o índice de la hoja
+        
+    Returns:
+        ResultadoCarga (ver validar_costos)
+    """
+    df = pd.read_excel(ruta, sheet_name=hoja, dtype={"empleado_id": str, "periodo": str})
+    return validar_costos(df, origen=f"{ruta}[{hoja}]")
+
+
+def empleados_desde_dataframe(
+    df: pd.DataFrame,
+    compactos: bool = False,
+) -> List[Empleado]:
+    """
+    Convierte empleados ya validados (``ResultadoCarga.datos``) a objetos Empleado.
+    
+    La conversión es aparte de la carga: solo hace falta para las funciones
+    que reciben listas de empleados.
+    
+    Args:
+        df: DataFrame devuelto por validar_empleados o las funciones de carga
+        compactos: Si se crean EmpleadoCompacto (departamento y cargo
+            internados, sin ``__dict__``) en lugar de Empleado
+            
+    Returns:
+        Lista de empleados en el orden del DataFrame
+    """
+    clase = EmpleadoCompacto if compactos else Empleado
+    fechas = df["fecha_ingreso"].dt.date.tolist()
+    return [
+        clase(id_, nombre, departamento, cargo, salario, fecha, activo)
+        for id_, nombre, departamento, cargo, salario, fecha, activo in zip(
+            df["id"].tolist(),
+            df["nombre"].tolist(),
+            df["departamento"].tolist(),
+            df["cargo"].tolist(),
+            df["salario_base"].tolist(),
+            fechas,
+            df["activo"].tolist(),
+        )
+    ]
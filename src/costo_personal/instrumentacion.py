@@ -0,0 +1,400 @@
+"""
+Instrumentación opcional de los cálculos y reportes.
+
+Los métodos principales de CalculadoraCostos, GeneradorReportes y los demás
+módulos están decorados con ``medido``; mientras no haya una Instrumentacion
+activa la envoltura solo consulta una variable global y llama al método.
+Al activarla (como context manager o con ``activar``) se acumulan tiempos y
+filas por método, contadores (por ejemplo, aciertos y fallos de la caché) y,
+opcionalmente, el pico de memoria, y cada evento se envía a los sumideros
+configurados: cualquier función que reciba un diccionario, un archivo JSON
+por líneas, el módulo logging o un archivo de texto en formato Prometheus.
+
+Solo se mide el proceso actual: los cálculos enviados a otros procesos
+(``procesos`` distinto de 1) se ven como una única llamada del proceso
+principal.
+"""
+
+import functools
+import inspect
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, TypeVar, Union
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+Sumidero = Callable[[Dict[str, Any]], None]
+
+# Instrumentación activa del proceso (None = desactivada)
+_activa: Optional["Instrumentacion"] = None
+
+
+def pico_rss() -> Optional[int]:
+    """Pico de memoria residente del proceso en bytes (None si no se puede medir)."""
+    if resource is None:  # pragma: no cover - Windows
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa kilobytes y macOS bytes
+    return pico if sys.platform == "darwin" else pico * 1024
+
+
+def _contar_filas(valor: Any) -> Optional[int]:
+    """Cantidad de filas de un resultado o argumento, si se puede saber."""
+    if isinstance(valor, bool):
+        return None
+    if isinstance(valor, int):
+        return valor
+    try:
+        return len(valor)
+    except TypeError:
+        return None
+
+
+def medido(nombre: str, filas: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Decora una función para medirla cuando hay una instrumentación activa.
+    
+    Args:
+        nombre: Nombre de la métrica (por ejemplo, "calculadora.calcular_costos_lote")
+        filas: Qué contar como filas procesadas: "resultado" (el largo del
+            resultado, o el resultado si es un entero) o el nombre de un
+            argumento cuyo largo se cuenta
+            
+    Returns:
+        Decorador
+    """
+    def decorador(funcion: F) -> F:
+        firma = None if filas in (None, "resultado") else inspect.signature(funcion)
+        
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            activa = _activa
+            if activa is None:
+                return funcion(*args, **kwargs)
+            
+            inicio = time.perf_counter()
+            resultado = funcion(*args, **kwargs)
+            segundos = time.perf_counter() - inicio
+            
+            if filas == "resultado":
+                cantidad = _contar_filas(resultado)
+            elif firma is not None:
+                cantidad = _contar_filas(firma.bind(*args, **kwargs).arguments.get(filas))
+            else:
+                cantidad = None
+            activa.registrar(nombre, segundos, cantidad)
+            return resultado
+        
+        return envoltura  # type: ignore[return-value]
+    
+    return decorador
+
+
+def contar(nombre: str, cantidad: int = 1) -> None:
+    """
+    Incrementa un contador de la instrumentación activa (si hay una).
+    
+    Los contadores terminados en ".aciertos" y ".fallos" se resumen además
+    como una tasa de aciertos.
+    """
+    activa = _activa
+    if activa is not None:
+        activa.incrementar(nombre, cantidad)
+
+
+def instrumentacion_activa() -> Optional["Instrumentacion"]:
+    """Instrumentación activa del proceso, o None."""
+    return _activa
+
+
+class Instrumentacion:
+    """
+    Acumula métricas mientras está activa.
+    
+    Uso típico, para perfilar una ejecución::
+    
+        with Instrumentacion(sumideros=[SumideroJSON("metricas.jsonl")], memoria=True) as inst:
+            calculadora.calcular_costos_lote(empleados, "2025-01")
+            generador.generar_paquete_reportes(empleados, costos)
+        inst.resumen()
+        
+    Las instrumentaciones se pueden anidar: al salir se restaura la anterior.
+    """
+    
+    def __init__(self, sumideros: Iterable[Sumidero] = (), memoria: bool = False):
+        """
+        Inicializa la instrumentación (inactiva).
+        
+        Args:
+            sumideros: Funciones que reciben cada evento (un diccionario con
+                ``tipo`` "llamada" o "resumen")
+            memoria: Si se mide el pico de memoria con tracemalloc mientras
+                está activa (encarece las asignaciones de memoria)
+        """
+        self.sumideros: List[Sumidero] = list(sumideros)
+        self.memoria = memoria
+        self._metodos: Dict[str, Dict[str, Any]] = {}
+        self._contadores: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._anterior: Optional[Instrumentacion] = None
+        self._inicio: Optional[float] = None
+        self._duracion = 0.0
+        self._inicio_tracemalloc = False
+        self._pico_memoria: Optional[int] = None
+    
+    def activar(self) -> "Instrumentacion":
+        """Activa la instrumentación para todo el proceso."""
+        global _activa
+        self._anterior = _activa
+        _activa = self
+        self._inicio = time.perf_counter()
+        if self.memoria and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._inicio_tracemalloc = True
+        return self
+    
+    def desactivar(self) -> None:
+        """Desactiva la instrumentación y envía el resumen a los sumideros."""
+        global _activa
+        if self._inicio is None:
+            return
+        if self.memoria and tracemalloc.is_tracing():
+            self._pico_memoria = tracemalloc.get_traced_memory()[1]
+            if self._inicio_tracemalloc:
+                tracemalloc.stop()
+                self._inicio_tracemalloc = False
+        self._duracion += time.perf_counter() - self._inicio
+        self._inicio = None
+        _activa = self._anterior
+        self._anterior = None
+        
+        self._emitir({"tipo": "resumen", **self.resumen()})
+        for sumidero in self.sumideros:
+            cerrar = getattr(sumidero, "cerrar", None)
+            if cerrar is not None:
+                cerrar()
+    
+    def __enter__(self) -> "Instrumentacion":
+        return self.activar()
+    
+    def __exit__(self, *exc: Any) -> None:
+        self.desactivar()
+    
+    def registrar(self, nombre: str, segundos: float, filas: Optional[int] = None) -> None:
+        """
+        Registra una llamada medida.
+        
+        Args:
+            nombre: Nombre del método
+            segundos: Duración de la llamada
+            filas: Filas procesadas (si se conocen)
+        """
+        with self._lock:
+            metodo = self._metodos.get(nombre)
+            if metodo is None:
+                metodo = self._metodos[nombre] = {
+                    "llamadas": 0, "segundos_total": 0.0, "segundos_max": 0.0, "filas": 0,
+                }
+            metodo["llamadas"] += 1
+            metodo["segundos_total"] += segundos
+            metodo["segundos_max"] = max(metodo["segundos_max"], segundos)
+            if filas is not None:
+                metodo["filas"] += filas
+        
+        if self.sumideros:
+            self._emitir({"tipo": "llamada", "nombre": nombre, "segundos": segundos, "filas": filas})
+    
+    def incrementar(self, nombre: str, cantidad: int = 1) -> None:
+        """Incrementa un contador."""
+        with self._lock:
+            self._contadores[nombre] = self._contadores.get(nombre, 0) + cantidad
+    
+    def resumen(self) -> Dict[str, Any]:
+        """
+        Devuelve las métricas acumuladas.
+        
+        Returns:
+            Diccionario con ``metodos`` (llamadas, tiempos, filas y filas por
+            segundo de cada método), ``contadores``, ``tasas_aciertos``,
+            ``pico_memoria_bytes`` (None si no se midió), ``pico_rss_bytes``
+            y ``duracion_segundos``
+        """
+        with self._lock:
+            metodos = {}
+            for nombre, m in self._metodos.items():
+                metodos[nombre] = {
+                    **m,
+                    "segundos_promedio": m["segundos_total"] / m["llamadas"],
+                    "filas_por_segundo": (
+                        m["filas"] / m["segundos_total"] if m["segundos_total"] > 0 else 0.0
+                    ),
+                }
+            contadores = dict(self._contadores)
+        
+        tasas = {}
+        for nombre, aciertos in contadores.items():
+            if nombre.endswith(".aciertos"):
+                prefijo = nombre[:-len(".aciertos")]
+                consultas = aciertos + contadores.get(prefijo + ".fallos", 0)
+                tasas[prefijo] = aciertos / consultas if consultas > 0 else 0.0
+        
+        duracion = self._duracion
+        if self._inicio is not None:
+            duracion += time.perf_counter() - self._inicio
+        pico_memoria = self._pico_memoria
+        if self._inicio is not None and self.memoria and tracemalloc.is_tracing():
+            pico_memoria = tracemalloc.get_traced_memory()[1]
+        
+        return {
+            "metodos": metodos,
+            "contadores": contadores,
+            "tasas_aciertos": tasas,
+            "pico_memoria_bytes": pico_memoria,
+            "pico_rss_bytes": pico_rss(),
+            "duracion_segundos": duracion,
+        }
+    
+    def a_prometheus(self, prefijo: str = "costo_personal") -> str:
+        """Exporta el resumen en el formato de texto de Prometheus (ver formato_prometheus)."""
+        return formato_prometheus(self.resumen(), prefijo)
+    
+    def _emitir(self, evento: Dict[str, Any]) -> None:
+        """Envía un evento a todos los sumideros."""
+        for sumidero in self.sumideros:
+            sumidero(evento)
+
+
+def formato_prometheus(resumen: Dict[str, Any], prefijo: str = "costo_personal") -> str:
+    """
+    Convierte un resumen de Instrumentacion al formato de texto de Prometheus.
+    
+    Args:
+        resumen: Resultado de Instrumentacion.resumen (o un evento "resumen")
+        prefijo: Prefijo de los nombres de métricas
+        
+    Returns:
+        Texto apto para el "textfile collector" de node_exporter o para
+        servirlo en un endpoint /metrics
+    """
+    lineas: List[str] = []
+    
+    def metrica(nombre: str, tipo: str, ayuda: str, valores: Dict[str, Any], etiqueta: str) -> None:
+        if not valores:
+            return
+        lineas.append(f"# HELP {prefijo}_{nombre} {ayuda}")
+        lineas.append(f"# TYPE {prefijo}_{nombre} {tipo}")
+        for clave, valor in valores.items():
+            lineas.append(f'{prefijo}_{nombre}{{{etiqueta}="{clave}"}} {valor}')
+    
+    metodos = resumen["metodos"]
+    metrica("llamadas_total", "counter", "Llamadas por método",
+            {k: m["llamadas"] for k, m in metodos.items()}, "metodo")
+    metrica("segundos_total", "counter", "Tiempo acumulado por método",
+            {k: m["segundos_total"] for k, m in metodos.items()}, "metodo")
+    metrica("filas_total", "counter", "Filas procesadas por método",
+            {k: m["filas"] for k, m in metodos.items()}, "metodo")
+    metrica("eventos_total", "counter", "Contadores (aciertos y fallos de caché, etc.)",
+            resumen["contadores"], "nombre")
+    metrica("tasa_aciertos", "gauge", "Tasa de aciertos de cada caché",
+            resumen["tasas_aciertos"], "cache")
+    
+    for nombre, ayuda in (
+        ("pico_memoria_bytes", "Pico de memoria asignada (tracemalloc)"),
+        ("pico_rss_bytes", "Pico de memoria residente del proceso"),
+    ):
+        if resumen.get(nombre) is not None:
+            lineas.append(f"# HELP {prefijo}_{nombre} {ayuda}")
+            lineas.append(f"# TYPE {prefijo}_{nombre} gauge")
+            lineas.append(f"{prefijo}_{nombre} {resumen[nombre]}")
+    
+    return "\n".join(lineas) + "\n"
+
+
+def perfilar(
+    sumideros: Iterable[Sumidero] = (),
+    memoria: bool = True,
+) -> Instrumentacion:
+    """
+    Crea una instrumentación para perfilar una ejecución con ``with``.
+    
+    Equivale a ``Instrumentacion(sumideros, memoria)`` pero mide la memoria
+    por defecto.
+    """
+    return Instrumentacion(sumideros=sumideros, memoria=memoria)
+
+
+class SumideroJSON:
+    """Escribe cada evento como una línea JSON en un archivo o stream."""
+    
+    def __init__(self, destino: Union[str, IO[str]]):
+        """
+        Inicializa el sumidero.
+        
+        Args:
+            destino: Ruta del archivo (se agrega al final) o stream de texto
+        """
+        self._ruta = destino if isinstance(destino, str) else None
+        self._stream: Optional[IO[str]] = None if isinstance(destino, str) else destino
+    
+    def __call__(self, evento: Dict[str, Any]) -> None:
+        if self._stream is None:
+            self._stream = open(self._ruta, "a", encoding="utf-8")
+        self._stream.write(json.dumps(evento, ensure_ascii=False) + "\n")
+    
+    def cerrar(self) -> None:
+        """Cierra el archivo si lo abrió el sumidero."""
+        if self._ruta is not None and self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+
+class SumideroLogging:
+    """Envía cada evento como JSON al módulo logging."""
+    
+    def __init__(self, logger: Optional[logging.Logger] = None, nivel: int = logging.INFO):
+        """
+        Inicializa el sumidero.
+        
+        Args:
+            logger: Logger a usar (por defecto, "costo_personal.instrumentacion")
+            nivel: Nivel de los mensajes
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.nivel = nivel
+    
+    def __call__(self, evento: Dict[str, Any]) -> None:
+        self.logger.log(self.nivel, json.dumps(evento, ensure_ascii=False))
+
+
+class SumideroPrometheus:
+    """Escribe el resumen en formato de texto Prometheus al desactivar."""
+    
+    def __init__(self, ruta: str, prefijo: str = "costo_personal"):
+        """
+        Inicializa el sumidero.
+        
+        Args:
+            ruta: Archivo .prom a escribir (se reemplaza en cada resumen)
+            prefijo: Prefijo de los nombres de métricas
+        """
+        self.ruta = ruta
+        self.prefijo = prefijo
+    
+    def __call__(self, evento: Dict[str, Any]) -> None:
+        if evento["tipo"] != "resumen":
+            return
+        temporal = self.ruta + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            archivo.write(formato_prometheus(evento, self.prefijo))
+        os.replace(temporal, self.ruta)
@@ -0,0 +1,418 @@
+"""
+Contenedor columnar de costos de personal.
+
+Un ``CostoPersonalBatch`` almacena muchos costos como arreglos NumPy
+(una columna por campo) en lugar de una lista de objetos ``CostoPersonal``.
+Los montos son float64 o, si el lote tiene una ``Moneda``, enteros int64 en
+unidades menores.
+"""
+
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from .models import CostoPersonal, CostoPersonalCompacto
+from .dinero import Moneda
+from .periodos import IndicePeriodos
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+CAMPOS_MONTO = (
+    "salario_base",
+    "bonos",
+    "horas_extra",
+    "beneficios",
+    "cargas_sociales",
+    "otros_costos",
+)
+
+CAMPOS = ("empleado_id", "periodo") + CAMPOS_MONTO
+
+
+def _columna_texto(valores: Any) -> np.ndarray:
+    """Convierte valores a un arreglo de objetos (cadenas)."""
+    if isinstance(valores, np.ndarray) and valores.dtype == object:
+        return valores
+    arreglo = np.empty(len(valores), dtype=object)
+    arreglo[:] = list(valores)
+    return arreglo
+
+
+def _columna_monto(valores: Any, n: int) -> np.ndarray:
+    """Convierte valores a un arreglo float64 de largo ``n``."""
+    if valores is None:
+        return np.zeros(n, dtype=np.float64)
+    arreglo = np.asarray(valores, dtype=np.float64)
+    if arreglo.ndim == 0:
+        return np.full(n, float(arreglo), dtype=np.float64)
+    return arreglo
+
+
+def _columna_unidades(valores: Any, n: int) -> np.ndarray:
+    """Convierte valores enteros a un arreglo int64 de largo ``n``."""
+    if valores is None:
+        return np.zeros(n, dtype=np.int64)
+    arreglo = np.asarray(valores)
+    if arreglo.size and arreglo.dtype.kind not in "iu":
+        raise ValueError(
+            "Los montos en unidades menores deben ser enteros (ver Moneda.a_unidades)"
+        )
+    arreglo = arreglo.astype(np.int64, copy=False)
+    if arreglo.ndim == 0:
+        return np.full(n, int(arreglo), dtype=np.int64)
+    return arreglo
+
+
+class CostoPersonalBatch:
+    """Conjunto de costos de personal almacenado por columnas."""
+    
+    def __init__(
+        self,
+        empleado_id: Sequence[str],
+        periodo: Union[str, Sequence[str]],
+        salario_base: Any,
+        bonos: Any = None,
+        horas_extra: Any = None,
+        beneficios: Any = None,
+        cargas_sociales: Any = None,
+        otros_costos: Any = None,
+        moneda: Optional[Moneda] = None,
+    ):
+        """
+        Inicializa el lote a partir de columnas.
+        
+        Args:
+            empleado_id: IDs de empleado, uno por registro
+            periodo: Periodo de cada registro ("YYYY-MM") o un único periodo
+            salario_base: Salarios base
+            bonos: Bonos (por defecto 0.0)
+            horas_extra: Costo de horas extra (por defecto 0.0)
+            beneficios: Beneficios adicionales (por defecto 0.0)
+            cargas_sociales: Cargas sociales (por defecto 0.0)
+            otros_costos: Otros costos asociados (por defecto 0.0)
+            moneda: Si se indica, los montos son enteros en unidades menores
+                de esa moneda (por ejemplo, centavos)
+                
+        Raises:
+            ValueError: Si las columnas no tienen el mismo largo o, con
+                ``moneda``, algún monto no es entero
+        """
+        self.empleado_id = _columna_texto(empleado_id)
+        n = len(self.empleado_id)
+        
+        if isinstance(periodo, str):
+            self.periodo = np.full(n, periodo, dtype=object)
+        else:
+            self.periodo = _columna_texto(periodo)
+        
+        self.moneda = moneda
+        columna = _columna_monto if moneda is None else _columna_unidades
+        self.salario_base = columna(salario_base, n)
+        self.bonos = columna(bonos, n)
+        self.horas_extra = columna(horas_extra, n)
+        self.beneficios = columna(beneficios, n)
+        self.cargas_sociales = columna(cargas_sociales, n)
+        self.otros_costos = columna(otros_costos, n)
+        
+        for campo in CAMPOS:
+            if len(getattr(self, campo)) != n:
+                raise ValueError(
+                    f"La columna '{campo}' no tiene el largo esperado ({n})"
+                )
+    
+    @classmethod
+    def vacio(cls, moneda: Optional[Moneda] = None) -> "CostoPersonalBatch":
+        """Crea un lote sin registros."""
+        return cls(empleado_id=[], periodo=[], salario_base=[], moneda=moneda)
+    
+    @classmethod
+    def from_costos(cls, costos: Iterable[CostoPersonal]) -> "CostoPersonalBatch":
+        """
+        Crea un lote a partir de objetos CostoPersonal.
+        
+        Args:
+            costos: Costos de personal
+            
+        Returns:
+            CostoPersonalBatch con los mismos registros
+        """
+        costos = list(costos)
+        return cls(
+            empleado_id=[c.empleado_id for c in costos],
+            periodo=[c.periodo for c in costos],
+            salario_base=[c.salario_base for c in costos],
+            bonos=[c.bonos for c in costos],
+            horas_extra=[c.horas_extra for c in costos],
+            beneficios=[c.beneficios for c in costos],
+            cargas_sociales=[c.cargas_sociales for c in costos],
+            otros_costos=[c.otros_costos for c in costos],
+        )
+    
+    @classmethod
+    def from_dataframe(cls, df: "pd.DataFrame") -> "CostoPersonalBatch":
+        """
+        Crea un lote a partir de un DataFrame.
+        
+        Las columnas numéricas float64 se toman sin copia. Las columnas de
+        montos ausentes se completan con 0.0 y ``costo_total`` se ignora.
+        
+        Args:
+            df: DataFrame con las columnas de CostoPersonal
+            
+        Returns:
+            CostoPersonalBatch con los datos del DataFrame
+        """
+        columnas = {
+            "empleado_id": df["empleado_id"].to_numpy(dtype=object),
+            "periodo": df["periodo"].to_numpy(dtype=object),
+        }
+        for campo in CAMPOS_MONTO:
+            if campo in df.columns:
+                columnas[campo] = df[campo].to_numpy(dtype=np.float64)
+        return cls(**columnas)
+    
+    @classmethod
+    def concatenar(cls, lotes: Iterable["CostoPersonalBatch"]) -> "CostoPersonalBatch":
+        """
+        Une varios lotes en uno solo, conservando el orden.
+        
+        Args:
+            lotes: Lotes a unir
+            
+        Returns:
+            CostoPersonalBatch con todos los registros
+            
+        Raises:
+            ValueError: Si los lotes no tienen la misma moneda
+        """
+        lotes = list(lotes)
+        if not lotes:
+            return cls.vacio()
+        moneda = lotes[0].moneda
+        if any(lote.moneda != moneda for lote in lotes):
+            raise ValueError("No se pueden unir lotes con distinta moneda")
+        return cls(
+            **{
+                campo: np.concatenate([getattr(lote, campo) for lote in lotes])
+                for campo in CAMPOS
+            },
+            moneda=moneda,
+        )
+    
+    def en_unidades(self, moneda: Moneda) -> "CostoPersonalBatch":
+        """
+        Convierte los montos a unidades menores enteras.
+        
+        Args:
+            moneda: Moneda con los decimales y la política de redondeo
+            
+        Returns:
+            CostoPersonalBatch con montos int64 (el mismo lote si ya usa
+            esa moneda)
+            
+        Raises:
+            ValueError: Si el lote ya está en unidades de otra moneda
+        """
+        if self.moneda == moneda:
+            return self
+        if self.moneda is not None:
+            raise ValueError("El lote ya está en unidades menores de otra moneda")
+        return CostoPersonalBatch(
+            empleado_id=self.empleado_id,
+            periodo=self.periodo,
+            **{campo: moneda.a_unidades(getattr(self, campo)) for campo in CAMPOS_MONTO},
+            moneda=moneda,
+        )
+    
+    def en_float(self) -> "CostoPersonalBatch":
+        """Devuelve el lote con montos float64 (el mismo lote si ya los usa)."""
+        if self.moneda is None:
+            return self
+        return CostoPersonalBatch(
+            empleado_id=self.empleado_id,
+            periodo=self.periodo,
+            **{campo: self.moneda.a_float(getattr(self, campo)) for campo in CAMPOS_MONTO},
+        )
+    
+    def indice_periodos(self) -> IndicePeriodos:
+        """
+        Construye el índice de periodos del lote para consultas por rango.
+        
+        Conviene construirlo una vez y pasarlo a ``entre_periodos`` cuando
+        se consultan varios rangos del mismo lote.
+        """
+        return IndicePeriodos(self.periodo)
+    
+    def entre_periodos(
+        self,
+        desde: Optional[str] = None,
+        hasta: Optional[str] = None,
+        indice: Optional[IndicePeriodos] = None,
+    ) -> "CostoPersonalBatch":
+        """
+        Selecciona los registros con periodo entre ``desde`` y ``hasta``.
+        
+        Args:
+            desde: Primer periodo ("YYYY-MM"), inclusive (None = sin límite)
+            hasta: Último periodo ("YYYY-MM"), inclusive (None = sin límite)
+            indice: Índice de periodos de este lote (ver
+                ``indice_periodos``); si no se indica se construye
+                
+        Returns:
+            CostoPersonalBatch ordenado por periodo. Si el lote ya estaba
+            ordenado, sus columnas son vistas del lote original
+            
+        Raises:
+            ValueError: Si el índice no corresponde al lote o algún periodo
+                no es válido
+        """
+        indice = indice if indice is not None else self.indice_periodos()
+        if len(indice) != len(self):
+            raise ValueError("El índice de periodos no corresponde al lote")
+        return self[indice.posiciones(desde, hasta)]
+    
+    @property
+    def costo_total(self) -> np.ndarray:
+        """
+        Calcula el costo total de cada registro.
+        
+        Con ``moneda`` la suma es entera y exacta, en unidades menores.
+        """
+        return (
+            self.salario_base +
+            self.bonos +
+            self.horas_extra +
+            self.beneficios +
+            self.cargas_sociales +
+            self.otros_costos
+        )
+    
+    def __len__(self) -> int:
+        return len(self.empleado_id)
+    
+    def __iter__(self) -> Iterator[CostoPersonal]:
+        for i in range(len(self)):
+            yield self._fila(i)
+    
+    def __getitem__(self, clave: Any) -> Union[CostoPersonal, "CostoPersonalBatch"]:
+        """
+        Accede a un registro o a un subconjunto del lote.
+        
+        Un índice entero devuelve un CostoPersonal; un slice, máscara
+        booleana o arreglo de índices devuelve un nuevo CostoPersonalBatch.
+        """
+        if isinstance(clave, (int, np.integer)):
+            n = len(self)
+            if clave < 0:
+                clave += n
+            if not 0 <= clave < n:
+                raise IndexError("Índice fuera de rango")
+            return self._fila(int(clave))
+        return CostoPersonalBatch(
+            **{campo: getattr(self, campo)[clave] for campo in CAMPOS},
+            moneda=self.moneda,
+        )
+    
+    def __repr__(self) -> str:
+        if self.moneda is None:
+            return f"CostoPersonalBatch(registros={len(self)})"
+        return f"CostoPersonalBatch(registros={len(self)}, decimales={self.moneda.decimales})"
+    
+    def _fila(self, i: int) -> CostoPersonal:
+        """Construye el CostoPersonal de la fila ``i`` (montos en float)."""
+        monto = float if self.moneda is None else self.moneda.a_float
+        return CostoPersonal(
+            empleado_id=self.empleado_id[i],
+            periodo=self.periodo[i],
+            salario_base=monto(self.salario_base[i]),
+            bonos=monto(self.bonos[i]),
+            horas_extra=monto(self.horas_extra[i]),
+            beneficios=monto(self.beneficios[i]),
+            cargas_sociales=monto(self.cargas_sociales[i]),
+            otros_costos=monto(self.otros_costos[i]),
+        )
+    
+    def to_costos(self, compactos: bool = False) -> List[Any]:
+        """
+        Convierte el lote a una lista de costos.
+        
+        Args:
+            compactos: Si se crean CostoPersonalCompacto (menos memoria y
+                más rápidos de crear) en lugar de CostoPersonal
+                
+        Returns:
+            Lista con un costo por registro, con montos en float
+        """
+        if not compactos:
+            return list(self)
+        lote = self.en_float()
+        return list(map(CostoPersonalCompacto, *(getattr(lote, campo).tolist() for campo in CAMPOS)))
+    
+    def to_dataframe(self, incluir_total: bool = True) -> "pd.DataFrame":
+        """
+        Convierte el lote a un DataFrame sin copiar las columnas.
+        
+        Los montos en unidades menores se convierten a float.
+        
+        Args:
+            incluir_total: Si se agrega la columna calculada ``costo_total``
+            
+        Returns:
+            DataFrame con una columna por campo
+        """
+        import pandas as pd
+        
+        lote = self.en_float()
+        data = {campo: getattr(lote, campo) for campo in CAMPOS}
+        if incluir_total:
+            # Con moneda, el total se suma en enteros y se convierte al final
+            data["costo_total"] = (
+                lote.costo_total if self.moneda is None
+                else self.moneda.a_float(self.costo_total)
+            )
+        return pd.DataFrame(data, copy=False)
+
+
+def como_lote(
+    costos: Union[Iterable[CostoPersonal], CostoPersonalBatch, None],
+) -> CostoPersonalBatch:
+    """
+    Devuelve ``costos`` como CostoPersonalBatch, convirtiéndolo si es necesario.
+    
+    Args:
+        costos: Lista de CostoPersonal o lote
+        
+    Returns:
+        CostoPersonalBatch equivalente, con montos float64
+    """
+    if isinstance(costos, CostoPersonalBatch):
+        return costos.en_float()
+    if costos is None:
+        return CostoPersonalBatch.vacio()
+    return CostoPersonalBatch.from_costos(costos)
+
+
+def agrupar(claves: np.ndarray, ordenar: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Asigna un código entero a cada clave distinta.
+    
+    Args:
+        claves: Arreglo de claves (por ejemplo IDs o periodos)
+        ordenar: Si True los grupos quedan en orden ascendente; si False,
+            en orden de primera aparición
+            
+    Returns:
+        Tupla (claves únicas, código de grupo de cada elemento)
+    """
+    if len(claves) == 0:
+        return claves[:0], np.zeros(0, dtype=np.intp)
+    unicas, primeras, codigos = np.unique(
+        claves, return_index=True, return_inverse=True
+    )
+    codigos = codigos.ravel()
+    if ordenar:
+        return unicas, codigos
+    orden = np.argsort(primeras, kind="stable")
+    rango = np.empty_like(orden)
+    rango[orden] = np.arange(len(orden))
+    return unicas[orden], rango[codigos]
@@ -1,10 +1,17 @@
 """
 Modelos de datos para el sistema de costo de personal.
+
+Además de los dataclasses Empleado y CostoPersonal hay variantes compactas
+para nóminas grandes: sin ``__dict__`` por instancia, con departamento, cargo
+y periodo internados (todas las instancias comparten la misma cadena) y con
+el costo total calculado una sola vez.
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import FrozenInstanceError, dataclass
 from datetime import date
-from typing import Optional, Dict, Any
+from operator import attrgetter, itemgetter
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 
 
 @dataclass
@@ -74,3 +81,274 @@ class CostoPersonal:
             "otros_costos": self.otros_costos,
             "costo_total": self.costo_total,
         }
+
+
+CAMPOS_EMPLEADO = (
+    "id",
+    "nombre",
+    "departamento",
+    "cargo",
+    "salario_base",
+    "fecha_ingreso",
+    "activo",
+)
+
+CAMPOS_COSTO = (
+    "empleado_id",
+    "periodo",
+    "salario_base",
+    "bonos",
+    "horas_extra",
+    "beneficios",
+    "cargas_sociales",
+    "otros_costos",
+    "costo_total",
+)
+
+
+class EmpleadoCompacto:
+    """
+    Empleado con ``__slots__`` y departamento y cargo internados.
+    
+    Tiene los mismos campos y métodos que Empleado y se puede usar en su
+    lugar en la calculadora, el registro y los reportes. Departamento y
+    cargo también se internan al asignarlos después de crearlo.
+    """
+    
+    # Departamento y cargo se guardan en slots privados detrás de
+    # propiedades que los internan
+    __slots__ = (
+        "id", "nombre", "_departamento", "_cargo", "salario_base", "fecha_ingreso", "activo"
+    )
+    
+    def __init__(
+        self,
+        id: str,
+        nombre: str,
+        departamento: str,
+        cargo: str,
+        salario_base: float,
+        fecha_ingreso: date,
+        activo: bool = True,
+    ):
+        if salario_base < 0:
+            raise ValueError("El salario base no puede ser negativo")
+        self.id = id
+        self.nombre = nombre
+        self._departamento = sys.intern(departamento)
+        self._cargo = sys.intern(cargo)
+        self.salario_base = salario_base
+        self.fecha_ingreso = fecha_ingreso
+        self.activo = activo
+    
+    @property
+    def departamento(self) -> str:
+        return self._departamento
+    
+    @departamento.setter
+    def departamento(self, valor: str) -> None:
+        self._departamento = sys.intern(valor)
+    
+    @property
+    def cargo(self) -> str:
+        return self._cargo
+    
+    @cargo.setter
+    def cargo(self, valor: str) -> None:
+        self._cargo = sys.intern(valor)
+    
+    @classmethod
+    def desde(cls, empleado: Any) -> "EmpleadoCompacto":
+        """Crea la variante compacta de un Empleado (u objeto con sus campos)."""
+        return cls(*_campos_empleado(empleado))
+    
+    @staticmethod
+    def to_records(empleados: Iterable[Any]) -> List[Tuple[Any, ...]]:
+        """
+        Convierte empleados a tuplas en el orden de CAMPOS_EMPLEADO.
+        
+        Args:
+            empleados: Empleados (compactos o no)
+            
+        Returns:
+            Lista de tuplas, apta para DataFrame.from_records
+        """
+        return list(map(_campos_empleado, empleados))
+    
+    def a_empleado(self) -> Empleado:
+        """Convierte a un Empleado."""
+        return Empleado(*_campos_empleado(self))
+    
+    def reemplazar(self, **cambios: Any) -> "EmpleadoCompacto":
+        """Devuelve una copia (de la misma clase) con los campos indicados cambiados."""
+        campos = dict(zip(CAMPOS_EMPLEADO, _campos_empleado(self)))
+        campos.update(cambios)
+        return self.__class__(**campos)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convierte el empleado a un diccionario."""
+        return {
+            "id": self.id,
+            "nombre": self.nombre,
+            "departamento": self.departamento,
+            "cargo": self.cargo,
+            "salario_base": self.salario_base,
+            "fecha_ingreso": self.fecha_ingreso.isoformat(),
+            "activo": self.activo,
+        }
+    
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return _campos_empleado(self) == _campos_empleado(other)
+    
+    __hash__ = None  # type: ignore[assignment]
+    
+    def __repr__(self) -> str:
+        campos = ", ".join(f"{c}={getattr(self, c)!r}" for c in CAMPOS_EMPLEADO)
+        return f"{self.__class__.__name__}({campos})"
+    
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return _campos_empleado(self)
+    
+    def __setstate__(self, estado: Tuple[Any, ...]) -> None:
+        for campo, valor in zip(CAMPOS_EMPLEADO, estado):
+            if campo in ("departamento", "cargo"):
+                campo, valor = f"_{campo}", sys.intern(valor)
+            object.__setattr__(self, campo, valor)
+
+
+class EmpleadoCompactoInmutable(EmpleadoCompacto):
+    """EmpleadoCompacto de solo lectura y hashable."""
+    
+    __slots__ = ()
+    
+    def __setattr__(self, nombre: str, valor: Any) -> None:
+        # Cada campo se asigna una sola vez, en __init__
+        try:
+            getattr(self, nombre)
+        except AttributeError:
+            object.__setattr__(self, nombre, valor)
+            return
+        raise FrozenInstanceError(f"no se puede asignar el campo '{nombre.lstrip('_')}'")
+    
+    def __delattr__(self, nombre: str) -> None:
+        raise FrozenInstanceError(f"no se puede borrar el campo '{nombre}'")
+    
+    def __hash__(self) -> int:
+        return hash(_campos_empleado(self))
+
+
+class CostoPersonalCompacto(tuple):
+    """
+    CostoPersonal inmutable almacenado como tupla.
+    
+    El periodo se interna y el costo total se calcula una vez al crearlo
+    (por eso no hay variante modificable: usar ``reemplazar``). Los campos
+    se leen como atributos, igual que en CostoPersonal.
+    
+    Solo es igual a otro CostoPersonalCompacto con los mismos campos, no a
+    una tupla con los mismos valores (``tuple(costo)`` da la tupla).
+    """
+    
+    __slots__ = ()
+    
+    def __new__(
+        cls,
+        empleado_id: str,
+        periodo: str,
+        salario_base: float,
+        bonos: float = 0.0,
+        horas_extra: float = 0.0,
+        beneficios: float = 0.0,
+        cargas_sociales: float = 0.0,
+        otros_costos: float = 0.0,
+    ) -> "CostoPersonalCompacto":
+        # Mismo orden de suma que CostoPersonal.costo_total
+        costo_total = (
+            salario_base +
+            bonos +
+            horas_extra +
+            beneficios +
+            cargas_sociales +
+            otros_costos
+        )
+        return tuple.__new__(cls, (
+            empleado_id,
+            sys.intern(periodo),
+            salario_base,
+            bonos,
+            horas_extra,
+            beneficios,
+            cargas_sociales,
+            otros_costos,
+            costo_total,
+        ))
+    
+    empleado_id = property(itemgetter(0))
+    periodo = property(itemgetter(1))
+    salario_base = property(itemgetter(2))
+    bonos = property(itemgetter(3))
+    horas_extra = property(itemgetter(4))
+    beneficios = property(itemgetter(5))
+    cargas_sociales = property(itemgetter(6))
+    otros_costos = property(itemgetter(7))
+    costo_total = property(itemgetter(8))
+    
+    @classmethod
+    def desde(cls, costo: Any) -> "CostoPersonalCompacto":
+        """Crea la variante compacta de un CostoPersonal (u objeto con sus campos)."""
+        return cls(*_campos_costo(costo)[:-1])
+    
+    @staticmethod
+    def to_records(costos: Iterable[Any]) -> List[Tuple[Any, ...]]:
+        """
+        Convierte costos a tuplas en el orden de CAMPOS_COSTO.
+        
+        Args:
+            costos: Costos de personal (compactos o no)
+            
+        Returns:
+            Lista de tuplas con el costo total al final, apta para
+            DataFrame.from_records
+        """
+        return list(map(_campos_costo, costos))
+    
+    def a_costo(self) -> CostoPersonal:
+        """Convierte a un CostoPersonal."""
+        return CostoPersonal(*self[:-1])
+    
+    def reemplazar(self, **cambios: Any) -> "CostoPersonalCompacto":
+        """Devuelve una copia (de la misma clase) con los campos indicados cambiados."""
+        campos = dict(zip(CAMPOS_COSTO[:-1], self))
+        campos.update(cambios)
+        return self.__class__(**campos)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convierte el costo personal a un diccionario."""
+        return dict(zip(CAMPOS_COSTO, self))
+    
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            # Con NotImplemented se usaría la comparación de tuple
+            return False if isinstance(other, tuple) else NotImplemented
+        return tuple.__eq__(self, other)
+    
+    def __ne__(self, other: Any) -> bool:
+        igual = self.__eq__(other)
+        return igual if igual is NotImplemented else not igual
+    
+    def __hash__(self) -> int:
+        return hash((self.__class__, tuple.__hash__(self)))
+    
+    def __getnewargs__(self) -> Tuple[Any, ...]:
+        return tuple(self[:-1])
+    
+    def __repr__(self) -> str:
+        campos = ", ".join(f"{c}={v!r}" for c, v in zip(CAMPOS_COSTO, self))
+        return f"{self.__class__.__name__}({campos})"
+
+
+_campos_empleado = attrgetter(*CAMPOS_EMPLEADO)
+
+_campos_costo = attrgetter(*CAMPOS_COSTO)
@@ -0,0 +1,157 @@
+"""
+Cálculo de la nómina en paralelo por fragmentos de empleados.
+
+La nómina se divide en fragmentos contiguos que se envían a un
+ProcessPoolExecutor como arreglos NumPy (salarios y conceptos ya alineados),
+no como objetos Empleado. Cada proceso calcula las columnas de costo de su
+fragmento para todos los periodos y el proceso principal las ubica en su
+posición, de modo que el resultado no depende del orden en que terminan los
+procesos y es idéntico bit a bit al cálculo en serie.
+
+Los conceptos variables se repiten en todos los periodos o vienen como
+matrices (periodos, empleados). Se paraleliza el cálculo por periodos; los
+escenarios de ``SimuladorEscenarios`` se evalúan en el proceso actual, ya
+vectorizados como una matriz escenarios x registros.
+"""
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+import numpy as np
+from .lote import CostoPersonalBatch
+from .cargas import AtributosCargas
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .calculadora import CalculadoraCostos
+
+
+TAMANO_FRAGMENTO = 50_000
+
+CONCEPTOS = ("bonos", "horas_extra", "beneficios", "otros_costos")
+
+
+def calcular_fragmento(
+    calculadora: "CalculadoraCostos",
+    salario_base: np.ndarray,
+    conceptos: Dict[str, np.ndarray],
+    cantidad_periodos: int,
+    atributos: Optional[AtributosCargas] = None,
+    fracciones: Optional[np.ndarray] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Calcula las columnas de costo de un fragmento de empleados.
+    
+    Args:
+        calculadora: Calculadora con la configuración a aplicar
+        salario_base: Salario base de cada empleado del fragmento
+        conceptos: Conceptos variables del fragmento, de forma (empleados,)
+            o (periodos, empleados)
+        cantidad_periodos: Cantidad de periodos a calcular
+        atributos: Atributos de los empleados del fragmento, si la
+            calculadora usa reglas de cargas sociales
+        fracciones: Fracción trabajada de cada periodo por empleado del
+            fragmento (periodos, empleados), si se prorratea
+            
+    Returns:
+        Diccionario campo -> matriz (periodos, empleados del fragmento)
+    """
+    forma = (cantidad_periodos, len(salario_base))
+    if fracciones is not None:
+        salario_base = salario_base * fracciones
+    columnas = {
+        "salario_base": salario_base,
+        "cargas_sociales": calculadora.calcular_cargas_sociales(
+            salario_base, atributos, fracciones
+        ),
+        **conceptos,
+    }
+    return {
+        campo: np.ascontiguousarray(np.broadcast_to(valores, forma))
+        for campo, valores in columnas.items()
+    }
+
+
+def calcular_costos_paralelo(
+    calculadora: "CalculadoraCostos",
+    ids: Sequence[str],
+    salario_base: np.ndarray,
+    conceptos: Dict[str, np.ndarray],
+    periodos: Sequence[str],
+    atributos: Optional[AtributosCargas] = None,
+    procesos: Optional[int] = None,
+    tamano_fragmento: int = TAMANO_FRAGMENTO,
+    fracciones: Optional[np.ndarray] = None,
+) -> CostoPersonalBatch:
+    """
+    Calcula los costos de una nómina para varios periodos en paralelo.
+    
+    Args:
+        calculadora: Calculadora con la configuración a aplicar
+        ids: IDs de empleado en orden
+        salario_base: Salario base alineado con ``ids``
+        conceptos: Conceptos variables alineados con ``ids``, de forma
+            (empleados,) o (periodos, empleados)
+        periodos: Periodos a calcular ("YYYY-MM")
+        atributos: Atributos de los empleados alineados con ``ids``, si la
+            calculadora usa reglas de cargas sociales
+        procesos: Cantidad de procesos (por defecto, uno por CPU). Con 1 se
+            calcula en el proceso actual
+        tamano_fragmento: Empleados por fragmento enviado a cada proceso
+        fracciones: Fracción trabajada de cada periodo por empleado
+            (periodos, empleados) para prorratear el salario base
+            
+    Returns:
+        CostoPersonalBatch ordenado por periodo y, dentro de cada periodo,
+        en el orden de ``ids``
+        
+    Raises:
+        ValueError: Si la cantidad de procesos o el tamaño de fragmento no
+            son positivos
+    """
+    if procesos is not None and procesos < 1:
+        raise ValueError("La cantidad de procesos debe ser positiva")
+    if tamano_fragmento < 1:
+        raise ValueError("El tamaño de fragmento debe ser positivo")
+    
+    n = len(ids)
+    cantidad_periodos = len(periodos)
+    if n == 0 or cantidad_periodos == 0:
+        return CostoPersonalBatch.vacio()
+    
+    limites = list(range(0, n, tamano_fragmento)) + [n]
+    tramos = list(zip(limites[:-1], limites[1:]))
+    argumentos = (
+        [calculadora] * len(tramos),
+        [salario_base[a:b] for a, b in tramos],
+        [{campo: valores[..., a:b] for campo, valores in conceptos.items()} for a, b in tramos],
+        [cantidad_periodos] * len(tramos),
+        [None if atributos is None else atributos[a:b] for a, b in tramos],
+        [None if fracciones is None else fracciones[:, a:b] for a, b in tramos],
+    )
+    
+    if procesos == 1 or len(tramos) == 1:
+        bloques: List[Dict[str, np.ndarray]] = list(map(calcular_fragmento, *argumentos))
+    else:
+        # Importado aquí: cargar concurrent.futures.process (y multiprocessing)
+        # encarece el arranque de los procesos que solo calculan en serie
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with ProcessPoolExecutor(max_workers=procesos) as executor:
+            bloques = list(executor.map(calcular_fragmento, *argumentos))
+    
+    columnas = {
+        campo: np.empty((cantidad_periodos, n), dtype=np.float64)
+        for campo in bloques[0]
+    }
+    for (a, b), bloque in zip(tramos, bloques):
+        for campo, valores in bloque.items():
+            columnas[campo][:, a:b] = valores
+    
+    id_columna = np.empty(n, dtype=object)
+    id_columna[:] = list(ids)
+    periodo_columna = np.empty(cantidad_periodos, dtype=object)
+    periodo_columna[:] = list(periodos)
+    
+    return CostoPersonalBatch(
+        empleado_id=np.tile(id_columna, cantidad_periodos),
+        periodo=np.repeat(periodo_columna, n),
+        **{campo: valores.ravel() for campo, valores in columnas.items()},
+    )
@@ -0,0 +1,322 @@
+"""
+Periodos mensuales codificados como enteros.
+
+Un periodo "YYYY-MM" se representa con el número de meses desde el año 0
+(``anio * 12 + mes - 1``), de modo que ordenar, comparar, restar periodos o
+sumarles meses son operaciones enteras, y los arreglos de periodos se
+agrupan por año, trimestre o año fiscal con aritmética de NumPy. Las
+funciones de este módulo convierten arreglos completos sin recorrerlos en
+Python; ``IndicePeriodos`` ordena una vez los periodos de un lote para
+responder consultas por rango con búsqueda binaria.
+"""
+
+from datetime import date
+from typing import Any, Iterable, Optional, Tuple, Union
+import numpy as np
+
+
+# Posiciones de los dígitos de año y mes en "YYYY-MM"
+_DIGITOS = [0, 1, 2, 3, 5, 6]
+
+_GUION = ord("-")
+
+
+class Periodo(int):
+    """
+    Periodo mensual inmutable.
+    
+    Es un ``int`` (meses desde el año 0), así que se ordena, se compara y se
+    usa como clave igual que un entero. Sumarle o restarle meses devuelve
+    otro Periodo y la diferencia entre dos periodos es la cantidad de meses.
+    
+    Ejemplo:
+        >>> p = Periodo("2024-11")
+        >>> str(p + 3), p.anio, p.mes, Periodo("2025-01") - p
+        ('2025-02', 2025, 11, 2)
+    """
+    
+    __slots__ = ()
+    
+    def __new__(cls, valor: Union[str, int, date]) -> "Periodo":
+        """
+        Crea un periodo.
+        
+        Args:
+            valor: "YYYY-MM", fecha (se toma su mes) o código entero
+            
+        Raises:
+            ValueError: Si el texto no es un periodo válido o el código es
+                negativo
+        """
+        if isinstance(valor, str):
+            anio, guion, mes = valor[:4], valor[4:5], valor[5:]
+            if not (
+                guion == "-" and len(mes) == 2 and (anio + mes).isascii()
+                and (anio + mes).isdigit() and 1 <= int(mes) <= 12
+            ):
+                raise ValueError(f"Periodo inválido: '{valor}' (se espera YYYY-MM)")
+            codigo = int(anio) * 12 + int(mes) - 1
+        elif isinstance(valor, date):
+            codigo = valor.year * 12 + valor.month - 1
+        else:
+            codigo = int(valor)
+            if not 0 <= codigo < 10000 * 12:
+                raise ValueError(f"Código de periodo fuera de rango: {codigo}")
+        return super().__new__(cls, codigo)
+    
+    @classmethod
+    def desde_anio_mes(cls, anio: int, mes: int) -> "Periodo":
+        """Crea el periodo de un año y mes (1 a 12)."""
+        if not 1 <= mes <= 12:
+            raise ValueError(f"Mes inválido: {mes}")
+        return cls(anio * 12 + mes - 1)
+    
+    @property
+    def anio(self) -> int:
+        return int(self) // 12
+    
+    @property
+    def mes(self) -> int:
+        return int(self) % 12 + 1
+    
+    @property
+    def trimestre(self) -> int:
+        return int(self) % 12 // 3 + 1
+    
+    def anio_fiscal(self, mes_inicio: int = 1) -> int:
+        """Año fiscal del periodo (ver la función ``anio_fiscal``)."""
+        return int(anio_fiscal(np.array([int(self)]), mes_inicio)[0])
+    
+    def __add__(self, meses: int) -> "Periodo":
+        if isinstance(meses, Periodo):
+            return NotImplemented
+        return Periodo(int(self) + meses)
+    
+    __radd__ = __add__
+    
+    def __sub__(self, otro: int) -> Union["Periodo", int]:
+        if isinstance(otro, Periodo):
+            return int(self) - int(otro)
+        return Periodo(int(self) - otro)
+    
+    def __str__(self) -> str:
+        return f"{self.anio:04d}-{self.mes:02d}"
+    
+    def __repr__(self) -> str:
+        return f"Periodo('{self}')"
+    
+    def __format__(self, especificacion: str) -> str:
+        return format(str(self), especificacion)
+    
+    def __getnewargs__(self) -> Tuple[int]:
+        return (int(self),)
+
+
+def parsear(periodos: Iterable[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convierte textos "YYYY-MM" a códigos sin lanzar errores.
+    
+    Args:
+        periodos: Arreglo o secuencia de textos
+        
+    Returns:
+        Tupla (códigos int64, máscara de válidos); los inválidos tienen
+        código -1
+    """
+    try:
+        texto = np.asarray(periodos, dtype="S8")
+    except UnicodeEncodeError:
+        # Algún texto no ASCII: se parsea de a uno
+        texto = np.array(
+            [p.encode("ascii", "replace") if isinstance(p, str) else b"" for p in periodos],
+            dtype="S8",
+        )
+    bytes_ = texto.reshape(-1).view(np.uint8).reshape(-1, 8)
+    digitos = bytes_[:, _DIGITOS].astype(np.int32) - ord("0")
+    
+    anio = digitos[:, 0] * 1000 + digitos[:, 1] * 100 + digitos[:, 2] * 10 + digitos[:, 3]
+    mes = digitos[:, 4] * 10 + digitos[:, 5]
+    validos = (
+        ((digitos >= 0) & (digitos <= 9)).all(axis=1)
+        & (bytes_[:, 4] == _GUION)
+        & (bytes_[:, 7] == 0)
+        & (mes >= 1)
+        & (mes <= 12)
+    )
+    codigos = np.where(validos, anio.astype(np.int64) * 12 + mes - 1, -1)
+    return codigos, validos
+
+
+def codificar(periodos: Iterable[Any]) -> np.ndarray:
+    """
+    Convierte textos "YYYY-MM" a códigos enteros.
+    
+    Args:
+        periodos: Arreglo o secuencia de textos
+        
+    Returns:
+        Arreglo int64 de códigos
+        
+    Raises:
+        ValueError: Si algún periodo no es válido
+    """
+    if isinstance(periodos, np.ndarray) and periodos.dtype.kind in "iu":
+        return periodos.astype(np.int64, copy=False)
+    valores = periodos if isinstance(periodos, np.ndarray) else list(periodos)
+    codigos, validos = parsear(valores)
+    if not validos.all():
+        invalido = valores[int(np.argmin(validos))]
+        raise ValueError(f"Periodo inválido: '{invalido}' (se espera YYYY-MM)")
+    return codigos
+
+
+def formatear(codigos: Any) -> np.ndarray:
+    """
+    Convierte códigos de periodo a textos "YYYY-MM".
+    
+    Cada periodo distinto se formatea una sola vez y todas sus apariciones
+    comparten la misma cadena.
+    
+    Args:
+        codigos: Arreglo de códigos
+        
+    Returns:
+        Arreglo de objetos (cadenas) con la forma de ``codigos``
+    """
+    codigos = np.asarray(codigos, dtype=np.int64)
+    resultado = np.empty(codigos.shape, dtype=object)
+    if codigos.size == 0:
+        return resultado
+    minimo = int(codigos.min())
+    textos = np.empty(int(codigos.max()) - minimo + 1, dtype=object)
+    textos[:] = [f"{m // 12:04d}-{m % 12 + 1:02d}" for m in range(minimo, minimo + len(textos))]
+    resultado[...] = textos[codigos - minimo]
+    return resultado
+
+
+def rango(desde: Union[str, int], hasta: Union[str, int]) -> np.ndarray:
+    """
+    Códigos de los periodos entre dos periodos, inclusive.
+    
+    Args:
+        desde: Primer periodo ("YYYY-MM" o código)
+        hasta: Último periodo ("YYYY-MM" o código)
+        
+    Returns:
+        Arreglo int64 ascendente
+        
+    Raises:
+        ValueError: Si algún periodo no es válido o ``desde`` es posterior a
+            ``hasta``
+    """
+    inicio, fin = Periodo(desde), Periodo(hasta)
+    if inicio > fin:
+        raise ValueError(f"El periodo inicial '{inicio}' es posterior al final '{fin}'")
+    return np.arange(int(inicio), int(fin) + 1, dtype=np.int64)
+
+
+def anio_fiscal(codigos: np.ndarray, mes_inicio: int = 1) -> np.ndarray:
+    """
+    Año fiscal de cada periodo.
+    
+    El año fiscal se identifica por el año calendario en que termina: con
+    ``mes_inicio=7``, julio de 2024 a junio de 2025 es el año fiscal 2025.
+    Con ``mes_inicio=1`` coincide con el año calendario.
+    
+    Args:
+        codigos: Códigos de periodo
+        mes_inicio: Mes (1 a 12) en que empieza el año fiscal
+        
+    Returns:
+        Arreglo int64 con el año fiscal de cada periodo
+        
+    Raises:
+        ValueError: Si el mes de inicio no está entre 1 y 12
+    """
+    if not 1 <= mes_inicio <= 12:
+        raise ValueError(f"Mes de inicio inválido: {mes_inicio}")
+    desplazado = np.asarray(codigos, dtype=np.int64) - (mes_inicio - 1)
+    return desplazado // 12 + (1 if mes_inicio > 1 else 0)
+
+
+def trimestre(codigos: np.ndarray) -> np.ndarray:
+    """Trimestre calendario (1 a 4) de cada periodo."""
+    return np.asarray(codigos, dtype=np.int64) % 12 // 3 + 1
+
+
+class IndicePeriodos:
+    """
+    Periodos de un lote ordenados para consultas por rango.
+    
+    Se construye una vez (ordenar los códigos) y después cada consulta por
+    rango es una búsqueda binaria. Si los periodos ya estaban ordenados,
+    como en los lotes de la calculadora, las posiciones son un ``slice`` y
+    los subconjuntos del lote son vistas sin copia.
+    """
+    
+    def __init__(self, periodos: Iterable[Any]):
+        """
+        Inicializa el índice.
+        
+        Args:
+            periodos: Periodo de cada registro (textos o códigos)
+            
+        Raises:
+            ValueError: Si algún periodo no es válido
+        """
+        codigos = codificar(periodos)
+        if len(codigos) and bool((np.diff(codigos) < 0).any()):
+            self._orden: Optional[np.ndarray] = np.argsort(codigos, kind="stable")
+            codigos = codigos[self._orden]
+        else:
+            self._orden = None
+        self.codigos = codigos
+        self.periodos, inicios = np.unique(codigos, return_index=True)
+        self.limites = np.append(inicios, len(codigos))
+    
+    def __len__(self) -> int:
+        return len(self.codigos)
+    
+    def posiciones(
+        self,
+        desde: Optional[Union[str, int]] = None,
+        hasta: Optional[Union[str, int]] = None,
+    ) -> Union[slice, np.ndarray]:
+        """
+        Posiciones de los registros con periodo entre ``desde`` y ``hasta``.
+        
+        Args:
+            desde: Primer periodo, inclusive (None = sin límite)
+            hasta: Último periodo, inclusive (None = sin límite)
+            
+        Returns:
+            ``slice`` si los periodos estaban ordenados; si no, arreglo de
+            posiciones ordenado por periodo (estable)
+        """
+        a = 0 if desde is None else int(np.searchsorted(self.codigos, int(Periodo(desde)), "left"))
+        b = len(self.codigos) if hasta is None else int(
+            np.searchsorted(self.codigos, int(Periodo(hasta)), "right")
+        )
+        b = max(a, b)
+        return slice(a, b) if self._orden is None else self._orden[a:b]
+    
+    def ultimos(self, cantidad: int) -> Union[slice, np.ndarray]:
+        """
+        Posiciones de los registros de los últimos ``cantidad`` periodos.
+        
+        Como en ``AlmacenCostos``, se cuentan los periodos presentes en el
+        índice, no los meses calendario.
+        
+        Args:
+            cantidad: Cantidad de periodos
+            
+        Returns:
+            Igual que ``posiciones``
+            
+        Raises:
+            ValueError: Si la cantidad no es positiva
+        """
+        if cantidad < 1:
+            raise ValueError("La cantidad de periodos debe ser positiva")
+        inicio = self.limites[max(len(self.periodos) - cantidad, 0)]
+        return self.posiciones(self.codigos[inicio] if inicio < len(self.codigos) else None)
@@ -0,0 +1,145 @@
+"""
+Prorrateo del salario en meses trabajados en forma parcial.
+
+Un empleado que ingresa o egresa a mitad de mes cobra la fracción de los
+días computables del mes que trabajó: días corridos o días hábiles (lunes a
+viernes, sin los feriados indicados). Para cada periodo se calcula una sola
+vez la cantidad acumulada de días computables hasta cada día del mes; la
+fracción de cada empleado es una resta entre dos posiciones de esa tabla,
+vectorizada para toda la nómina.
+"""
+
+import calendar
+import functools
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable, Optional, Tuple, Union
+import numpy as np
+from .periodos import Periodo
+
+
+BASES = ("calendario", "habiles")
+
+# Ordinal de egreso de los empleados sin egreso
+SIN_EGRESO = date.max.toordinal()
+
+
+@dataclass(frozen=True)
+class Prorrateo:
+    """
+    Forma de prorratear el salario de los meses parciales.
+    
+    Attributes:
+        base: "calendario" (días corridos) o "habiles"
+        feriados: Fechas no hábiles además de los fines de semana (solo con
+            base "habiles")
+        dias_habiles: Días hábiles de la semana, de lunes a domingo, como
+            en np.busday_count (por defecto "1111100")
+    """
+    
+    base: str = "calendario"
+    feriados: Tuple[date, ...] = ()
+    dias_habiles: str = "1111100"
+    
+    def __post_init__(self):
+        if self.base not in BASES:
+            raise ValueError(f"Base inválida: '{self.base}'. Opciones: {', '.join(BASES)}")
+        if len(self.dias_habiles) != 7 or set(self.dias_habiles) - {"0", "1"} or "1" not in self.dias_habiles:
+            raise ValueError(f"Días hábiles inválidos: '{self.dias_habiles}'")
+        # Ordenados y sin repetir, para que la tabla de un periodo se
+        # reutilice con cualquier orden de feriados
+        object.__setattr__(self, "feriados", tuple(sorted(set(self.feriados))))
+    
+    def dias_computables(self, periodo: Union[str, int]) -> np.ndarray:
+        """
+        Días computables acumulados del mes de un periodo.
+        
+        Args:
+            periodo: Periodo ("YYYY-MM" o código)
+            
+        Returns:
+            Arreglo de solo lectura de largo días del mes + 1: el elemento
+            ``k`` es la cantidad de días computables entre el día 1 y el
+            ``k`` inclusive (el elemento 0 vale 0)
+        """
+        return _dias_computables(self, int(Periodo(periodo)))
+    
+    def fracciones(
+        self,
+        periodo: Union[str, int],
+        ingreso: np.ndarray,
+        egreso: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Fracción del mes trabajada por cada empleado.
+        
+        Args:
+            periodo: Periodo ("YYYY-MM" o código)
+            ingreso: Ordinal (date.toordinal) de la fecha de ingreso
+            egreso: Ordinal de la fecha de egreso, último día trabajado
+                (``SIN_EGRESO`` o None si no egresó)
+                
+        Returns:
+            Arreglo float64 entre 0 y 1: 1 para el mes completo y 0 si el
+            empleado ingresó después o egresó antes del mes
+        """
+        codigo = int(Periodo(periodo))
+        acumulado = _dias_computables(self, codigo)
+        dias = len(acumulado) - 1
+        primero = date(codigo // 12, codigo % 12 + 1, 1).toordinal()
+        
+        # Días del mes antes del ingreso y hasta el egreso, inclusive
+        previos = np.clip(np.asarray(ingreso, dtype=np.int64) - primero, 0, dias)
+        if egreso is None:
+            trabajados = acumulado[dias] - acumulado[previos]
+        else:
+            hasta = np.clip(np.asarray(egreso, dtype=np.int64) - primero + 1, 0, dias)
+            trabajados = np.maximum(acumulado[hasta] - acumulado[previos], 0)
+        total = acumulado[dias]
+        if total == 0:
+            return np.zeros(trabajados.shape)
+        return trabajados / total
+    
+    def matriz(
+        self,
+        periodos: Iterable[Union[str, int]],
+        ingreso: np.ndarray,
+        egreso: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Fracciones de varios periodos: matriz (periodos, empleados)."""
+        return np.array([self.fracciones(periodo, ingreso, egreso) for periodo in periodos])
+
+
+@functools.lru_cache(maxsize=256)
+def _dias_computables(prorrateo: Prorrateo, codigo: int) -> np.ndarray:
+    """Tabla de días computables acumulados de un periodo (ver Prorrateo)."""
+    inicio = np.datetime64(f"{codigo // 12:04d}-{codigo % 12 + 1:02d}", "D")
+    dias = inicio + np.arange(calendar.monthrange(codigo // 12, codigo % 12 + 1)[1])
+    if prorrateo.base == "calendario":
+        computables = np.ones(len(dias), dtype=np.int64)
+    else:
+        computables = np.is_busday(
+            dias,
+            weekmask=prorrateo.dias_habiles,
+            holidays=np.array(prorrateo.feriados, dtype="datetime64[D]"),
+        ).astype(np.int64)
+    acumulado = np.concatenate([[0], np.cumsum(computables)])
+    acumulado.setflags(write=False)
+    return acumulado
+
+
+def ordinales(fechas: Iterable[Optional[date]], cantidad: int, defecto: int = SIN_EGRESO) -> np.ndarray:
+    """
+    Convierte fechas a ordinales, con ``defecto`` para las ausentes.
+    
+    Args:
+        fechas: Fechas (o None)
+        cantidad: Cantidad de fechas
+        defecto: Ordinal de las fechas en None
+        
+    Returns:
+        Arreglo int64 de ordinales
+    """
+    return np.fromiter(
+        (defecto if f is None else f.toordinal() for f in fechas), dtype=np.int64, count=cantidad
+    )
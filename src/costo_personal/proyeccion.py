@@ -0,0 +1,189 @@
+"""
+Proyección de costos de personal para varios periodos.
+
+La proyección se calcula como una matriz periodos x empleados: los aumentos
+programados, la indexación por inflación y las políticas de bonos por
+departamento se aplican como máscaras y factores que se multiplican sobre
+toda la matriz, por lo que proyectar 36 periodos cuesta casi lo mismo que
+proyectar uno.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import TYPE_CHECKING, List, Mapping, Optional, Sequence, Tuple, Union
+import numpy as np
+from .models import Empleado
+from .lote import CostoPersonalBatch
+from .registro import EmpleadoRegistry
+from .periodos import Periodo, formatear, rango
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .calculadora import CalculadoraCostos
+
+
+@dataclass
+class AumentoProgramado:
+    """Aumento de salario que rige desde un periodo."""
+    
+    periodo: str
+    porcentaje: float
+    departamento: Optional[str] = None
+    cargo: Optional[str] = None
+
+
+@dataclass
+class PoliticaBonos:
+    """Bono de un departamento, como porcentaje del salario y/o monto fijo."""
+    
+    departamento: str
+    porcentaje_salario: float = 0.0
+    monto_fijo: float = 0.0
+    meses: Sequence[int] = ()
+
+
+@dataclass
+class AjustesProyeccion:
+    """
+    Supuestos de una proyección.
+    
+    Attributes:
+        aumentos: Aumentos programados. Se acumulan de forma compuesta y
+            aplican a todos los empleados o solo a un departamento y/o cargo
+        inflacion_anual: Indexación anual de salarios (0.04 = 4%), aplicada
+            de forma compuesta cada vez que se llega a ``mes_indexacion``
+            después del primer periodo proyectado
+        mes_indexacion: Mes del año (1-12) en que se indexan los salarios
+        politicas_bonos: Bonos por departamento; sin ``meses`` se pagan todos
+            los meses, si no solo en los meses indicados (1-12)
+        beneficios: Beneficios mensuales por empleado
+        horas_extra: Costo mensual de horas extra por empleado
+        otros_costos: Otros costos mensuales por empleado
+        solo_activos: Si solo se proyectan los empleados activos
+    """
+    
+    aumentos: List[AumentoProgramado] = field(default_factory=list)
+    inflacion_anual: float = 0.0
+    mes_indexacion: int = 1
+    politicas_bonos: List[PoliticaBonos] = field(default_factory=list)
+    beneficios: float = 0.0
+    horas_extra: float = 0.0
+    otros_costos: float = 0.0
+    solo_activos: bool = True
+
+
+def rango_periodos(desde: str, hasta: str) -> Tuple[List[str], np.ndarray]:
+    """
+    Enumera los periodos mensuales entre dos periodos, inclusive.
+    
+    Args:
+        desde: Primer periodo ("YYYY-MM")
+        hasta: Último periodo ("YYYY-MM")
+        
+    Returns:
+        Tupla (periodos, meses absolutos) en orden ascendente
+        
+    Raises:
+        ValueError: Si algún periodo no es válido o ``desde`` es posterior a
+            ``hasta``
+    """
+    meses = rango(desde, hasta)
+    return formatear(meses).tolist(), meses
+
+
+def proyectar_costos(
+    calculadora: "CalculadoraCostos",
+    empleados: Union[Sequence[Empleado], EmpleadoRegistry],
+    desde: str,
+    hasta: str,
+    ajustes: Optional[AjustesProyeccion] = None,
+    egresos: Optional[Mapping[str, date]] = None,
+) -> CostoPersonalBatch:
+    """
+    Proyecta los costos de una nómina entre dos periodos.
+    
+    Ver CalculadoraCostos.proyectar.
+    """
+    ajustes = ajustes or AjustesProyeccion()
+    periodos, meses = rango_periodos(desde, hasta)
+    
+    empleados = [
+        emp for emp in empleados
+        if emp.activo or not ajustes.solo_activos
+    ]
+    n = len(empleados)
+    if n == 0:
+        return CostoPersonalBatch.vacio()
+    
+    departamento = np.array([emp.departamento for emp in empleados], dtype=object)
+    cargo = np.array([emp.cargo for emp in empleados], dtype=object)
+    salario_inicial = np.fromiter(
+        (emp.salario_base for emp in empleados), dtype=np.float64, count=n
+    )
+    
+    # Factor de salario por periodo (filas) y empleado (columnas)
+    factor = np.ones((len(periodos), n))
+    for aumento in ajustes.aumentos:
+        aplica = np.ones(n, dtype=bool)
+        if aumento.departamento is not None:
+            aplica &= departamento == aumento.departamento
+        if aumento.cargo is not None:
+            aplica &= cargo == aumento.cargo
+        vigente = meses >= Periodo(aumento.periodo)
+        factor[np.ix_(vigente, aplica)] *= 1.0 + aumento.porcentaje
+    
+    if ajustes.inflacion_anual:
+        indexaciones = np.cumsum(meses % 12 == ajustes.mes_indexacion - 1)
+        indexaciones -= indexaciones[0]
+        factor *= ((1.0 + ajustes.inflacion_anual) ** indexaciones)[:, np.newaxis]
+    
+    salario_base = salario_inicial * factor
+    fracciones = calculadora.fracciones_trabajadas(empleados, periodos, egresos)
+    if fracciones is not None:
+        salario_base *= fracciones
+    
+    # Solo las celdas desde el mes de ingreso de cada empleado y, si se
+    # prorratea, con días trabajados: sin días trabajados no hay beneficios,
+    # horas extra, otros costos ni bonos fijos que proyectar
+    ingreso = np.fromiter(
+        (emp.fecha_ingreso.year * 12 + emp.fecha_ingreso.month - 1 for emp in empleados),
+        dtype=np.int64, count=n,
+    )
+    incluir = meses[:, np.newaxis] >= ingreso
+    if fracciones is not None:
+        incluir &= fracciones > 0
+    
+    bonos = np.zeros_like(salario_base)
+    mes_del_anio = meses % 12 + 1
+    for politica in ajustes.politicas_bonos:
+        aplica = departamento == politica.departamento
+        if politica.meses:
+            paga = np.isin(mes_del_anio, list(politica.meses))
+        else:
+            paga = np.ones(len(meses), dtype=bool)
+        celdas = np.ix_(paga, aplica)
+        bonos[celdas] += salario_base[celdas] * politica.porcentaje_salario + politica.monto_fijo
+    
+    fila, empleado = np.nonzero(incluir)
+    ids = np.empty(n, dtype=object)
+    ids[:] = [emp.id for emp in empleados]
+    periodo = np.empty(len(periodos), dtype=object)
+    periodo[:] = periodos
+    salario_base = salario_base[fila, empleado]
+    if fracciones is not None:
+        fracciones = fracciones[fila, empleado]
+    atributos = calculadora.atributos_cargas(empleados)
+    if atributos is not None:
+        atributos = atributos[empleado]
+    
+    return CostoPersonalBatch(
+        empleado_id=ids[empleado],
+        periodo=periodo[fila],
+        salario_base=salario_base,
+        bonos=bonos[fila, empleado],
+        horas_extra=ajustes.horas_extra,
+        beneficios=ajustes.beneficios,
+        cargas_sociales=calculadora.calcular_cargas_sociales(
+            salario_base, atributos, fracciones
+        ),
+        otros_costos=ajustes.otros_costos,
+    )
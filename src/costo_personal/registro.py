@@ -0,0 +1,224 @@
+"""
+Registro indexado de empleados.
+
+Mantiene índices hash por ID, departamento, cargo y estado activo para que
+las búsquedas por departamento y los cruces con costos no recorran toda la
+nómina.
+"""
+
+import itertools
+from collections import defaultdict
+from dataclasses import replace
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping
+from .models import Empleado, EmpleadoCompacto
+
+
+# Versiones únicas entre todos los registros: dos registros (ni uno nuevo que
+# reutilice la dirección de memoria de otro ya liberado) nunca comparten una
+_VERSIONES = itertools.count()
+
+
+class EmpleadoRegistry:
+    """Colección de empleados con índices actualizados en cada cambio."""
+    
+    def __init__(self, empleados: Iterable[Empleado] = ()):
+        """
+        Inicializa el registro.
+        
+        Args:
+            empleados: Empleados iniciales
+        """
+        self._por_id: Dict[str, Empleado] = {}
+        # Los diccionarios internos se usan como conjuntos ordenados por ID
+        self._por_departamento: Dict[str, Dict[str, Empleado]] = defaultdict(dict)
+        self._por_cargo: Dict[str, Dict[str, Empleado]] = defaultdict(dict)
+        self._activos: Dict[str, Empleado] = {}
+        self._version = next(_VERSIONES)
+        
+        for empleado in empleados:
+            self.agregar(empleado)
+    
+    def agregar(self, empleado: Empleado) -> None:
+        """
+        Agrega un empleado al registro.
+        
+        Args:
+            empleado: Empleado a agregar
+            
+        Raises:
+            ValueError: Si ya existe un empleado con el mismo ID
+        """
+        if empleado.id in self._por_id:
+            raise ValueError(f"El empleado '{empleado.id}' ya existe en el registro")
+        self._indexar(empleado)
+    
+    def actualizar(self, empleado_id: str, **cambios: Any) -> Empleado:
+        """
+        Modifica los datos de un empleado y actualiza los índices.
+        
+        Args:
+            empleado_id: ID del empleado
+            **cambios: Campos de Empleado a modificar (el ID no se puede cambiar)
+            
+        Returns:
+            El empleado actualizado
+            
+        Raises:
+            KeyError: Si el empleado no existe
+            ValueError: Si se intenta cambiar el ID o los datos son inválidos
+        """
+        if "id" in cambios and cambios["id"] != empleado_id:
+            raise ValueError("El ID de un empleado no se puede modificar")
+        
+        actual = self._por_id[empleado_id]
+        if isinstance(actual, EmpleadoCompacto):
+            nuevo = actual.reemplazar(**cambios)
+        else:
+            nuevo = replace(actual, **cambios)
+        self._desindexar(actual)
+        self._indexar(nuevo)
+        return nuevo
+    
+    def desactivar(self, empleado_id: str) -> Empleado:
+        """
+        Marca un empleado como inactivo.
+        
+        Args:
+            empleado_id: ID del empleado
+            
+        Returns:
+            El empleado actualizado
+        """
+        return self.actualizar(empleado_id, activo=False)
+    
+    def eliminar(self, empleado_id: str) -> Empleado:
+        """
+        Quita un empleado del registro.
+        
+        Args:
+            empleado_id: ID del empleado
+            
+        Returns:
+            El empleado eliminado
+        """
+        empleado = self._por_id.pop(empleado_id)
+        self._desindexar(empleado)
+        return empleado
+    
+    def obtener(self, empleado_id: str) -> Empleado:
+        """
+        Busca un empleado por ID.
+        
+        Raises:
+            KeyError: Si el empleado no existe
+        """
+        return self._por_id[empleado_id]
+    
+    def por_departamento(self, departamento: str, solo_activos: bool = False) -> List[Empleado]:
+        """
+        Devuelve los empleados de un departamento.
+        
+        Args:
+            departamento: Nombre del departamento
+            solo_activos: Si True excluye a los empleados inactivos
+            
+        Returns:
+            Lista de empleados en orden de alta
+        """
+        return self._filtrar(self._por_departamento.get(departamento, {}), solo_activos)
+    
+    def por_cargo(self, cargo: str, solo_activos: bool = False) -> List[Empleado]:
+        """
+        Devuelve los empleados con un cargo.
+        
+        Args:
+            cargo: Nombre del cargo
+            solo_activos: Si True excluye a los empleados inactivos
+            
+        Returns:
+            Lista de empleados en orden de alta
+        """
+        return self._filtrar(self._por_cargo.get(cargo, {}), solo_activos)
+    
+    def activos(self) -> List[Empleado]:
+        """Devuelve los empleados activos."""
+        return list(self._activos.values())
+    
+    def cantidad_activos(self) -> int:
+        """Devuelve la cantidad de empleados activos."""
+        return len(self._activos)
+    
+    def departamentos(self) -> List[str]:
+        """Devuelve los departamentos con al menos un empleado."""
+        return list(self._por_departamento)
+    
+    def cargos(self) -> List[str]:
+        """Devuelve los cargos con al menos un empleado."""
+        return list(self._por_cargo)
+    
+    def como_diccionario(self) -> Mapping[str, Empleado]:
+        """Devuelve una vista de solo lectura de los empleados por ID."""
+        return MappingProxyType(self._por_id)
+    
+    @property
+    def version(self) -> int:
+        """
+        Versión del contenido del registro.
+        
+        Cambia con cada alta, baja o actualización hecha con los métodos del
+        registro, y es única entre todos los registros, así que sirve como
+        clave barata de su contenido (por ejemplo, en CacheReportes). Los
+        cambios hechos directamente sobre los objetos Empleado no la cambian.
+        """
+        return self._version
+    
+    def __len__(self) -> int:
+        return len(self._por_id)
+    
+    def __iter__(self) -> Iterator[Empleado]:
+        return iter(list(self._por_id.values()))
+    
+    def __contains__(self, empleado_id: object) -> bool:
+        return empleado_id in self._por_id
+    
+    def __repr__(self) -> str:
+        return (
+            f"EmpleadoRegistry(empleados={len(self)}, "
+            f"activos={self.cantidad_activos()})"
+        )
+    
+    def _indexar(self, empleado: Empleado) -> None:
+        """Agrega el empleado a todos los índices."""
+        self._version = next(_VERSIONES)
+        self._por_id[empleado.id] = empleado
+        self._por_departamento[empleado.departamento][empleado.id] = empleado
+        self._por_cargo[empleado.cargo][empleado.id] = empleado
+        if empleado.activo:
+            self._activos[empleado.id] = empleado
+    
+    def _desindexar(self, empleado: Empleado) -> None:
+        """Quita el empleado de los índices secundarios (no del índice por ID)."""
+        self._version = next(_VERSIONES)
+        self._quitar_de_grupo(self._por_departamento, empleado.departamento, empleado.id)
+        self._quitar_de_grupo(self._por_cargo, empleado.cargo, empleado.id)
+        self._activos.pop(empleado.id, None)
+    
+    @staticmethod
+    def _quitar_de_grupo(
+        indice: Dict[str, Dict[str, Empleado]],
+        clave: str,
+        empleado_id: str,
+    ) -> None:
+        """Quita un ID de un grupo y elimina el grupo si queda vacío."""
+        grupo = indice[clave]
+        del grupo[empleado_id]
+        if not grupo:
+            del indice[clave]
+    
+    @staticmethod
+    def _filtrar(grupo: Mapping[str, Empleado], solo_activos: bool) -> List[Empleado]:
+        """Devuelve los empleados de un grupo, opcionalmente solo los activos."""
+        if solo_activos:
+            return [emp for emp in grupo.values() if emp.activo]
+        return list(grupo.values())
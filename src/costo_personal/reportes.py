@@ -2,36 +2,146 @@
 Generador de reportes y métricas clave de costo de personal.
 """
 
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any, Mapping, Optional, Tuple, TypeVar, Union
 from collections import defaultdict
+from datetime import date
+import functools
+import inspect
+import numpy as np
 import pandas as pd
 from .models import Empleado, CostoPersonal
+from .lote import CostoPersonalBatch, agrupar
+from .dinero import sumar_por_grupo
+from .registro import EmpleadoRegistry
+from .cache import CacheReportes
+from .instrumentacion import medido
+from .dotacion import calcular_dotacion
+from .exportacion import (
+    Filas,
+    MAX_FILAS_EXCEL,
+    TAMANO_LOTE,
+    exportar_csv_por_lotes,
+    exportar_excel_por_lotes,
+)
+
+
+Costos = Union[List[CostoPersonal], CostoPersonalBatch]
+Empleados = Union[List[Empleado], EmpleadoRegistry]
+
+COLUMNAS_DEPARTAMENTO = [
+    "departamento",
+    "cantidad_empleados",
+    "costo_total",
+    "costo_promedio_por_empleado",
+    "salario_base_total",
+    "bonos_total",
+    "horas_extra_total",
+    "beneficios_total",
+    "cargas_sociales_total",
+]
+
+COLUMNAS_TENDENCIA = [
+    "periodo",
+    "cantidad_registros",
+    "costo_total",
+    "costo_promedio",
+    "salario_base_total",
+    "bonos_total",
+    "horas_extra_total",
+]
+
+
+BACKENDS = ("python", "pandas")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _memoizar(metodo: F) -> F:
+    """
+    Guarda el resultado del reporte en la caché del generador, si tiene una.
+    
+    La clave incluye el nombre del método, el backend y una huella del
+    contenido de todos los argumentos. Si algún argumento no tiene una huella
+    barata (listas de empleados o de costos), el reporte se calcula sin caché.
+    """
+    firma = inspect.signature(metodo)
+    
+    @functools.wraps(metodo)
+    def envoltura(self, *args, **kwargs):
+        if self.cache is None:
+            return metodo(self, *args, **kwargs)
+        argumentos = firma.bind(self, *args, **kwargs)
+        argumentos.apply_defaults()
+        valores = list(argumentos.arguments.values())[1:]
+        clave = self.cache.clave(metodo.__name__, self.backend, *valores)
+        if clave is None:
+            return metodo(self, *args, **kwargs)
+        return self.cache.obtener_o_calcular(
+            clave, lambda: metodo(self, *args, **kwargs)
+        )
+    
+    return envoltura  # type: ignore[return-value]
 
 
 class GeneradorReportes:
     """Genera reportes y métricas clave del proceso de costo de personal."""
     
-    def __init__(self):
-        """Inicializa el generador de reportes."""
-        pass
+    def __init__(
+        self,
+        backend: str = "python",
+        cache: Optional[CacheReportes] = None,
+    ):
+        """
+        Inicializa el generador de reportes.
+        
+        Args:
+            backend: Motor de agregación. "python" recorre los costos en
+                Python (o con NumPy si se recibe un CostoPersonalBatch);
+                "pandas" carga los costos en un DataFrame y agrega con
+                groupby().agg(). Los lotes en unidades menores (con
+                ``moneda``) se suman siempre con enteros exactos y los
+                montos se devuelven en el tipo de salida de su moneda
+            cache: Caché opcional de resultados. Si se indica, los reportes
+                con las mismas entradas (CostoPersonalBatch y
+                EmpleadoRegistry) se devuelven sin recalcular
+                
+        Raises:
+            ValueError: Si el backend no es válido
+        """
+        if backend not in BACKENDS:
+            raise ValueError(
+                f"Backend inválido: '{backend}'. Opciones: {', '.join(BACKENDS)}"
+            )
+        self.backend = backend
+        self.cache = cache
     
+    @medido("reportes.generar_reporte_por_departamento", filas="costos")
+    @_memoizar
     def generar_reporte_por_departamento(
         self,
-        empleados: List[Empleado],
-        costos: List[CostoPersonal],
+        empleados: Empleados,
+        costos: Costos,
     ) -> pd.DataFrame:
         """
         Genera un reporte de costos agrupados por departamento.
         
         Args:
-            empleados: Lista de empleados
-            costos: Lista de costos de personal
+            empleados: Lista de empleados o EmpleadoRegistry
+            costos: Lista de costos de personal o CostoPersonalBatch
             
         Returns:
             DataFrame con métricas por departamento
         """
         # Crear diccionario de empleados para búsqueda rápida
-        emp_dict = {emp.id: emp for emp in empleados}
+        emp_dict = _indice_empleados(empleados)
+        
+        if self._usa_pandas(costos):
+            return _reporte_departamento_pandas(emp_dict, _costos_a_dataframe(costos))
+        
+        if isinstance(costos, CostoPersonalBatch):
+            return _construir_reporte_departamento(
+                _agregar_departamentos_lote(emp_dict, costos)
+            )
         
         # Agrupar costos por departamento
         dept_data = defaultdict(lambda: {
@@ -62,53 +172,30 @@ class GeneradorReportes:
         for dept, empleados_ids in empleados_por_dept.items():
             dept_data[dept]["cantidad_empleados"] = len(empleados_ids)
         
-        # Convertir a DataFrame
-        data = []
-        for dept, metrics in dept_data.items():
-            metrics["departamento"] = dept
-            if metrics["cantidad_empleados"] > 0:
-                metrics["costo_promedio_por_empleado"] = (
-                    metrics["costo_total"] / metrics["cantidad_empleados"]
-                )
-            else:
-                metrics["costo_promedio_por_empleado"] = 0.0
-            data.append(metrics)
-        
-        df = pd.DataFrame(data)
-        
-        # Ordenar columnas
-        columns = [
-            "departamento",
-            "cantidad_empleados",
-            "costo_total",
-            "costo_promedio_por_empleado",
-            "salario_base_total",
-            "bonos_total",
-            "horas_extra_total",
-            "beneficios_total",
-            "cargas_sociales_total",
-        ]
-        
-        return df[columns] if not df.empty else pd.DataFrame(columns=columns)
+        return _construir_reporte_departamento(dept_data)
     
+    @medido("reportes.generar_metricas_clave", filas="costos")
+    @_memoizar
     def generar_metricas_clave(
         self,
-        empleados: List[Empleado],
-        costos: List[CostoPersonal],
+        empleados: Empleados,
+        costos: Costos,
     ) -> Dict[str, Any]:
         """
         Genera métricas clave del proceso de costo de personal.
         
         Args:
-            empleados: Lista de empleados
-            costos: Lista de costos de personal
+            empleados: Lista de empleados o EmpleadoRegistry
+            costos: Lista de costos de personal o CostoPersonalBatch
             
         Returns:
             Diccionario con métricas clave
         """
+        total_empleados = _contar_activos(empleados)
+        
         if not costos:
             return {
-                "total_empleados": len([e for e in empleados if e.activo]),
+                "total_empleados": total_empleados,
                 "costo_total": 0.0,
                 "costo_promedio_por_empleado": 0.0,
                 "salario_base_promedio": 0.0,
@@ -117,41 +204,36 @@ class GeneradorReportes:
                 "porcentaje_horas_extra": 0.0,
             }
         
-        empleados_activos = [e for e in empleados if e.activo]
-        
-        total_costo = sum(c.costo_total for c in costos)
-        total_salario_base = sum(c.salario_base for c in costos)
-        total_bonos = sum(c.bonos for c in costos)
-        total_horas_extra = sum(c.horas_extra for c in costos)
-        total_cargas_sociales = sum(c.cargas_sociales for c in costos)
-        
-        num_registros = len(costos)
+        if self._usa_pandas(costos):
+            totales = _totales_pandas(_costos_a_dataframe(costos))
+        elif isinstance(costos, CostoPersonalBatch):
+            totales = _totales_lote(costos)
+        else:
+            totales = _totales(costos)
         
-        metricas = {
-            "total_empleados": len(empleados_activos),
-            "costo_total": total_costo,
-            "costo_promedio_por_empleado": total_costo / num_registros if num_registros > 0 else 0.0,
-            "salario_base_promedio": total_salario_base / num_registros if num_registros > 0 else 0.0,
-            "cargas_sociales_promedio": total_cargas_sociales / num_registros if num_registros > 0 else 0.0,
-            "porcentaje_bonos": (total_bonos / total_costo * 100) if total_costo > 0 else 0.0,
-            "porcentaje_horas_extra": (total_horas_extra / total_costo * 100) if total_costo > 0 else 0.0,
-        }
-        
-        return metricas
+        return _construir_metricas_clave(total_empleados, totales, len(costos))
     
+    @medido("reportes.generar_reporte_tendencia", filas="costos")
+    @_memoizar
     def generar_reporte_tendencia(
         self,
-        costos: List[CostoPersonal],
+        costos: Costos,
     ) -> pd.DataFrame:
         """
         Genera un reporte de tendencia de costos por periodo.
         
         Args:
-            costos: Lista de costos de personal
+            costos: Lista de costos de personal o CostoPersonalBatch
             
         Returns:
             DataFrame con métricas por periodo
         """
+        if self._usa_pandas(costos):
+            return _reporte_tendencia_pandas(_costos_a_dataframe(costos))
+        
+        if isinstance(costos, CostoPersonalBatch):
+            return _construir_reporte_tendencia(_agregar_periodos_lote(costos))
+        
         # Agrupar por periodo
         periodo_data = defaultdict(lambda: {
             "cantidad_registros": 0,
@@ -169,36 +251,98 @@ class GeneradorReportes:
             periodo_data[periodo]["bonos_total"] += costo.bonos
             periodo_data[periodo]["horas_extra_total"] += costo.horas_extra
         
-        # Convertir a DataFrame
-        data = []
-        for periodo, metrics in periodo_data.items():
-            metrics["periodo"] = periodo
-            if metrics["cantidad_registros"] > 0:
-                metrics["costo_promedio"] = (
-                    metrics["costo_total"] / metrics["cantidad_registros"]
-                )
-            else:
-                metrics["costo_promedio"] = 0.0
-            data.append(metrics)
-        
-        df = pd.DataFrame(data)
-        
-        if not df.empty:
-            df = df.sort_values("periodo")
-        
-        # Ordenar columnas
-        columns = [
-            "periodo",
-            "cantidad_registros",
-            "costo_total",
-            "costo_promedio",
-            "salario_base_total",
-            "bonos_total",
-            "horas_extra_total",
-        ]
-        
-        return df[columns] if not df.empty else pd.DataFrame(columns=columns)
+        return _construir_reporte_tendencia(periodo_data)
+    
+    @medido("reportes.generar_paquete_reportes", filas="costos")
+    @_memoizar
+    def generar_paquete_reportes(
+        self,
+        empleados: Empleados,
+        costos: Costos,
+    ) -> Dict[str, Any]:
+        """
+        Genera el reporte por departamento, las métricas clave y la tendencia
+        recorriendo los costos una sola vez.
+        
+        El resultado es idéntico al de llamar por separado a
+        generar_reporte_por_departamento, generar_metricas_clave y
+        generar_reporte_tendencia, pero el costo total de cada registro se
+        calcula una sola vez.
+        
+        Args:
+            empleados: Lista de empleados o EmpleadoRegistry
+            costos: Lista de costos de personal o CostoPersonalBatch
+            
+        Returns:
+            Diccionario con las claves "por_departamento" (DataFrame),
+            "metricas_clave" (dict) y "tendencia" (DataFrame)
+        """
+        emp_dict = _indice_empleados(empleados)
+        total_empleados = _contar_activos(empleados)
+        
+        if self._usa_pandas(costos):
+            df_costos = _costos_a_dataframe(costos)
+            return {
+                "por_departamento": _reporte_departamento_pandas(emp_dict, df_costos),
+                "metricas_clave": _construir_metricas_clave(
+                    total_empleados, _totales_pandas(df_costos), len(df_costos)
+                ),
+                "tendencia": _reporte_tendencia_pandas(df_costos),
+            }
+        
+        if isinstance(costos, CostoPersonalBatch):
+            costo_total = costos.costo_total
+            dept_data = _agregar_departamentos_lote(emp_dict, costos, costo_total)
+            periodo_data = _agregar_periodos_lote(costos, costo_total)
+            totales = _totales_lote(costos, costo_total)
+        else:
+            dept_data, periodo_data, totales = _agregar_una_pasada(emp_dict, costos)
+        
+        return {
+            "por_departamento": _construir_reporte_departamento(dept_data),
+            "metricas_clave": _construir_metricas_clave(
+                total_empleados, totales, len(costos)
+            ),
+            "tendencia": _construir_reporte_tendencia(periodo_data),
+        }
+    
+    @medido("reportes.generar_reporte_dotacion", filas="empleados")
+    @_memoizar
+    def generar_reporte_dotacion(
+        self,
+        empleados: Empleados,
+        desde: str,
+        hasta: str,
+        egresos: Optional[Mapping[str, date]] = None,
+        por: Tuple[str, ...] = (),
+    ) -> pd.DataFrame:
+        """
+        Genera la serie mensual de dotación, ingresos, egresos y rotación.
+        
+        La serie se calcula con conteos de eventos por periodo y sumas
+        acumuladas (ver ``dotacion.calcular_dotacion``), igual con ambos
+        backends.
+        
+        Args:
+            empleados: Lista de empleados o EmpleadoRegistry
+            desde: Primer periodo ("YYYY-MM")
+            hasta: Último periodo ("YYYY-MM"), inclusive
+            egresos: Fecha de egreso por ID de empleado; los inactivos sin
+                fecha se omiten
+            por: Desglose por "departamento" y/o "cargo"
+            
+        Returns:
+            DataFrame con una fila por periodo (y grupo)
+        """
+        return calcular_dotacion(empleados, desde, hasta, egresos, por)
     
+    def _usa_pandas(self, costos: Costos) -> bool:
+        """Si los costos se agregan con pandas (no para lotes en unidades menores)."""
+        if isinstance(costos, CostoPersonalBatch) and costos.moneda is not None:
+            return False
+        return self.backend == "pandas"
+    
+    @medido("reportes.exportar_reporte_csv", filas="df")
     def exportar_reporte_csv(self, df: pd.DataFrame, filename: str) -> None:
         """
         Exporta un DataFrame a un archivo CSV.
@@ -209,6 +353,7 @@ class GeneradorReportes:
         """
         df.to_csv(filename, index=False, encoding="utf-8-sig")
     
+    @medido("reportes.exportar_reporte_excel", filas="df")
     def exportar_reporte_excel(self, df: pd.DataFrame, filename: str) -> None:
         """
         Exporta un DataFrame a un archivo Excel.
@@ -218,3 +363,554 @@ class GeneradorReportes:
             filename: Nombre del archivo de salida
         """
         df.to_excel(filename, index=False, engine="openpyxl")
+    
+    @medido("reportes.exportar_csv_por_lotes", filas="resultado")
+    def exportar_csv_por_lotes(
+        self,
+        filas: Filas,
+        filename: str,
+        tamano_lote: int = TAMANO_LOTE,
+    ) -> int:
+        """
+        Exporta filas a CSV de a un lote por vez, sin materializar todo el
+        DataFrame.
+        
+        Args:
+            filas: DataFrame, CostoPersonalBatch, lista o iterador de
+                CostoPersonal o de diccionarios, o iterador de lotes de filas
+            filename: Nombre del archivo de salida
+            tamano_lote: Filas por lote
+            
+        Returns:
+            Cantidad de filas escritas
+        """
+        return exportar_csv_por_lotes(filas, filename, tamano_lote=tamano_lote)
+    
+    @medido("reportes.exportar_excel_por_lotes", filas="resultado")
+    def exportar_excel_por_lotes(
+        self,
+        filas: Filas,
+        filename: str,
+        tamano_lote: int = TAMANO_LOTE,
+        max_filas_hoja: int = MAX_FILAS_EXCEL,
+    ) -> int:
+        """
+        Exporta filas a Excel en modo de solo escritura, continuando en una
+        hoja nueva al llegar al límite de filas de Excel.
+        
+        Args:
+            filas: DataFrame, CostoPersonalBatch, lista o iterador de
+                CostoPersonal o de diccionarios, o iterador de lotes de filas
+            filename: Nombre del archivo de salida
+            tamano_lote: Filas por lote
+            max_filas_hoja: Filas máximas por hoja, incluido el encabezado
+            
+        Returns:
+            Cantidad de filas de datos escritas
+        """
+        return exportar_excel_por_lotes(
+            filas, filename, tamano_lote=tamano_lote, max_filas_hoja=max_filas_hoja
+        )
+
+
+def _construir_reporte_departamento(
+    dept_data: Dict[str, Dict[str, Any]],
+) -> pd.DataFrame:
+    """
+    Convierte las sumas por departamento al DataFrame del reporte.
+    
+    Args:
+        dept_data: Sumas y cantidad de empleados por departamento
+        
+    Returns:
+        DataFrame con métricas por departamento
+    """
+    # Convertir a DataFrame
+    data = []
+    for dept, metrics in dept_data.items():
+        metrics["departamento"] = dept
+        if metrics["cantidad_empleados"] > 0:
+            metrics["costo_promedio_por_empleado"] = (
+                metrics["costo_total"] / metrics["cantidad_empleados"]
+            )
+        else:
+            metrics["costo_promedio_por_empleado"] = 0.0
+        data.append(metrics)
+    
+    df = pd.DataFrame(data)
+    
+    # Ordenar columnas
+    columns = COLUMNAS_DEPARTAMENTO
+    
+    return df[columns] if not df.empty else pd.DataFrame(columns=columns)
+
+
+def _construir_metricas_clave(
+    total_empleados: int,
+    totales: Dict[str, float],
+    num_registros: int,
+) -> Dict[str, Any]:
+    """
+    Calcula las métricas clave a partir de los totales de los costos.
+    
+    Args:
+        total_empleados: Cantidad de empleados activos
+        totales: Sumas de costo total, salario base, bonos, horas extra
+            y cargas sociales
+        num_registros: Cantidad de registros de costo
+        
+    Returns:
+        Diccionario con métricas clave
+    """
+    total_costo = totales["costo_total"]
+    total_salario_base = totales["salario_base"]
+    total_bonos = totales["bonos"]
+    total_horas_extra = totales["horas_extra"]
+    total_cargas_sociales = totales["cargas_sociales"]
+    
+    metricas = {
+        "total_empleados": total_empleados,
+        "costo_total": total_costo,
+        "costo_promedio_por_empleado": total_costo / num_registros if num_registros > 0 else 0.0,
+        "salario_base_promedio": total_salario_base / num_registros if num_registros > 0 else 0.0,
+        "cargas_sociales_promedio": total_cargas_sociales / num_registros if num_registros > 0 else 0.0,
+        "porcentaje_bonos": (total_bonos / total_costo * 100) if total_costo > 0 else 0.0,
+        "porcentaje_horas_extra": (total_horas_extra / total_costo * 100) if total_costo > 0 else 0.0,
+    }
+    
+    return metricas
+
+
+def _construir_reporte_tendencia(
+    periodo_data: Dict[str, Dict[str, Any]],
+) -> pd.DataFrame:
+    """
+    Convierte las sumas por periodo al DataFrame del reporte.
+    
+    Args:
+        periodo_data: Sumas y cantidad de registros por periodo
+        
+    Returns:
+        DataFrame con métricas por periodo, ordenado por periodo
+    """
+    # Convertir a DataFrame
+    data = []
+    for periodo, metrics in periodo_data.items():
+        metrics["periodo"] = periodo
+        if metrics["cantidad_registros"] > 0:
+            metrics["costo_promedio"] = (
+                metrics["costo_total"] / metrics["cantidad_registros"]
+            )
+        else:
+            metrics["costo_promedio"] = 0.0
+        data.append(metrics)
+    
+    df = pd.DataFrame(data)
+    
+    if not df.empty:
+        df = df.sort_values("periodo")
+    
+    # Ordenar columnas
+    columns = COLUMNAS_TENDENCIA
+    
+    return df[columns] if not df.empty else pd.DataFrame(columns=columns)
+
+
+def _indice_empleados(empleados: Empleados) -> Mapping[str, Empleado]:
+    """Devuelve los empleados indexados por ID, reutilizando el del registro."""
+    if isinstance(empleados, EmpleadoRegistry):
+        return empleados.como_diccionario()
+    return {emp.id: emp for emp in empleados}
+
+
+def _contar_activos(empleados: Empleados) -> int:
+    """Cuenta los empleados activos."""
+    if isinstance(empleados, EmpleadoRegistry):
+        return empleados.cantidad_activos()
+    return len([e for e in empleados if e.activo])
+
+
+def _agregar_departamentos_lote(
+    emp_dict: Mapping[str, Empleado],
+    lote: CostoPersonalBatch,
+    costo_total: Optional[np.ndarray] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Suma un lote de costos por departamento de forma vectorizada.
+    
+    Los departamentos quedan en orden de primera aparición y las sumas se
+    acumulan en el orden de los registros, igual que el recorrido en Python.
+    
+    Args:
+        emp_dict: Empleados indexados por ID
+        lote: Costos de personal
+        costo_total: Costo total por registro, si ya fue calculado
+        
+    Returns:
+        Sumas y cantidad de empleados por departamento
+    """
+    ids_unicos, codigo_id = agrupar(lote.empleado_id)
+    
+    # Resolver el departamento una sola vez por empleado
+    codigos_dept: Dict[str, int] = {}
+    dept_por_id = np.empty(len(ids_unicos), dtype=np.intp)
+    for k, emp_id in enumerate(ids_unicos):
+        empleado = emp_dict.get(emp_id)
+        if empleado:
+            dept_por_id[k] = codigos_dept.setdefault(
+                empleado.departamento, len(codigos_dept)
+            )
+        else:
+            dept_por_id[k] = -1
+    
+    dept_fila = dept_por_id[codigo_id]
+    validas = dept_fila >= 0
+    dept_fila = dept_fila[validas]
+    m = len(codigos_dept)
+    
+    def sumar(columna: np.ndarray) -> np.ndarray:
+        if lote.moneda is not None:
+            return sumar_por_grupo(dept_fila, columna[validas], m)
+        return np.bincount(dept_fila, weights=columna[validas], minlength=m)
+    
+    monto = _conversion_montos(lote)
+    
+    if costo_total is None:
+        costo_total = lote.costo_total
+    
+    cantidad = np.bincount(dept_por_id[dept_por_id >= 0], minlength=m)
+    costo_total = sumar(costo_total)
+    salario_base = sumar(lote.salario_base)
+    bonos = sumar(lote.bonos)
+    horas_extra = sumar(lote.horas_extra)
+    beneficios = sumar(lote.beneficios)
+    cargas_sociales = sumar(lote.cargas_sociales)
+    
+    return {
+        dept: {
+            "cantidad_empleados": int(cantidad[k]),
+            "costo_total": monto(costo_total[k]),
+            "salario_base_total": monto(salario_base[k]),
+            "bonos_total": monto(bonos[k]),
+            "horas_extra_total": monto(horas_extra[k]),
+            "beneficios_total": monto(beneficios[k]),
+            "cargas_sociales_total": monto(cargas_sociales[k]),
+        }
+        for dept, k in codigos_dept.items()
+    }
+
+
+def _agregar_periodos_lote(
+    lote: CostoPersonalBatch,
+    costo_total: Optional[np.ndarray] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Suma un lote de costos por periodo de forma vectorizada.
+    
+    Args:
+        lote: Costos de personal
+        costo_total: Costo total por registro, si ya fue calculado
+        
+    Returns:
+        Sumas y cantidad de registros por periodo
+    """
+    periodos, codigo = agrupar(lote.periodo)
+    m = len(periodos)
+    
+    def sumar(columna: np.ndarray) -> np.ndarray:
+        if lote.moneda is not None:
+            return sumar_por_grupo(codigo, columna, m)
+        return np.bincount(codigo, weights=columna, minlength=m)
+    
+    monto = _conversion_montos(lote)
+    
+    if costo_total is None:
+        costo_total = lote.costo_total
+    
+    cantidad = np.bincount(codigo, minlength=m)
+    costo_total = sumar(costo_total)
+    salario_base = sumar(lote.salario_base)
+    bonos = sumar(lote.bonos)
+    horas_extra = sumar(lote.horas_extra)
+    
+    return {
+        periodo: {
+            "cantidad_registros": int(cantidad[k]),
+            "costo_total": monto(costo_total[k]),
+            "salario_base_total": monto(salario_base[k]),
+            "bonos_total": monto(bonos[k]),
+            "horas_extra_total": monto(horas_extra[k]),
+        }
+        for k, periodo in enumerate(periodos)
+    }
+
+
+def _conversion_montos(lote: CostoPersonalBatch) -> Callable[[Any], Any]:
+    """Conversión de una suma del lote al monto del reporte."""
+    return float if lote.moneda is None else lote.moneda.convertir
+
+
+def _totales(costos: List[CostoPersonal]) -> Dict[str, float]:
+    """
+    Suma los montos de una lista de costos en un solo recorrido.
+    
+    Args:
+        costos: Lista de costos de personal
+        
+    Returns:
+        Sumas de costo total, salario base, bonos, horas extra y cargas sociales
+    """
+    total_costo = 0.0
+    total_salario_base = 0.0
+    total_bonos = 0.0
+    total_horas_extra = 0.0
+    total_cargas_sociales = 0.0
+    
+    for c in costos:
+        total_costo += c.costo_total
+        total_salario_base += c.salario_base
+        total_bonos += c.bonos
+        total_horas_extra += c.horas_extra
+        total_cargas_sociales += c.cargas_sociales
+    
+    return {
+        "costo_total": total_costo,
+        "salario_base": total_salario_base,
+        "bonos": total_bonos,
+        "horas_extra": total_horas_extra,
+        "cargas_sociales": total_cargas_sociales,
+    }
+
+
+def _totales_lote(
+    lote: CostoPersonalBatch,
+    costo_total: Optional[np.ndarray] = None,
+) -> Dict[str, float]:
+    """
+    Suma los montos de un lote de costos de forma vectorizada.
+    
+    Args:
+        lote: Costos de personal
+        costo_total: Costo total por registro, si ya fue calculado
+        
+    Returns:
+        Sumas de costo total, salario base, bonos, horas extra y cargas sociales
+    """
+    if costo_total is None:
+        costo_total = lote.costo_total
+    
+    # Con moneda, np.sum de int64 es exacta en cualquier orden
+    monto = _conversion_montos(lote)
+    sumar = np.sum if lote.moneda is not None else _sumar_en_orden
+    return {
+        "costo_total": monto(sumar(costo_total)),
+        "salario_base": monto(sumar(lote.salario_base)),
+        "bonos": monto(sumar(lote.bonos)),
+        "horas_extra": monto(sumar(lote.horas_extra)),
+        "cargas_sociales": monto(sumar(lote.cargas_sociales)),
+    }
+
+
+def _sumar_en_orden(columna: np.ndarray) -> float:
+    """
+    Suma una columna float64 de izquierda a derecha, como _totales.
+    
+    np.sum suma por pares y puede diferir en el último bit; np.bincount con
+    un solo grupo acumula en orden, igual que las sumas por periodo y por
+    departamento de los lotes.
+    """
+    grupo = np.zeros(len(columna), dtype=np.intp)
+    return float(np.bincount(grupo, weights=columna, minlength=1)[0])
+
+
+def _agregar_una_pasada(
+    emp_dict: Mapping[str, Empleado],
+    costos: List[CostoPersonal],
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]], Dict[str, float]]:
+    """
+    Acumula en un solo recorrido las sumas por departamento, por periodo y
+    los totales generales.
+    
+    Las sumas se acumulan en el mismo orden que en los métodos individuales,
+    por lo que los resultados son idénticos.
+    
+    Args:
+        emp_dict: Empleados indexados por ID
+        costos: Lista de costos de personal
+        
+    Returns:
+        Tupla (sumas por departamento, sumas por periodo, totales)
+    """
+    dept_data: Dict[str, Dict[str, Any]] = {}
+    empleados_por_dept: Dict[str, set] = {}
+    periodo_data: Dict[str, Dict[str, Any]] = {}
+    
+    total_costo = 0.0
+    total_salario_base = 0.0
+    total_bonos = 0.0
+    total_horas_extra = 0.0
+    total_cargas_sociales = 0.0
+    
+    for c in costos:
+        costo_total = c.costo_total
+        
+        total_costo += costo_total
+        total_salario_base += c.salario_base
+        total_bonos += c.bonos
+        total_horas_extra += c.horas_extra
+        total_cargas_sociales += c.cargas_sociales
+        
+        p = periodo_data.get(c.periodo)
+        if p is None:
+            p = periodo_data[c.periodo] = {
+                "cantidad_registros": 0,
+                "costo_total": 0.0,
+                "salario_base_total": 0.0,
+                "bonos_total": 0.0,
+                "horas_extra_total": 0.0,
+            }
+        p["cantidad_registros"] += 1
+        p["costo_total"] += costo_total
+        p["salario_base_total"] += c.salario_base
+        p["bonos_total"] += c.bonos
+        p["horas_extra_total"] += c.horas_extra
+        
+        empleado = emp_dict.get(c.empleado_id)
+        if empleado:
+            dept = empleado.departamento
+            d = dept_data.get(dept)
+            if d is None:
+                d = dept_data[dept] = {
+                    "cantidad_empleados": 0,
+                    "costo_total": 0.0,
+                    "salario_base_total": 0.0,
+                    "bonos_total": 0.0,
+                    "horas_extra_total": 0.0,
+                    "beneficios_total": 0.0,
+                    "cargas_sociales_total": 0.0,
+                }
+                empleados_por_dept[dept] = set()
+            empleados_por_dept[dept].add(c.empleado_id)
+            d["costo_total"] += costo_total
+            d["salario_base_total"] += c.salario_base
+            d["bonos_total"] += c.bonos
+            d["horas_extra_total"] += c.horas_extra
+            d["beneficios_total"] += c.beneficios
+            d["cargas_sociales_total"] += c.cargas_sociales
+    
+    for dept, empleados_ids in empleados_por_dept.items():
+        dept_data[dept]["cantidad_empleados"] = len(empleados_ids)
+    
+    totales = {
+        "costo_total": total_costo,
+        "salario_base": total_salario_base,
+        "bonos": total_bonos,
+        "horas_extra": total_horas_extra,
+        "cargas_sociales": total_cargas_sociales,
+    }
+    
+    return dept_data, periodo_data, totales
+
+
+def _costos_a_dataframe(costos: Costos) -> pd.DataFrame:
+    """
+    Carga los costos en un DataFrame con la columna ``costo_total``.
+    
+    Un CostoPersonalBatch se convierte sin copiar sus columnas.
+    
+    Args:
+        costos: Lista de costos de personal o CostoPersonalBatch
+        
+    Returns:
+        DataFrame con una fila por registro de costo
+    """
+    if not isinstance(costos, CostoPersonalBatch):
+        costos = CostoPersonalBatch.from_costos(costos)
+    return costos.to_dataframe()
+
+
+def _reporte_departamento_pandas(
+    emp_dict: Mapping[str, Empleado],
+    df_costos: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    Reporte por departamento agregado con pandas groupby.
+    
+    Args:
+        emp_dict: Empleados indexados por ID
+        df_costos: Costos cargados con _costos_a_dataframe
+        
+    Returns:
+        DataFrame con las mismas columnas que generar_reporte_por_departamento
+    """
+    departamentos = pd.Series(
+        {emp_id: emp.departamento for emp_id, emp in emp_dict.items()},
+        dtype=object,
+    )
+    df = df_costos.assign(
+        departamento=df_costos["empleado_id"].map(departamentos)
+    ).dropna(subset=["departamento"])
+    
+    if df.empty:
+        return pd.DataFrame(columns=COLUMNAS_DEPARTAMENTO)
+    
+    # sort=False conserva el orden de primera aparición del backend python
+    agregado = df.groupby("departamento", sort=False).agg(
+        cantidad_empleados=("empleado_id", "nunique"),
+        costo_total=("costo_total", "sum"),
+        salario_base_total=("salario_base", "sum"),
+        bonos_total=("bonos", "sum"),
+        horas_extra_total=("horas_extra", "sum"),
+        beneficios_total=("beneficios", "sum"),
+        cargas_sociales_total=("cargas_sociales", "sum"),
+    )
+    agregado["costo_promedio_por_empleado"] = (
+        agregado["costo_total"] / agregado["cantidad_empleados"]
+    )
+    
+    return agregado.reset_index()[COLUMNAS_DEPARTAMENTO]
+
+
+def _totales_pandas(df_costos: pd.DataFrame) -> Dict[str, float]:
+    """
+    Suma los montos de los costos cargados en un DataFrame.
+    
+    Args:
+        df_costos: Costos cargados con _costos_a_dataframe
+        
+    Returns:
+        Sumas de costo total, salario base, bonos, horas extra y cargas sociales
+    """
+    sumas = df_costos[
+        ["costo_total", "salario_base", "bonos", "horas_extra", "cargas_sociales"]
+    ].sum()
+    return {clave: float(valor) for clave, valor in sumas.items()}
+
+
+def _reporte_tendencia_pandas(df_costos: pd.DataFrame) -> pd.DataFrame:
+    """
+    Reporte de tendencia agregado con pandas groupby.
+    
+    Args:
+        df_costos: Costos cargados con _costos_a_dataframe
+        
+    Returns:
+        DataFrame con las mismas columnas que generar_reporte_tendencia
+    """
+    if df_costos.empty:
+        return pd.DataFrame(columns=COLUMNAS_TENDENCIA)
+    
+    agregado = df_costos.groupby("periodo", sort=False).agg(
+        cantidad_registros=("periodo", "size"),
+        costo_total=("costo_total", "sum"),
+        salario_base_total=("salario_base", "sum"),
+        bonos_total=("bonos", "sum"),
+        horas_extra_total=("horas_extra", "sum"),
+    )
+    agregado["costo_promedio"] = (
+        agregado["costo_total"] / agregado["cantidad_registros"]
+    )
+    
+    # Igual que el backend python: orden de aparición y luego por periodo
+    df = agregado.reset_index().sort_values("periodo")
+    return df[COLUMNAS_TENDENCIA]
@@ -0,0 +1,227 @@
+"""
+Generador determinístico de nóminas y costos sintéticos.
+
+Produce poblaciones de empleados con distribuciones realistas (departamentos
+y cargos desbalanceados, salarios log-normales, antigüedad variada y una
+proporción de inactivos) e historiales de costos de cualquier tamaño, para
+pruebas de rendimiento y de carga. Con la misma semilla el resultado es
+siempre el mismo.
+"""
+
+import math
+from datetime import date, timedelta
+from typing import List, Sequence, Tuple
+import numpy as np
+from .models import Empleado
+from .lote import CostoPersonalBatch
+from .periodos import Periodo, codificar, formatear
+
+
+# Departamento -> peso relativo en la nómina
+DEPARTAMENTOS = {
+    "Operaciones": 0.34,
+    "Ventas": 0.20,
+    "Logística": 0.14,
+    "Tecnología": 0.13,
+    "Finanzas": 0.08,
+    "Recursos Humanos": 0.06,
+    "Legal": 0.05,
+}
+
+# Cargo -> (peso relativo, multiplicador de salario)
+CARGOS = {
+    "Asistente": (0.30, 0.8),
+    "Analista": (0.32, 1.0),
+    "Analista Senior": (0.18, 1.4),
+    "Jefe": (0.11, 2.0),
+    "Gerente": (0.07, 3.2),
+    "Director": (0.02, 5.5),
+}
+
+SALARIO_REFERENCIA = 2500.0
+
+
+def periodos_consecutivos(desde: str, cantidad: int) -> List[str]:
+    """
+    Genera periodos mensuales consecutivos.
+    
+    Args:
+        desde: Primer periodo ("YYYY-MM")
+        cantidad: Cantidad de periodos
+        
+    Returns:
+        Lista de periodos en formato "YYYY-MM"
+    """
+    inicio = Periodo(desde)
+    return formatear(np.arange(inicio, inicio + cantidad)).tolist()
+
+
+def generar_empleados(
+    cantidad: int,
+    semilla: int = 0,
+    tasa_inactivos: float = 0.08,
+    fecha_referencia: date = date(2024, 12, 31),
+    antiguedad_media_anios: float = 5.0,
+) -> List[Empleado]:
+    """
+    Genera una nómina sintética.
+    
+    Args:
+        cantidad: Cantidad de empleados
+        semilla: Semilla del generador aleatorio
+        tasa_inactivos: Proporción de empleados inactivos
+        fecha_referencia: Fecha más reciente de ingreso
+        antiguedad_media_anios: Antigüedad media (distribución exponencial,
+            acotada a 30 años)
+            
+    Returns:
+        Lista de empleados con IDs "E0000000", "E0000001", ...
+    """
+    rng = np.random.Generator(np.random.PCG64(semilla))
+    
+    nombres_dept = list(DEPARTAMENTOS)
+    pesos_dept = np.array(list(DEPARTAMENTOS.values()))
+    nombres_cargo = list(CARGOS)
+    pesos_cargo = np.array([peso for peso, _ in CARGOS.values()])
+    multiplicadores = np.array([mult for _, mult in CARGOS.values()])
+    
+    dept = rng.choice(len(nombres_dept), size=cantidad, p=pesos_dept / pesos_dept.sum())
+    cargo = rng.choice(len(nombres_cargo), size=cantidad, p=pesos_cargo / pesos_cargo.sum())
+    salario = np.round(
+        SALARIO_REFERENCIA * multiplicadores[cargo] * rng.lognormal(0.0, 0.25, size=cantidad),
+        2,
+    )
+    dias = np.minimum(
+        rng.exponential(antiguedad_media_anios * 365.25, size=cantidad),
+        30 * 365.25,
+    ).astype(np.int64)
+    activo = rng.random(size=cantidad) >= tasa_inactivos
+    
+    return [
+        Empleado(
+            id=f"E{i:07d}",
+            nombre=f"Empleado {i}",
+            departamento=nombres_dept[dept[i]],
+            cargo=nombres_cargo[cargo[i]],
+            salario_base=float(salario[i]),
+            fecha_ingreso=fecha_referencia - timedelta(days=int(dias[i])),
+            activo=bool(activo[i]),
+        )
+        for i in range(cantidad)
+    ]
+
+
+def generar_costos(
+    empleados: Sequence[Empleado],
+    periodos: Sequence[str],
+    semilla: int = 0,
+    tasa_cargas_sociales: float = 0.25,
+    densa: bool = False,
+) -> CostoPersonalBatch:
+    """
+    Genera el historial de costos de una nómina para varios periodos.
+    
+    Como en una nómina real, cada empleado activo tiene un registro desde el
+    mes de su ingreso y los inactivos no tienen registros (no se sabe hasta
+    cuándo estuvieron). Los registros quedan ordenados por periodo y, dentro
+    de cada periodo, en el orden de ``empleados``.
+    
+    Args:
+        empleados: Nómina
+        periodos: Periodos a generar ("YYYY-MM")
+        semilla: Semilla del generador aleatorio
+        tasa_cargas_sociales: Tasa usada para las cargas sociales
+        densa: Si se genera un registro por cada empleado y periodo, sin
+            filtrar por estado ni por fecha de ingreso
+            
+    Returns:
+        CostoPersonalBatch con a lo sumo len(empleados) * len(periodos)
+        registros (exactamente esa cantidad con ``densa``)
+    """
+    rng = np.random.Generator(np.random.PCG64(semilla))
+    n = len(empleados)
+    filas = n * len(periodos)
+    
+    ids = np.empty(n, dtype=object)
+    ids[:] = [emp.id for emp in empleados]
+    salario = np.fromiter((emp.salario_base for emp in empleados), dtype=np.float64, count=n)
+    
+    periodo = np.empty(len(periodos), dtype=object)
+    periodo[:] = list(periodos)
+    
+    salario_base = np.tile(salario, len(periodos))
+    # Bonos e horas extra solo para una parte de los registros
+    bonos = np.where(
+        rng.random(filas) < 0.3,
+        np.round(salario_base * rng.uniform(0.02, 0.25, filas), 2),
+        0.0,
+    )
+    horas_extra = np.where(
+        rng.random(filas) < 0.25,
+        np.round(rng.gamma(2.0, 60.0, filas), 2),
+        0.0,
+    )
+    beneficios = np.round(rng.uniform(80.0, 220.0, filas), 2)
+    otros_costos = np.where(rng.random(filas) < 0.1, np.round(rng.uniform(10.0, 150.0, filas), 2), 0.0)
+    
+    costos = CostoPersonalBatch(
+        empleado_id=np.tile(ids, len(periodos)),
+        periodo=np.repeat(periodo, n),
+        salario_base=salario_base,
+        bonos=bonos,
+        horas_extra=horas_extra,
+        beneficios=beneficios,
+        cargas_sociales=salario_base * tasa_cargas_sociales,
+        otros_costos=otros_costos,
+    )
+    if densa:
+        return costos
+    
+    # Los valores aleatorios se generan para todas las celdas y después se
+    # filtran, para que cada registro no dependa de cuáles se descartan
+    activo = np.fromiter((emp.activo for emp in empleados), dtype=bool, count=n)
+    ingreso = np.fromiter(
+        (emp.fecha_ingreso.year * 12 + emp.fecha_ingreso.month - 1 for emp in empleados),
+        dtype=np.int64,
+        count=n,
+    )
+    vigente = activo & (ingreso <= codificar(list(periodos))[:, np.newaxis])
+    return costos[vigente.ravel()]
+
+
+def generar_historial(
+    filas: int,
+    cantidad_periodos: int = 36,
+    desde: str = "2022-01",
+    semilla: int = 0,
+) -> Tuple[List[Empleado], CostoPersonalBatch]:
+    """
+    Genera una nómina y un historial de costos con ``filas`` registros.
+    
+    La cantidad de empleados se ajusta a la proporción de registros que
+    quedan después de filtrar inactivos e ingresos posteriores a cada
+    periodo (ver generar_costos).
+    
+    Args:
+        filas: Cantidad de registros de costo deseada (por ejemplo 10_000,
+            1_000_000 o 10_000_000)
+        cantidad_periodos: Cantidad de periodos del historial
+        desde: Primer periodo
+        semilla: Semilla del generador aleatorio
+        
+    Returns:
+        Tupla (empleados, costos) con exactamente ``filas`` registros
+    """
+    cantidad_periodos = max(1, min(cantidad_periodos, filas))
+    periodos = periodos_consecutivos(desde, cantidad_periodos)
+    cantidad_empleados = math.ceil(filas / cantidad_periodos)
+    
+    while True:
+        empleados = generar_empleados(cantidad_empleados, semilla=semilla)
+        costos = generar_costos(empleados, periodos, semilla=semilla + 1)
+        if len(costos) >= filas:
+            return empleados, costos[:filas]
+        # Se estima la nómina necesaria con la proporción obtenida
+        cantidad_empleados = math.ceil(
+            cantidad_empleados * filas / max(len(costos), 1) * 1.01
+        ) + 1
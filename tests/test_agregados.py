@@ -0,0 +1,258 @@
+"""Tests para los agregados incrementales."""
+
+import json
+import numpy as np
+import pandas as pd
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from costo_personal.models import Empleado, CostoPersonal
+from costo_personal.lote import CostoPersonalBatch
+from costo_personal.registro import EmpleadoRegistry
+from costo_personal.reportes import GeneradorReportes
+from costo_personal.calculadora import CalculadoraCostos
+from costo_personal.agregados import (
+    AgregadoFlujo,
+    AgregadoIncremental,
+    AgregadoParcial,
+    combinar_parciales,
+)
+from costo_personal.sintetico import generar_historial
+
+
+class TestAgregadoIncremental:
+    """Tests para la clase AgregadoIncremental."""
+    
+    @pytest.fixture
+    def empleados(self):
+        """Fixture con empleados de ejemplo."""
+        return [
+            Empleado(
+                id=f"E{i:03d}",
+                nombre=f"Empleado {i}",
+                departamento=["Tecnología", "Ventas", "Finanzas"][i % 3],
+                cargo="Analista",
+                salario_base=1000.0 + 100.0 * i,
+                fecha_ingreso=date(2020, 1, 1),
+                activo=i != 4,
+            )
+            for i in range(9)
+        ]
+    
+    def costos_periodo(self, empleados, periodo, bonos=0.0):
+        """Genera los costos de un periodo para todos los empleados."""
+        return [
+            CostoPersonal(
+                empleado_id=emp.id,
+                periodo=periodo,
+                salario_base=emp.salario_base,
+                bonos=bonos,
+                horas_extra=10.0,
+                beneficios=5.0,
+                cargas_sociales=emp.salario_base * 0.25,
+            )
+            for emp in empleados
+        ]
+    
+    def assert_equivalente(self, agregado, empleados, costos):
+        """Compara el agregado con los reportes calculados desde cero."""
+        generador = GeneradorReportes()
+        pd.testing.assert_frame_equal(
+            agregado.reporte_por_departamento(),
+            generador.generar_reporte_por_departamento(empleados, costos),
+        )
+        pd.testing.assert_frame_equal(
+            agregado.reporte_tendencia(),
+            generador.generar_reporte_tendencia(costos),
+        )
+        assert agregado.metricas_clave() == pytest.approx(
+            generador.generar_metricas_clave(empleados, costos)
+        )
+    
+    def test_agregar_periodos(self, empleados):
+        """Test que agregar periodo a periodo equivale a recalcular todo."""
+        agregado = AgregadoIncremental(empleados)
+        historial = []
+        for mes, bonos in [("2024-09", 0.0), ("2024-10", 100.0), ("2024-11", 50.5)]:
+            nuevos = self.costos_periodo(empleados, mes, bonos)
+            agregado.agregar(CostoPersonalBatch.from_costos(nuevos))
+            historial.extend(nuevos)
+            self.assert_equivalente(agregado, empleados, historial)
+        
+        assert agregado.cantidad_registros == len(historial)
+    
+    def test_costos_iniciales_y_empleado_desconocido(self, empleados):
+        """Test costos iniciales con un empleado que no está en la nómina."""
+        costos = self.costos_periodo(empleados, "2024-11") + [
+            CostoPersonal(empleado_id="X999", periodo="2024-11", salario_base=500.0)
+        ]
+        agregado = AgregadoIncremental(empleados, costos)
+        self.assert_equivalente(agregado, empleados, costos)
+    
+    def test_retirar_correccion(self, empleados):
+        """Test que retirar y volver a agregar corrige un periodo."""
+        octubre = self.costos_periodo(empleados, "2024-10")
+        noviembre = self.costos_periodo(empleados, "2024-11")
+        agregado = AgregadoIncremental(empleados, octubre + noviembre)
+        
+        corregido = self.costos_periodo(empleados, "2024-11", bonos=250.0)
+        agregado.retirar(noviembre)
+        agregado.agregar(corregido)
+        self.assert_equivalente(agregado, empleados, octubre + corregido)
+    
+    def test_retirar_todo_un_departamento(self, empleados):
+        """Test que un departamento sin registros desaparece del reporte."""
+        costos = self.costos_periodo(empleados, "2024-11")
+        agregado = AgregadoIncremental(empleados, costos)
+        
+        ventas = [c for c in costos if c.empleado_id in {"E001", "E004", "E007"}]
+        agregado.retirar(ventas)
+        restantes = [c for c in costos if c not in ventas]
+        
+        df = agregado.reporte_por_departamento()
+        assert "Ventas" not in df["departamento"].tolist()
+        self.assert_equivalente(agregado, empleados, restantes)
+    
+    def test_retirar_inexistente(self, empleados):
+        """Test que retirar registros no agregados falla sin modificar nada."""
+        costos = self.costos_periodo(empleados, "2024-11")
+        agregado = AgregadoIncremental(empleados, costos)
+        
+        with pytest.raises(ValueError):
+            agregado.retirar(self.costos_periodo(empleados, "2024-12"))
+        with pytest.raises(ValueError):
+            agregado.retirar(costos + costos[:1])
+        
+        self.assert_equivalente(agregado, empleados, costos)
+    
+    def test_cambio_de_departamento_no_afecta_retiro(self, empleados):
+        """Test que los costos se retiran del departamento en que se agregaron."""
+        registro = EmpleadoRegistry(empleados)
+        costos = self.costos_periodo(empleados, "2024-11")
+        agregado = AgregadoIncremental(registro, costos)
+        
+        registro.actualizar("E000", departamento="Ventas")
+        agregado.retirar([c for c in costos if c.empleado_id == "E000"])
+        
+        tech = agregado.reporte_por_departamento().set_index("departamento").loc["Tecnología"]
+        assert tech["cantidad_empleados"] == 2
+    
+    def test_vacio(self, empleados):
+        """Test agregado sin costos."""
+        agregado = AgregadoIncremental(empleados)
+        self.assert_equivalente(agregado, empleados, [])
+
+
+class TestAgregadoParcial:
+    """Tests para la clase AgregadoParcial."""
+    
+    @pytest.fixture
+    def historial(self):
+        """Fixture con una nómina y 6 meses de costos sintéticos."""
+        return generar_historial(600, cantidad_periodos=6, semilla=4)
+    
+    def fragmentos(self, costos, cantidad):
+        """Divide los costos en fragmentos contiguos."""
+        limites = np.linspace(0, len(costos), cantidad + 1).astype(int)
+        return [costos[a:b] for a, b in zip(limites[:-1], limites[1:])]
+    
+    def test_combinar_equivale_a_generador(self, historial):
+        """Test que combinar los parciales equivale a los reportes sobre todos los costos."""
+        empleados, costos = historial
+        parciales = [
+            AgregadoParcial.desde_costos(empleados, fragmento)
+            for fragmento in self.fragmentos(costos, 4)
+        ]
+        paquete = combinar_parciales(parciales).paquete_reportes(empleados)
+        esperado = GeneradorReportes().generar_paquete_reportes(empleados, costos)
+        
+        pd.testing.assert_frame_equal(paquete["por_departamento"], esperado["por_departamento"])
+        pd.testing.assert_frame_equal(paquete["tendencia"], esperado["tendencia"])
+        assert paquete["metricas_clave"] == pytest.approx(esperado["metricas_clave"])
+    
+    def test_empleado_en_varios_fragmentos_se_cuenta_una_vez(self, historial):
+        """Test que los empleados únicos por departamento no se duplican al combinar."""
+        empleados, costos = historial
+        a, b = self.fragmentos(costos, 2)
+        combinado = AgregadoParcial.desde_costos(empleados, a).combinar(
+            AgregadoParcial.desde_costos(empleados, b)
+        )
+        
+        cantidades = combinado.reporte_por_departamento()["cantidad_empleados"]
+        assert cantidades.sum() == len(set(costos.empleado_id))
+    
+    def test_asociativo_y_neutro(self, historial):
+        """Test que la combinación es asociativa y el parcial vacío es neutro."""
+        empleados, costos = historial
+        a, b, c = (AgregadoParcial.desde_costos(empleados, f) for f in self.fragmentos(costos, 3))
+        
+        izquierda = a.combinar(b).combinar(c)
+        derecha = a.combinar(b.combinar(c))
+        pd.testing.assert_frame_equal(
+            izquierda.reporte_tendencia(), derecha.reporte_tendencia()
+        )
+        assert izquierda.empleados_por_departamento == derecha.empleados_por_departamento
+        assert AgregadoParcial().combinar(a) == a == a.combinar(AgregadoParcial())
+    
+    def test_serializacion(self, historial):
+        """Test que el parcial se puede enviar como JSON o entre procesos."""
+        empleados, costos = historial
+        parcial = AgregadoParcial.desde_costos(empleados, costos)
+        
+        assert AgregadoParcial.from_dict(json.loads(json.dumps(parcial.to_dict()))) == parcial
+        
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            parciales = list(executor.map(
+                AgregadoParcial.desde_costos,
+                [empleados] * 3,
+                self.fragmentos(costos, 3),
+            ))
+        assert combinar_parciales(parciales).costo_promedio_por_empleado() == pytest.approx(
+            CalculadoraCostos().calcular_costo_promedio_por_empleado(costos)
+        )
+    
+    def test_vacio(self, historial):
+        """Test que sin parciales se obtienen los reportes vacíos."""
+        empleados, _ = historial
+        combinado = combinar_parciales([])
+        esperado = GeneradorReportes().generar_paquete_reportes(empleados, [])
+        
+        assert combinado.metricas_clave(empleados) == esperado["metricas_clave"]
+        assert combinado.reporte_tendencia().empty
+        assert combinado.costo_promedio_por_empleado() == 0.0
+
+
+class TestAgregadoFlujo:
+    """Tests para la clase AgregadoFlujo."""
+    
+    def test_fragmentos_de_nomina_equivalen_a_generador(self):
+        """Test que acumular la nómina por fragmentos equivale a los reportes completos."""
+        empleados, _ = generar_historial(500, cantidad_periodos=1, semilla=8)
+        calculadora = CalculadoraCostos()
+        periodos = ["2024-01", "2024-02"]
+        
+        agregado = AgregadoFlujo()
+        for inicio in range(0, len(empleados), 120):
+            fragmento = empleados[inicio:inicio + 120]
+            activos = [emp for emp in fragmento if emp.activo]
+            agregado.agregar(fragmento, calculadora.calcular_costos_periodos(activos, periodos))
+        
+        costos = calculadora.calcular_costos_periodos(
+            [emp for emp in empleados if emp.activo], periodos
+        )
+        paquete = agregado.paquete_reportes()
+        esperado = GeneradorReportes().generar_paquete_reportes(empleados, costos)
+        
+        pd.testing.assert_frame_equal(paquete["por_departamento"], esperado["por_departamento"])
+        pd.testing.assert_frame_equal(paquete["tendencia"], esperado["tendencia"])
+        assert paquete["metricas_clave"] == pytest.approx(esperado["metricas_clave"])
+        assert agregado.cantidad_registros == len(costos)
+        assert agregado.cantidad_empleados == len(empleados)
+    
+    def test_vacio(self):
+        """Test que sin fragmentos se obtienen los reportes vacíos."""
+        esperado = GeneradorReportes().generar_paquete_reportes([], [])
+        paquete = AgregadoFlujo().paquete_reportes()
+        
+        assert paquete["metricas_clave"] == esperado["metricas_clave"]
+        assert paquete["por_departamento"].empty and paquete["tendencia"].empty
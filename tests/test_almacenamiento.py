@@ -0,0 +1,168 @@
+"""Tests para el almacenamiento Parquet."""
+
+import os
+import pandas as pd
+import pytest
+from datetime import date
+from costo_personal.models import Empleado, CostoPersonal
+from costo_personal.lote import CostoPersonalBatch
+from costo_personal.reportes import GeneradorReportes
+
+pytest.importorskip("pyarrow")
+
+from costo_personal import almacenamiento  # noqa: E402
+from costo_personal.almacenamiento import AlmacenCostos  # noqa: E402
+
+
+@pytest.fixture
+def empleados():
+    """Fixture con empleados de ejemplo."""
+    return [
+        Empleado(
+            id="E001",
+            nombre="Juan Pérez",
+            departamento="Tecnología",
+            cargo="Desarrollador",
+            salario_base=5000.0,
+            fecha_ingreso=date(2020, 1, 15),
+        ),
+        Empleado(
+            id="E002",
+            nombre="María García",
+            departamento="Ventas",
+            cargo="Vendedor",
+            salario_base=3000.0,
+            fecha_ingreso=date(2021, 6, 1),
+            activo=False,
+        ),
+    ]
+
+
+@pytest.fixture
+def costos():
+    """Fixture con costos de seis periodos."""
+    return [
+        CostoPersonal(
+            empleado_id=emp_id,
+            periodo=f"2024-{mes:02d}",
+            salario_base=salario,
+            bonos=10.0 * mes,
+            horas_extra=1.5,
+            beneficios=2.0,
+            cargas_sociales=salario * 0.25,
+            otros_costos=0.5,
+        )
+        for mes in range(1, 7)
+        for emp_id, salario in [("E001", 5000.0), ("E002", 3000.0)]
+    ]
+
+
+class TestAlmacenCostos:
+    """Tests para la clase AlmacenCostos."""
+    
+    def test_particiones_por_periodo(self, tmp_path, costos):
+        """Test que se crea una partición por periodo."""
+        almacen = AlmacenCostos(str(tmp_path))
+        escritos = almacen.guardar_costos(costos)
+        
+        assert escritos == [f"2024-{mes:02d}" for mes in range(1, 7)]
+        assert almacen.periodos() == escritos
+        assert os.path.isdir(tmp_path / "costos" / "periodo=2024-03")
+    
+    def test_ida_y_vuelta(self, tmp_path, costos):
+        """Test que los costos leídos coinciden con los guardados."""
+        almacen = AlmacenCostos(str(tmp_path))
+        almacen.guardar_costos(CostoPersonalBatch.from_costos(costos))
+        
+        lote = almacen.leer_costos()
+        assert isinstance(lote, CostoPersonalBatch)
+        assert lote.to_costos() == costos
+    
+    def test_rango_de_periodos(self, tmp_path, costos):
+        """Test que solo se leen los periodos del rango."""
+        almacen = AlmacenCostos(str(tmp_path))
+        almacen.guardar_costos(costos)
+        
+        lote = almacen.leer_costos(desde="2024-02", hasta="2024-04")
+        assert sorted(set(lote.periodo)) == ["2024-02", "2024-03", "2024-04"]
+        
+        ultimos = almacen.leer_costos(ultimos=2)
+        assert sorted(set(ultimos.periodo)) == ["2024-05", "2024-06"]
+        assert len(almacen.leer_costos(desde="2025-01")) == 0
+    
+    def test_tendencia_desde_almacen(self, tmp_path, costos):
+        """Test que la tendencia de los últimos periodos coincide con la lista."""
+        almacen = AlmacenCostos(str(tmp_path))
+        almacen.guardar_costos(costos)
+        generador = GeneradorReportes()
+        
+        recientes = [c for c in costos if c.periodo >= "2024-04"]
+        pd.testing.assert_frame_equal(
+            generador.generar_reporte_tendencia(almacen.leer_costos(ultimos=3)).reset_index(drop=True),
+            generador.generar_reporte_tendencia(recientes).reset_index(drop=True),
+        )
+    
+    def test_proyeccion_de_columnas(self, tmp_path, costos):
+        """Test lectura de un subconjunto de columnas."""
+        almacen = AlmacenCostos(str(tmp_path))
+        almacen.guardar_costos(costos)
+        
+        df = almacen.leer_dataframe(columnas=["periodo", "bonos"], desde="2024-06")
+        assert list(df.columns) == ["periodo", "bonos"]
+        assert df["bonos"].tolist() == [60.0, 60.0]
+        
+        vacio = almacen.leer_dataframe(columnas=["bonos"], desde="2030-01")
+        assert vacio.empty
+        assert list(vacio.columns) == ["bonos"]
+    
+    def test_reemplazar_y_agregar(self, tmp_path, costos):
+        """Test los modos de escritura de una partición."""
+        almacen = AlmacenCostos(str(tmp_path))
+        almacen.guardar_costos(costos)
+        
+        enero = [c for c in costos if c.periodo == "2024-01"]
+        almacen.guardar_costos(enero[:1])
+        assert len(almacen.leer_costos(desde="2024-01", hasta="2024-01")) == 1
+        
+        almacen.guardar_costos(enero[1:], modo="agregar")
+        assert len(almacen.leer_costos(desde="2024-01", hasta="2024-01")) == 2
+        
+        almacen.eliminar_periodo("2024-01")
+        assert "2024-01" not in almacen.periodos()
+        
+        with pytest.raises(ValueError):
+            almacen.guardar_costos(costos, modo="sobrescribir")
+    
+    def test_reemplazar_fallido_conserva_particion(self, tmp_path, costos, monkeypatch):
+        """Test que si falla la escritura la partición anterior queda intacta."""
+        almacen = AlmacenCostos(str(tmp_path))
+        almacen.guardar_costos(costos)
+        
+        def fallar(tabla, ruta):
+            raise OSError("disco lleno")
+        
+        monkeypatch.setattr(almacenamiento, "_escribir_tabla", fallar)
+        with pytest.raises(OSError):
+            almacen.guardar_costos(costos[:1])
+        
+        assert len(almacen.leer_costos(desde="2024-01", hasta="2024-01")) == 2
+        assert sorted(os.listdir(tmp_path / "costos")) == [f"periodo=2024-0{mes}" for mes in range(1, 7)]
+    
+    @pytest.mark.parametrize("periodo", ["../x", "2024-13", "2024-1"])
+    def test_periodo_invalido(self, tmp_path, periodo):
+        """Test que los periodos mal formados no llegan a la ruta de la partición."""
+        almacen = AlmacenCostos(str(tmp_path))
+        
+        with pytest.raises(ValueError):
+            almacen.guardar_costos([CostoPersonal("E001", periodo, 5000.0)])
+        with pytest.raises(ValueError):
+            almacen.eliminar_periodo(periodo)
+        assert not os.path.exists(tmp_path / "x")
+    
+    def test_empleados(self, tmp_path, empleados):
+        """Test que la nómina se guarda y se lee completa."""
+        almacen = AlmacenCostos(str(tmp_path))
+        assert almacen.leer_empleados() == []
+        
+        almacen.guardar_empleados(empleados)
+        assert almacen.leer_empleados() == empleados
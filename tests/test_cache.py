@@ -0,0 +1,188 @@
+"""Tests para la caché de reportes."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import date
+from costo_personal.models import Empleado
+from costo_personal.registro import EmpleadoRegistry
+from costo_personal.calculadora import CalculadoraCostos
+from costo_personal.reportes import GeneradorReportes
+from costo_personal.cache import CacheReportes, huella
+
+
+class TestCacheReportes:
+    """Tests para la clase CacheReportes."""
+    
+    @pytest.fixture
+    def empleados(self):
+        """Fixture con empleados de ejemplo."""
+        return [
+            Empleado(
+                id="E001",
+                nombre="Juan Pérez",
+                departamento="Tecnología",
+                cargo="Desarrollador",
+                salario_base=5000.0,
+                fecha_ingreso=date(2020, 1, 1),
+            ),
+            Empleado(
+                id="E002",
+                nombre="Carlos López",
+                departamento="Ventas",
+                cargo="Vendedor",
+                salario_base=4000.0,
+                fecha_ingreso=date(2022, 1, 1),
+            ),
+        ]
+    
+    def test_acierto_devuelve_copia(self, empleados):
+        """Test que la segunda llamada usa la caché y devuelve una copia."""
+        cache = CacheReportes()
+        generador = GeneradorReportes(cache=cache)
+        registro = EmpleadoRegistry(empleados)
+        costos = CalculadoraCostos().calcular_costos_lote(registro, "2024-11")
+        
+        df1 = generador.generar_reporte_por_departamento(registro, costos)
+        df1.loc[0, "costo_total"] = -1.0
+        df2 = generador.generar_reporte_por_departamento(registro, costos)
+        
+        assert df2.loc[0, "costo_total"] == 6250.0
+        estadisticas = cache.estadisticas()
+        assert estadisticas["aciertos"] == 1
+        assert estadisticas["fallos"] == 1
+        assert estadisticas["tasa_aciertos"] == 0.5
+    
+    def test_resultado_igual_sin_cache(self, empleados):
+        """Test que los resultados con caché coinciden con los calculados."""
+        costos = CalculadoraCostos().calcular_costos_lote(empleados, "2024-11", bonos=10.0)
+        con_cache = GeneradorReportes(cache=CacheReportes())
+        sin_cache = GeneradorReportes()
+        
+        for _ in range(2):
+            pd.testing.assert_frame_equal(
+                con_cache.generar_reporte_tendencia(costos),
+                sin_cache.generar_reporte_tendencia(costos),
+            )
+            assert con_cache.generar_metricas_clave(empleados, costos) == (
+                sin_cache.generar_metricas_clave(empleados, costos)
+            )
+            paquete = con_cache.generar_paquete_reportes(empleados, costos)
+            assert paquete["metricas_clave"] == sin_cache.generar_metricas_clave(
+                empleados, costos
+            )
+    
+    def test_tasa_distinta_invalida(self, empleados):
+        """Test que cambiar la tasa de cargas sociales produce otra entrada."""
+        cache = CacheReportes()
+        generador = GeneradorReportes(cache=cache)
+        
+        costos_25 = CalculadoraCostos(0.25).calcular_costos_lote(empleados, "2024-11")
+        costos_30 = CalculadoraCostos(0.30).calcular_costos_lote(empleados, "2024-11")
+        
+        registro = EmpleadoRegistry(empleados)
+        m25 = generador.generar_metricas_clave(registro, costos_25)
+        m30 = generador.generar_metricas_clave(registro, costos_30)
+        
+        assert m30["costo_total"] > m25["costo_total"]
+        assert cache.estadisticas()["fallos"] == 2
+    
+    def test_fila_editada_invalida(self, empleados):
+        """Test que editar un costo (lote o lista) invalida la entrada."""
+        cache = CacheReportes()
+        generador = GeneradorReportes(cache=cache)
+        registro = EmpleadoRegistry(empleados)
+        lote = CalculadoraCostos().calcular_costos_lote(registro, "2024-11")
+        lista = lote.to_costos()
+        
+        total = generador.generar_metricas_clave(registro, lote)["costo_total"]
+        lote.bonos[1] = 100.0
+        assert generador.generar_metricas_clave(registro, lote)["costo_total"] == total + 100.0
+        
+        generador.generar_metricas_clave(registro, lista)
+        lista[0].horas_extra = 50.0
+        assert generador.generar_metricas_clave(registro, lista)["costo_total"] == total + 50.0
+        assert cache.estadisticas()["aciertos"] == 0
+        assert cache.estadisticas()["fallos"] == 2
+    
+    def test_empleado_modificado_invalida(self, empleados):
+        """Test que cambiar un empleado invalida la entrada."""
+        cache = CacheReportes()
+        generador = GeneradorReportes(cache=cache)
+        costos = CalculadoraCostos().calcular_costos_lote(empleados, "2024-11")
+        
+        assert generador.generar_metricas_clave(empleados, costos)["total_empleados"] == 2
+        empleados[1].activo = False
+        assert generador.generar_metricas_clave(empleados, costos)["total_empleados"] == 1
+        
+        registro = EmpleadoRegistry(empleados)
+        version = registro.version
+        assert generador.generar_metricas_clave(registro, costos)["total_empleados"] == 1
+        registro.actualizar("E002", activo=True)
+        assert registro.version != version
+        assert generador.generar_metricas_clave(registro, costos)["total_empleados"] == 2
+        assert cache.estadisticas()["aciertos"] == 0
+    
+    def test_listas_sin_cache(self, empleados):
+        """Test que las listas de empleados o costos se calculan sin caché."""
+        cache = CacheReportes()
+        generador = GeneradorReportes(cache=cache)
+        costos = CalculadoraCostos().calcular_costos_lote(empleados, "2024-11")
+        
+        for _ in range(2):
+            assert generador.generar_metricas_clave(empleados, costos)["total_empleados"] == 2
+            assert len(generador.generar_reporte_tendencia(costos.to_costos())) == 1
+        
+        assert cache.clave("generar_reporte_tendencia", costos.to_costos()) is None
+        assert len(cache) == 0
+        assert cache.estadisticas()["fallos"] == 0
+    
+    def test_backend_en_la_clave(self, empleados):
+        """Test que cada backend tiene su propia entrada."""
+        cache = CacheReportes()
+        costos = CalculadoraCostos().calcular_costos_lote(empleados, "2024-11")
+        
+        GeneradorReportes(cache=cache).generar_reporte_tendencia(costos)
+        GeneradorReportes(backend="pandas", cache=cache).generar_reporte_tendencia(costos)
+        assert len(cache) == 2
+    
+    def test_desalojo_lru_por_entradas(self):
+        """Test que se desaloja la entrada menos usada recientemente."""
+        cache = CacheReportes(max_entradas=2)
+        cache.guardar("a", 1)
+        cache.guardar("b", 2)
+        cache.obtener_o_calcular("a", lambda: 0)
+        cache.guardar("c", 3)
+        
+        assert cache.obtener_o_calcular("a", lambda: -1) == 1
+        assert cache.obtener_o_calcular("b", lambda: -1) == -1
+        assert cache.estadisticas()["desalojos"] >= 1
+    
+    def test_desalojo_por_memoria(self):
+        """Test que el límite de memoria desaloja entradas y omite las grandes."""
+        df = pd.DataFrame({"x": range(1000)})
+        tamano = int(df.memory_usage(deep=True, index=True).sum())
+        cache = CacheReportes(max_bytes=tamano * 2)
+        
+        cache.guardar("a", df)
+        cache.guardar("b", df)
+        cache.guardar("c", df)
+        assert len(cache) == 2
+        assert cache.estadisticas()["bytes"] <= tamano * 2
+        
+        cache.guardar("grande", pd.DataFrame({"x": range(10000)}))
+        assert cache.obtener_o_calcular("grande", lambda: None) is None
+    
+    def test_limites_invalidos(self):
+        """Test que los límites deben ser positivos."""
+        with pytest.raises(ValueError):
+            CacheReportes(max_entradas=0)
+
+
+def test_huella_distingue_contenido():
+    """Test que la huella cambia con el contenido y no con la identidad."""
+    assert huella([1, 2], "a") == huella([1, 2], "a")
+    assert huella([1, 2], "a") != huella([2, 1], "a")
+    assert huella(["a", "b"]) != huella(["ab"])
+    assert huella(np.arange(2000.0)) != huella(np.arange(2000.0)[::-1])
+    assert huella(EmpleadoRegistry()) != huella(EmpleadoRegistry())
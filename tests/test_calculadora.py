@@ -1,9 +1,15 @@
 """Tests para el calculador de costos."""
 
+import numpy as np
 import pytest
 from datetime import date
 from costo_personal.models import Empleado
+from costo_personal.lote import CAMPOS_MONTO, CostoPersonalBatch
 from costo_personal.calculadora import CalculadoraCostos
+from costo_personal.cargas import Condicion, ReglaCargas, ReglasCargas, Tramo
+from costo_personal.proyeccion import AjustesProyeccion, AumentoProgramado, PoliticaBonos
+from costo_personal.reportes import GeneradorReportes
+from costo_personal.sintetico import generar_empleados
 
 
 class TestCalculadoraCostos:
@@ -159,3 +165,236 @@ class TestCalculadoraCostos:
         calculadora = CalculadoraCostos()
         promedio = calculadora.calcular_costo_promedio_por_empleado([])
         assert promedio == 0.0
+    
+    def test_calcular_costo_promedio_lote(self):
+        """Test cálculo de costo promedio sobre un CostoPersonalBatch."""
+        lote = CostoPersonalBatch(
+            empleado_id=["E001", "E002"],
+            periodo="2024-11",
+            salario_base=[5000.0, 3000.0],
+            cargas_sociales=[1250.0, 750.0],
+        )
+        
+        calculadora = CalculadoraCostos()
+        assert calculadora.calcular_costo_promedio_por_empleado(lote) == 5000.0
+        assert calculadora.calcular_costo_promedio_por_empleado(CostoPersonalBatch.vacio()) == 0.0
+    
+    def test_calcular_costos_lote(self):
+        """Test cálculo en lote equivalente a calcular_costo_mensual."""
+        empleados = [
+            Empleado(
+                id="E001",
+                nombre="Juan Pérez",
+                departamento="Tecnología",
+                cargo="Desarrollador",
+                salario_base=5000.0,
+                fecha_ingreso=date(2020, 1, 1),
+            ),
+            Empleado(
+                id="E002",
+                nombre="María García",
+                departamento="Ventas",
+                cargo="Vendedor",
+                salario_base=3000.0,
+                fecha_ingreso=date(2021, 1, 1),
+            ),
+        ]
+        
+        calculadora = CalculadoraCostos(tasa_cargas_sociales=0.25)
+        lote = calculadora.calcular_costos_lote(
+            empleados,
+            "2024-11",
+            bonos={"E002": 500.0},
+            horas_extra=[100.0, 0.0],
+            beneficios=150.0,
+        )
+        
+        esperado = [
+            calculadora.calcular_costo_mensual(
+                empleados[0], "2024-11", horas_extra=100.0, beneficios=150.0
+            ),
+            calculadora.calcular_costo_mensual(
+                empleados[1], "2024-11", bonos=500.0, beneficios=150.0
+            ),
+        ]
+        assert isinstance(lote, CostoPersonalBatch)
+        assert lote.to_costos() == esperado
+        assert lote.costo_total.tolist() == [c.costo_total for c in esperado]
+    
+    def test_calcular_costos_lote_largo_invalido(self):
+        """Test que un arreglo desalineado con los empleados es rechazado."""
+        empleados = [
+            Empleado(
+                id="E001",
+                nombre="Juan Pérez",
+                departamento="Tecnología",
+                cargo="Desarrollador",
+                salario_base=5000.0,
+                fecha_ingreso=date(2020, 1, 1),
+            ),
+        ]
+        
+        calculadora = CalculadoraCostos()
+        with pytest.raises(ValueError):
+            calculadora.calcular_costos_lote(empleados, "2024-11", bonos=[1.0, 2.0])
+    
+    def test_calcular_costos_lote_vacio(self):
+        """Test cálculo en lote sin empleados."""
+        calculadora = CalculadoraCostos()
+        lote = calculadora.calcular_costos_lote([], "2024-11")
+        assert len(lote) == 0
+    
+    def test_calcular_costos_periodos_serie_y_paralelo(self):
+        """Test que el cálculo por fragmentos en procesos coincide bit a bit con el serial."""
+        empleados = generar_empleados(250, semilla=2)
+        periodos = ["2024-10", "2024-11", "2024-12"]
+        bonos = {emp.id: 10.0 * k for k, emp in enumerate(empleados[::4])}
+        
+        calculadora = CalculadoraCostos(tasa_cargas_sociales=0.27)
+        esperado = CostoPersonalBatch.concatenar([
+            calculadora.calcular_costos_lote(empleados, periodo, bonos=bonos, beneficios=120.0)
+            for periodo in periodos
+        ])
+        serie = calculadora.calcular_costos_periodos(
+            empleados, periodos, bonos=bonos, beneficios=120.0
+        )
+        paralelo = calculadora.calcular_costos_periodos(
+            empleados, periodos, bonos=bonos, beneficios=120.0,
+            procesos=2, tamano_fragmento=60,
+        )
+        
+        for lote in (serie, paralelo):
+            assert lote.empleado_id.tolist() == esperado.empleado_id.tolist()
+            assert lote.periodo.tolist() == esperado.periodo.tolist()
+            for campo in CAMPOS_MONTO:
+                assert getattr(lote, campo).tobytes() == getattr(esperado, campo).tobytes()
+    
+    def test_calcular_costos_periodos_conceptos_por_periodo(self):
+        """Test conceptos distintos en cada periodo, en serie y en paralelo."""
+        empleados = generar_empleados(90, semilla=6)
+        periodos = ["2024-10", "2024-11", "2024-12"]
+        bonos = np.arange(len(periodos) * len(empleados), dtype=np.float64).reshape(len(periodos), -1)
+        
+        calculadora = CalculadoraCostos()
+        esperado = CostoPersonalBatch.concatenar([
+            calculadora.calcular_costos_lote(empleados, periodo, bonos=bonos[k], beneficios=50.0)
+            for k, periodo in enumerate(periodos)
+        ])
+        for procesos in (1, 2):
+            lote = calculadora.calcular_costos_periodos(
+                empleados, periodos, bonos=bonos, beneficios=50.0,
+                procesos=procesos, tamano_fragmento=25,
+            )
+            assert lote.to_costos() == esperado.to_costos()
+        
+        with pytest.raises(ValueError):
+            calculadora.calcular_costos_periodos(empleados, periodos[:2], bonos=bonos)
+    
+    def test_reglas_cargas_lista_lote_y_paralelo(self):
+        """Test que las reglas de cargas dan lo mismo en todas las formas de cálculo."""
+        empleados = generar_empleados(150, semilla=4)
+        reglas = ReglasCargas((
+            ReglaCargas(Condicion(departamentos=("Ventas",)), tasa=0.3, tope_base=4000.0),
+            ReglaCargas(tramos=(Tramo(0.0, 0.2), Tramo(3000.0, 0.28)), minimo=400.0),
+        ))
+        calculadora = CalculadoraCostos(reglas_cargas=reglas)
+        
+        lista = [calculadora.calcular_costo_mensual(emp, "2025-01") for emp in empleados]
+        lote = calculadora.calcular_costos_lote(empleados, "2025-01")
+        paralelo = calculadora.calcular_costos_periodos(
+            empleados, ["2025-01", "2025-02"], procesos=2, tamano_fragmento=40
+        )
+        proyeccion = calculadora.proyectar(
+            empleados, "2025-01", "2025-02", AjustesProyeccion(solo_activos=False)
+        )
+        
+        assert lote.to_costos() == lista
+        assert paralelo[:len(empleados)].to_costos() == lista
+        assert proyeccion.cargas_sociales.tolist() == paralelo.cargas_sociales.tolist()
+        assert lista[0].cargas_sociales != empleados[0].salario_base * 0.25
+    
+    def test_calcular_costos_periodos_parametros_invalidos(self):
+        """Test que procesos y tamaño de fragmento deben ser positivos."""
+        empleados = generar_empleados(3)
+        calculadora = CalculadoraCostos()
+        
+        with pytest.raises(ValueError):
+            calculadora.calcular_costos_periodos(empleados, ["2024-11"], procesos=0)
+        with pytest.raises(ValueError):
+            calculadora.calcular_costos_periodos(empleados, ["2024-11"], tamano_fragmento=0)
+    
+    def test_proyectar_sin_ajustes(self):
+        """Test que sin ajustes la proyección repite el costo de los empleados activos."""
+        empleados = generar_empleados(40, semilla=9)
+        activos = [emp for emp in empleados if emp.activo]
+        calculadora = CalculadoraCostos()
+        
+        lote = calculadora.proyectar(empleados, "2025-11", "2026-02")
+        esperado = calculadora.calcular_costos_periodos(
+            activos, ["2025-11", "2025-12", "2026-01", "2026-02"]
+        )
+        
+        assert lote.to_costos() == esperado.to_costos()
+    
+    def test_proyectar_con_ajustes(self):
+        """Test aumentos, indexación por inflación y bonos por departamento."""
+        empleados = [
+            Empleado(
+                id="E001",
+                nombre="Juan Pérez",
+                departamento="Tecnología",
+                cargo="Desarrollador",
+                salario_base=1000.0,
+                fecha_ingreso=date(2020, 1, 1),
+            ),
+            Empleado(
+                id="E002",
+                nombre="María García",
+                departamento="Ventas",
+                cargo="Ejecutivo",
+                salario_base=2000.0,
+                fecha_ingreso=date(2021, 3, 15),
+            ),
+        ]
+        ajustes = AjustesProyeccion(
+            aumentos=[AumentoProgramado("2025-12", 0.10, departamento="Ventas")],
+            inflacion_anual=0.05,
+            politicas_bonos=[PoliticaBonos("Ventas", porcentaje_salario=0.5, meses=[12])],
+            beneficios=100.0,
+        )
+        
+        calculadora = CalculadoraCostos()
+        lote = calculadora.proyectar(empleados, "2025-11", "2026-01", ajustes)
+        
+        assert lote.periodo.tolist() == ["2025-11"] * 2 + ["2025-12"] * 2 + ["2026-01"] * 2
+        assert lote.salario_base.tolist() == pytest.approx(
+            [1000.0, 2000.0, 1000.0, 2200.0, 1050.0, 2310.0]
+        )
+        assert lote.bonos.tolist() == pytest.approx([0.0, 0.0, 0.0, 1100.0, 0.0, 0.0])
+        assert lote.cargas_sociales.tolist() == pytest.approx(
+            (lote.salario_base * 0.25).tolist()
+        )
+        
+        tendencia = GeneradorReportes().generar_reporte_tendencia(lote)
+        assert tendencia["periodo"].tolist() == ["2025-11", "2025-12", "2026-01"]
+    
+    def test_proyectar_desde_ingreso(self):
+        """Test que no se proyectan costos antes del mes de ingreso."""
+        empleados = [
+            Empleado("E1", "Ana", "Ventas", "Ejecutivo", 1000.0, date(2020, 1, 1)),
+            Empleado("E2", "Luis", "Ventas", "Ejecutivo", 1000.0, date(2025, 6, 15)),
+        ]
+        
+        lote = CalculadoraCostos().proyectar(empleados, "2025-04", "2025-07")
+        
+        assert lote.periodo.tolist() == ["2025-04", "2025-05", "2025-06", "2025-06", "2025-07", "2025-07"]
+        assert lote.empleado_id.tolist() == ["E1", "E1", "E1", "E2", "E1", "E2"]
+        assert lote.salario_base.tolist() == [1000.0] * 6
+    
+    def test_proyectar_rango_invalido(self):
+        """Test que un rango invertido o un periodo mal formado son rechazados."""
+        calculadora = CalculadoraCostos()
+        with pytest.raises(ValueError):
+            calculadora.proyectar([], "2026-01", "2025-12")
+        with pytest.raises(ValueError):
+            calculadora.proyectar([], "2025-13", "2026-01")
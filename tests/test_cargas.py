@@ -0,0 +1,99 @@
+"""Tests para las reglas de cargas sociales."""
+
+import numpy as np
+import pytest
+from datetime import date
+from costo_personal.models import Empleado
+from costo_personal.cargas import (
+    AtributosCargas,
+    Condicion,
+    ReglaCargas,
+    ReglasCargas,
+    Tramo,
+    compilar,
+)
+
+
+def _empleado(id, departamento, cargo, salario_base, fecha_ingreso=date(2020, 1, 1)):
+    return Empleado(
+        id=id,
+        nombre=f"Empleado {id}",
+        departamento=departamento,
+        cargo=cargo,
+        salario_base=salario_base,
+        fecha_ingreso=fecha_ingreso,
+    )
+
+
+class TestReglasCargas:
+    """Tests para la compilación y aplicación de ReglasCargas."""
+    
+    def test_sin_reglas_usa_tasa_defecto(self):
+        """Test que sin reglas se aplica la tasa por defecto."""
+        salarios = np.array([1000.0, 2500.0])
+        cargas = compilar(ReglasCargas(tasa_defecto=0.3)).aplicar(salarios)
+        assert cargas.tolist() == (salarios * 0.3).tolist()
+    
+    def test_tramos_tope_minimo_y_maximo(self):
+        """Test escala progresiva, tope de base imponible y mínimo/máximo."""
+        reglas = ReglasCargas((
+            ReglaCargas(
+                tramos=(Tramo(0.0, 0.1), Tramo(1000.0, 0.2), Tramo(3000.0, 0.3)),
+                tope_base=5000.0,
+                minimo=50.0,
+                maximo=1000.0,
+            ),
+        ))
+        salarios = np.array([300.0, 2000.0, 4000.0, 9000.0])
+        cargas = compilar(reglas).aplicar(salarios)
+        
+        # 300 -> 30 (mínimo 50); 2000 -> 100 + 200; 4000 -> 100 + 400 + 300;
+        # 9000 -> tope 5000 -> 100 + 400 + 600 = 1100 (máximo 1000)
+        assert cargas.tolist() == pytest.approx([50.0, 300.0, 800.0, 1000.0])
+    
+    def test_condiciones_primera_regla_gana(self):
+        """Test que cada empleado usa la primera regla cuya condición cumple."""
+        empleados = [
+            _empleado("E001", "Ventas", "Gerente", 1000.0),
+            _empleado("E002", "Ventas", "Ejecutivo", 1000.0),
+            _empleado("E003", "Legal", "Abogado", 1000.0, date(2024, 6, 1)),
+            _empleado("E004", "Legal", "Abogado", 1000.0),
+        ]
+        reglas = ReglasCargas((
+            ReglaCargas(Condicion(cargos=("Gerente",)), tasa=0.4),
+            ReglaCargas(Condicion(departamentos=("Ventas",)), tasa=0.3),
+            ReglaCargas(Condicion(ingreso_desde=date(2024, 1, 1)), tasa=0.1),
+        ), tasa_defecto=0.2)
+        atributos = AtributosCargas.desde_empleados(empleados)
+        
+        cargas = compilar(reglas).aplicar(np.full(4, 1000.0), atributos)
+        assert cargas.tolist() == pytest.approx([400.0, 300.0, 100.0, 200.0])
+        
+        # Matriz periodos x empleados: las condiciones se aplican por columna
+        matriz = compilar(reglas).aplicar(np.full((3, 4), 1000.0), atributos)
+        assert matriz.shape == (3, 4)
+        assert (matriz == cargas).all()
+    
+    def test_compilacion_en_cache(self):
+        """Test que un mismo conjunto de reglas se compila una sola vez."""
+        reglas = ReglasCargas((ReglaCargas(tasa=0.2, tope_base=4000.0),), version="2025")
+        igual = ReglasCargas((ReglaCargas(tasa=0.2, tope_base=4000.0),), version="2025")
+        otra_version = ReglasCargas((ReglaCargas(tasa=0.2, tope_base=4000.0),), version="2026")
+        
+        assert compilar(reglas) is compilar(igual)
+        assert compilar(reglas) is not compilar(otra_version)
+    
+    def test_reglas_invalidas(self):
+        """Test que se rechazan reglas mal definidas o sin atributos requeridos."""
+        with pytest.raises(ValueError):
+            ReglaCargas()
+        with pytest.raises(ValueError):
+            ReglaCargas(tasa=0.2, tramos=(Tramo(0.0, 0.1),))
+        with pytest.raises(ValueError):
+            ReglaCargas(tramos=(Tramo(1000.0, 0.1), Tramo(0.0, 0.2)))
+        with pytest.raises(ValueError):
+            ReglaCargas(tasa=0.2, minimo=100.0, maximo=50.0)
+        
+        reglas = ReglasCargas((ReglaCargas(Condicion(departamentos=("Ventas",)), tasa=0.3),))
+        with pytest.raises(ValueError):
+            compilar(reglas).aplicar(np.array([1000.0]))
@@ -0,0 +1,130 @@
+"""Tests para los montos en unidades menores enteras."""
+
+from decimal import Decimal
+import numpy as np
+import pytest
+from costo_personal.dinero import Moneda, sumar_por_grupo
+from costo_personal.lote import CostoPersonalBatch
+from costo_personal.calculadora import CalculadoraCostos
+from costo_personal.cargas import ReglaCargas, ReglasCargas, Tramo
+from costo_personal.cache import huella
+from costo_personal.reportes import GeneradorReportes
+from costo_personal.sintetico import generar_empleados
+
+
+class TestMoneda:
+    """Tests para la clase Moneda y las sumas enteras."""
+    
+    def test_politicas_de_redondeo(self):
+        """Test las políticas de redondeo, incluido el ruido de float."""
+        montos = [2.675, 0.125, -0.125, 1.999]
+        
+        assert Moneda().a_unidades(montos).tolist() == [268, 13, -13, 200]
+        assert Moneda(redondeo="mitad_par").a_unidades(montos).tolist() == [268, 12, -12, 200]
+        assert Moneda(redondeo="truncar").a_unidades(montos).tolist() == [267, 12, -12, 199]
+        assert Moneda(decimales=0).a_unidades(2.5).dtype == np.int64
+        assert Moneda().redondear(1.005) == 1.01
+    
+    def test_conversiones(self):
+        """Test la conversión de unidades a float y Decimal."""
+        moneda = Moneda(salida="decimal")
+        
+        assert moneda.a_float(np.int64(123456)) == 1234.56
+        assert moneda.convertir(123456) == Decimal("1234.56")
+        assert Moneda().convertir(-5) == -0.05
+    
+    @pytest.mark.parametrize("parametros", [
+        {"decimales": 7},
+        {"redondeo": "hacia_arriba"},
+        {"salida": "str"},
+    ])
+    def test_parametros_invalidos(self, parametros):
+        """Test que se validan los decimales, el redondeo y la salida."""
+        with pytest.raises(ValueError):
+            Moneda(**parametros)
+    
+    def test_sumar_por_grupo_exacto(self):
+        """Test la suma por grupo con y sin desborde de float64."""
+        codigos = np.array([0, 1, 0, 1])
+        chicos = np.array([1, 2, 3, 4], dtype=np.int64)
+        grandes = np.array([2 ** 53, 1, 1, 1], dtype=np.int64)
+        
+        assert sumar_por_grupo(codigos, chicos, 3).tolist() == [4, 6, 0]
+        assert sumar_por_grupo(codigos, grandes, 2).tolist() == [2 ** 53 + 1, 2]
+        assert sumar_por_grupo(codigos[:0], chicos[:0], 2).tolist() == [0, 0]
+
+
+class TestModoEntero:
+    """Tests del lote, la calculadora y los reportes en unidades menores."""
+    
+    def test_lote_en_unidades(self):
+        """Test la conversión del lote y que conserva la moneda."""
+        moneda = Moneda()
+        lote = CostoPersonalBatch(["E1", "E2"], "2024-01", [1000.005, 2000.0], bonos=0.1)
+        
+        enteros = lote.en_unidades(moneda)
+        assert enteros.salario_base.tolist() == [100001, 200000]
+        assert enteros.costo_total.dtype == np.int64
+        assert enteros[0].salario_base == 1000.01
+        assert enteros[:1].moneda == moneda
+        assert enteros.en_unidades(moneda) is enteros
+        assert enteros.en_float().bonos.tolist() == [0.1, 0.1]
+        assert enteros.to_dataframe()["costo_total"].tolist() == [1000.11, 2000.1]
+        assert huella(enteros) != huella(lote.en_unidades(Moneda(salida="decimal")))
+        
+        with pytest.raises(ValueError):
+            CostoPersonalBatch(["E1"], "2024-01", [1.5], moneda=moneda)
+        with pytest.raises(ValueError):
+            CostoPersonalBatch.concatenar([lote, enteros])
+        with pytest.raises(ValueError):
+            enteros.en_unidades(Moneda(decimales=3))
+    
+    def test_calculadora_redondea_cargas(self):
+        """Test que todas las formas de cálculo aplican el mismo redondeo."""
+        empleados = generar_empleados(120, semilla=8)
+        for emp in empleados:
+            emp.salario_base += 0.005
+        reglas = ReglasCargas((ReglaCargas(tramos=(Tramo(0.0, 0.1234), Tramo(3000.0, 0.2777))),))
+        calculadora = CalculadoraCostos(reglas_cargas=reglas, moneda=Moneda(redondeo="mitad_par"))
+        
+        lista = [calculadora.calcular_costo_mensual(emp, "2024-11", bonos=0.333) for emp in empleados]
+        lote = calculadora.calcular_costos_lote(empleados, "2024-11", bonos=0.333)
+        periodos = calculadora.calcular_costos_periodos(
+            empleados, ["2024-11", "2024-12"], bonos=0.333, procesos=2, tamano_fragmento=50
+        )
+        
+        assert lote.moneda == calculadora.moneda
+        assert lote.to_costos() == lista
+        assert periodos[:len(empleados)].to_costos() == lista
+        assert all(round(c.cargas_sociales, 2) == c.cargas_sociales for c in lista)
+        assert calculadora.proyectar(empleados, "2024-11", "2024-12").salario_base.dtype == np.int64
+    
+    def test_reportes_sumas_exactas(self):
+        """Test que los reportes suman exacto y respetan el tipo de salida."""
+        n = 10_000
+        ids = [f"E{i}" for i in range(n)]
+        flotante = CostoPersonalBatch(ids, "2024-01", 0.0, bonos=0.1)
+        empleados = generar_empleados(1, semilla=1)
+        
+        metricas_float = GeneradorReportes().generar_metricas_clave(empleados, flotante)
+        assert metricas_float["costo_total"] != 1000.0
+        
+        for backend in ("python", "pandas"):
+            generador = GeneradorReportes(backend=backend)
+            enteros = flotante.en_unidades(Moneda())
+            metricas = generador.generar_metricas_clave(empleados, enteros)
+            tendencia = generador.generar_reporte_tendencia(enteros)
+            assert metricas["costo_total"] == 1000.0
+            assert tendencia["bonos_total"].tolist() == [1000.0]
+            
+            decimales = flotante.en_unidades(Moneda(salida="decimal"))
+            paquete = generador.generar_paquete_reportes(empleados, decimales)
+            assert paquete["metricas_clave"]["costo_total"] == Decimal("1000.00")
+            assert paquete["tendencia"]["costo_promedio"].tolist() == [Decimal("0.1")]
+        
+        assert CalculadoraCostos().calcular_costo_promedio_por_empleado(
+            flotante.en_unidades(Moneda())
+        ) == 0.1
+        assert CalculadoraCostos().calcular_costo_promedio_por_empleado(
+            flotante.en_unidades(Moneda(salida="decimal"))
+        ) == Decimal("0.1")
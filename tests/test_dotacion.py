@@ -0,0 +1,89 @@
+"""Tests para la serie de dotación."""
+
+from datetime import date, timedelta
+import numpy as np
+import pytest
+from costo_personal.models import Empleado
+from costo_personal.dotacion import COLUMNAS_DOTACION, calcular_dotacion
+from costo_personal.registro import EmpleadoRegistry
+from costo_personal.reportes import GeneradorReportes
+from costo_personal.sintetico import generar_empleados, periodos_consecutivos
+
+
+@pytest.fixture
+def empleados():
+    """Fixture con ingresos antes y durante el rango, un egreso y un inactivo sin fecha."""
+    return [
+        Empleado("E1", "Ana", "Ventas", "Analista", 1000.0, date(2023, 12, 5)),
+        Empleado("E2", "Luis", "TI", "Dev", 2000.0, date(2024, 2, 1)),
+        Empleado("E3", "Eva", "Ventas", "Jefe", 3000.0, date(2024, 1, 15), activo=False),
+        Empleado("E4", "Juan", "TI", "Dev", 1500.0, date(2020, 1, 1), activo=False),
+    ]
+
+
+class TestDotacion:
+    """Tests para calcular_dotacion y generar_reporte_dotacion."""
+    
+    def test_serie_total(self, empleados):
+        """Test la dotación, los movimientos y la rotación por mes."""
+        df = calcular_dotacion(empleados, "2024-01", "2024-04", egresos={"E3": date(2024, 3, 10)})
+        
+        assert list(df.columns) == COLUMNAS_DOTACION
+        assert df["periodo"].tolist() == ["2024-01", "2024-02", "2024-03", "2024-04"]
+        assert df["dotacion_inicial"].tolist() == [1, 2, 3, 2]
+        assert df["ingresos"].tolist() == [1, 1, 0, 0]
+        assert df["egresos"].tolist() == [0, 0, 1, 0]
+        assert df["dotacion_final"].tolist() == [2, 3, 2, 2]
+        assert df["tasa_rotacion"].tolist() == [0.0, 0.0, 0.4, 0.0]
+    
+    def test_desglose(self, empleados):
+        """Test el desglose por departamento y cargo desde el reporte."""
+        df = GeneradorReportes().generar_reporte_dotacion(
+            EmpleadoRegistry(empleados), "2024-01", "2024-02", por=("departamento", "cargo")
+        )
+        
+        assert list(df.columns[:3]) == ["periodo", "departamento", "cargo"]
+        assert df[["departamento", "cargo"]].values.tolist()[:2] == [["TI", "Dev"], ["Ventas", "Analista"]]
+        assert df["dotacion_final"].tolist() == [0, 1, 1, 1]
+        assert calcular_dotacion([], "2024-01", "2024-02").empty
+    
+    @pytest.mark.parametrize("argumentos", [
+        {"desde": "2024-03", "hasta": "2024-01"},
+        {"por": ("nombre",)},
+        {"egresos": {"E1": date(2023, 1, 1)}},
+    ])
+    def test_parametros_invalidos(self, empleados, argumentos):
+        """Test que se validan el rango, los campos y las fechas de egreso."""
+        parametros = {"desde": "2024-01", "hasta": "2024-03", **argumentos}
+        with pytest.raises(ValueError):
+            calcular_dotacion(empleados, **parametros)
+    
+    def test_coincide_con_recorrido_mensual(self):
+        """Test contra el conteo empleado por empleado y mes por mes."""
+        empleados = generar_empleados(400, semilla=5, tasa_inactivos=0.3)
+        rng = np.random.default_rng(5)
+        egresos = {
+            emp.id: emp.fecha_ingreso + timedelta(days=int(rng.integers(0, 2000)))
+            for emp in empleados if not emp.activo
+        }
+        periodos = periodos_consecutivos("2020-01", 36)
+        
+        df = calcular_dotacion(empleados, periodos[0], periodos[-1], egresos, por=("departamento",))
+        
+        for periodo in periodos[::7]:
+            anio, mes = map(int, periodo.split("-"))
+            cierre = date(anio + mes // 12, mes % 12 + 1, 1) - timedelta(days=1)
+            for departamento in {emp.departamento for emp in empleados}:
+                grupo = [emp for emp in empleados if emp.departamento == departamento]
+                esperado = sum(
+                    1 for emp in grupo
+                    if emp.fecha_ingreso <= cierre
+                    and (emp.activo or egresos[emp.id] > cierre)
+                )
+                salidas = sum(
+                    1 for emp in grupo
+                    if not emp.activo and egresos[emp.id].strftime("%Y-%m") == periodo
+                )
+                fila = df[(df["periodo"] == periodo) & (df["departamento"] == departamento)]
+                assert fila["dotacion_final"].tolist() == [esperado]
+                assert fila["egresos"].tolist() == [salidas]
@@ -0,0 +1,110 @@
+"""Tests para el simulador de escenarios."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from costo_personal.lote import CostoPersonalBatch
+from costo_personal.reportes import GeneradorReportes
+from costo_personal.escenarios import SimuladorEscenarios
+from costo_personal.sintetico import generar_historial
+
+
+class TestSimuladorEscenarios:
+    """Tests para la clase SimuladorEscenarios."""
+    
+    @pytest.fixture
+    def historial(self):
+        """Fixture con una nómina y 3 meses de costos sintéticos."""
+        return generar_historial(900, cantidad_periodos=3, semilla=6)
+    
+    def assert_equivalente(self, resultado, escenario, empleados, costos):
+        """Compara un escenario con los reportes sobre costos recalculados."""
+        generador = GeneradorReportes()
+        pd.testing.assert_frame_equal(
+            resultado.reporte_por_departamento(escenario),
+            generador.generar_reporte_por_departamento(empleados, costos),
+        )
+        assert resultado.metricas_clave(escenario) == pytest.approx(
+            generador.generar_metricas_clave(empleados, costos)
+        )
+    
+    def test_escenarios_equivalen_a_recalcular(self, historial):
+        """Test que cada escenario equivale a recalcular los costos con sus parámetros."""
+        empleados, costos = historial
+        resultado = SimuladorEscenarios(empleados, costos).evaluar([
+            {"nombre": "base"},
+            {"nombre": "tasa", "tasa_cargas_sociales": 0.31},
+            {"nombre": "aumento_tope", "aumento_salarial": 0.1, "tope_bonos": 150.0},
+        ])
+        
+        assert resultado.metricas.index.tolist() == ["base", "tasa", "aumento_tope"]
+        self.assert_equivalente(resultado, "base", empleados, costos)
+        
+        con_tasa = CostoPersonalBatch(
+            costos.empleado_id, costos.periodo, costos.salario_base, costos.bonos,
+            costos.horas_extra, costos.beneficios, costos.salario_base * 0.31, costos.otros_costos,
+        )
+        self.assert_equivalente(resultado, "tasa", empleados, con_tasa)
+        
+        con_aumento = CostoPersonalBatch(
+            costos.empleado_id, costos.periodo, costos.salario_base * 1.1,
+            np.minimum(costos.bonos, 150.0), costos.horas_extra, costos.beneficios,
+            costos.cargas_sociales * 1.1, costos.otros_costos,
+        )
+        self.assert_equivalente(resultado, "aumento_tope", empleados, con_aumento)
+    
+    def test_recortes_retiran_ingresos_recientes(self, historial):
+        """Test que los recortes retiran primero a los empleados de ingreso más reciente."""
+        empleados, costos = historial
+        resultado = SimuladorEscenarios(empleados, costos).evaluar(
+            pd.DataFrame({
+                "nombre": ["recorte"],
+                "recortes": [{"Ventas": 0.5, "Legal": 1.0}],
+            })
+        )
+        
+        por_id = {emp.id: emp for emp in empleados}
+        ventas = sorted(
+            {emp_id for emp_id in costos.empleado_id if por_id[emp_id].departamento == "Ventas"},
+            key=lambda emp_id: (-por_id[emp_id].fecha_ingreso.toordinal(), emp_id),
+        )
+        retirados = set(ventas[:round(len(ventas) * 0.5)]) | {
+            emp_id for emp_id in costos.empleado_id if por_id[emp_id].departamento == "Legal"
+        }
+        quedan = np.array([emp_id not in retirados for emp_id in costos.empleado_id])
+        nomina = [emp for emp in empleados if emp.id not in retirados]
+        
+        reporte = resultado.reporte_por_departamento("recorte")
+        assert "Legal" not in reporte["departamento"].tolist()
+        pd.testing.assert_frame_equal(
+            reporte,
+            GeneradorReportes().generar_reporte_por_departamento(empleados, costos[quedan]),
+        )
+        assert resultado.metricas_clave("recorte") == pytest.approx(
+            GeneradorReportes().generar_metricas_clave(nomina, costos[quedan])
+        )
+    
+    def test_muchos_escenarios_en_bloques(self, historial, monkeypatch):
+        """Test que evaluar por bloques no cambia los resultados."""
+        empleados, costos = historial
+        escenarios = [{"tasa_cargas_sociales": 0.2 + 0.01 * i} for i in range(7)]
+        simulador = SimuladorEscenarios(empleados, costos)
+        completo = simulador.evaluar(escenarios)
+        
+        monkeypatch.setattr("costo_personal.escenarios.LIMITE_CELDAS", len(costos) * 2)
+        por_bloques = simulador.evaluar(escenarios)
+        
+        pd.testing.assert_frame_equal(completo.metricas, por_bloques.metricas)
+        pd.testing.assert_frame_equal(completo.por_departamento, por_bloques.por_departamento)
+        assert completo.metricas.index.tolist() == [str(i) for i in range(7)]
+    
+    def test_parametros_invalidos(self, historial):
+        """Test que se rechazan parámetros desconocidos, nombres repetidos y recortes fuera de rango."""
+        simulador = SimuladorEscenarios(*historial)
+        
+        with pytest.raises(ValueError):
+            simulador.evaluar([{"tasa": 0.3}])
+        with pytest.raises(ValueError):
+            simulador.evaluar([{"nombre": "a"}, {"nombre": "a"}])
+        with pytest.raises(ValueError):
+            simulador.evaluar([{"recortes": {"Ventas": 1.5}}])
@@ -0,0 +1,183 @@
+"""Tests para la exportación por lotes."""
+
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+from costo_personal.models import CAMPOS_COSTO, CostoPersonal
+from costo_personal.lote import CostoPersonalBatch
+from costo_personal.reportes import GeneradorReportes
+from costo_personal.exportacion import (
+    exportar_csv_por_lotes,
+    exportar_excel_por_lotes,
+    iterar_lotes,
+)
+
+
+@pytest.fixture
+def costos():
+    """Fixture con costos de ejemplo."""
+    return [
+        CostoPersonal(
+            empleado_id=f"E{i:03d}",
+            periodo="2024-11",
+            salario_base=1000.0 + i,
+            bonos=float(i % 3),
+            cargas_sociales=250.0,
+        )
+        for i in range(25)
+    ]
+
+
+class TestIterarLotes:
+    """Tests para la normalización de fuentes de filas."""
+    
+    def test_lista_de_costos(self, costos):
+        """Test que una lista de costos se divide en lotes."""
+        lotes = list(iterar_lotes(costos, tamano_lote=10))
+        
+        assert [len(df) for df in lotes] == [10, 10, 5]
+        assert list(lotes[0].columns) == list(costos[0].to_dict())
+    
+    def test_generador_de_costos(self, costos):
+        """Test que un generador de costos se consume de a un lote."""
+        lotes = list(iterar_lotes((c for c in costos), tamano_lote=20))
+        assert [len(df) for df in lotes] == [20, 5]
+    
+    def test_lote_y_dataframe(self, costos):
+        """Test que un CostoPersonalBatch o DataFrame se dividen en lotes."""
+        lote = CostoPersonalBatch.from_costos(costos)
+        assert [len(df) for df in iterar_lotes(lote, tamano_lote=10)] == [10, 10, 5]
+        assert [len(df) for df in iterar_lotes(lote.to_dataframe(), tamano_lote=30)] == [25]
+    
+    def test_iterador_de_lotes(self, costos):
+        """Test que los lotes recibidos se respetan."""
+        fuente = [
+            [c.to_dict() for c in costos[:5]],
+            CostoPersonalBatch.from_costos(costos[5:]),
+        ]
+        assert [len(df) for df in iterar_lotes(fuente)] == [5, 20]
+    
+    def test_generador_de_diccionarios(self, costos):
+        """Test que un flujo de filas como diccionarios se divide en lotes."""
+        lotes = list(iterar_lotes((c.to_dict() for c in costos), tamano_lote=10))
+        
+        assert [len(df) for df in lotes] == [10, 10, 5]
+        assert list(lotes[0].columns) == list(costos[0].to_dict())
+        assert lotes[2]["empleado_id"].tolist()[-1] == "E024"
+    
+    @pytest.mark.parametrize("fuente", [
+        ["E001", "E002"],
+        [[{"empleado_id": "E001"}, "E002"]],
+        [{"empleado_id": "E001"}, "E002"],
+    ])
+    def test_tipo_no_admitido(self, fuente):
+        """Test que las fuentes no admitidas fallan en lugar de exportarse."""
+        with pytest.raises(TypeError):
+            list(iterar_lotes(fuente))
+    
+    def test_vacio(self):
+        """Test fuente sin filas."""
+        assert list(iterar_lotes([])) == []
+
+
+class TestExportacionPorLotes:
+    """Tests para los exportadores por lotes."""
+    
+    def test_csv_igual_a_exportacion_completa(self, costos, tmp_path):
+        """Test que el CSV por lotes coincide con exportar el DataFrame entero."""
+        generador = GeneradorReportes()
+        completo = tmp_path / "completo.csv"
+        por_lotes = tmp_path / "por_lotes.csv"
+        
+        generador.exportar_reporte_csv(pd.DataFrame([c.to_dict() for c in costos]), str(completo))
+        filas = generador.exportar_csv_por_lotes(iter(costos), str(por_lotes), tamano_lote=7)
+        
+        assert filas == 25
+        assert por_lotes.read_bytes() == completo.read_bytes()
+    
+    def test_csv_de_diccionarios(self, tmp_path):
+        """Test que un generador de diccionarios se exporta con sus valores."""
+        destino = tmp_path / "dicts.csv"
+        filas = exportar_csv_por_lotes(
+            ({"empleado_id": f"E{i}", "costo": 1.0} for i in range(3)), str(destino), tamano_lote=2
+        )
+        
+        assert filas == 3
+        assert pd.read_csv(destino, encoding="utf-8-sig").values.tolist() == [
+            ["E0", 1.0], ["E1", 1.0], ["E2", 1.0]
+        ]
+    
+    def test_csv_vacio(self, tmp_path):
+        """Test que una fuente vacía genera un archivo con solo el encabezado."""
+        destino = tmp_path / "vacio.csv"
+        assert exportar_csv_por_lotes([], str(destino)) == 0
+        assert list(pd.read_csv(destino, encoding="utf-8-sig").columns) == list(CAMPOS_COSTO)
+        
+        exportar_csv_por_lotes(pd.DataFrame(columns=["a", "b"]), str(destino))
+        completo = tmp_path / "completo.csv"
+        GeneradorReportes().exportar_reporte_csv(pd.DataFrame(columns=["a", "b"]), str(completo))
+        assert destino.read_bytes() == completo.read_bytes()
+    
+    def test_csv_lote_sin_columna_opcional(self, tmp_path):
+        """Test que una columna que falta en un lote se escribe vacía."""
+        destino = tmp_path / "opcional.csv"
+        fuente = [{"empleado_id": "E0", "bonos": 1.0}, {"empleado_id": "E1"}]
+        exportar_csv_por_lotes(iter(fuente), str(destino), tamano_lote=1)
+        
+        df = pd.read_csv(destino, encoding="utf-8-sig")
+        assert df["empleado_id"].tolist() == ["E0", "E1"]
+        assert df["bonos"].isna().tolist() == [False, True]
+    
+    def test_excel_divide_hojas(self, costos, tmp_path):
+        """Test que el Excel continúa en otra hoja al llegar al límite."""
+        destino = tmp_path / "detalle.xlsx"
+        filas = GeneradorReportes().exportar_excel_por_lotes(
+            CostoPersonalBatch.from_costos(costos),
+            str(destino),
+            tamano_lote=4,
+            max_filas_hoja=11,
+        )
+        
+        assert filas == 25
+        wb = load_workbook(destino, read_only=True)
+        assert wb.sheetnames == ["Hoja1", "Hoja2", "Hoja3"]
+        
+        leidas = []
+        for hoja in wb.worksheets:
+            valores = list(hoja.values)
+            assert list(valores[0]) == list(costos[0].to_dict())
+            assert len(valores) <= 11
+            leidas.extend(valores[1:])
+        
+        assert len(leidas) == 25
+        assert leidas[0][0] == "E000"
+        assert leidas[-1][0] == "E024"
+        assert leidas[-1][2] == 1024.0
+    
+    def test_excel_columnas_en_otro_orden(self, tmp_path):
+        """Test que los lotes siguientes se alinean con el encabezado."""
+        destino = tmp_path / "orden.xlsx"
+        fuente = [
+            pd.DataFrame({"a": [1], "b": [2]}),
+            pd.DataFrame({"b": [4], "a": [3]}),
+        ]
+        exportar_excel_por_lotes(fuente, str(destino))
+        
+        valores = list(load_workbook(destino, read_only=True).worksheets[0].values)
+        assert valores == [("a", "b"), (1, 2), (3, 4)]
+        
+        exportar_excel_por_lotes([fuente[0], pd.DataFrame({"b": [6]})], str(destino))
+        valores = list(load_workbook(destino, read_only=True).worksheets[0].values)
+        assert valores == [("a", "b"), (1, 2), (None, 6)]
+    
+    def test_excel_vacio(self, tmp_path):
+        """Test que una fuente vacía genera un libro con una hoja."""
+        destino = tmp_path / "vacio.xlsx"
+        assert exportar_excel_por_lotes([], str(destino)) == 0
+        assert load_workbook(destino).sheetnames == ["Hoja1"]
+        assert list(load_workbook(destino).worksheets[0].values) == [CAMPOS_COSTO]
+    
+    def test_excel_limite_invalido(self, costos, tmp_path):
+        """Test que cada hoja debe admitir al menos una fila de datos."""
+        with pytest.raises(ValueError):
+            exportar_excel_por_lotes(costos, str(tmp_path / "x.xlsx"), max_filas_hoja=1)
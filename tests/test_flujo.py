@@ -0,0 +1,226 @@
+"""Tests para el procesamiento en flujo."""
+
+import csv
+import tracemalloc
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import date
+from costo_personal.models import Empleado
+from costo_personal.calculadora import CalculadoraCostos
+from costo_personal.reportes import GeneradorReportes
+from costo_personal.flujo import (
+    combinar_conceptos,
+    fragmentar,
+    iterar_conceptos_csv,
+    leer_conceptos_csv,
+    leer_empleados_csv,
+    procesar_flujo,
+)
+from costo_personal.sintetico import generar_empleados
+
+
+def _nomina_perezosa(cantidad):
+    """Genera empleados de a uno, sin guardarlos."""
+    departamentos = ("Ventas", "Operaciones", "Finanzas")
+    for i in range(cantidad):
+        yield Empleado(
+            id=f"E{i:07d}",
+            nombre=f"Empleado {i}",
+            departamento=departamentos[i % 3],
+            cargo="Analista",
+            salario_base=1000.0 + i % 500,
+            fecha_ingreso=date(2020, 1, 1),
+            activo=i % 10 != 0,
+        )
+
+
+class TestProcesarFlujo:
+    """Tests para procesar_flujo."""
+    
+    def test_equivale_a_calcular_todo(self):
+        """Test que el flujo por fragmentos equivale a calcular y reportar todo junto."""
+        empleados = generar_empleados(700, semilla=3)
+        periodos = ["2024-11", "2024-12"]
+        bonos = {emp.id: 50.0 for emp in empleados[::7]}
+        calculadora = CalculadoraCostos(tasa_cargas_sociales=0.3)
+        
+        resultado = procesar_flujo(
+            iter(empleados), periodos, calculadora, bonos=bonos, beneficios=80.0,
+            tamano_fragmento=150,
+        )
+        
+        activos = [emp for emp in empleados if emp.activo]
+        costos = calculadora.calcular_costos_periodos(
+            activos, periodos, bonos=bonos, beneficios=80.0
+        )
+        generador = GeneradorReportes()
+        pd.testing.assert_frame_equal(
+            resultado.por_departamento,
+            generador.generar_reporte_por_departamento(empleados, costos),
+        )
+        pd.testing.assert_frame_equal(
+            resultado.tendencia, generador.generar_reporte_tendencia(costos)
+        )
+        assert resultado.metricas_clave == pytest.approx(
+            generador.generar_metricas_clave(empleados, costos)
+        )
+        assert resultado.cantidad_empleados == 700
+        assert resultado.cantidad_registros == len(costos)
+        assert resultado.cantidad_fragmentos == 5
+        assert resultado.pico_rss_bytes is None or resultado.pico_rss_bytes > 0
+    
+    def test_memoria_acotada_por_fragmento(self):
+        """Test que la memoria no crece con la cantidad de empleados ni de conceptos."""
+        def pico(cantidad):
+            conceptos = ((f"E{i:07d}", {"bonos": 10.0}) for i in range(cantidad))
+            tracemalloc.start()
+            try:
+                procesar_flujo(
+                    _nomina_perezosa(cantidad), "2024-11", tamano_fragmento=1000,
+                    conceptos=conceptos,
+                )
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        
+        pico(1000)
+        assert pico(20_000) < 2 * pico(2000)
+    
+    def test_conceptos_en_flujo(self, tmp_path):
+        """Test que los conceptos leídos en flujo equivalen a leerlos completos."""
+        empleados = generar_empleados(500, semilla=11)
+        ruta = tmp_path / "variables.csv"
+        with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(["empleado_id", "bonos", "horas_extra"])
+            for k, emp in enumerate(empleados):
+                if k % 3 == 0:
+                    escritor.writerow([emp.id, "100", ""])
+                    escritor.writerow([emp.id, "25.5", "12"])
+            escritor.writerow(["E9999999", "1000", ""])
+        
+        variables = leer_conceptos_csv(str(ruta))
+        completo = procesar_flujo(
+            iter(empleados), "2024-11", tamano_fragmento=120,
+            bonos=variables["bonos"], horas_extra=variables["horas_extra"],
+        )
+        en_flujo = procesar_flujo(
+            iter(empleados), "2024-11", tamano_fragmento=120,
+            conceptos=iterar_conceptos_csv(str(ruta)),
+        )
+        
+        pd.testing.assert_frame_equal(en_flujo.por_departamento, completo.por_departamento)
+        assert en_flujo.metricas_clave == completo.metricas_clave
+        with pytest.raises(ValueError):
+            procesar_flujo(iter(empleados), "2024-11", bonos=1.0, conceptos=[])
+    
+    def test_combinar_conceptos_consume_por_fragmento(self):
+        """Test que cada fragmento solo consume los conceptos de sus IDs."""
+        leidos = []
+        
+        def registros():
+            for i in range(0, 10, 2):
+                leidos.append(i)
+                yield f"E{i:07d}", {"bonos": float(i)}
+        
+        pares = combinar_conceptos(fragmentar(_nomina_perezosa(10), 4), registros())
+        fragmento, montos = next(pares)
+        assert [emp.id for emp in fragmento] == [f"E{i:07d}" for i in range(4)]
+        assert montos["bonos"] == {"E0000000": 0.0, "E0000002": 2.0}
+        assert leidos == [0, 2, 4]
+        assert [montos["bonos"] for _, montos in pares] == [
+            {"E0000004": 4.0, "E0000006": 6.0}, {"E0000008": 8.0}
+        ]
+    
+    @pytest.mark.parametrize("ids_empleados, ids_conceptos", [
+        (["E2", "E1"], []),
+        (["E1", "E1"], []),
+        (["E1", "E2", "E3"], ["E2", "E1"]),
+    ])
+    def test_combinar_conceptos_desordenados(self, ids_empleados, ids_conceptos):
+        """Test que las fuentes deben venir ordenadas por ID."""
+        empleados = [
+            Empleado(emp_id, "X", "Ventas", "Analista", 1000.0, date(2020, 1, 1))
+            for emp_id in ids_empleados
+        ]
+        conceptos = [(emp_id, {"bonos": 1.0}) for emp_id in ids_conceptos]
+        with pytest.raises(ValueError):
+            list(combinar_conceptos(fragmentar(empleados, 2), conceptos))
+    
+    @pytest.mark.parametrize("bonos", [[1.0, 2.0], np.array([1.0, 2.0]), "10"])
+    def test_conceptos_posicionales_rechazados(self, bonos):
+        """Test que los conceptos solo pueden ser un número o un diccionario por ID."""
+        def nomina():
+            yield from _nomina_perezosa(4)
+            raise AssertionError("la nómina no se debe leer")
+        
+        with pytest.raises(ValueError, match="bonos"):
+            procesar_flujo(nomina(), "2024-01", bonos=bonos, tamano_fragmento=2)
+        resultado = procesar_flujo(_nomina_perezosa(4), "2024-01", bonos=np.float64(5.0))
+        assert resultado.tendencia["bonos_total"].tolist() == [15.0]
+    
+    def test_fragmentar(self):
+        """Test la división perezosa en fragmentos."""
+        assert list(fragmentar(range(5), 2)) == [[0, 1], [2, 3], [4]]
+        assert list(fragmentar([], 3)) == []
+        with pytest.raises(ValueError):
+            list(fragmentar(range(5), 0))
+
+
+class TestLecturaCsv:
+    """Tests para la lectura de empleados y conceptos desde CSV."""
+    
+    def test_leer_empleados_csv(self, tmp_path):
+        """Test que los empleados escritos con to_dict se leen iguales."""
+        empleados = generar_empleados(30, semilla=5)
+        ruta = tmp_path / "empleados.csv"
+        pd.DataFrame([emp.to_dict() for emp in empleados]).to_csv(ruta, index=False)
+        
+        assert list(leer_empleados_csv(str(ruta))) == empleados
+    
+    def test_leer_empleados_csv_fila_invalida(self, tmp_path):
+        """Test que una fila inválida informa el número de línea."""
+        ruta = tmp_path / "empleados.csv"
+        ruta.write_text(
+            "id,nombre,departamento,cargo,salario_base,fecha_ingreso\n"
+            "E1,Ana,Ventas,Ejecutivo,1000,2020-01-01\n"
+            "E2,Luis,Ventas,Ejecutivo,mil,2020-01-01\n",
+            encoding="utf-8",
+        )
+        
+        with pytest.raises(ValueError, match="línea 3"):
+            list(leer_empleados_csv(str(ruta)))
+    
+    def test_leer_empleados_csv_activo(self, tmp_path):
+        """Test que ``activo`` acepta los valores de la ingesta y rechaza los demás."""
+        ruta = tmp_path / "empleados.csv"
+        ruta.write_text(
+            "id,nombre,departamento,cargo,salario_base,fecha_ingreso,activo\n"
+            "E1,Ana,Ventas,Ejecutivo,1000,2020-01-01,1.0\n"
+            "E2,Luis,Ventas,Ejecutivo,1000,2020-01-01,No\n",
+            encoding="utf-8",
+        )
+        assert [emp.activo for emp in leer_empleados_csv(str(ruta))] == [True, False]
+        
+        with open(ruta, "a", encoding="utf-8") as archivo:
+            archivo.write("E3,Eva,Ventas,Ejecutivo,1000,2020-01-01,Verdadro\n")
+        with pytest.raises(ValueError, match="línea 4"):
+            list(leer_empleados_csv(str(ruta)))
+    
+    def test_leer_conceptos_csv(self, tmp_path):
+        """Test que los conceptos repetidos de un empleado se suman."""
+        ruta = tmp_path / "variables.csv"
+        with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(["empleado_id", "bonos", "horas_extra"])
+            escritor.writerows([["E1", "100", ""], ["E2", "", "40.5"], ["E1", "25", "10"]])
+        
+        assert leer_conceptos_csv(str(ruta)) == {
+            "bonos": {"E1": 125.0},
+            "horas_extra": {"E2": 40.5, "E1": 10.0},
+        }
+        
+        ruta.write_text("id,bonos\nE1,10\n", encoding="utf-8")
+        with pytest.raises(ValueError):
+            leer_conceptos_csv(str(ruta))
@@ -0,0 +1,117 @@
+"""Tests para el historial de empleados con vigencias."""
+
+from datetime import date
+import numpy as np
+import pytest
+from costo_personal.models import Empleado
+from costo_personal.historial import CambioEmpleado, HistorialEmpleados
+from costo_personal.calculadora import CalculadoraCostos
+from costo_personal.cargas import Condicion, ReglaCargas, ReglasCargas
+
+
+@pytest.fixture
+def historial():
+    """Fixture con dos empleados y cambios de salario, área y estado."""
+    empleados = [
+        Empleado("E1", "Ana", "Ventas", "Analista", 1000.0, date(2023, 5, 10)),
+        Empleado("E2", "Luis", "TI", "Dev", 2000.0, date(2024, 2, 1)),
+    ]
+    cambios = [
+        CambioEmpleado("E1", "2024-03", departamento="TI"),
+        CambioEmpleado("E1", "2024-01", salario_base=1100.0),
+        CambioEmpleado("E2", "2024-06", activo=False),
+        CambioEmpleado("E1", "2024-03", salario_base=1200.0),
+        CambioEmpleado("E1", "2024-05", salario_base=1200.0),
+    ]
+    return HistorialEmpleados(empleados, cambios)
+
+
+class TestHistorialEmpleados:
+    """Tests para la búsqueda de datos vigentes."""
+    
+    def test_segmentos_compactos(self, historial):
+        """Test que se fusionan los cambios del mismo periodo y los repetidos."""
+        assert historial.cantidad_segmentos == 5
+        assert historial.limites.tolist() == [0, 3, 5]
+        assert historial.departamentos[historial.departamento].tolist() == [
+            "Ventas", "Ventas", "TI", "TI", "TI"
+        ]
+    
+    def test_vigente(self, historial):
+        """Test la búsqueda de un empleado en un periodo."""
+        assert historial.vigente("E1", "2023-04") is None
+        assert historial.vigente("E1", "2023-12").salario_base == 1000.0
+        vigente = historial.vigente("E1", "2024-04")
+        assert (vigente.salario_base, vigente.departamento, vigente.cargo) == (1200.0, "TI", "Analista")
+        assert vigente.fecha_ingreso == date(2023, 5, 10)
+        assert historial.vigente("E2", "2030-01").activo is False
+        with pytest.raises(KeyError):
+            historial.vigente("E9", "2024-01")
+    
+    def test_foto_de_la_nomina(self, historial):
+        """Test la búsqueda vectorizada para varios periodos."""
+        assert historial.segmentos(["2023-05", "2024-02", "2024-06"]).tolist() == [
+            [0, -1], [1, 3], [2, 4]
+        ]
+        assert historial.segmentos("2024-01").tolist() == [1, -1]
+        assert [e.id for e in historial.al("2024-06")] == ["E1", "E2"]
+        assert [e.id for e in historial.al("2024-06", solo_activos=True)] == ["E1"]
+    
+    @pytest.mark.parametrize("cambio", [
+        CambioEmpleado("E9", "2024-01", salario_base=1.0),
+        CambioEmpleado("E2", "2024-01", salario_base=1.0),
+        CambioEmpleado("E1", "2024-13", salario_base=1.0),
+    ])
+    def test_cambios_invalidos(self, cambio):
+        """Test que se rechazan empleados desconocidos y cambios previos."""
+        empleados = [
+            Empleado("E1", "Ana", "Ventas", "Analista", 1000.0, date(2023, 5, 10)),
+            Empleado("E2", "Luis", "TI", "Dev", 2000.0, date(2024, 2, 1)),
+        ]
+        with pytest.raises(ValueError):
+            HistorialEmpleados(empleados, [cambio])
+    
+    def test_estado_inicial_comun(self):
+        """Test el parámetro desde y los IDs repetidos."""
+        empleado = Empleado("E1", "Ana", "Ventas", "Analista", 1000.0, date(2023, 5, 10))
+        
+        assert HistorialEmpleados([empleado], desde="2020-01").vigente("E1", "2020-01") is not None
+        with pytest.raises(ValueError):
+            HistorialEmpleados([empleado, empleado])
+        with pytest.raises(ValueError):
+            CambioEmpleado("E1", "2024-01", salario_base=-1.0)
+
+
+class TestCalculoHistorico:
+    """Tests para el recálculo de periodos pasados."""
+    
+    def test_usa_los_datos_de_cada_periodo(self, historial):
+        """Test que cada periodo usa el salario vigente y omite inactivos."""
+        calculadora = CalculadoraCostos(tasa_cargas_sociales=0.5)
+        lote = calculadora.calcular_costos_historicos(
+            historial, ["2023-12", "2024-03", "2024-06"], bonos={"E2": 10.0}
+        )
+        
+        assert lote.periodo.tolist() == ["2023-12", "2024-03", "2024-03", "2024-06"]
+        assert lote.empleado_id.tolist() == ["E1", "E1", "E2", "E1"]
+        assert lote.salario_base.tolist() == [1000.0, 1200.0, 2000.0, 1200.0]
+        assert lote.cargas_sociales.tolist() == [500.0, 600.0, 1000.0, 600.0]
+        assert lote.bonos.tolist() == [0.0, 0.0, 10.0, 0.0]
+        assert len(calculadora.calcular_costos_historicos(
+            historial, ["2024-06"], solo_activos=False
+        )) == 2
+    
+    def test_coincide_con_la_foto(self, historial):
+        """Test que el cálculo coincide con calcular_costos_lote sobre la foto."""
+        reglas = ReglasCargas((
+            ReglaCargas(tasa=0.1, condicion=Condicion(departamentos=("TI",))),
+        ), tasa_defecto=0.3)
+        calculadora = CalculadoraCostos(reglas_cargas=reglas)
+        periodos = ["2024-02", "2024-04"]
+        
+        lote = calculadora.calcular_costos_historicos(historial, periodos)
+        for periodo in periodos:
+            esperado = calculadora.calcular_costos_lote(historial.al(periodo, True), periodo)
+            obtenido = lote[lote.periodo == periodo]
+            assert np.array_equal(obtenido.cargas_sociales, esperado.cargas_sociales)
+            assert obtenido.to_costos() == esperado.to_costos()
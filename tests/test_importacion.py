@@ -0,0 +1,45 @@
+"""Tests para la importación perezosa del paquete."""
+
+import subprocess
+import sys
+import pytest
+import costo_personal
+
+
+def _modulos_cargados(codigo: str) -> set:
+    """Ejecuta código en un intérprete nuevo y devuelve los módulos cargados."""
+    salida = subprocess.run(
+        [sys.executable, "-c", f"import sys\n{codigo}\nprint(' '.join(sys.modules))"],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    return set(salida.split())
+
+
+class TestImportacion:
+    """Tests de las dependencias cargadas al importar el paquete."""
+    
+    def test_nucleo_no_importa_pandas(self):
+        """Test que los modelos y la calculadora no cargan pandas ni openpyxl."""
+        modulos = _modulos_cargados(
+            "from datetime import date\n"
+            "from costo_personal import CalculadoraCostos, Empleado\n"
+            "e = Empleado('E1', 'Ana', 'Ventas', 'Ejecutivo', 1000.0, date(2020, 1, 1))\n"
+            "c = CalculadoraCostos()\n"
+            "c.calcular_costo_mensual(e, '2024-01')\n"
+            "c.calcular_costos_periodos([e], ['2024-01', '2024-02'])\n"
+            "c.proyectar([e], '2024-01', '2024-12')"
+        )
+        
+        assert "costo_personal.calculadora" in modulos
+        assert not {"pandas", "openpyxl", "costo_personal.reportes", "multiprocessing"} & modulos
+    
+    def test_exportaciones_perezosas(self):
+        """Test que los nombres perezosos se importan al primer acceso."""
+        modulos = _modulos_cargados("import costo_personal\ncosto_personal.GeneradorReportes")
+        assert "costo_personal.reportes" in modulos
+        
+        from costo_personal.reportes import GeneradorReportes
+        assert costo_personal.GeneradorReportes is GeneradorReportes
+        assert set(costo_personal.__all__) <= set(dir(costo_personal))
+        with pytest.raises(AttributeError):
+            costo_personal.NoExiste
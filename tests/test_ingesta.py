@@ -0,0 +1,185 @@
+"""Tests para la carga masiva de empleados y costos."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from costo_personal.lote import CAMPOS_MONTO
+from costo_personal.ingesta import (
+    cargar_costos_csv,
+    cargar_costos_excel,
+    cargar_empleados_csv,
+    cargar_empleados_excel,
+    empleados_desde_dataframe,
+    validar_costos,
+    validar_empleados,
+)
+from costo_personal.sintetico import generar_historial
+
+
+class TestCargaEmpleados:
+    """Tests para la carga de empleados."""
+    
+    @pytest.fixture
+    def empleados(self):
+        """Fixture con una nómina sintética."""
+        return generar_historial(200, cantidad_periodos=1, semilla=12)[0]
+    
+    def test_csv_sin_errores(self, empleados, tmp_path):
+        """Test que una nómina exportada con to_dict se carga tipada y sin errores."""
+        ruta = tmp_path / "empleados.csv"
+        pd.DataFrame([emp.to_dict() for emp in empleados]).to_csv(ruta, index=False)
+        
+        resultado = cargar_empleados_csv(str(ruta))
+        
+        assert resultado.valido
+        assert resultado.filas_leidas == len(empleados)
+        assert resultado.datos["salario_base"].dtype == np.float64
+        assert resultado.datos["activo"].dtype == bool
+        assert empleados_desde_dataframe(resultado.datos) == empleados
+        compactos = empleados_desde_dataframe(resultado.datos, compactos=True)
+        assert [emp.a_empleado() for emp in compactos] == empleados
+    
+    def test_excel_sin_errores(self, empleados, tmp_path):
+        """Test la carga desde una hoja de Excel."""
+        ruta = tmp_path / "empleados.xlsx"
+        pd.DataFrame([emp.to_dict() for emp in empleados[:20]]).to_excel(ruta, index=False)
+        
+        resultado = cargar_empleados_excel(str(ruta))
+        
+        assert resultado.valido
+        assert empleados_desde_dataframe(resultado.datos) == empleados[:20]
+    
+    def test_reporte_de_errores(self, tmp_path):
+        """Test que cada fila inválida se informa y se excluye de los datos."""
+        ruta = tmp_path / "empleados.csv"
+        ruta.write_text(
+            "id,nombre,departamento,cargo,salario_base,fecha_ingreso,activo\n"
+            "E1,Ana,Ventas,Ejecutivo,1000,2020-01-01,true\n"
+            ",Luis,Ventas,Ejecutivo,1000,2020-01-01,true\n"
+            "E3,Eva,Ventas,Ejecutivo,-5,2020-01-01,no\n"
+            "E4,Leo,Legal,Abogado,mil,2020-02-30,quizas\n"
+            "E5,Sol,Legal,Abogado,2000,2021-05-01,false\n"
+            "E5,Sol,Legal,Abogado,2000,2021-05-01,false\n",
+            encoding="utf-8",
+        )
+        
+        resultado = cargar_empleados_csv(str(ruta))
+        errores = resultado.errores
+        
+        assert not resultado.valido
+        assert resultado.filas_leidas == 6
+        assert resultado.filas_invalidas == 5
+        assert resultado.datos["id"].tolist() == ["E1"]
+        assert list(zip(errores["fila"], errores["columna"])) == [
+            (3, "id"),
+            (4, "salario_base"),
+            (5, "salario_base"),
+            (5, "fecha_ingreso"),
+            (5, "activo"),
+            (6, "id"),
+            (7, "id"),
+        ]
+        assert errores["error"].iloc[1] == "El salario base no puede ser negativo"
+        assert errores["valor"].iloc[4] == "quizas"
+    
+    def test_ids_con_espacios_y_activo_vacio(self):
+        """Test que los IDs se comparan sin espacios y un activo vacío vale True."""
+        df = pd.DataFrame({
+            "id": ["E1", " E1", "E2 ", "E3"],
+            "nombre": ["Ana", "Ana", "Luis", "Eva"],
+            "departamento": ["Ventas"] * 4,
+            "cargo": ["Ejecutivo"] * 4,
+            "salario_base": [1000.0] * 4,
+            "fecha_ingreso": ["2020-01-01"] * 4,
+            "activo": [None, "true", " ", "no"],
+        })
+        
+        resultado = validar_empleados(df)
+        
+        assert resultado.errores["fila"].tolist() == [2, 3]
+        assert set(resultado.errores["error"]) == {"ID duplicado"}
+        assert resultado.datos["id"].tolist() == ["E2", "E3"]
+        assert resultado.datos["activo"].tolist() == [True, False]
+    
+    def test_columnas_faltantes(self):
+        """Test que un archivo sin las columnas requeridas se rechaza."""
+        with pytest.raises(ValueError, match="salario_base"):
+            validar_costos(pd.DataFrame({"empleado_id": ["E1"], "periodo": ["2024-01"]}))
+
+
+class TestCargaCostos:
+    """Tests para la carga de costos."""
+    
+    @pytest.fixture
+    def costos(self):
+        """Fixture con 3 meses de costos sintéticos."""
+        return generar_historial(300, cantidad_periodos=3, semilla=13)[1]
+    
+    def assert_lote_igual(self, lote, esperado):
+        """Compara dos lotes columna por columna."""
+        assert lote.empleado_id.tolist() == esperado.empleado_id.tolist()
+        assert lote.periodo.tolist() == esperado.periodo.tolist()
+        for campo in CAMPOS_MONTO:
+            assert getattr(lote, campo).tolist() == pytest.approx(getattr(esperado, campo).tolist())
+    
+    def test_csv_y_excel_sin_errores(self, costos, tmp_path):
+        """Test que los costos exportados se cargan como lote sin errores."""
+        csv = tmp_path / "costos.csv"
+        excel = tmp_path / "costos.xlsx"
+        costos.to_dataframe().to_csv(csv, index=False)
+        costos[:50].to_dataframe().to_excel(excel, index=False)
+        
+        resultado = cargar_costos_csv(str(csv))
+        assert resultado.valido
+        self.assert_lote_igual(resultado.datos, costos)
+        
+        resultado = cargar_costos_excel(str(excel))
+        assert resultado.valido
+        self.assert_lote_igual(resultado.datos, costos[:50])
+    
+    def test_reporte_de_errores(self, tmp_path):
+        """Test periodos mal formados, duplicados y montos inválidos."""
+        ruta = tmp_path / "costos.csv"
+        ruta.write_text(
+            "empleado_id,periodo,salario_base,bonos\n"
+            "E1,2024-01,1000,\n"
+            "E1,2024-13,1000,10\n"
+            "E2,202401,1000,10\n"
+            "E3,2024-01,1000,diez\n"
+            "E4,2024-01,1000,5\n"
+            "E4,2024-01,1200,5\n",
+            encoding="utf-8",
+        )
+        
+        resultado = cargar_costos_csv(str(ruta))
+        
+        assert list(zip(resultado.errores["fila"], resultado.errores["error"])) == [
+            (3, "Periodo inválido (se espera YYYY-MM)"),
+            (4, "Periodo inválido (se espera YYYY-MM)"),
+            (5, "Monto inválido"),
+            (6, "Registro duplicado para el periodo"),
+            (7, "Registro duplicado para el periodo"),
+        ]
+        assert resultado.datos.empleado_id.tolist() == ["E1"]
+        assert resultado.datos.bonos.tolist() == [0.0]
+    
+    def test_montos_negativos_e_ids_con_espacios(self):
+        """Test que ningún monto puede ser negativo y los IDs se comparan sin espacios."""
+        df = pd.DataFrame({
+            "empleado_id": ["E1", " E1", "E2", "E3"],
+            "periodo": ["2024-01"] * 4,
+            "salario_base": [1000.0] * 4,
+            "bonos": [0.0, 0.0, -10.0, 5.0],
+            "otros_costos": [0.0, 0.0, 0.0, -1.0],
+        })
+        
+        resultado = validar_costos(df)
+        
+        errores = resultado.errores
+        assert list(zip(errores["fila"], errores["columna"], errores["error"])) == [
+            (2, "empleado_id", "Registro duplicado para el periodo"),
+            (3, "empleado_id", "Registro duplicado para el periodo"),
+            (4, "bonos", "El monto no puede ser negativo"),
+            (5, "otros_costos", "El monto no puede ser negativo"),
+        ]
+        assert len(resultado.datos) == 0
@@ -0,0 +1,109 @@
+"""Tests para la instrumentación opcional."""
+
+import io
+import json
+import logging
+import pytest
+from costo_personal.calculadora import CalculadoraCostos
+from costo_personal.cache import CacheReportes
+from costo_personal.cargas import ReglaCargas, ReglasCargas
+from costo_personal.reportes import GeneradorReportes
+from costo_personal.instrumentacion import (
+    Instrumentacion,
+    SumideroJSON,
+    SumideroLogging,
+    SumideroPrometheus,
+    contar,
+    instrumentacion_activa,
+    perfilar,
+)
+from costo_personal.sintetico import generar_historial
+
+
+class TestInstrumentacion:
+    """Tests para la clase Instrumentacion y los sumideros."""
+    
+    @pytest.fixture
+    def historial(self):
+        """Fixture con una nómina y 2 meses de costos sintéticos."""
+        return generar_historial(400, cantidad_periodos=2, semilla=14)
+    
+    def test_desactivada_no_registra(self, historial):
+        """Test que sin instrumentación activa no se acumula nada."""
+        empleados, costos = historial
+        instrumentacion = Instrumentacion()
+        
+        CalculadoraCostos().calcular_costos_lote(empleados, "2024-01")
+        contar("cache_reportes.aciertos")
+        
+        assert instrumentacion_activa() is None
+        assert instrumentacion.resumen()["metodos"] == {}
+        assert CalculadoraCostos.calcular_costos_lote.__name__ == "calcular_costos_lote"
+    
+    def test_tiempos_filas_y_cache(self, historial):
+        """Test tiempos y filas por método y tasa de aciertos de la caché."""
+        empleados, costos = historial
+        calculadora = CalculadoraCostos()
+        generador = GeneradorReportes(cache=CacheReportes())
+        
+        with Instrumentacion() as instrumentacion:
+            assert instrumentacion_activa() is instrumentacion
+            calculadora.calcular_costos_lote(empleados, "2024-01")
+            calculadora.calcular_costo_promedio_por_empleado(costos)
+            generador.generar_reporte_tendencia(costos)
+            generador.generar_reporte_tendencia(costos)
+        
+        assert instrumentacion_activa() is None
+        resumen = instrumentacion.resumen()
+        metodos = resumen["metodos"]
+        assert metodos["calculadora.calcular_costos_lote"]["filas"] == len(empleados)
+        assert metodos["calculadora.calcular_costo_promedio_por_empleado"]["filas"] == len(costos)
+        tendencia = metodos["reportes.generar_reporte_tendencia"]
+        assert tendencia["llamadas"] == 2
+        assert tendencia["filas"] == 2 * len(costos)
+        assert 0 < tendencia["segundos_max"] <= tendencia["segundos_total"]
+        assert resumen["contadores"] == {"cache_reportes.fallos": 1, "cache_reportes.aciertos": 1}
+        assert resumen["tasas_aciertos"] == {"cache_reportes": 0.5}
+        assert resumen["pico_memoria_bytes"] is None
+    
+    def test_anidada_y_memoria(self, historial):
+        """Test que al salir de una instrumentación anidada se restaura la anterior."""
+        empleados, _ = historial
+        calculadora = CalculadoraCostos(reglas_cargas=ReglasCargas((ReglaCargas(tasa=0.3),)))
+        
+        with perfilar() as externa:
+            with Instrumentacion() as interna:
+                calculadora.calcular_costos_lote(empleados, "2024-01")
+            assert instrumentacion_activa() is externa
+            calculadora.calcular_costos_lote(empleados, "2024-02")
+        
+        assert interna.resumen()["metodos"]["calculadora.calcular_costos_lote"]["llamadas"] == 1
+        assert externa.resumen()["metodos"]["calculadora.calcular_costos_lote"]["llamadas"] == 1
+        assert externa.resumen()["contadores"]["reglas_cargas.aciertos"] == 1
+        assert externa.resumen()["pico_memoria_bytes"] > 0
+    
+    def test_sumideros(self, historial, tmp_path, caplog):
+        """Test los sumideros de función, JSON, logging y Prometheus."""
+        empleados, costos = historial
+        eventos = []
+        stream = io.StringIO()
+        ruta_prom = str(tmp_path / "metricas.prom")
+        
+        with caplog.at_level(logging.INFO, logger="costo_personal.instrumentacion"):
+            with Instrumentacion(sumideros=[
+                eventos.append,
+                SumideroJSON(stream),
+                SumideroLogging(),
+                SumideroPrometheus(ruta_prom),
+            ]):
+                GeneradorReportes().generar_metricas_clave(empleados, costos)
+        
+        assert [e["tipo"] for e in eventos] == ["llamada", "resumen"]
+        assert eventos[0]["nombre"] == "reportes.generar_metricas_clave"
+        assert [json.loads(linea) for linea in stream.getvalue().splitlines()] == eventos
+        assert len(caplog.records) == 2
+        
+        with open(ruta_prom, encoding="utf-8") as archivo:
+            texto = archivo.read()
+        assert "# TYPE costo_personal_llamadas_total counter" in texto
+        assert f'costo_personal_filas_total{{metodo="reportes.generar_metricas_clave"}} {len(costos)}' in texto
@@ -0,0 +1,116 @@
+"""Tests para el contenedor columnar de costos."""
+
+import numpy as np
+import pytest
+from costo_personal.models import CostoPersonal
+from costo_personal.lote import CostoPersonalBatch, agrupar
+
+
+class TestCostoPersonalBatch:
+    """Tests para la clase CostoPersonalBatch."""
+    
+    @pytest.fixture
+    def costos_ejemplo(self):
+        """Fixture con costos de ejemplo."""
+        return [
+            CostoPersonal(
+                empleado_id="E001",
+                periodo="2024-11",
+                salario_base=5000.0,
+                bonos=500.0,
+                horas_extra=300.0,
+                beneficios=200.0,
+                cargas_sociales=1250.0,
+                otros_costos=100.0,
+            ),
+            CostoPersonal(
+                empleado_id="E002",
+                periodo="2024-10",
+                salario_base=3000.0,
+                cargas_sociales=750.0,
+            ),
+        ]
+    
+    def test_from_costos_y_fila(self, costos_ejemplo):
+        """Test que la conversión ida y vuelta conserva los registros."""
+        lote = CostoPersonalBatch.from_costos(costos_ejemplo)
+        
+        assert len(lote) == 2
+        assert lote.salario_base.dtype == np.float64
+        assert lote[0] == costos_ejemplo[0]
+        assert lote[-1] == costos_ejemplo[1]
+        assert lote.to_costos() == costos_ejemplo
+    
+    def test_costo_total_vectorizado(self, costos_ejemplo):
+        """Test que costo_total coincide con el de cada CostoPersonal."""
+        lote = CostoPersonalBatch.from_costos(costos_ejemplo)
+        
+        assert lote.costo_total.tolist() == [c.costo_total for c in costos_ejemplo]
+    
+    def test_columnas_por_defecto_y_periodo_unico(self):
+        """Test que los montos omitidos son 0.0 y el periodo se replica."""
+        lote = CostoPersonalBatch(
+            empleado_id=["E001", "E002"],
+            periodo="2024-11",
+            salario_base=[1000.0, 2000.0],
+        )
+        
+        assert lote.periodo.tolist() == ["2024-11", "2024-11"]
+        assert lote.bonos.tolist() == [0.0, 0.0]
+        assert lote.costo_total.tolist() == [1000.0, 2000.0]
+    
+    def test_largos_distintos(self):
+        """Test que las columnas deben tener el mismo largo."""
+        with pytest.raises(ValueError):
+            CostoPersonalBatch(
+                empleado_id=["E001", "E002"],
+                periodo="2024-11",
+                salario_base=[1000.0],
+            )
+    
+    def test_indice_fuera_de_rango(self, costos_ejemplo):
+        """Test acceso a una fila inexistente."""
+        lote = CostoPersonalBatch.from_costos(costos_ejemplo)
+        with pytest.raises(IndexError):
+            lote[2]
+    
+    def test_subconjunto(self, costos_ejemplo):
+        """Test que una máscara devuelve un nuevo lote."""
+        lote = CostoPersonalBatch.from_costos(costos_ejemplo)
+        sub = lote[lote.periodo == "2024-10"]
+        
+        assert isinstance(sub, CostoPersonalBatch)
+        assert sub.empleado_id.tolist() == ["E002"]
+    
+    def test_dataframe_sin_copia(self, costos_ejemplo):
+        """Test conversión a DataFrame y de vuelta sin copiar columnas."""
+        lote = CostoPersonalBatch.from_costos(costos_ejemplo)
+        df = lote.to_dataframe()
+        
+        assert np.shares_memory(df["salario_base"].to_numpy(), lote.salario_base)
+        assert df["costo_total"].tolist() == lote.costo_total.tolist()
+        
+        lote2 = CostoPersonalBatch.from_dataframe(df)
+        assert np.shares_memory(lote2.bonos, lote.bonos)
+        assert lote2.to_costos() == costos_ejemplo
+    
+    def test_concatenar(self, costos_ejemplo):
+        """Test que concatenar conserva el orden de los registros."""
+        lote = CostoPersonalBatch.from_costos(costos_ejemplo)
+        unido = CostoPersonalBatch.concatenar([lote, lote[:1]])
+        
+        assert unido.empleado_id.tolist() == ["E001", "E002", "E001"]
+        assert len(CostoPersonalBatch.concatenar([])) == 0
+
+
+def test_agrupar_orden_de_aparicion():
+    """Test que agrupar respeta el orden de primera aparición."""
+    claves = np.array(["b", "a", "b", "c"], dtype=object)
+    
+    unicas, codigos = agrupar(claves)
+    assert unicas.tolist() == ["b", "a", "c"]
+    assert codigos.tolist() == [0, 1, 0, 2]
+    
+    unicas, codigos = agrupar(claves, ordenar=True)
+    assert unicas.tolist() == ["a", "b", "c"]
+    assert codigos.tolist() == [1, 0, 1, 2]
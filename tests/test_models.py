@@ -1,8 +1,22 @@
 """Tests para los modelos de datos."""
 
+import pickle
+import sys
 import pytest
+from dataclasses import FrozenInstanceError
 from datetime import date
-from costo_personal.models import Empleado, CostoPersonal
+from costo_personal.models import (
+    CAMPOS_COSTO,
+    CostoPersonal,
+    CostoPersonalCompacto,
+    Empleado,
+    EmpleadoCompacto,
+    EmpleadoCompactoInmutable,
+)
+from costo_personal.lote import CostoPersonalBatch
+from costo_personal.registro import EmpleadoRegistry
+from costo_personal.calculadora import CalculadoraCostos
+from costo_personal.reportes import GeneradorReportes
 
 
 class TestEmpleado:
@@ -118,3 +132,108 @@ class TestCostoPersonal:
         assert dict_costo["salario_base"] == 5000.0
         assert dict_costo["bonos"] == 500.0
         assert "costo_total" in dict_costo
+
+
+class TestModelosCompactos:
+    """Tests para EmpleadoCompacto y CostoPersonalCompacto."""
+    
+    @pytest.fixture
+    def empleado(self):
+        """Fixture con un empleado de ejemplo."""
+        return Empleado(
+            id="E001",
+            nombre="Juan Pérez",
+            departamento="Tecnología",
+            cargo="Desarrollador",
+            salario_base=5000.0,
+            fecha_ingreso=date(2020, 1, 1),
+        )
+    
+    def test_empleado_compacto(self, empleado):
+        """Test que el empleado compacto equivale al original y comparte cadenas."""
+        compacto = EmpleadoCompacto.desde(empleado)
+        otro = EmpleadoCompacto("E002", "Ana", "".join(["Tecno", "logía"]), "Analista", 1.0, date(2021, 1, 1))
+        
+        assert not hasattr(compacto, "__dict__")
+        assert compacto.to_dict() == empleado.to_dict()
+        assert compacto.a_empleado() == empleado
+        assert otro.departamento is compacto.departamento
+        assert pickle.loads(pickle.dumps(compacto)) == compacto
+        assert EmpleadoCompacto.to_records([empleado, otro])[1][:3] == ("E002", "Ana", "Tecnología")
+        with pytest.raises(ValueError):
+            EmpleadoCompacto("E003", "X", "Y", "Z", -1.0, date(2020, 1, 1))
+    
+    def test_empleado_compacto_interna_al_asignar(self, empleado):
+        """Test que departamento y cargo se internan también al reasignarlos."""
+        compacto = EmpleadoCompacto.desde(empleado)
+        compacto.departamento = "".join(["Ven", "tas"])
+        compacto.cargo = "".join(["Ana", "lista"])
+        
+        assert compacto.departamento is sys.intern("Ventas")
+        assert compacto.cargo is sys.intern("Analista")
+        copia = pickle.loads(pickle.dumps(compacto))
+        assert copia == compacto and copia.cargo is compacto.cargo
+        with pytest.raises(FrozenInstanceError):
+            EmpleadoCompactoInmutable.desde(empleado).cargo = "Analista"
+    
+    def test_empleado_inmutable(self, empleado):
+        """Test que la variante inmutable no se puede modificar y es hashable."""
+        inmutable = EmpleadoCompactoInmutable.desde(empleado)
+        
+        with pytest.raises(FrozenInstanceError):
+            inmutable.salario_base = 1.0
+        with pytest.raises(FrozenInstanceError):
+            del inmutable.activo
+        assert hash(inmutable) == hash(EmpleadoCompactoInmutable.desde(empleado))
+        assert inmutable != EmpleadoCompacto.desde(empleado)
+        
+        registro = EmpleadoRegistry([inmutable])
+        actualizado = registro.desactivar("E001")
+        assert isinstance(actualizado, EmpleadoCompactoInmutable)
+        assert actualizado.activo is False and inmutable.activo is True
+    
+    def test_costo_compacto(self):
+        """Test el costo total precalculado y las conversiones."""
+        costo = CostoPersonal("E001", "2024-11", 5000.0, bonos=500.0, cargas_sociales=1250.0)
+        compacto = CostoPersonalCompacto.desde(costo)
+        
+        assert compacto.costo_total == costo.costo_total
+        assert compacto.to_dict() == costo.to_dict()
+        assert compacto.a_costo() == costo
+        assert compacto.reemplazar(bonos=0.0).costo_total == 6250.0
+        assert pickle.loads(pickle.dumps(compacto)) == compacto
+        assert CostoPersonalCompacto.to_records([costo]) == [tuple(compacto)]
+        assert len(CAMPOS_COSTO) == len(compacto)
+        with pytest.raises(AttributeError):
+            compacto.bonos = 1.0
+    
+    def test_costo_compacto_no_es_igual_a_tupla(self):
+        """Test que un costo compacto solo es igual a otro costo compacto."""
+        compacto = CostoPersonalCompacto("E001", "2024-11", 5000.0)
+        
+        assert compacto == CostoPersonalCompacto("E001", "2024-11", 5000.0)
+        assert compacto != tuple(compacto) and tuple(compacto) != compacto
+        assert len({compacto, tuple(compacto)}) == 2
+    
+    def test_costo_compacto_subclase(self):
+        """Test que reemplazar y repr conservan la subclase."""
+        class CostoAuditado(CostoPersonalCompacto):
+            __slots__ = ()
+        
+        costo = CostoAuditado("E001", "2024-11", 5000.0)
+        
+        assert type(costo.reemplazar(bonos=10.0)) is CostoAuditado
+        assert repr(costo).startswith("CostoAuditado(empleado_id='E001'")
+    
+    def test_compactos_en_calculo_y_reportes(self, empleado):
+        """Test que los compactos se usan en lugar de los dataclasses."""
+        empleados = [EmpleadoCompacto.desde(empleado)]
+        lote = CalculadoraCostos().calcular_costos_lote(empleados, "2024-11")
+        compactos = lote.to_costos(compactos=True)
+        
+        assert compactos[0].periodo is lote.to_costos(compactos=True)[0].periodo
+        assert [c.a_costo() for c in compactos] == lote.to_costos()
+        assert CostoPersonalBatch.from_costos(compactos).costo_total.tolist() == lote.costo_total.tolist()
+        assert GeneradorReportes().generar_metricas_clave(empleados, compactos) == (
+            GeneradorReportes().generar_metricas_clave([empleado], lote.to_costos())
+        )
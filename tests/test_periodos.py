@@ -0,0 +1,109 @@
+"""Tests para los periodos codificados como enteros."""
+
+from datetime import date
+import pickle
+import numpy as np
+import pytest
+from costo_personal.periodos import (
+    IndicePeriodos,
+    Periodo,
+    anio_fiscal,
+    codificar,
+    formatear,
+    parsear,
+    rango,
+    trimestre,
+)
+from costo_personal.lote import CostoPersonalBatch
+
+
+class TestPeriodo:
+    """Tests para la clase Periodo."""
+    
+    def test_aritmetica_y_formato(self):
+        """Test la suma de meses, la diferencia y la representación."""
+        p = Periodo("2024-11")
+        
+        assert str(p + 3) == "2025-02"
+        assert isinstance(p - 11, Periodo) and str(p - 11) == "2023-12"
+        assert Periodo("2025-01") - p == 2
+        assert (p.anio, p.mes, p.trimestre) == (2024, 11, 4)
+        assert p.anio_fiscal(7) == 2025
+        assert Periodo(date(2024, 11, 30)) == p == Periodo.desde_anio_mes(2024, 11)
+        assert sorted([Periodo("2024-02"), Periodo("2023-12")])[0] == Periodo("2023-12")
+        assert pickle.loads(pickle.dumps(p)) == p
+        assert repr(p) == "Periodo('2024-11')"
+    
+    @pytest.mark.parametrize("valor", ["2024-13", "2024-1", "24-01", "2024-01-01", "2024/01", -1])
+    def test_periodo_invalido(self, valor):
+        """Test que se rechazan los periodos mal formados."""
+        with pytest.raises(ValueError):
+            Periodo(valor)
+
+
+class TestFuncionesVectorizadas:
+    """Tests para la conversión y agrupación de arreglos de periodos."""
+    
+    def test_codificar_y_formatear(self):
+        """Test la conversión de ida y vuelta y la detección de inválidos."""
+        textos = np.array(["2023-12", "2024-01", "2023-12", "0999-07"], dtype=object)
+        codigos = codificar(textos)
+        
+        assert codigos.tolist() == [24287, 24288, 24287, 11994]
+        assert formatear(codigos).tolist() == textos.tolist()
+        assert formatear(codigos[:0]).tolist() == []
+        assert codificar(codigos) is codigos
+        
+        _, validos = parsear(["2024-00", "2024-1x", "año-01", None, "2024-12"])
+        assert validos.tolist() == [False, False, False, False, True]
+        with pytest.raises(ValueError, match="2024-00"):
+            codificar(["2024-01", "2024-00"])
+    
+    def test_rango_y_agrupaciones(self):
+        """Test el rango de periodos, trimestres y años fiscales."""
+        meses = rango("2024-06", "2025-01")
+        
+        assert formatear(meses[[0, -1]]).tolist() == ["2024-06", "2025-01"]
+        assert trimestre(meses).tolist() == [2, 3, 3, 3, 4, 4, 4, 1]
+        assert anio_fiscal(meses).tolist() == [2024] * 7 + [2025]
+        assert anio_fiscal(meses, mes_inicio=7).tolist() == [2024] + [2025] * 7
+        with pytest.raises(ValueError):
+            rango("2024-02", "2024-01")
+        with pytest.raises(ValueError):
+            anio_fiscal(meses, mes_inicio=13)
+
+
+class TestIndicePeriodos:
+    """Tests para las consultas por rango de periodos."""
+    
+    def test_lote_ordenado_devuelve_vistas(self):
+        """Test que en un lote ordenado las consultas son slices sin copia."""
+        lote = CostoPersonalBatch(
+            [f"E{i}" for i in range(6)],
+            ["2024-01", "2024-01", "2024-02", "2024-04", "2024-04", "2024-05"],
+            np.arange(6.0),
+        )
+        indice = lote.indice_periodos()
+        
+        assert indice.posiciones("2024-02", "2024-04") == slice(2, 5)
+        assert indice.posiciones("2024-03", "2024-03") == slice(3, 3)
+        assert indice.ultimos(2) == slice(3, 6)
+        assert indice.ultimos(10) == slice(0, 6)
+        
+        seleccion = lote.entre_periodos("2024-02", "2024-04", indice)
+        assert seleccion.empleado_id.tolist() == ["E2", "E3", "E4"]
+        assert np.shares_memory(seleccion.salario_base, lote.salario_base)
+        assert len(lote.entre_periodos(hasta="2024-01")) == 2
+        with pytest.raises(ValueError):
+            lote[:3].entre_periodos("2024-01", indice=indice)
+    
+    def test_lote_desordenado(self):
+        """Test las consultas en un lote no ordenado y en uno vacío."""
+        lote = CostoPersonalBatch(
+            ["A", "B", "C", "D"], ["2024-03", "2024-01", "2024-02", "2024-01"], 1.0
+        )
+        
+        assert lote.entre_periodos("2024-01", "2024-02").empleado_id.tolist() == ["B", "D", "C"]
+        assert lote.indice_periodos().ultimos(1).tolist() == [0]
+        assert len(CostoPersonalBatch.vacio().entre_periodos("2024-01")) == 0
+        assert IndicePeriodos([]).ultimos(3) == slice(0, 0)
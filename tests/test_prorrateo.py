@@ -0,0 +1,152 @@
+"""Tests para el prorrateo de meses parciales."""
+
+from datetime import date
+import numpy as np
+import pytest
+from costo_personal.models import Empleado
+from costo_personal.calculadora import CalculadoraCostos
+from costo_personal.cargas import ReglaCargas, ReglasCargas
+from costo_personal.historial import HistorialEmpleados
+from costo_personal.dinero import Moneda
+from costo_personal.prorrateo import Prorrateo, ordinales
+from costo_personal.proyeccion import AjustesProyeccion, PoliticaBonos
+
+
+@pytest.fixture
+def empleados():
+    """Fixture con un ingreso a mitad de mayo y un empleado antiguo."""
+    return [
+        Empleado("E1", "Ana", "Ventas", "Analista", 3100.0, date(2024, 5, 16)),
+        Empleado("E2", "Luis", "TI", "Dev", 2000.0, date(2020, 1, 1)),
+    ]
+
+
+class TestProrrateo:
+    """Tests para las tablas de días y las fracciones."""
+    
+    def test_dias_computables(self):
+        """Test los días corridos y hábiles con feriados."""
+        habiles = Prorrateo("habiles", feriados=(date(2024, 5, 1), date(2024, 5, 1)))
+        
+        assert Prorrateo().dias_computables("2024-02")[-1] == 29
+        assert habiles.dias_computables("2024-05")[-1] == 22
+        assert habiles.feriados == (date(2024, 5, 1),)
+        assert Prorrateo("habiles", dias_habiles="1111110").dias_computables("2024-05")[-1] == 27
+        assert habiles.dias_computables("2024-05") is habiles.dias_computables("2024-05")
+    
+    def test_fracciones(self):
+        """Test las fracciones por ingreso, egreso y fuera del mes."""
+        ingreso = ordinales([date(2024, 5, 16), date(2020, 1, 1), date(2024, 6, 1)], 3)
+        egreso = ordinales([None, date(2024, 5, 15), None], 3)
+        
+        calendario = Prorrateo().fracciones("2024-05", ingreso, egreso)
+        assert calendario.tolist() == [16 / 31, 15 / 31, 0.0]
+        habiles = Prorrateo("habiles", feriados=(date(2024, 5, 1),)).fracciones("2024-05", ingreso, egreso)
+        assert habiles.tolist() == [12 / 22, 10 / 22, 0.0]
+        assert Prorrateo().matriz(["2024-05", "2024-06"], ingreso).shape == (2, 3)
+    
+    @pytest.mark.parametrize("parametros", [
+        {"base": "semanal"},
+        {"dias_habiles": "0000000"},
+        {"dias_habiles": "11111"},
+    ])
+    def test_parametros_invalidos(self, parametros):
+        """Test que se validan la base y los días hábiles."""
+        with pytest.raises(ValueError):
+            Prorrateo(**parametros)
+
+
+class TestCalculadoraConProrrateo:
+    """Tests del prorrateo en la calculadora."""
+    
+    def test_todas_las_formas_de_calculo(self, empleados):
+        """Test que el cálculo individual, en lote y por periodos coinciden."""
+        calculadora = CalculadoraCostos(prorrateo=Prorrateo(), moneda=Moneda())
+        egresos = {"E2": date(2024, 6, 10)}
+        
+        individual = calculadora.calcular_costo_mensual(empleados[0], "2024-05")
+        assert (individual.salario_base, individual.cargas_sociales) == (1600.0, 400.0)
+        
+        lote = calculadora.calcular_costos_lote(empleados, "2024-06", egresos=egresos)
+        assert lote.to_costos()[1].salario_base == 666.67
+        assert lote.to_costos() == [
+            calculadora.calcular_costo_mensual(emp, "2024-06", egreso=egresos.get(emp.id))
+            for emp in empleados
+        ]
+        
+        periodos = calculadora.calcular_costos_periodos(
+            empleados, ["2024-05", "2024-06", "2024-07"], egresos=egresos,
+            procesos=2, tamano_fragmento=1,
+        )
+        assert periodos.en_float().salario_base.tolist() == [
+            1600.0, 2000.0, 3100.0, 666.67, 3100.0, 0.0
+        ]
+        assert periodos[2:4].to_costos() == lote.to_costos()
+    
+    def test_sin_prorrateo_no_cambia(self, empleados):
+        """Test que sin prorrateo se cobra el mes completo."""
+        lote = CalculadoraCostos().calcular_costos_lote(
+            empleados, "2024-05", egresos={"E2": date(2024, 5, 1)}
+        )
+        assert np.array_equal(lote.salario_base, [3100.0, 2000.0])
+    
+    def test_minimo_no_aplica_sin_dias_trabajados(self):
+        """Test que el mínimo de cargas no se cobra antes del ingreso ni después del egreso."""
+        empleado = Empleado("E1", "Eva", "TI", "Dev", 3000.0, date(2025, 6, 16))
+        calculadora = CalculadoraCostos(
+            reglas_cargas=ReglasCargas((ReglaCargas(tasa=0.2, minimo=150.0),)),
+            prorrateo=Prorrateo(),
+        )
+        egresos = {"E1": date(2025, 7, 31)}
+        
+        assert calculadora.calcular_costo_mensual(empleado, "2025-03").cargas_sociales == 0.0
+        assert calculadora.calcular_costos_lote([empleado], "2025-03").cargas_sociales.tolist() == [0.0]
+        periodos = calculadora.calcular_costos_periodos(
+            [empleado], ["2025-05", "2025-06", "2025-07", "2025-08"], egresos=egresos, procesos=2
+        )
+        assert periodos.salario_base.tolist() == [0.0, 1500.0, 3000.0, 0.0]
+        assert periodos.cargas_sociales.tolist() == [0.0, 300.0, 600.0, 0.0]
+    
+    def test_proyeccion_e_historial(self, empleados):
+        """Test que la proyección y el recálculo histórico también prorratean."""
+        calculadora = CalculadoraCostos(prorrateo=Prorrateo())
+        egresos = {"E2": date(2024, 6, 10)}
+        periodos = calculadora.calcular_costos_periodos(
+            empleados, ["2024-05", "2024-06", "2024-07"], egresos=egresos
+        )
+        
+        proyeccion = calculadora.proyectar(empleados, "2024-05", "2024-07", egresos=egresos)
+        trabajados = [costo for costo in periodos.to_costos() if costo.salario_base > 0]
+        assert proyeccion.to_costos() == trabajados
+        
+        historial = HistorialEmpleados(empleados, desde="2024-01")
+        historicos = calculadora.calcular_costos_historicos(
+            historial, ["2024-05", "2024-06", "2024-07"], egresos=egresos
+        )
+        assert historicos.to_costos() == periodos.to_costos()
+    
+    def test_proyeccion_sin_costos_fuera_de_los_meses_trabajados(self):
+        """Test que la proyección no cobra montos fijos antes del ingreso ni tras el egreso."""
+        empleados = [
+            Empleado("E1", "Ana", "Ventas", "Analista", 1000.0, date(2020, 1, 1)),
+            Empleado("E2", "Luis", "Ventas", "Analista", 1000.0, date(2025, 6, 15)),
+        ]
+        ajustes = AjustesProyeccion(
+            politicas_bonos=[PoliticaBonos("Ventas", monto_fijo=50.0)],
+            beneficios=100.0,
+        )
+        calculadora = CalculadoraCostos(prorrateo=Prorrateo())
+        
+        lote = calculadora.proyectar(
+            empleados, "2025-04", "2025-07", ajustes, egresos={"E1": date(2025, 5, 10)}
+        )
+        
+        assert list(zip(lote.empleado_id, lote.periodo)) == [
+            ("E1", "2025-04"), ("E1", "2025-05"), ("E2", "2025-06"), ("E2", "2025-07"),
+        ]
+        for empleado_id, periodo in [("E2", "2025-04"), ("E2", "2025-05"), ("E1", "2025-06")]:
+            celda = (lote.empleado_id == empleado_id) & (lote.periodo == periodo)
+            assert lote.costo_total[celda].sum() == 0.0
+        assert lote.costo_total[lote.empleado_id == "E2"].tolist() == pytest.approx(
+            [16 / 30 * 1000.0 * 1.25 + 150.0, 1000.0 * 1.25 + 150.0]
+        )
@@ -0,0 +1,147 @@
+"""Tests para el registro indexado de empleados."""
+
+import pytest
+from datetime import date
+from costo_personal.models import Empleado, CostoPersonal
+from costo_personal.registro import EmpleadoRegistry
+from costo_personal.calculadora import CalculadoraCostos
+from costo_personal.reportes import GeneradorReportes
+
+
+class TestEmpleadoRegistry:
+    """Tests para la clase EmpleadoRegistry."""
+    
+    @pytest.fixture
+    def empleados_ejemplo(self):
+        """Fixture con empleados de ejemplo."""
+        return [
+            Empleado(
+                id="E001",
+                nombre="Juan Pérez",
+                departamento="Tecnología",
+                cargo="Desarrollador",
+                salario_base=5000.0,
+                fecha_ingreso=date(2020, 1, 1),
+            ),
+            Empleado(
+                id="E002",
+                nombre="María García",
+                departamento="Tecnología",
+                cargo="Tester",
+                salario_base=3000.0,
+                fecha_ingreso=date(2021, 1, 1),
+                activo=False,
+            ),
+            Empleado(
+                id="E003",
+                nombre="Carlos López",
+                departamento="Ventas",
+                cargo="Vendedor",
+                salario_base=4000.0,
+                fecha_ingreso=date(2022, 1, 1),
+            ),
+        ]
+    
+    def test_indices_iniciales(self, empleados_ejemplo):
+        """Test que los índices reflejan los empleados iniciales."""
+        registro = EmpleadoRegistry(empleados_ejemplo)
+        
+        assert len(registro) == 3
+        assert "E002" in registro
+        assert registro.obtener("E003").nombre == "Carlos López"
+        assert [e.id for e in registro.por_departamento("Tecnología")] == ["E001", "E002"]
+        assert [e.id for e in registro.por_departamento("Tecnología", solo_activos=True)] == ["E001"]
+        assert [e.id for e in registro.por_cargo("Vendedor")] == ["E003"]
+        assert registro.cantidad_activos() == 2
+        assert registro.por_departamento("Finanzas") == []
+    
+    def test_agregar_duplicado(self, empleados_ejemplo):
+        """Test que no se puede agregar un ID repetido."""
+        registro = EmpleadoRegistry(empleados_ejemplo)
+        with pytest.raises(ValueError):
+            registro.agregar(empleados_ejemplo[0])
+    
+    def test_actualizar_mueve_indices(self, empleados_ejemplo):
+        """Test que actualizar el departamento y cargo reindexa al empleado."""
+        registro = EmpleadoRegistry(empleados_ejemplo)
+        registro.actualizar("E001", departamento="Ventas", cargo="Gerente")
+        
+        assert [e.id for e in registro.por_departamento("Tecnología")] == ["E002"]
+        assert [e.id for e in registro.por_departamento("Ventas")] == ["E003", "E001"]
+        assert registro.por_cargo("Desarrollador") == []
+        assert "Desarrollador" not in registro.cargos()
+        # El orden por ID no cambia al actualizar
+        assert [e.id for e in registro] == ["E001", "E002", "E003"]
+    
+    def test_actualizar_valida_datos(self, empleados_ejemplo):
+        """Test que actualizar conserva las validaciones de Empleado."""
+        registro = EmpleadoRegistry(empleados_ejemplo)
+        with pytest.raises(ValueError):
+            registro.actualizar("E001", salario_base=-1.0)
+        with pytest.raises(ValueError):
+            registro.actualizar("E001", id="E999")
+        with pytest.raises(KeyError):
+            registro.actualizar("E999", salario_base=1.0)
+        assert registro.obtener("E001").salario_base == 5000.0
+    
+    def test_desactivar_y_eliminar(self, empleados_ejemplo):
+        """Test desactivar y eliminar empleados."""
+        registro = EmpleadoRegistry(empleados_ejemplo)
+        
+        registro.desactivar("E001")
+        assert registro.cantidad_activos() == 1
+        assert registro.obtener("E001").activo is False
+        
+        registro.eliminar("E003")
+        assert "E003" not in registro
+        assert "Ventas" not in registro.departamentos()
+        assert registro.cantidad_activos() == 0
+    
+    def test_version_cambia_con_cada_cambio(self, empleados_ejemplo):
+        """Test que la versión cambia con altas, bajas y actualizaciones."""
+        registro = EmpleadoRegistry(empleados_ejemplo[:2])
+        versiones = [registro.version]
+        
+        registro.agregar(empleados_ejemplo[2])
+        versiones.append(registro.version)
+        registro.actualizar("E001", salario_base=5500.0)
+        versiones.append(registro.version)
+        registro.eliminar("E002")
+        versiones.append(registro.version)
+        registro.obtener("E001")
+        
+        assert registro.version == versiones[-1]
+        assert len(set(versiones)) == 4
+        assert EmpleadoRegistry(empleados_ejemplo).version not in versiones
+    
+    def test_calculadora_acepta_registro(self, empleados_ejemplo):
+        """Test que calcular_costos_departamento usa el índice del registro."""
+        registro = EmpleadoRegistry(empleados_ejemplo)
+        calculadora = CalculadoraCostos()
+        
+        desde_registro = calculadora.calcular_costos_departamento(
+            registro, "Tecnología", "2024-11"
+        )
+        desde_lista = calculadora.calcular_costos_departamento(
+            empleados_ejemplo, "Tecnología", "2024-11"
+        )
+        assert desde_registro == desde_lista
+        
+        lote = calculadora.calcular_costos_lote(registro, "2024-11")
+        assert lote.empleado_id.tolist() == ["E001", "E002", "E003"]
+    
+    def test_reportes_aceptan_registro(self, empleados_ejemplo):
+        """Test que los reportes producen lo mismo con registro o lista."""
+        registro = EmpleadoRegistry(empleados_ejemplo)
+        costos = [
+            CostoPersonal(empleado_id="E001", periodo="2024-11", salario_base=5000.0),
+            CostoPersonal(empleado_id="E003", periodo="2024-11", salario_base=4000.0),
+        ]
+        generador = GeneradorReportes()
+        
+        assert generador.generar_reporte_por_departamento(registro, costos).equals(
+            generador.generar_reporte_por_departamento(empleados_ejemplo, costos)
+        )
+        assert generador.generar_metricas_clave(registro, costos) == (
+            generador.generar_metricas_clave(empleados_ejemplo, costos)
+        )
@@ -1,9 +1,12 @@
 """Tests para el generador de reportes."""
 
 import pytest
+import pandas as pd
 from datetime import date
 from costo_personal.models import Empleado, CostoPersonal
+from costo_personal.lote import CostoPersonalBatch
 from costo_personal.reportes import GeneradorReportes
+from costo_personal.sintetico import generar_historial
 
 
 class TestGeneradorReportes:
@@ -187,3 +190,213 @@ class TestGeneradorReportes:
         ]
         for col in expected_columns:
             assert col in df.columns
+    
+    def test_reportes_aceptan_lote(self, empleados_ejemplo, costos_ejemplo):
+        """Test que los reportes sobre un lote coinciden con los de la lista."""
+        generador = GeneradorReportes()
+        lote = CostoPersonalBatch.from_costos(costos_ejemplo)
+        
+        pd.testing.assert_frame_equal(
+            generador.generar_reporte_por_departamento(empleados_ejemplo, lote),
+            generador.generar_reporte_por_departamento(empleados_ejemplo, costos_ejemplo),
+        )
+        pd.testing.assert_frame_equal(
+            generador.generar_reporte_tendencia(lote),
+            generador.generar_reporte_tendencia(costos_ejemplo),
+        )
+        assert generador.generar_metricas_clave(empleados_ejemplo, lote) == pytest.approx(
+            generador.generar_metricas_clave(empleados_ejemplo, costos_ejemplo)
+        )
+    
+    def test_reportes_lote_vacio(self, empleados_ejemplo):
+        """Test reportes sobre un lote vacío."""
+        generador = GeneradorReportes()
+        lote = CostoPersonalBatch.vacio()
+        
+        assert generador.generar_reporte_por_departamento(empleados_ejemplo, lote).empty
+        assert generador.generar_reporte_tendencia(lote).empty
+        assert generador.generar_metricas_clave(empleados_ejemplo, lote)["costo_total"] == 0.0
+    
+    @pytest.mark.parametrize("como_lote", [False, True])
+    def test_generar_paquete_reportes_identico(self, empleados_ejemplo, como_lote):
+        """Test que el paquete coincide exactamente con los tres reportes."""
+        costos = [
+            CostoPersonal(
+                empleado_id=emp_id,
+                periodo=periodo,
+                salario_base=1000.1 * (i + 1),
+                bonos=0.3 * i,
+                horas_extra=0.7 * i,
+                beneficios=0.1 * i,
+                cargas_sociales=250.03 * (i + 1),
+                otros_costos=0.2,
+            )
+            for i, (emp_id, periodo) in enumerate(
+                (emp_id, periodo)
+                for periodo in ["2024-11", "2024-09", "2024-10"]
+                for emp_id in ["E003", "E001", "E999", "E002"]
+            )
+        ]
+        if como_lote:
+            costos = CostoPersonalBatch.from_costos(costos)
+        
+        generador = GeneradorReportes()
+        paquete = generador.generar_paquete_reportes(empleados_ejemplo, costos)
+        
+        pd.testing.assert_frame_equal(
+            paquete["por_departamento"],
+            generador.generar_reporte_por_departamento(empleados_ejemplo, costos),
+            check_exact=True,
+        )
+        pd.testing.assert_frame_equal(
+            paquete["tendencia"],
+            generador.generar_reporte_tendencia(costos),
+            check_exact=True,
+        )
+        assert paquete["metricas_clave"] == generador.generar_metricas_clave(
+            empleados_ejemplo, costos
+        )
+    
+    def test_lote_identico_a_lista(self):
+        """Test que las sumas del lote coinciden bit a bit con las de la lista."""
+        empleados, lote = generar_historial(2000, cantidad_periodos=3, semilla=3)
+        lista = lote.to_costos()
+        generador = GeneradorReportes()
+        
+        paquete_lote = generador.generar_paquete_reportes(empleados, lote)
+        paquete_lista = generador.generar_paquete_reportes(empleados, lista)
+        
+        assert paquete_lote["metricas_clave"] == paquete_lista["metricas_clave"]
+        assert generador.generar_metricas_clave(empleados, lote) == paquete_lista["metricas_clave"]
+        pd.testing.assert_frame_equal(
+            paquete_lote["tendencia"], paquete_lista["tendencia"], check_exact=True
+        )
+    
+    def test_generar_paquete_reportes_vacio(self, empleados_ejemplo):
+        """Test paquete de reportes sin costos."""
+        generador = GeneradorReportes()
+        paquete = generador.generar_paquete_reportes(empleados_ejemplo, [])
+        
+        assert paquete["por_departamento"].empty
+        assert paquete["tendencia"].empty
+        assert paquete["metricas_clave"] == generador.generar_metricas_clave(
+            empleados_ejemplo, []
+        )
+
+
+class TestBackendPandas:
+    """Tests de equivalencia entre los backends python y pandas."""
+    
+    @pytest.fixture
+    def empleados(self):
+        """Fixture con empleados de varios departamentos."""
+        departamentos = ["Tecnología", "Ventas", "Finanzas", "Operaciones"]
+        return [
+            Empleado(
+                id=f"E{i:03d}",
+                nombre=f"Empleado {i}",
+                departamento=departamentos[i % len(departamentos)],
+                cargo="Analista",
+                salario_base=1000.0 + 37.31 * i,
+                fecha_ingreso=date(2020, 1, 1),
+                activo=i % 7 != 0,
+            )
+            for i in range(40)
+        ]
+    
+    @pytest.fixture
+    def costos(self, empleados):
+        """Fixture con costos de varios periodos e IDs desconocidos."""
+        costos = []
+        for k, periodo in enumerate(["2024-11", "2024-09", "2024-10", "2024-12"]):
+            for i, emp in enumerate(empleados):
+                if (i + k) % 5 == 0:
+                    continue
+                costos.append(
+                    CostoPersonal(
+                        empleado_id=emp.id,
+                        periodo=periodo,
+                        salario_base=emp.salario_base,
+                        bonos=13.7 * ((i * k) % 4),
+                        horas_extra=21.9 * (i % 3),
+                        beneficios=150.0,
+                        cargas_sociales=emp.salario_base * 0.25,
+                        otros_costos=3.3,
+                    )
+                )
+            costos.append(
+                CostoPersonal(empleado_id="X999", periodo=periodo, salario_base=777.0)
+            )
+        return costos
+    
+    def test_backend_invalido(self):
+        """Test que un backend desconocido es rechazado."""
+        with pytest.raises(ValueError):
+            GeneradorReportes(backend="polars")
+    
+    @pytest.mark.parametrize("como_lote", [False, True])
+    def test_reporte_por_departamento(self, empleados, costos, como_lote):
+        """Test que ambos backends generan el mismo reporte por departamento."""
+        if como_lote:
+            costos = CostoPersonalBatch.from_costos(costos)
+        pd.testing.assert_frame_equal(
+            GeneradorReportes(backend="pandas").generar_reporte_por_departamento(empleados, costos),
+            GeneradorReportes().generar_reporte_por_departamento(empleados, costos),
+        )
+    
+    @pytest.mark.parametrize("como_lote", [False, True])
+    def test_reporte_tendencia(self, costos, como_lote):
+        """Test que ambos backends generan la misma tendencia."""
+        if como_lote:
+            costos = CostoPersonalBatch.from_costos(costos)
+        pd.testing.assert_frame_equal(
+            GeneradorReportes(backend="pandas").generar_reporte_tendencia(costos),
+            GeneradorReportes().generar_reporte_tendencia(costos),
+        )
+    
+    def test_metricas_clave(self, empleados, costos):
+        """Test que ambos backends generan las mismas métricas clave."""
+        assert GeneradorReportes(backend="pandas").generar_metricas_clave(
+            empleados, costos
+        ) == pytest.approx(GeneradorReportes().generar_metricas_clave(empleados, costos))
+    
+    def test_paquete_reportes(self, empleados, costos):
+        """Test que el paquete del backend pandas coincide con el de python."""
+        paquete_pandas = GeneradorReportes(backend="pandas").generar_paquete_reportes(
+            empleados, costos
+        )
+        paquete_python = GeneradorReportes().generar_paquete_reportes(empleados, costos)
+        
+        pd.testing.assert_frame_equal(
+            paquete_pandas["por_departamento"], paquete_python["por_departamento"]
+        )
+        pd.testing.assert_frame_equal(
+            paquete_pandas["tendencia"], paquete_python["tendencia"]
+        )
+        assert paquete_pandas["metricas_clave"] == pytest.approx(
+            paquete_python["metricas_clave"]
+        )
+    
+    def test_sin_costos(self, empleados):
+        """Test que ambos backends coinciden sin costos."""
+        pandas = GeneradorReportes(backend="pandas")
+        python = GeneradorReportes()
+        
+        pd.testing.assert_frame_equal(
+            pandas.generar_reporte_por_departamento(empleados, []),
+            python.generar_reporte_por_departamento(empleados, []),
+        )
+        pd.testing.assert_frame_equal(
+            pandas.generar_reporte_tendencia([]),
+            python.generar_reporte_tendencia([]),
+        )
+        assert pandas.generar_metricas_clave(empleados, []) == (
+            python.generar_metricas_clave(empleados, [])
+        )
+    
+    def test_sin_empleados_conocidos(self, costos):
+        """Test reporte por departamento cuando ningún costo tiene empleado."""
+        pd.testing.assert_frame_equal(
+            GeneradorReportes(backend="pandas").generar_reporte_por_departamento([], costos),
+            GeneradorReportes().generar_reporte_por_departamento([], costos),
+        )
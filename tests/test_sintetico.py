@@ -0,0 +1,91 @@
+"""Tests para el generador de datos sintéticos."""
+
+import numpy as np
+from costo_personal.sintetico import (
+    CARGOS,
+    DEPARTAMENTOS,
+    generar_costos,
+    generar_empleados,
+    generar_historial,
+    periodos_consecutivos,
+)
+
+
+class TestPeriodosConsecutivos:
+    """Tests para periodos_consecutivos."""
+    
+    def test_cruza_el_anio(self):
+        """Test que los periodos pasan de diciembre a enero."""
+        assert periodos_consecutivos("2023-11", 3) == ["2023-11", "2023-12", "2024-01"]
+
+
+class TestGenerarEmpleados:
+    """Tests para generar_empleados."""
+    
+    def test_determinista(self):
+        """Test que la misma semilla produce la misma nómina."""
+        assert generar_empleados(200, semilla=7) == generar_empleados(200, semilla=7)
+        assert generar_empleados(200, semilla=7) != generar_empleados(200, semilla=8)
+    
+    def test_distribuciones(self):
+        """Test que las distribuciones respetan los catálogos y proporciones."""
+        empleados = generar_empleados(5000, semilla=1, tasa_inactivos=0.1)
+        
+        assert len({e.id for e in empleados}) == 5000
+        assert {e.departamento for e in empleados} <= set(DEPARTAMENTOS)
+        assert {e.cargo for e in empleados} <= set(CARGOS)
+        assert all(e.salario_base > 0 for e in empleados)
+        assert 0.07 < sum(not e.activo for e in empleados) / 5000 < 0.13
+        
+        operaciones = sum(e.departamento == "Operaciones" for e in empleados)
+        legal = sum(e.departamento == "Legal" for e in empleados)
+        assert operaciones > 3 * legal
+
+
+class TestGenerarCostos:
+    """Tests para generar_costos y generar_historial."""
+    
+    def test_forma_y_orden(self):
+        """Test que la forma densa tiene un registro por empleado y periodo, ordenado por periodo."""
+        empleados = generar_empleados(10, semilla=0)
+        costos = generar_costos(
+            empleados, ["2024-01", "2024-02"], tasa_cargas_sociales=0.3, densa=True
+        )
+        
+        assert len(costos) == 20
+        assert list(costos.periodo[:10]) == ["2024-01"] * 10
+        assert list(costos.empleado_id[10:]) == [e.id for e in empleados]
+        np.testing.assert_array_equal(costos.cargas_sociales, costos.salario_base * 0.3)
+    
+    def test_solo_activos_desde_el_ingreso(self):
+        """Test que solo hay registros de activos desde el mes de su ingreso."""
+        empleados = generar_empleados(300, semilla=2, tasa_inactivos=0.2)
+        periodos = periodos_consecutivos("2023-01", 24)
+        costos = generar_costos(empleados, periodos, semilla=1)
+        densos = generar_costos(empleados, periodos, semilla=1, densa=True)
+        
+        vigentes = np.array([
+            emp.activo and emp.fecha_ingreso.strftime("%Y-%m") <= periodo
+            for periodo in periodos for emp in empleados
+        ])
+        assert 0 < len(costos) == vigentes.sum() < len(densos)
+        # Cada registro conserva los valores de su celda en la forma densa
+        np.testing.assert_array_equal(costos.empleado_id, densos.empleado_id[vigentes])
+        np.testing.assert_array_equal(costos.periodo, densos.periodo[vigentes])
+        np.testing.assert_array_equal(costos.bonos, densos.bonos[vigentes])
+    
+    def test_historial_tamano_exacto(self):
+        """Test que el historial tiene exactamente las filas pedidas."""
+        empleados, costos = generar_historial(1001, cantidad_periodos=12, semilla=3)
+        
+        assert len(costos) == 1001
+        assert len(empleados) > 84
+        assert set(costos.empleado_id) <= {e.id for e in empleados if e.activo}
+    
+    def test_historial_determinista(self):
+        """Test que el historial es reproducible con la misma semilla."""
+        _, a = generar_historial(500, semilla=5)
+        _, b = generar_historial(500, semilla=5)
+        
+        np.testing.assert_array_equal(a.costo_total, b.costo_total)
+        np.testing.assert_array_equal(a.empleado_id, b.empleado_id)